@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedanalytics',
+            name='source_timings',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -83,6 +83,7 @@ class FeedAnalytics(models.Model):
     generation_time_ms = models.PositiveIntegerField()
     content_count = models.PositiveIntegerField()
     composition_used = models.JSONField(default=dict)
+    source_timings = models.JSONField(default=dict, blank=True)  # Per candidate source: latency, status, items
     
     # Content breakdown
     personal_connections_count = models.PositiveIntegerField(default=0)
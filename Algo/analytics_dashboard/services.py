@@ -1,6 +1,6 @@
 from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Avg, Count, Sum, Q, Max, Min
+from django.db.models import Avg, Count, Sum, Q, Max, Min, F, FloatField
 from django.contrib.auth.models import User
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
@@ -12,6 +12,59 @@ from .models import (
     RealTimeMetric, UserBehaviorInsight
 )
 
+EXPERIMENT_RESULTS_CACHE_SECONDS = 30
+
+EMPTY_ARM = {'count': 0, 'sum': 0.0, 'sum_sq': 0.0, 'participants': 0}
+
+
+def experiment_arm_statistics(experiment, metric_name):
+    """
+    Sufficient statistics (count, sum, sum of squares, distinct participants)
+    of a metric per experiment group, from one grouped SQL aggregate.
+    """
+    rows = ExperimentMetric.objects.filter(
+        experiment=experiment,
+        metric_name=metric_name
+    ).values('participant__group').annotate(
+        count=Count('id'),
+        sum=Sum('metric_value'),
+        sum_sq=Sum(F('metric_value') * F('metric_value'), output_field=FloatField()),
+        participants=Count('participant', distinct=True)
+    )
+    return {
+        row['participant__group']: {
+            'count': row['count'],
+            'sum': float(row['sum'] or 0.0),
+            'sum_sq': float(row['sum_sq'] or 0.0),
+            'participants': row['participants'],
+        }
+        for row in rows
+    }
+
+
+def mean_and_variance(arm):
+    """Mean and sample variance (ddof=1) from an arm's sufficient statistics."""
+    n = arm['count']
+    if n == 0:
+        return 0.0, 0.0
+    mean = arm['sum'] / n
+    if n < 2:
+        return mean, 0.0
+    # Clamp the rounding error of sum_sq - n * mean^2 on near-constant data
+    return mean, max((arm['sum_sq'] - n * mean * mean) / (n - 1), 0.0)
+
+
+def cohens_d(control, treatment):
+    """Cohen's d with the pooled sample standard deviation of both arms."""
+    control_mean, control_var = mean_and_variance(control)
+    treatment_mean, treatment_var = mean_and_variance(treatment)
+    dof = control['count'] + treatment['count'] - 2
+    if dof <= 0:
+        return 0.0
+    pooled_std = np.sqrt(((control['count'] - 1) * control_var +
+                          (treatment['count'] - 1) * treatment_var) / dof)
+    return float((treatment_mean - control_mean) / pooled_std) if pooled_std > 0 else 0.0
+
 
 class AnalyticsService:
     """
@@ -187,53 +240,40 @@ class AnalyticsService:
         if cached_results:
             return cached_results
         
-        # Get participants by group
-        control_participants = experiment.participants.filter(group='control')
-        treatment_participants = experiment.participants.filter(group='treatment')
+        # Per-arm sufficient statistics of the primary metric in one grouped query
+        arms = experiment_arm_statistics(experiment, experiment.primary_metric)
+        control = arms.get('control', EMPTY_ARM)
+        treatment = arms.get('treatment', EMPTY_ARM)
         
-        # Calculate primary metric for each group
-        control_metrics = ExperimentMetric.objects.filter(
-            experiment=experiment,
-            participant__in=control_participants,
-            metric_name=experiment.primary_metric
-        )
-        
-        treatment_metrics = ExperimentMetric.objects.filter(
-            experiment=experiment,
-            participant__in=treatment_participants,
-            metric_name=experiment.primary_metric
-        )
-        
-        # Calculate statistics
-        control_values = list(control_metrics.values_list('metric_value', flat=True))
-        treatment_values = list(treatment_metrics.values_list('metric_value', flat=True))
-        
-        if len(control_values) == 0 or len(treatment_values) == 0:
+        if control['count'] == 0 or treatment['count'] == 0:
             return {
                 'error': 'Insufficient data for analysis',
-                'control_count': len(control_values),
-                'treatment_count': len(treatment_values)
+                'control_count': control['count'],
+                'treatment_count': treatment['count']
             }
         
-        # Statistical analysis
-        control_mean = np.mean(control_values)
-        treatment_mean = np.mean(treatment_values)
-        control_std = np.std(control_values)
-        treatment_std = np.std(treatment_values)
-        
-        # Perform t-test
-        t_stat, p_value = stats.ttest_ind(treatment_values, control_values)
+        control_mean, control_var = mean_and_variance(control)
+        treatment_mean, treatment_var = mean_and_variance(treatment)
+        control_std = float(np.sqrt(control_var))
+        treatment_std = float(np.sqrt(treatment_var))
+        
+        # Welch's t-test (unequal variances) from the aggregates
+        if control['count'] > 1 and treatment['count'] > 1 and (control_var > 0 or treatment_var > 0):
+            t_stat, p_value = stats.ttest_ind_from_stats(
+                treatment_mean, treatment_std, treatment['count'],
+                control_mean, control_std, control['count'],
+                equal_var=False
+            )
+            t_stat, p_value = float(t_stat), float(p_value)
+        else:
+            t_stat, p_value = 0.0, 1.0
         
         # Calculate confidence interval
         confidence_level = experiment.confidence_level / 100
         alpha = 1 - confidence_level
         
         # Effect size (Cohen's d)
-        pooled_std = np.sqrt(((len(control_values) - 1) * control_std**2 + 
-                             (len(treatment_values) - 1) * treatment_std**2) / 
-                            (len(control_values) + len(treatment_values) - 2))
-        
-        effect_size = (treatment_mean - control_mean) / pooled_std if pooled_std > 0 else 0
+        effect_size = cohens_d(control, treatment)
         
         # Determine significance
         is_significant = p_value < alpha
@@ -249,12 +289,14 @@ class AnalyticsService:
         
         results = {
             'control': {
-                'participants': len(control_values),
+                'participants': control['participants'],
+                'observations': control['count'],
                 'mean': control_mean,
                 'std': control_std
             },
             'treatment': {
-                'participants': len(treatment_values),
+                'participants': treatment['participants'],
+                'observations': treatment['count'],
                 'mean': treatment_mean,
                 'std': treatment_std
             },
@@ -278,8 +320,8 @@ class AnalyticsService:
         experiment.results_summary = results
         experiment.save()
         
-        # Cache results for 10 minutes
-        cache.set(cache_key, results, 600)
+        # The aggregate is cheap, so results are only cached briefly
+        cache.set(cache_key, results, EXPERIMENT_RESULTS_CACHE_SECONDS)
         
         return results
     
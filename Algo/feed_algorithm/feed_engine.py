@@ -4,9 +4,14 @@ Implements dynamic content composition with configurable ratios.
 """
 
 import logging
+import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Any, Optional
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import connections
 from django.db.models import Q, F, Count
 from django.core.cache import cache
 from django.utils import timezone
@@ -25,6 +30,23 @@ from analytics.models import FeedAnalytics, AnalyticsEvent
 
 logger = logging.getLogger('feed_algorithm')
 
+# Composition key -> candidate source method
+CANDIDATE_SOURCES = (
+    ('personal_connections', '_get_personal_connections_content'),
+    ('interest_based', '_get_interest_based_content'),
+    ('trending_content', '_get_trending_content'),
+    ('discovery_content', '_get_discovery_content'),
+    ('community_content', '_get_community_content'),
+    ('product_content', '_get_product_content'),
+)
+
+DEFAULT_SOURCE_FETCH = {
+    'MODE': 'sequential',
+    'TIMEOUT_MS': 300,
+    'SOURCE_TIMEOUTS_MS': {},
+    'MAX_WORKERS': 12,
+    'OVERFETCH_RATIO': 0.5,
+}
 
 class FeedAlgorithmEngine:
     """
@@ -36,6 +58,7 @@ class FeedAlgorithmEngine:
         self.user_profile = self._get_or_create_user_profile()
         self.feed_composition = self._get_feed_composition()
         self.feed_size = 20  # Default feed size
+        self.source_timings = {}
         
     def _get_or_create_user_profile(self) -> UserProfile:
         """Get or create user profile."""
@@ -117,7 +140,6 @@ class FeedAlgorithmEngine:
     def _generate_fresh_feed(self, size: int) -> List[Dict[str, Any]]:
         """Generate fresh feed content based on composition."""
         composition = self.feed_composition.composition_dict
-        feed_items = []
         
         # Calculate target counts for each content type
         targets = {
@@ -130,46 +152,159 @@ class FeedAlgorithmEngine:
         if remaining > 0:
             targets['personal_connections'] += remaining
         
-        # Generate content for each category
-        if targets['personal_connections'] > 0:
-            personal_content = self._get_personal_connections_content(
-                targets['personal_connections']
-            )
-            feed_items.extend(personal_content)
+        fetch_config = self._get_source_fetch_config()
+        if fetch_config['MODE'] == 'parallel':
+            feed_items = self._fetch_sources_parallel(targets, fetch_config)
+        else:
+            feed_items = self._fetch_sources_sequential(targets)
         
-        if targets['interest_based'] > 0:
-            interest_content = self._get_interest_based_content(
-                targets['interest_based']
-            )
-            feed_items.extend(interest_content)
-        
-        if targets['trending_content'] > 0:
-            trending_content = self._get_trending_content(
-                targets['trending_content']
-            )
-            feed_items.extend(trending_content)
+        # Sort by final score and limit to requested size
+        feed_items.sort(key=lambda x: x.get('score', 0), reverse=True)
+        return feed_items[:size]
+    
+    def _get_source_fetch_config(self) -> Dict[str, Any]:
+        config = dict(DEFAULT_SOURCE_FETCH)
+        config.update(getattr(settings, 'FEED_SOURCE_FETCH', {}))
+        return config
+    
+    def _fetch_sources_sequential(self, targets: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Run each candidate source in turn (latency is the sum of all sources)."""
+        feed_items = []
+        self.source_timings = {'mode': 'sequential', 'sources': {}}
+        for source, method_name in CANDIDATE_SOURCES:
+            if targets.get(source, 0) <= 0:
+                continue
+            start = time.monotonic()
+            items = getattr(self, method_name)(targets[source])
+            self.source_timings['sources'][source] = {
+                'latency_ms': int((time.monotonic() - start) * 1000),
+                'status': 'ok',
+                'items': len(items),
+            }
+            feed_items.extend(items)
+        return feed_items
+    
+    def _run_source(self, method_name: str, count: int, started: threading.Event, started_at: Dict[str, float], source: str):
+        # Runs on a per-request pool thread, which opens its own DB connection.
+        # The thread exits with the pool, so close the connection outright
+        # (close_old_connections() would keep it open for CONN_MAX_AGE).
+        start = time.monotonic()
+        started_at[source] = start
+        started.set()
+        try:
+            return getattr(self, method_name)(count), (time.monotonic() - start) * 1000
+        finally:
+            connections.close_all()
+    
+    def _fetch_sources_parallel(self, targets: Dict[str, int], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run all candidate sources concurrently, each with its own timeout.
         
-        if targets['discovery_content'] > 0:
-            discovery_content = self._get_discovery_content(
-                targets['discovery_content']
-            )
-            feed_items.extend(discovery_content)
+        Every source is asked for OVERFETCH_RATIO more items than its quota;
+        the surplus is kept in reserve and used, best score first, to fill the
+        quota of sources that timed out, failed or came back short.
         
-        if targets['community_content'] > 0:
-            community_content = self._get_community_content(
-                targets['community_content']
-            )
-            feed_items.extend(community_content)
+        Each request gets its own pool (at most MAX_WORKERS threads), so one
+        request's sources never queue behind another's, and each source's
+        timeout runs from the moment it starts. A source that times out while
+        running is left to finish on its own thread; the pool is shut down
+        without waiting, so its threads exit once their sources return.
+        """
+        overfetch = config['OVERFETCH_RATIO']
+        started = time.monotonic()
+        
+        sources = [
+            (source, method_name) for source, method_name in CANDIDATE_SOURCES
+            if targets.get(source, 0) > 0
+        ]
+        if not sources:
+            self.source_timings = {'mode': 'parallel', 'wall_ms': 0, 'refilled': 0, 'sources': {}}
+            return []
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(config['MAX_WORKERS'], len(sources))),
+            thread_name_prefix='feed-source',
+        )
         
-        if targets['product_content'] > 0:
-            product_content = self._get_product_content(
-                targets['product_content']
+        futures = {}
+        start_events = {}
+        started_at = {}
+        for source, method_name in sources:
+            target = targets[source]
+            requested = target + int(math.ceil(target * overfetch))
+            start_events[source] = threading.Event()
+            futures[source] = executor.submit(
+                self._run_source, method_name, requested, start_events[source], started_at, source
             )
-            feed_items.extend(product_content)
         
-        # Sort by final score and limit to requested size
-        feed_items.sort(key=lambda x: x.get('score', 0), reverse=True)
-        return feed_items[:size]
+        timings = {}
+        feed_items = []
+        reserve = []
+        try:
+            for source, future in futures.items():
+                timeout_s = config['SOURCE_TIMEOUTS_MS'].get(source, config['TIMEOUT_MS']) / 1000.0
+                # With MAX_WORKERS below the number of sources a source can be
+                # queued; drop it if it has not started within its own timeout.
+                if not start_events[source].wait(timeout_s) and future.cancel():
+                    timings[source] = {
+                        'latency_ms': 0,
+                        'status': 'cancelled',
+                        'items': 0,
+                    }
+                    continue
+                start_events[source].wait()
+                source_start = started_at[source]
+                remaining = max(0.0, source_start + timeout_s - time.monotonic())
+                try:
+                    items, latency_ms = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    timings[source] = {
+                        'latency_ms': int((time.monotonic() - source_start) * 1000),
+                        'status': 'timeout',
+                        'items': 0,
+                    }
+                    continue
+                except Exception as e:
+                    logger.error(f'Feed source {source} failed: {e}')
+                    timings[source] = {
+                        'latency_ms': int((time.monotonic() - source_start) * 1000),
+                        'status': 'error',
+                        'items': 0,
+                    }
+                    continue
+                target = targets[source]
+                feed_items.extend(items[:target])
+                reserve.extend(items[target:])
+                timings[source] = {
+                    'latency_ms': int(latency_ms),
+                    'status': 'ok',
+                    'items': min(len(items), target),
+                }
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Refill the quota missing from slow, failed or short sources
+        deficit = sum(targets[source] for source in futures) - len(feed_items)
+        refilled = 0
+        if deficit > 0 and reserve:
+            seen = {(item.get('type'), item.get('id')) for item in feed_items}
+            reserve.sort(key=lambda x: x.get('score', 0), reverse=True)
+            for item in reserve:
+                if refilled >= deficit:
+                    break
+                key = (item.get('type'), item.get('id'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                feed_items.append(item)
+                refilled += 1
+        
+        self.source_timings = {
+            'mode': 'parallel',
+            'wall_ms': int((time.monotonic() - started) * 1000),
+            'refilled': refilled,
+            'sources': timings,
+        }
+        return feed_items
     
     def _get_personal_connections_content(self, count: int) -> List[Dict[str, Any]]:
         """Get content from user's personal connections."""
@@ -463,6 +598,7 @@ class FeedAlgorithmEngine:
                 generation_time_ms=generation_time_ms,
                 content_count=feed_data['total_items'],
                 composition_used=self.feed_composition.composition_dict,
+                source_timings=self.source_timings,
                 cache_hit=(feed_data.get('cache_status') == 'hit'),
                 experiment_group=self.feed_composition.experiment_group
             )
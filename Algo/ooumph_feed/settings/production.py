@@ -272,6 +272,14 @@ TRENDING_CACHE_TTL = 1800  # 30 minutes
 CONNECTION_CACHE_TTL = 7200  # 2 hours
 USER_INSIGHTS_CACHE_TTL = 86400  # 24 hours
 
+# Candidate-source fetching in FeedAlgorithmEngine ('sequential' or 'parallel')
+FEED_SOURCE_FETCH = {
+    'MODE': os.getenv('FEED_SOURCE_FETCH_MODE', 'parallel'),
+    'TIMEOUT_MS': int(os.getenv('FEED_SOURCE_TIMEOUT_MS', '300')),
+    'MAX_WORKERS': int(os.getenv('FEED_SOURCE_MAX_WORKERS', '12')),
+    'OVERFETCH_RATIO': 0.5,  # Extra items per source kept in reserve to refill slow sources
+}
+
 # A/B Testing Settings
 AB_TEST_MAX_DURATION_DAYS = 30
 AB_TEST_MIN_SAMPLE_SIZE = 1000
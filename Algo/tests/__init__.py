@@ -19,7 +19,7 @@ from feed_algorithm.models import (
     TrendingMetric, CreatorMetric
 )
 from feed_content_types.models import Post, Community, Product, Engagement
-from feed_algorithm.feed_engine import FeedAlgorithmEngine
+from feed_algorithm.feed_engine import FeedAlgorithmEngine, CANDIDATE_SOURCES
 from analytics.models import FeedAnalytics, AnalyticsEvent
 
 
@@ -273,6 +273,57 @@ class FeedEngineTestCase(TestCase):
             self.assertIn('category', content[0])
             self.assertEqual(content[0]['category'], 'interest_based')
 
+    def test_parallel_sources_refill_slow_source(self):
+        """Test that a timed-out source's quota is filled from the other sources."""
+        import time as time_module
+
+        def fake_source(category, delay=0.0):
+            def fetch(count):
+                time_module.sleep(delay)
+                return [
+                    {'id': f'{category}-{i}', 'type': 'post', 'score': float(100 - i), 'category': category}
+                    for i in range(count)
+                ]
+            return fetch
+
+        sources = {
+            '_get_personal_connections_content': fake_source('personal_connections', delay=0.5),
+            '_get_interest_based_content': fake_source('interest_based'),
+            '_get_trending_content': fake_source('trending'),
+            '_get_discovery_content': fake_source('discovery'),
+            '_get_community_content': fake_source('community'),
+            '_get_product_content': fake_source('product'),
+        }
+        fetch_settings = {'MODE': 'parallel', 'TIMEOUT_MS': 100, 'MAX_WORKERS': 6, 'OVERFETCH_RATIO': 1.0}
+        with self.settings(FEED_SOURCE_FETCH=fetch_settings):
+            with patch.multiple(self.engine, **sources):
+                items = self.engine._generate_fresh_feed(20)
+
+        self.assertEqual(len(items), 20)
+        self.assertNotIn('personal_connections', {item['category'] for item in items})
+        timings = self.engine.source_timings
+        self.assertEqual(timings['mode'], 'parallel')
+        self.assertEqual(timings['sources']['personal_connections']['status'], 'timeout')
+        self.assertEqual(timings['sources']['interest_based']['status'], 'ok')
+        self.assertGreater(timings['refilled'], 0)
+
+    def test_parallel_source_timeout_starts_when_source_runs(self):
+        """Test that time spent queued for a worker does not count against a source's timeout."""
+        import time as time_module
+
+        def fetch(count):
+            time_module.sleep(0.04)
+            return [{'id': i, 'type': 'post', 'score': 1.0} for i in range(count)]
+
+        sources = {method_name: fetch for _, method_name in CANDIDATE_SOURCES}
+        fetch_settings = {'MODE': 'parallel', 'TIMEOUT_MS': 100, 'MAX_WORKERS': 1, 'OVERFETCH_RATIO': 0.0}
+        with self.settings(FEED_SOURCE_FETCH=fetch_settings):
+            with patch.multiple(self.engine, **sources):
+                self.engine._generate_fresh_feed(20)
+
+        statuses = {t['status'] for t in self.engine.source_timings['sources'].values()}
+        self.assertEqual(statuses, {'ok'})
+
 
 class APITestCase(APITestCase):
     """Test case for REST API endpoints."""
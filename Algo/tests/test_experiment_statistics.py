@@ -0,0 +1,57 @@
+import numpy as np
+from django.test import SimpleTestCase
+from scipy import stats
+
+from analytics_dashboard.services import cohens_d, mean_and_variance
+
+
+def arm(values):
+    return {
+        'count': len(values),
+        'sum': float(sum(values)),
+        'sum_sq': float(sum(v * v for v in values)),
+        'participants': len(values),
+    }
+
+
+class TestSufficientStatistics(SimpleTestCase):
+    """Results from (count, sum, sum of squares) must match the raw-sample computation."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.control = list(rng.normal(3.0, 1.0, 400))
+        self.treatment = list(rng.normal(3.3, 1.6, 250))
+
+    def test_mean_and_sample_variance(self):
+        mean, var = mean_and_variance(arm(self.control))
+
+        self.assertAlmostEqual(mean, np.mean(self.control))
+        self.assertAlmostEqual(var, np.var(self.control, ddof=1))
+
+    def test_welch_t_test_matches_raw_samples(self):
+        control_mean, control_var = mean_and_variance(arm(self.control))
+        treatment_mean, treatment_var = mean_and_variance(arm(self.treatment))
+
+        t_stat, p_value = stats.ttest_ind_from_stats(
+            treatment_mean, np.sqrt(treatment_var), len(self.treatment),
+            control_mean, np.sqrt(control_var), len(self.control),
+            equal_var=False
+        )
+        expected_t, expected_p = stats.ttest_ind(self.treatment, self.control, equal_var=False)
+
+        self.assertAlmostEqual(t_stat, expected_t)
+        self.assertAlmostEqual(p_value, expected_p)
+
+    def test_cohens_d(self):
+        n1, n2 = len(self.control), len(self.treatment)
+        pooled = np.sqrt(((n1 - 1) * np.var(self.control, ddof=1) +
+                          (n2 - 1) * np.var(self.treatment, ddof=1)) / (n1 + n2 - 2))
+
+        self.assertAlmostEqual(
+            cohens_d(arm(self.control), arm(self.treatment)),
+            (np.mean(self.treatment) - np.mean(self.control)) / pooled
+        )
+
+    def test_constant_arm_has_zero_variance(self):
+        self.assertEqual(mean_and_variance(arm([1.0] * 50)), (1.0, 0.0))
+        self.assertEqual(cohens_d(arm([1.0] * 5), arm([1.0] * 5)), 0.0)
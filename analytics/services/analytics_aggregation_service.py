@@ -2,14 +2,19 @@
 
 This service handles aggregation and analysis of user activity data
 for analytics reporting and insights.
+
+Activity summaries and daily trends read the hourly/daily ActivityAggregation
+rollups maintained by user_activity.tasks.aggregate_daily_activities, so they
+cover whole UTC days and are as fresh as the last rollup run.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Dict, List, Optional, Any
 from django.db.models import Count, Avg, Sum, Q
 from django.utils import timezone
 
-from user_activity.models import UserActivity, ContentInteraction, ProfileActivity, MediaInteraction, SocialInteraction, SessionActivity
+from user_activity.models import UserActivity
+from user_activity.services.aggregation_service import AggregationService, ENGAGEMENT_SOURCES, ROLLUP_SOURCES
 
 
 class AnalyticsAggregationService:
@@ -22,79 +27,34 @@ class AnalyticsAggregationService:
             end_date = timezone.now()
             start_date = end_date - timedelta(days=days)
             
-            # Aggregate from all activity models
-            user_activities = UserActivity.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            content_interactions = ContentInteraction.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            profile_activities = ProfileActivity.objects.filter(
-                visitor_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            media_interactions = MediaInteraction.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            social_interactions = SocialInteraction.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            session_activities = SessionActivity.objects.filter(
-                user_id=user_id,
-                start_time__gte=start_date,
-                start_time__lte=end_date
-            )
-            
-            # Calculate totals
-            total_activities = (
-                user_activities.count() +
-                content_interactions.count() +
-                profile_activities.count() +
-                media_interactions.count() +
-                social_interactions.count() +
-                session_activities.count()
-            )
+            # Daily rollups cover every activity model
+            counts = AggregationService.summarize(user_id, start_date.date(), end_date.date())
             
             # Activity breakdown by model
-            activity_breakdown = {
-                'user_activities': user_activities.count(),
-                'content_interactions': content_interactions.count(),
-                'profile_activities': profile_activities.count(),
-                'media_interactions': media_interactions.count(),
-                'social_interactions': social_interactions.count(),
-                'session_activities': session_activities.count()
-            }
-            
-            # Content interaction breakdown
-            content_by_type = content_interactions.values('content_type').annotate(
-                count=Count('id')
-            ).order_by('-count')
+            activity_breakdown = {source: counts.get(source, 0) for source in ROLLUP_SOURCES}
+            total_activities = sum(activity_breakdown.values())
             
-            interaction_by_type = content_interactions.values('interaction_type').annotate(
-                count=Count('id')
-            ).order_by('-count')
+            # Content interaction breakdown ("<content_type>/<interaction_type>" counts)
+            content_by_type = {}
+            interaction_by_type = {}
+            for kind, count in counts['types'].get('content_interactions', {}).items():
+                content_type, _, interaction_type = kind.partition('/')
+                content_by_type[content_type] = content_by_type.get(content_type, 0) + count
+                interaction_by_type[interaction_type] = interaction_by_type.get(interaction_type, 0) + count
             
             return {
                 'user_id': user_id,
                 'period_days': days,
                 'total_activities': total_activities,
                 'activity_breakdown': activity_breakdown,
-                'content_by_type': list(content_by_type),
-                'interaction_by_type': list(interaction_by_type),
+                'content_by_type': [
+                    {'content_type': k, 'count': v}
+                    for k, v in sorted(content_by_type.items(), key=lambda item: -item[1])
+                ],
+                'interaction_by_type': [
+                    {'interaction_type': k, 'count': v}
+                    for k, v in sorted(interaction_by_type.items(), key=lambda item: -item[1])
+                ],
                 'average_daily_activities': total_activities / days if days > 0 else 0
             }
         except Exception as e:
@@ -108,92 +68,23 @@ class AnalyticsAggregationService:
     def get_user_engagement_trends(user_id: str, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
         """Get user engagement trends over time with daily breakdown."""
         try:
-            from user_activity.models import ContentInteraction, SocialInteraction, SessionActivity
-            
             trends = []
             current_date = start_date.date()
             end_date_only = end_date.date()
             
+            # One read of the daily rollups; days without a bucket had no activity
+            buckets = AggregationService.daily_buckets(user_id, current_date, end_date_only)
+            
             while current_date <= end_date_only:
-                day_start = timezone.make_aware(datetime.combine(current_date, datetime.min.time()))
-                day_end = day_start + timedelta(days=1)
-                
-                # Get activities for this day
-                daily_activities = UserActivity.objects.filter(
-                    user_id=user_id,
-                    created_at__gte=day_start,
-                    created_at__lt=day_end
-                )
-                
-                # Get content interactions for this day
-                daily_content_interactions = ContentInteraction.objects.filter(
-                    user_id=user_id,
-                    created_at__gte=day_start,
-                    created_at__lt=day_end
-                )
-                
-                # Get social interactions for this day
-                daily_social_interactions = SocialInteraction.objects.filter(
-                    user_id=user_id,
-                    created_at__gte=day_start,
-                    created_at__lt=day_end
-                )
-                
-                # Calculate daily interactions
-                daily_interactions = (
-                    daily_activities.count() + 
-                    daily_content_interactions.count() + 
-                    daily_social_interactions.count()
-                )
-                
-                # Calculate active hours (estimate based on activity spread)
-                active_hours = 0.0
-                if daily_interactions > 0:
-                    # Get unique hours when activities occurred
-                    activity_hours = set()
-                    
-                    for activity in daily_activities:
-                        activity_hours.add(activity.created_at.hour)
-                    
-                    for interaction in daily_content_interactions:
-                        activity_hours.add(interaction.created_at.hour)
-                    
-                    for interaction in daily_social_interactions:
-                        activity_hours.add(interaction.created_at.hour)
-                    
-                    active_hours = float(len(activity_hours))
-                
-                # Calculate engagement score (simple algorithm)
-                engagement_score = 0.0
-                if daily_interactions > 0:
-                    # Base score from interactions (normalized to 0-5)
-                    interaction_score = min(daily_interactions / 10.0, 5.0)
-                    
-                    # Bonus for active hours (normalized to 0-3)
-                    hours_score = min(active_hours / 8.0, 3.0)
-                    
-                    # Bonus for variety of interaction types
-                    variety_score = 0.0
-                    interaction_types = set()
-                    
-                    for activity in daily_activities:
-                        interaction_types.add(activity.activity_type)
-                    
-                    for interaction in daily_content_interactions:
-                        interaction_types.add(interaction.interaction_type)
-                    
-                    for interaction in daily_social_interactions:
-                        interaction_types.add(interaction.interaction_type)
-                    
-                    variety_score = min(len(interaction_types) / 5.0, 2.0)
-                    
-                    engagement_score = interaction_score + hours_score + variety_score
+                day_start = datetime.combine(current_date, datetime.min.time(), tzinfo=dt_timezone.utc)
+                bucket = buckets.get(current_date)
+                counts = bucket.activity_counts if bucket else {}
                 
                 trends.append({
                     'date': day_start,
-                    'daily_interactions': daily_interactions,
-                    'engagement_score': round(engagement_score, 2),
-                    'active_hours': round(active_hours, 2)
+                    'daily_interactions': sum(counts.get(source, 0) for source in ENGAGEMENT_SOURCES),
+                    'engagement_score': round(bucket.engagement_score, 2) if bucket else 0.0,
+                    'active_hours': float(counts.get('active_hours', 0))
                 })
                 
                 current_date += timedelta(days=1)
@@ -208,73 +99,32 @@ class AnalyticsAggregationService:
     def get_user_activity_summary(user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get activity summary for a user over specified days with GraphQL-compatible fields."""
         try:
-            from django.contrib.auth.models import User
-            from user_activity.models import ContentInteraction, SocialInteraction
-            
             end_date = timezone.now()
             start_date = end_date - timedelta(days=days)
             
-            # Get all user activities in the period
-            activities = UserActivity.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
-            
-            # Get content interactions
-            content_interactions = ContentInteraction.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
+            counts = AggregationService.summarize(user_id, start_date.date(), end_date.date())
+            activity_types = counts['types'].get('user_activities', {})
+            content_types = counts['types'].get('content_interactions', {})
+            social_types = counts['types'].get('social_interactions', {})
             
-            # Get social interactions
-            social_interactions = SocialInteraction.objects.filter(
-                user_id=user_id,
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            )
+            def content_count(interaction_type):
+                return sum(v for k, v in content_types.items() if k.partition('/')[2] == interaction_type)
             
             # Calculate specific metrics for GraphQL
-            total_interactions = activities.count() + content_interactions.count() + social_interactions.count()
-            
-            # Posts created (from content interactions or activities)
-            posts_created = content_interactions.filter(
-                content_type='post',
-                interaction_type='view'  # Assuming view indicates creation context
-            ).count()
-            
-            # Communities joined (from social interactions)
-            communities_joined = social_interactions.filter(
-                interaction_type='group_join'
-            ).count()
-            
-            # Connections made (from social interactions)
-            connections_made = social_interactions.filter(
-                interaction_type='connection_accept'
-            ).count()
-            
-            # Likes given (from content interactions)
-            likes_given = content_interactions.filter(
-                interaction_type='like'
-            ).count()
-            
-            # Comments made (from content interactions)
-            comments_made = content_interactions.filter(
-                interaction_type='comment'
-            ).count()
+            total_interactions = sum(counts.get(source, 0) for source in ENGAGEMENT_SOURCES)
             
             return {
                 'user_id': user_id,
                 'period_days': days,
                 'total_interactions': total_interactions,
-                'posts_created': posts_created,
-                'communities_joined': communities_joined,
-                'connections_made': connections_made,
-                'likes_given': likes_given,
-                'comments_made': comments_made,
-                'total_activities': activities.count(),
-                'unique_activity_types': activities.values('activity_type').distinct().count(),
+                # Posts created (from content interactions; view indicates creation context)
+                'posts_created': content_types.get('post/view', 0),
+                'communities_joined': social_types.get('group_join', 0),
+                'connections_made': social_types.get('connection_accept', 0),
+                'likes_given': content_count('like'),
+                'comments_made': content_count('comment'),
+                'total_activities': counts.get('user_activities', 0),
+                'unique_activity_types': len(activity_types),
                 'average_daily_activities': total_interactions / days if days > 0 else 0
             }
         except Exception as e:
@@ -10,6 +10,7 @@ import mimetypes
 import os
 from graphql import GraphQLError
 
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 
 def generate_presigned_url(image_id):
@@ -36,52 +37,88 @@ def generate_presigned_url(image_id):
     
 
 
-def generate_file_info(image_id):
+FILE_INFO_CACHE_TTL = int(os.getenv('FILE_INFO_CACHE_TTL', '3600'))
+
+_EMPTY_FILE_INFO = {
+    'url': None,
+    'file_extension': None,
+    'file_type': None,
+    'file_size': None
+}
+
+
+def _file_info_cache_key(image_id):
+    return f"file_info:{image_id}"
+
+
+def _build_file_info(image):
+    """Build file info from the row alone; no storage round trip."""
+    file_name = image.file.name
     try:
-        if image_id is None or image_id == "":
-            return {
-                'url': None,
-                'file_extension': None,
-                'file_type': None,
-                'file_size': None
-            }
-        image = UploadFiles.objects.get(id=image_id)
-        file_name = image.file.name
+        file_url = default_storage.url(file_name)
+    except Exception:
         file_url = None
-        file_size = 0
+    file_extension = file_name.split('.')[-1] if '.' in file_name else 'unknown'
+    # Rows uploaded before metadata was captured fall back to a filename guess
+    mime_type = image.mime_type or mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+
+    return {
+        'url': file_url if file_url else f"https://{os.getenv('AWS_S3_CUSTOM_DOMAIN')}/{file_name}",
+        'file_extension': file_extension,
+        'file_type': mime_type,
+        'file_size': image.file_size or 0
+    }
+
+
+def generate_file_info_bulk(image_ids):
+    """
+    Resolve file info for many ids with one cache read and one `id__in` query.
+
+    Returns a dict keyed by the ids as given (stringified); unknown or invalid
+    ids map to the empty file info. Resolved entries are kept in the shared
+    cache for FILE_INFO_CACHE_TTL seconds.
+    """
+    ids = []
+    for image_id in image_ids or []:
+        if image_id is None or image_id == "":
+            continue
+        image_id = str(image_id)
+        if image_id not in ids:
+            ids.append(image_id)
+    if not ids:
+        return {}
+
+    result = {}
+    try:
+        cached = cache.get_many([_file_info_cache_key(i) for i in ids])
+    except Exception:
+        cached = {}
+    for image_id in ids:
+        info = cached.get(_file_info_cache_key(image_id))
+        if info is not None:
+            result[image_id] = info
+
+    missing = [i for i in ids if i not in result and i.isdigit()]
+    if missing:
         try:
-            file_url = default_storage.url(file_name) if default_storage.exists(file_name) else None
-            # file_size = default_storage.size(file_name)
+            fresh = {}
+            for image in UploadFiles.objects.filter(id__in=missing):
+                fresh[str(image.id)] = _build_file_info(image)
+            result.update(fresh)
+            if fresh:
+                cache.set_many({_file_info_cache_key(k): v for k, v in fresh.items()}, FILE_INFO_CACHE_TTL)
         except Exception as e:
-            file_url = f"https://{os.getenv('AWS_S3_CUSTOM_DOMAIN')}/{file_name}"
-            # file_size = image.file.size if hasattr(image.file, 'size') else 0
-        file_extension = file_name.split('.')[-1] if '.' in file_name else 'unknown'
-        mime_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
-
-        return {
-            'url': file_url if file_url else f"https://{os.getenv('AWS_S3_CUSTOM_DOMAIN')}/{file_name}",
-            'file_extension': file_extension,
-            'file_type': mime_type,
-            'file_size': file_size
-        }
-    except UploadFiles.DoesNotExist:
-        return {
-            'url': None,
-            'file_extension': None,
-            'file_type': None,
-            'file_size': None
-        }
-    except Exception as e:
-        # Initialize file_url and file_name to avoid reference before assignment
-        file_url = None
-        file_name = ""
-        print(f"Error in generate_file_info: {e}")
-        return {
-            'url': None,
-            'file_extension': None,
-            'file_type': None,
-            'file_size': None
-        }
+            print(f"Error in generate_file_info_bulk: {e}")
+
+    for image_id in ids:
+        result.setdefault(image_id, dict(_EMPTY_FILE_INFO))
+    return result
+
+
+def generate_file_info(image_id):
+    if image_id is None or image_id == "":
+        return dict(_EMPTY_FILE_INFO)
+    return generate_file_info_bulk([image_id]).get(str(image_id), dict(_EMPTY_FILE_INFO))
 
 
 def get_valid_image(image_id: str):
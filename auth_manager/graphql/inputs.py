@@ -154,7 +154,6 @@ class DeleteInput(graphene.InputObjectType):
     uid = custom_graphql_validator.String.add_option("uid", "Delete")(required=True)
 
 class ScoreInput(graphene.InputObjectType):
-    vibers_count = custom_graphql_validator.Float.add_option("vibersCount", "Score")()
     cumulative_vibescore = custom_graphql_validator.Float.add_option("cumulativeVibescore", "Score")()
     intelligence_score = custom_graphql_validator.Float.add_option("intelligenceScore", "Score")()
     appeal_score = custom_graphql_validator.Float.add_option("appealScore", "Score")()
@@ -165,7 +164,6 @@ class ScoreInput(graphene.InputObjectType):
 
 class UpdateScoreInput(graphene.InputObjectType):
     uid = custom_graphql_validator.String.add_option("uid", "UpdateScore")(required=True)
-    vibers_count = custom_graphql_validator.Float.add_option("vibersCount", "UpdateScore")()
     cumulative_vibescore = custom_graphql_validator.Float.add_option("cumulativeVibescore", "UpdateScore")()
     intelligence_score = custom_graphql_validator.Float.add_option("intelligenceScore", "UpdateScore")()
     appeal_score = custom_graphql_validator.Float.add_option("appealScore", "UpdateScore")()
@@ -51,6 +51,8 @@ from connection.models import ConnectionV2,CircleV2
 from vibe_manager.utils import VibeUtils
 from auth_manager.services.email_template import generate_payload 
 from auth_manager.Utils.matrix_avatar_manager import set_user_avatar_and_score
+from realtime.identity import invalidate_identity
+from notification.recipients import invalidate_device_token
 from auth_manager.redis import *
 from vibe_manager.services.vibe_activity_service import VibeActivityService
 import logging
@@ -424,6 +426,8 @@ class CreateProfile(Mutation):
 
             # Save the profile
             profile.save() 
+            if profile.device_id:
+                invalidate_device_token(user.uid)
             print(f"DEBUG: profile_pic_id provided1: {input.get('profile_pic_id')}")
             # Auto-update Matrix avatar if profile_pic_id is being updated
             if input.get('profile_pic_id'):
@@ -556,6 +560,7 @@ class UpdateUserProfile(graphene.Mutation):
        
 
         # Update profile fields
+            device_changed = 'device_id' in input and input['device_id'] != profile_node.device_id
             if 'device_id' in input:
                 profile_node.device_id = input['device_id']
 
@@ -606,6 +611,8 @@ class UpdateUserProfile(graphene.Mutation):
             user.save()
             profile_node.save()
             onboarding_status.save()
+            if device_changed:
+                invalidate_device_token(Users.nodes.get(user_id=user_id).uid)
 
             if bio := input.get("bio"):
                profile_node.bio = bio
@@ -708,6 +715,7 @@ def delete_user(user):
                 print("No profile found for user")
             user.delete()
             print("User deleted successfully")
+        invalidate_identity(user.user_id)
     except Exception as e:
         print("Error deleting user or profile:", e)
         raise e
@@ -901,8 +909,11 @@ class LoginUsingUsernameEmail(graphene.Mutation):
                     user_node = Users.nodes.get(user_id=user.id)
                     profile = user_node.profile.single()
                     if profile:
+                        device_changed = profile.device_id != device_id
                         profile.device_id = device_id
                         profile.save()
+                        if device_changed:
+                            invalidate_device_token(user_node.uid)
                         print(f"Device ID {device_id} stored for user {user.username}")
                     else:
                         print(f"No profile found for user {user.username}")
@@ -997,8 +1008,11 @@ class SocialLogin(graphene.Mutation):
                 try:
                     profile = users_node.profile.single()
                     if profile:
+                        device_changed = profile.device_id != device_id
                         profile.device_id = device_id
                         profile.save()
+                        if device_changed:
+                            invalidate_device_token(users_node.uid)
                 except Exception as e:
                     print(f"Error storing device_id: {str(e)}")
 
@@ -1100,8 +1114,11 @@ class AppleSocialLogin(graphene.Mutation):
                 try:
                     profile = users_node.profile.single()
                     if profile:
+                        device_changed = profile.device_id != device_id
                         profile.device_id = device_id
                         profile.save()
+                        if device_changed:
+                            invalidate_device_token(users_node.uid)
                 except Exception as e:
                     print(f"Error storing device_id: {str(e)}")
 
@@ -1193,6 +1210,7 @@ class Logout(graphene.Mutation):
                         if profile and profile.device_id:
                             profile.device_id = None
                             profile.save()
+                            invalidate_device_token(user_node.uid)
                     except Exception as e:
                         print(f"Error removing device_id during logout: {str(e)}")
                         # Don't fail logout if device_id removal fails
@@ -1629,7 +1647,6 @@ class CreateScore(Mutation):
     Args:
         input (ScoreInput): Score data containing:
             - profile_uid: UID of the profile to create scores for
-            - vibers_count: Number of vibers (default: 2.0)
             - cumulative_vibescore: Cumulative vibe score (default: 2.0)
             - intelligence_score: Intelligence rating (default: 2.0)
             - appeal_score: Appeal rating (default: 2.0)
@@ -1651,6 +1668,7 @@ class CreateScore(Mutation):
         - Requires login and superuser privileges
         - Links score to specified profile
         - All scores default to 2.0 if not specified
+        - vibers_count is maintained by vibe scoring and cannot be set here
     """
     score = graphene.Field(ScoreType)
     success = graphene.Boolean()
@@ -1668,7 +1686,6 @@ class CreateScore(Mutation):
                 raise GraphQLError ("Authentication Failure")
             profile = Profile.nodes.get(uid=input.profile_uid)
             score = Score(
-                vibers_count=input.get('vibers_count', 2.0),
                 cumulative_vibescore=input.get('cumulative_vibescore', 2.0),
                 intelligence_score=input.get('intelligence_score', 2.0),
                 appeal_score=input.get('appeal_score', 2.0),
@@ -1694,7 +1711,7 @@ class UpdateScore(Mutation):
     Args:
         input (UpdateScoreInput): Update data containing:
             - uid: UID of the score to update
-            - Score fields to update (vibers_count, cumulative_vibescore, etc.)
+            - Score fields to update (cumulative_vibescore, intelligence_score, etc.)
     
     Returns:
         UpdateScore: Response containing:
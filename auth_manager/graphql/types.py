@@ -2,11 +2,10 @@
 import graphene
 from graphene import ObjectType
 from  auth_manager.models import *
-from auth_manager.Utils import generate_presigned_url
 from graphene_django import DjangoObjectType
 from django.conf import settings
 from community.models import CommunityReactionManager
-from post.models import PostReactionManager
+from post.utils.reaction_counts import total_vibes as post_total_vibes
 from connection.utils.score_generator import generate_connection_score
 
 
@@ -14,13 +13,14 @@ from django.core.files.storage import default_storage
 from urllib.parse import urljoin
 from neomodel import db
 from connection.models import Connection
-from auth_manager.Utils import generate_presigned_url
 from connection.utils import relation as RELATIONUTILLS
 # from vibe_manager.models import IndividualVibe  # Commented to avoid circular import
 from datetime import datetime
 from community.models import Community
 from post.models import Post
 from django.apps import apps
+from post.utils.relationship_loader import load_one, load_all
+from post.utils.file_url import FileURL
 
 
 class FileDetailType(graphene.ObjectType):
@@ -93,8 +93,8 @@ class UserType(ObjectType):
                 updated_by=user.updated_by,
                 is_bot=user.is_bot,
                 persona=user.persona,
-                connection_stat=ConnectionStatsType.from_neomodel(user.connection_stat.single()) if hasattr(user, 'connection_stat') and user.connection_stat.single() else 0,
-                profile=ProfileNoUserType.from_neomodel(user.profile.single()) if hasattr(user, 'profile') and user.profile.single() else None,
+                connection_stat=ConnectionStatsType.from_neomodel(load_one(user, 'connection_stat')) if hasattr(user, 'connection_stat') and load_one(user, 'connection_stat') else 0,
+                profile=ProfileNoUserType.from_neomodel(load_one(user, 'profile')) if hasattr(user, 'profile') and load_one(user, 'profile') else None,
                 # connection=ConnectionNoUserType.from_neomodel(user.connection.single()) if user.connection.single() else None,
                 
         )
@@ -129,8 +129,8 @@ class UserType(ObjectType):
                     updated_by = user.get('updated_by'),
                     is_bot = user.get('is_bot'),
                     persona = user.get('persona'),
-                    connection_stat=ConnectionStatsType.from_neomodel(user_node.connection_stat.single()) if user_node and hasattr(user_node, 'connection_stat') and user_node.connection_stat.single() else 0,
-                    profile=ProfileNoUserType.from_neomodel(user_node.profile.single()) if user_node and hasattr(user_node, 'profile') and user_node.profile.single() else None,
+                    connection_stat=ConnectionStatsType.from_neomodel(load_one(user_node, 'connection_stat')) if user_node and hasattr(user_node, 'connection_stat') and load_one(user_node, 'connection_stat') else 0,
+                    profile=ProfileNoUserType.from_neomodel(load_one(user_node, 'profile')) if user_node and hasattr(user_node, 'profile') and load_one(user_node, 'profile') else None,
         
                 )
             except Exception as nested_e:
@@ -175,6 +175,12 @@ class ProfileType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, profile):
+        achievements, experiences = list(profile.achievement), list(profile.experience)
+        skills, educations = list(profile.skill), list(profile.education)
+        FileURL.store_file_urls_for(
+            [profile, *achievements, *experiences, *skills, *educations],
+            'profile_pic_id', 'cover_image_id', 'file_id',
+        )
         return cls(
             uid=profile.uid,
             user_id=profile.user_id,
@@ -191,20 +197,20 @@ class ProfileType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)) if profile.profile_pic_id else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)) if profile.profile_pic_id else None,
             cover_image_id=profile.cover_image_id,
-            cover_image=FileDetailType(**generate_presigned_url.generate_file_info(profile.cover_image_id)) if profile.cover_image_id else None,    
-            user=UserType.from_neomodel(profile.user.single()) if profile.user.single() else None,
+            cover_image=FileDetailType(**FileURL.get_file_url(profile.cover_image_id)) if profile.cover_image_id else None,    
+            user=UserType.from_neomodel(load_one(profile, 'user')) if load_one(profile, 'user') else None,
             city=profile.city,
             state=profile.state,
             onboarding_status=[OnboardingStatusNonProfileType.from_neomodel(status) for status in profile.onboarding],
             contact_info=[ContactInfoTypeNoProfile.from_neomodel(contact) for contact in profile.contactinfo],
-            score=ScoreNonProfileType.from_neomodel(profile.score.single()) if profile.score.single() else None,
+            score=ScoreNonProfileType.from_neomodel(load_one(profile, 'score')) if load_one(profile, 'score') else None,
             interest=[InterestNonProfileType.from_neomodel(interest) for interest in profile.interest],
-            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in profile.achievement],
-            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in profile.experience],
-            skill=[SkillNonProfileType.from_neomodel(skill) for skill in profile.skill],
-            education=[EducationNonProfileType.from_neomodel(education) for education in profile.education],
+            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in achievements],
+            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in experiences],
+            skill=[SkillNonProfileType.from_neomodel(skill) for skill in skills],
+            education=[EducationNonProfileType.from_neomodel(education) for education in educations],
             mentioned_users=cls._get_bio_mentioned_users(profile)  # Add this line
         )
     
@@ -218,7 +224,7 @@ class ProfileType(ObjectType):
             
             mentioned_users = []
             for mention in mentions:
-                mentioned_user = mention.mentioned_user.single()
+                mentioned_user = load_one(mention, 'mentioned_user')
                 if mentioned_user:
                     mentioned_users.append(UserType.from_neomodel(mentioned_user))
             
@@ -250,7 +256,7 @@ class OnboardingStatusType(ObjectType):
             last_name_set=onboarding_status.last_name_set,
             gender_set=onboarding_status.gender_set,
             bio_set=onboarding_status.bio_set,
-            profile=ProfileType.from_neomodel(onboarding_status.profile.single()) if onboarding_status.profile.single() else None
+            profile=ProfileType.from_neomodel(load_one(onboarding_status, 'profile')) if load_one(onboarding_status, 'profile') else None
         )
 
 class ContactInfoType(ObjectType):
@@ -269,7 +275,7 @@ class ContactInfoType(ObjectType):
             value=contact_info.value,
             platform=contact_info.platform,
             link=contact_info.link,
-            profile=ProfileType.from_neomodel(contact_info.profile.single()) if contact_info.profile.single() else None
+            profile=ProfileType.from_neomodel(load_one(contact_info, 'profile')) if load_one(contact_info, 'profile') else None
         )
 
 class ScoreType(ObjectType):
@@ -296,7 +302,7 @@ class ScoreType(ObjectType):
             human_score=score.human_score,
             repo_score=score.repo_score,
             overall_score=score.overall_score,
-            profile=ProfileType.from_neomodel(score.profile.single()) if score.profile.single() else None,
+            profile=ProfileType.from_neomodel(load_one(score, 'profile')) if load_one(score, 'profile') else None,
         )
 
 class InterestType(ObjectType):
@@ -311,7 +317,7 @@ class InterestType(ObjectType):
             uid=interest.uid,
             is_deleted=interest.is_deleted,
             names=interest.names,
-            profile=ProfileType.from_neomodel(interest.profile.single()) if interest.profile.single() else None,
+            profile=ProfileType.from_neomodel(load_one(interest, 'profile')) if load_one(interest, 'profile') else None,
         )
 
 
@@ -339,11 +345,11 @@ class AchievementType(ObjectType):
             date_achieved = achievement.date_achieved,
             is_deleted=achievement.is_deleted,
             file_id=achievement.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
             from_source = achievement.from_source,
             from_date = achievement.from_date,
             to_date = achievement.to_date,
-            profile=ProfileType.from_neomodel(achievement.profile.single()) if achievement.profile.single() else None,
+            profile=ProfileType.from_neomodel(load_one(achievement, 'profile')) if load_one(achievement, 'profile') else None,
         )
      
 
@@ -489,7 +495,7 @@ class AchievementNonProfileType(ObjectType):
                 from_date = achievement.from_date,
                 to_date = achievement.to_date,
                 file_id=achievement.file_id,
-                file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
+                file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
                 score=generate_connection_score()
             )
         else:
@@ -512,7 +518,7 @@ class AchievementNonProfileType(ObjectType):
                 to_date = to_date,
                 file_id = achievement.get('file_id'),
                 file_url = (
-                    [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) 
+                    [FileDetailType(**FileURL.get_file_url(file_id)) 
                     for file_id in achievement.get('file_id', [])] if achievement.get('file_id') else None
                 ),
                 score=generate_connection_score()
@@ -542,7 +548,7 @@ class EducationNonProfileType(ObjectType):
                 to_date = education.to_date,
                 created_on =  education.created_on,
                 file_id=education.file_id,
-                file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in education.file_id] if education.file_id else None),
+                file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in education.file_id] if education.file_id else None),
                 score=generate_connection_score()
             )
         else:
@@ -564,7 +570,7 @@ class EducationNonProfileType(ObjectType):
                 created_on = created_on,
                 file_id = education.get('file_id'),
                 file_url = (
-                    [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) 
+                    [FileDetailType(**FileURL.get_file_url(file_id)) 
                     for file_id in education.get('file_id', [])] if education.get('file_id') else None
                 ),
                 score=generate_connection_score()
@@ -591,7 +597,7 @@ class SkillNonProfileType(ObjectType):
                 to_date = skill.to_date,
                 created_on =  skill.created_on,
                 file_id=skill.file_id,
-                file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in skill.file_id] if skill.file_id else None),
+                file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in skill.file_id] if skill.file_id else None),
                 score=generate_connection_score()
             )
         else:
@@ -616,7 +622,7 @@ class SkillNonProfileType(ObjectType):
                 created_on = created_on,
                 file_id = skill.get('file_id'),
                 file_url = (
-                    [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) 
+                    [FileDetailType(**FileURL.get_file_url(file_id)) 
                     for file_id in skill.get('file_id', [])] if skill.get('file_id') else None
                 ),
                 score=generate_connection_score()
@@ -640,8 +646,8 @@ class UsersReviewType(ObjectType):
     def from_neomodel(cls, users_review):
         # print(users_review)
         # Assuming `users_review.byuser` and `users_review.touser` are the relationships to User nodes
-        byuser_node = users_review.byuser.single()
-        touser_node = users_review.touser.single()
+        byuser_node = load_one(users_review, 'byuser')
+        touser_node = load_one(users_review, 'touser')
 
         if not byuser_node or not touser_node:
             return None
@@ -718,7 +724,7 @@ class ExperienceNonProfileType(ObjectType):
                 to_date = experience.to_date,
                 file_id = experience.file_id,
                 file_url = (
-                    [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) 
+                    [FileDetailType(**FileURL.get_file_url(file_id)) 
                     for file_id in experience.file_id] if experience.file_id else None
                 ),
                 score=generate_connection_score()
@@ -743,7 +749,7 @@ class ExperienceNonProfileType(ObjectType):
                 to_date = to_date,
                 file_id = experience.get('file_id'),
                 file_url = (
-                    [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) 
+                    [FileDetailType(**FileURL.get_file_url(file_id)) 
                     for file_id in experience.get('file_id', [])] if experience.get('file_id') else None
                 ),
                 score=generate_connection_score()
@@ -778,7 +784,7 @@ class UserVibeRepoType(ObjectType):
     def from_neomodel(cls, user_vibe_repo):
         return cls(
             uid=user_vibe_repo.uid,
-            user=UserType.from_neomodel(user_vibe_repo.user.single()) if user_vibe_repo.user.single() else None,
+            user=UserType.from_neomodel(load_one(user_vibe_repo, 'user')) if load_one(user_vibe_repo, 'user') else None,
             category=user_vibe_repo.category,
             custom_value=user_vibe_repo.custom_value,
             created_at=user_vibe_repo.created_at,
@@ -844,6 +850,12 @@ class ProfileNoUserType(ObjectType):
 
 
     def from_neomodel(cls, profile):
+        achievements, experiences = list(profile.achievement), list(profile.experience)
+        skills, educations = list(profile.skill), list(profile.education)
+        FileURL.store_file_urls_for(
+            [profile, *achievements, *experiences, *skills, *educations],
+            'profile_pic_id', 'cover_image_id', 'file_id',
+        )
         return cls(
             uid=profile.uid,
             user_id=profile.user_id,
@@ -860,17 +872,17 @@ class ProfileNoUserType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)) if profile.profile_pic_id else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)) if profile.profile_pic_id else None,
             cover_image_id=profile.cover_image_id,
-            cover_image=FileDetailType(**generate_presigned_url.generate_file_info(profile.cover_image_id)) if profile.cover_image_id else None,
+            cover_image=FileDetailType(**FileURL.get_file_url(profile.cover_image_id)) if profile.cover_image_id else None,
             onboarding_status=[OnboardingStatusNonProfileType.from_neomodel(status) for status in profile.onboarding],
             contact_info=[ContactInfoTypeNoProfile.from_neomodel(contact) for contact in profile.contactinfo],
-            score=ScoreNonProfileType.from_neomodel(profile.score.single()) if profile.score.single() else None,
+            score=ScoreNonProfileType.from_neomodel(load_one(profile, 'score')) if load_one(profile, 'score') else None,
             interest=[InterestNonProfileType.from_neomodel(interest) for interest in profile.interest],
-            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in profile.achievement],
-            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in profile.experience],
-            skill=[SkillNonProfileType.from_neomodel(skill) for skill in profile.skill],
-            education=[EducationNonProfileType.from_neomodel(education) for education in profile.education]
+            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in achievements],
+            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in experiences],
+            skill=[SkillNonProfileType.from_neomodel(skill) for skill in skills],
+            education=[EducationNonProfileType.from_neomodel(education) for education in educations]
         )
 
 class CircleUserType(graphene.ObjectType):
@@ -989,9 +1001,16 @@ class ProfileDetailsVibeType(ObjectType):
             sorted_reactions = IndividualVibe.objects.all()[:10]
             vibes_count = 0
 
+        achievements, experiences = list(profile.achievement), list(profile.experience)
+        skills, educations = list(profile.skill), list(profile.education)
+        FileURL.store_file_urls_for(
+            [profile, *achievements, *experiences, *skills, *educations],
+            'profile_pic_id', 'cover_image_id', 'file_id',
+        )
+
         try:
-            user_for_posts = profile.user.single() if profile.user.single() else user_node
-            post_count = len([post for post in user_for_posts.post.all() if not post.is_deleted]) if user_for_posts else 0
+            user_for_posts = load_one(profile, 'user') if load_one(profile, 'user') else user_node
+            post_count = len([post for post in load_all(user_for_posts, 'post') if not post.is_deleted]) if user_for_posts else 0
         except Exception:
             post_count = 0    
 
@@ -1011,30 +1030,30 @@ class ProfileDetailsVibeType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)) if profile.profile_pic_id else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)) if profile.profile_pic_id else None,
             cover_image_id=profile.cover_image_id,
-            cover_image=FileDetailType(**generate_presigned_url.generate_file_info(profile.cover_image_id)) if profile.cover_image_id else None,
-            user=UserType.from_neomodel(profile.user.single()) if profile.user.single() else None,
+            cover_image=FileDetailType(**FileURL.get_file_url(profile.cover_image_id)) if profile.cover_image_id else None,
+            user=UserType.from_neomodel(load_one(profile, 'user')) if load_one(profile, 'user') else None,
             city=profile.city,
             state=profile.state,
             onboarding_status=[OnboardingStatusNonProfileType.from_neomodel(status) for status in profile.onboarding],
             contact_info=[ContactInfoTypeNoProfile.from_neomodel(contact) for contact in profile.contactinfo],
-            score=ScoreNonProfileType.from_neomodel(profile.score.single()) if profile.score.single() else None,
+            score=ScoreNonProfileType.from_neomodel(load_one(profile, 'score')) if load_one(profile, 'score') else None,
             interest=[InterestNonProfileType.from_neomodel(interest) for interest in profile.interest],
-            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in profile.achievement],
-            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in profile.experience],
-            skill=[SkillNonProfileType.from_neomodel(skill) for skill in profile.skill],
-            education=[EducationNonProfileType.from_neomodel(education) for education in profile.education],
+            achievement=[AchievementNonProfileType.from_neomodel(achievement) for achievement in achievements],
+            experience=[ExperienceNonProfileType.from_neomodel(experience) for experience in experiences],
+            skill=[SkillNonProfileType.from_neomodel(skill) for skill in skills],
+            education=[EducationNonProfileType.from_neomodel(education) for education in educations],
             profile_vibe_list=[VibeProfileListType.from_neomodel(vibe) for vibe in sorted_reactions],
-            user_review_list=[UsersReviewType.from_neomodel(review) for review in profile.user.single().user_review],
+            user_review_list=[UsersReviewType.from_neomodel(review) for review in load_one(profile, 'user').user_review],
             my_review_list = [
                 UsersReviewType.from_neomodel(review)
                 for review in sorted(
-                    profile.user.single().user_review,
+                    load_one(profile, 'user').user_review,
                     key=lambda r: r.timestamp,  # Assuming there's a timestamp attribute to sort by
                     reverse=True
                 )
-                if review.byuser.single().uid == user_node.uid
+                if load_one(review, 'byuser').uid == user_node.uid
             ],
             vibes_count=vibes_count,
             post_count=post_count,
@@ -1180,6 +1199,10 @@ class ProfileInfoType(ObjectType):
         full_name = f"{first_name} {last_name}".strip() or username or None
         
         print(f"DEBUG: Computed name = {full_name}")
+        FileURL.store_file_urls_for(
+            [profile, *(achievement_node or []), *(experience_node or []), *(skill_node or []), *(education_node or [])],
+            'profile_pic_id', 'cover_image_id', 'file_id',
+        )
             
        
         return cls(
@@ -1203,9 +1226,9 @@ class ProfileInfoType(ObjectType):
             college = profile.get('college'),
             lives_in = profile.get('lives_in'),
             profile_pic_id = profile.get('profile_pic_id'),
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.get('profile_pic_id')))if profile.get('profile_pic_id') else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.get('profile_pic_id')))if profile.get('profile_pic_id') else None,
             cover_image_id = profile.get('cover_image_id'),
-            cover_image=FileDetailType(**generate_presigned_url.generate_file_info(profile.get('cover_image_id')))if profile.get('cover_image_id') else None,
+            cover_image=FileDetailType(**FileURL.get_file_url(profile.get('cover_image_id')))if profile.get('cover_image_id') else None,
             user=UserType.from_neomodel(user) if user else None,
             city=profile.get('city'),
             state=profile.get('state'),
@@ -1314,7 +1337,7 @@ class ProfileDataType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)),
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)),
             
         )
 
@@ -1355,7 +1378,7 @@ class ProfileDataTypeV2(ObjectType):
             college=profile_data.get('college'),
             lives_in=profile_data.get('lives_in'),
             profile_pic_id=profile_data.get('profile_pic_id'),
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile_data.get('profile_pic_id'))),
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile_data.get('profile_pic_id'))),
             
         )
 
@@ -1387,7 +1410,7 @@ class UserInfoType(ObjectType):
                 user_type=user.user_type,
                 is_bot=user.is_bot,
                 persona=user.persona,
-                profile=ProfileDataType.from_neomodel(user.profile.single()) if user.profile.single() else None,
+                profile=ProfileDataType.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
                 
                 
             )
@@ -1436,21 +1459,22 @@ class BackProfileReviewType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, users_review):
-        byuser_node = users_review.byuser.single()
-        touser_node = users_review.touser.single()
+        byuser_node = load_one(users_review, 'byuser')
+        touser_node = load_one(users_review, 'touser')
         
         if not byuser_node or not touser_node:
             return None
 
         images = []
         if hasattr(users_review, 'image_ids') and users_review.image_ids:
+            FileURL.store_file_urls(users_review.image_ids)
             for image_id in users_review.image_ids:
                 if image_id:
-                    file_info = generate_presigned_url.generate_file_info(image_id)
+                    file_info = FileURL.get_file_url(image_id)
                     if file_info:
                         images.append(FileDetailType(**file_info))
         elif hasattr(users_review, 'file_id') and users_review.file_id:
-            file_info = generate_presigned_url.generate_file_info(users_review.file_id)
+            file_info = FileURL.get_file_url(users_review.file_id)
             if file_info:
                 images.append(FileDetailType(**file_info))
 
@@ -1563,7 +1587,7 @@ class BackProfileDataType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, user_node, profile, time_filter=None):
-        all_reviews = list(user_node.user_back_profile_review.all())
+        all_reviews = list(load_all(user_node, 'user_back_profile_review'))
         
         if time_filter:
             filtered_reviews = cls._filter_reviews_by_time(all_reviews, time_filter)
@@ -1694,7 +1718,7 @@ class ProfileDataReactionType(ObjectType):
     def from_neomodel(cls, like):
         return cls(
             uid=like.uid,
-            user=UserInfoType.from_neomodel(like.user.single()) if like.user.single() else None,
+            user=UserInfoType.from_neomodel(load_one(like, 'user')) if load_one(like, 'user') else None,
             reaction=like.reaction,
             vibe=like.vibe,
             timestamp=like.timestamp,
@@ -1713,7 +1737,7 @@ class ProfileDataCommentType(ObjectType):
     def from_neomodel(cls, comment_data):
         return cls(
             uid=comment_data.uid,
-            user=UserInfoType.from_neomodel(comment_data.user.single()) if comment_data.user.single() else None,
+            user=UserInfoType.from_neomodel(load_one(comment_data, 'user')) if load_one(comment_data, 'user') else None,
             comment=comment_data.content,
             timestamp=comment_data.timestamp,
             is_deleted=comment_data.is_deleted
@@ -1765,7 +1789,7 @@ class ProfileContentVibeType(ObjectType):
             individual_vibe_id=vibe.individual_vibe_id,
             vibe_name=vibe.vibe_name,
             vibe_intensity=vibe.vibe_intensity,
-            reacted_by=UserInfoType.from_neomodel(vibe.reacted_by.single()) if vibe.reacted_by.single() else None,
+            reacted_by=UserInfoType.from_neomodel(load_one(vibe, 'reacted_by')) if load_one(vibe, 'reacted_by') else None,
             timestamp=vibe.timestamp,
             is_active=vibe.is_active
         )
@@ -1813,8 +1837,8 @@ class AchievementType(ObjectType):
      @classmethod
      def from_neomodel(cls, achievement):
         # Count both old reactions and new vibe reactions
-        old_like_count = len(achievement.like.all())
-        new_vibe_count = len([v for v in achievement.vibe_reactions.all() if v.is_active]) if hasattr(achievement, 'vibe_reactions') else 0
+        old_like_count = len(load_all(achievement, 'like'))
+        new_vibe_count = len([v for v in load_all(achievement, 'vibe_reactions') if v.is_active]) if hasattr(achievement, 'vibe_reactions') else 0
         total_vibe_count = old_like_count + new_vibe_count
         
         return cls(
@@ -1827,14 +1851,14 @@ class AchievementType(ObjectType):
             to_date = achievement.to_date,
             is_deleted=achievement.is_deleted,
             file_id=achievement.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
             category="achievement",
-            comment_count= len(achievement.comment.all()),
+            comment_count= len(load_all(achievement, 'comment')),
             vibe_count= str(total_vibe_count),  # Updated to include new vibes
             vibe_list=ProfileDataVibeListType.from_neomodel(achievement.uid,"achievement"),
             comment=[ProfileDataCommentType.from_neomodel(comment) for comment in achievement.comment[:2]],
             like=[ProfileDataReactionType.from_neomodel(like) for like in achievement.like[:2]],
-            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in achievement.vibe_reactions.all() if vibe.is_active] if hasattr(achievement, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
+            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in load_all(achievement, 'vibe_reactions') if vibe.is_active] if hasattr(achievement, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
         )
      
 class EducationType(ObjectType):
@@ -1859,8 +1883,8 @@ class EducationType(ObjectType):
     @classmethod
     def from_neomodel(cls, education):
         # Count both old reactions and new vibe reactions
-        old_like_count = len(education.like.all())
-        new_vibe_count = len([v for v in education.vibe_reactions.all() if v.is_active]) if hasattr(education, 'vibe_reactions') else 0
+        old_like_count = len(load_all(education, 'like'))
+        new_vibe_count = len([v for v in load_all(education, 'vibe_reactions') if v.is_active]) if hasattr(education, 'vibe_reactions') else 0
         total_vibe_count = old_like_count + new_vibe_count
         
         return cls(
@@ -1874,16 +1898,16 @@ class EducationType(ObjectType):
             is_deleted=education.is_deleted,
             file_id=education.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in education.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in education.file_id]
                 if education.file_id else None
             ),
             category = "education",
-            comment_count=len(education.comment.all()),
+            comment_count=len(load_all(education, 'comment')),
             vibe_count=str(total_vibe_count),  # Updated to include new vibes
             vibe_list=ProfileDataVibeListType.from_neomodel(education.uid,"education"),
             comment=[ProfileDataCommentType.from_neomodel(comment) for comment in education.comment[:2]],
             like=[ProfileDataReactionType.from_neomodel(like) for like in education.like[:2]],
-            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in education.vibe_reactions.all() if vibe.is_active] if hasattr(education, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
+            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in load_all(education, 'vibe_reactions') if vibe.is_active] if hasattr(education, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
         )
 
 class ExperienceType(ObjectType):
@@ -1908,8 +1932,8 @@ class ExperienceType(ObjectType):
     @classmethod
     def from_neomodel(cls, experience):
         # Count both old reactions and new vibe reactions
-        old_like_count = len(experience.like.all())
-        new_vibe_count = len([v for v in experience.vibe_reactions.all() if v.is_active]) if hasattr(experience, 'vibe_reactions') else 0
+        old_like_count = len(load_all(experience, 'like'))
+        new_vibe_count = len([v for v in load_all(experience, 'vibe_reactions') if v.is_active]) if hasattr(experience, 'vibe_reactions') else 0
         total_vibe_count = old_like_count + new_vibe_count
         
         return cls(
@@ -1923,16 +1947,16 @@ class ExperienceType(ObjectType):
             is_deleted=experience.is_deleted,
             file_id=experience.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in experience.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in experience.file_id]
                 if experience.file_id else None
             ),
             category="experience",
-            comment_count=len(experience.comment.all()),
+            comment_count=len(load_all(experience, 'comment')),
             vibe_count=str(total_vibe_count),  # Updated to include new vibes
             vibe_list=ProfileDataVibeListType.from_neomodel(experience.uid,"experience"),
             comment=[ProfileDataCommentType.from_neomodel(comment) for comment in experience.comment[:2]],
             like=[ProfileDataReactionType.from_neomodel(like) for like in experience.like[:2]],
-            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in experience.vibe_reactions.all() if vibe.is_active] if hasattr(experience, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
+            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in load_all(experience, 'vibe_reactions') if vibe.is_active] if hasattr(experience, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
         )
 
 class SkillType(ObjectType):
@@ -1956,8 +1980,8 @@ class SkillType(ObjectType):
     @classmethod
     def from_neomodel(cls, skill):
         # Count both old reactions and new vibe reactions
-        old_like_count = len(skill.like.all())
-        new_vibe_count = len([v for v in skill.vibe_reactions.all() if v.is_active]) if hasattr(skill, 'vibe_reactions') else 0
+        old_like_count = len(load_all(skill, 'like'))
+        new_vibe_count = len([v for v in load_all(skill, 'vibe_reactions') if v.is_active]) if hasattr(skill, 'vibe_reactions') else 0
         total_vibe_count = old_like_count + new_vibe_count
         
         return cls(
@@ -1970,16 +1994,16 @@ class SkillType(ObjectType):
             is_deleted=skill.is_deleted,
             file_id=skill.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in skill.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in skill.file_id]
                 if skill.file_id else None
             ),
             category = "skill",
-            comment_count=len(skill.comment.all()),
+            comment_count=len(load_all(skill, 'comment')),
             vibe_count=str(total_vibe_count),  # Updated to include new vibes
             vibe_list=ProfileDataVibeListType.from_neomodel(skill.uid,"skill"),
             comment=[ProfileDataCommentType.from_neomodel(comment) for comment in skill.comment[:2]],
             like=[ProfileDataReactionType.from_neomodel(like) for like in skill.like[:2]],
-            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in skill.vibe_reactions.all() if vibe.is_active] if hasattr(skill, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
+            vibe_reactions_list=[ProfileContentVibeType.from_neomodel(vibe) for vibe in load_all(skill, 'vibe_reactions') if vibe.is_active] if hasattr(skill, 'vibe_reactions') else [],  # NEW: Return actual vibe nodes
         )
 
 
@@ -2071,7 +2095,7 @@ class AchievementOnlyType(ObjectType):
             to_date = achievement.to_date,
             is_deleted=achievement.is_deleted,
             file_id=achievement.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
             category="achievement",
         )
      
@@ -2102,7 +2126,7 @@ class EducationOnlyType(ObjectType):
             is_deleted=education.is_deleted,
             file_id=education.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in education.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in education.file_id]
                 if education.file_id else None
             ),
             category = "education",
@@ -2136,7 +2160,7 @@ class ExperienceOnlyType(ObjectType):
             is_deleted=experience.is_deleted,
             file_id=experience.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in experience.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in experience.file_id]
                 if experience.file_id else None
             ),
             category="experience",
@@ -2168,7 +2192,7 @@ class SkillOnlyType(ObjectType):
             is_deleted=skill.is_deleted,
             file_id=skill.file_id,
             file_url=(
-                [FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in skill.file_id]
+                [FileDetailType(**FileURL.get_file_url(file_id)) for file_id in skill.file_id]
                 if skill.file_id else None
             ),
             category = "skill",
@@ -2213,7 +2237,7 @@ class UserProfileDataType(ObjectType):
 
 
     def from_neomodel(cls, profile):
-        user_node = profile.user.single() if profile.user else None
+        user_node = load_one(profile, 'user') if profile.user else None
         
         # Calculate statistics efficiently
         vibes_count = cls._get_profile_vibes_count(profile.uid)
@@ -2238,8 +2262,8 @@ class UserProfileDataType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)),
-            user=UserInfoType.from_neomodel(profile.user.single()) if profile.user.single() else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)),
+            user=UserInfoType.from_neomodel(load_one(profile, 'user')) if load_one(profile, 'user') else None,
             city=profile.city,
             state=profile.state,
             achievement=[AchievementOnlyType.from_neomodel(achievement) for achievement in profile.achievement],
@@ -2267,7 +2291,7 @@ class UserProfileDataType(ObjectType):
         """Get total posts created by the user"""
         try:
             if user_node:
-                return len([post for post in user_node.post.all() if not post.is_deleted])
+                return len([post for post in load_all(user_node, 'post') if not post.is_deleted])
             return 0
         except Exception:
             return 0
@@ -2283,20 +2307,15 @@ class UserProfileDataType(ObjectType):
         # Post vibes
         try:
             if user_node:
-                posts = [post for post in user_node.post.all() if not post.is_deleted]
-                for post in posts:
-                    try:
-                        post_reaction_manager = PostReactionManager.objects.get(post_uid=post.uid)
-                        total_vibes += sum(reaction['vibes_count'] for reaction in post_reaction_manager.post_vibe)
-                    except PostReactionManager.DoesNotExist:
-                        continue
+                posts = [post for post in load_all(user_node, 'post') if not post.is_deleted]
+                total_vibes += post_total_vibes([post.uid for post in posts])
         except Exception:
             pass
         
         # Community vibes
         try:
             if user_node:
-                communities = user_node.community.all()
+                communities = load_all(user_node, 'community')
                 for community in communities:
                     try:
                         community_reaction_manager = CommunityReactionManager.objects.get(community_uid=community.uid)
@@ -2313,7 +2332,7 @@ class UserProfileDataType(ObjectType):
         """Get total communities created by the user"""
         try:
             if user_node:
-                return len(user_node.community.all())
+                return len(load_all(user_node, 'community'))
             return 0
         except Exception:
             return 0
@@ -2324,7 +2343,7 @@ class UserProfileDataType(ObjectType):
         try:
             if user_node:
                 # Count accepted connections
-                connections = user_node.connection.all()
+                connections = load_all(user_node, 'connection')
                 return len([conn for conn in connections if hasattr(conn, 'connection_status') and conn.connection_status == 'Accepted'])
             return 0
         except Exception:
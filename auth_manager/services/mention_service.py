@@ -154,11 +154,13 @@ class UserMentionService:
             connections = []
             seen_user_ids = set()
 
+            file_infos = generate_presigned_url.generate_file_info_bulk([row[5] for row in results])
+
             for row in results:
                 avatar_url = ""
                 if row[5]:  # profile_pic_id exists (index 5 now because we added uid)
                     try:
-                        file_info = generate_presigned_url.generate_file_info(row[5])
+                        file_info = file_infos.get(str(row[5]))
                         if file_info and 'url' in file_info:
                             avatar_url = file_info['url']
                     except Exception as e:
@@ -252,6 +254,10 @@ class UserMentionService:
                 int(row[0]): {'uid': row[1], 'profile_pic_id': row[2]} for row in neo4j_results
             }
 
+            file_infos = generate_presigned_url.generate_file_info_bulk(
+                [p.get('profile_pic_id') for p in profile_data.values()]
+            )
+
             results = []
             for user in django_users:
                 # Get profile data
@@ -263,7 +269,7 @@ class UserMentionService:
 
                 if profile_pic_id:
                     try:
-                        file_info = generate_presigned_url.generate_file_info(profile_pic_id)
+                        file_info = file_infos.get(str(profile_pic_id))
                         if file_info and 'url' in file_info:
                             avatar_url = file_info['url']
                     except Exception as e:
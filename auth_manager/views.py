@@ -4,6 +4,15 @@ from django.shortcuts import render
 from graphene_django.views import GraphQLView
 from graphql import GraphQLError
 from django.http import JsonResponse
+from post.utils.request_context import feed_request_context
+from post.utils.relationship_loader import loader_scope
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Operations making more Cypher calls than this are logged as warnings.
+GRAPHQL_CYPHER_WARN_CALLS = int(os.getenv('GRAPHQL_CYPHER_WARN_CALLS', '100'))
 
 class CustomGraphQLView(GraphQLView):
     def format_error(self, error):
@@ -46,3 +55,22 @@ class CustomGraphQLView(GraphQLView):
         }
 
         return JsonResponse(response_data, status=200)
+
+
+class RequestContextGraphQLView(GraphQLView):
+    """
+    GraphQLView that gives every request its own FeedRequestContext and
+    relationship LoaderScope, and reports the Cypher calls of each operation
+    (X-Cypher-Calls header and the log).
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with feed_request_context(), loader_scope() as scope:
+            response = super().dispatch(request, *args, **kwargs)
+        response['X-Cypher-Calls'] = str(scope.cypher_calls)
+        log = logger.warning if scope.cypher_calls > GRAPHQL_CYPHER_WARN_CALLS else logger.debug
+        log(
+            f"GraphQL {scope.operation_name or 'anonymous'}: {scope.cypher_calls} Cypher calls "
+            f"({scope.batches} batched relationship loads)"
+        )
+        return response
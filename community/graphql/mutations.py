@@ -18,17 +18,21 @@ from community.utils.get_community_or_subcommunity import validate_community_adm
 from msg.models import MatrixProfile
 from community.utils.create_matrix_room_with_token import create_room
 from community.utils.matrix_invites import process_matrix_invites
+from community.utils.matrix_provisioning import enqueue_room_provisioning
 from community.utils.community_decorator import handle_graphql_community_errors 
 from auth_manager.Utils.generate_presigned_url import get_valid_image
 from community import matrix_logger
 from community.services.notification_service import NotificationService
 from community.utils.matrix_avatar_manager import set_room_avatar_score_and_filter
 from community.utils.matrix_filter_manager import set_community_filter_data
-from post.models import Like, PostReactionManager
+from post.models import Like
+from post.utils import reaction_counts
+from post.utils.interest_vectors import record_membership_change
 from post.redis import increment_post_like_count
 from user_activity.services.activity_service import ActivityService
 from vibe_manager.services.vibe_activity_service import VibeActivityService
 from post.services.mention_service import MentionService
+from post.utils.feed_candidates import fanout_community_post
 from vibe_manager.utils import VibeUtils
 from vibe_manager.models import IndividualVibe
 from django.utils import timezone
@@ -65,10 +69,10 @@ class CreateCommunity(Mutation):
     
     This mutation handles the complete community creation process including:
     - Creating the community record
-    - Setting up Matrix chat room (if possible)
     - Adding initial members with appropriate permissions
     - Sending notifications to new members
-    - Processing Matrix room invitations
+    - Recording the Matrix chat room for provisioning (see
+      community.utils.matrix_provisioning)
     
     Args:
         input (CreateCommunityInput): Community creation data including:
@@ -91,7 +95,8 @@ class CreateCommunity(Mutation):
     
     Note:
         - Creator automatically becomes admin member
-        - Matrix room creation is optional and won't block community creation
+        - The Matrix room is created, joined by the members and written back to
+          room_id by a worker after the response; room_id is empty until then
         - All initial members receive push notifications
     """
     community = graphene.Field(CommunityType)
@@ -118,75 +123,11 @@ class CreateCommunity(Mutation):
             except Exception as e:
                 raise
                 
-            room_id = None
-            
-            # Try to create a Matrix room if possible, but don't block community creation if it fails
-            try:
-                print("Trying to get MatrixProfile")
-                matrix_profile = MatrixProfile.objects.get(user=user_id)
-                if matrix_profile and matrix_profile.matrix_user_id and matrix_profile.access_token:
-                    print("Matrix profile found with valid credentials")
-                    matrix_user_id = matrix_profile.matrix_user_id
-                    access_token = matrix_profile.access_token
-                    room_name = input.get('name', '')
-                    topic = str(input.get('description', ''))
-                    community_metadata = {
-                      'community_type': input.get('community_type').value if input.get('community_type') else '',
-                    }
-                    print("Creating Matrix room...")
-                    room_id = asyncio.run(create_room(
-                        access_token=access_token,
-                        user_id=matrix_user_id,
-                        room_name=room_name,
-                        topic=topic,
-                        visibility="private",    # Use "private" for invite-only rooms.
-                        preset="private_chat",    # Change to "private_chat" if needed.
-                        # initial_state=[
-                        #    {
-                        #       "type": "org.example.community_metadata",  # custom event type
-                        #       "state_key": "",
-                        #       "content": {
-                        #               "community_type": input.get('community_type').value if input.get('community_type') else ''
-                        #       }
-                        #     }
-                        # ]
-                    ))
-            except MatrixProfile.DoesNotExist:
-                print("No Matrix profile found for user")
-                matrix_logger.warning(f"No Matrix profile found for user {user_id}, creating community without chat room")
-            except Exception as e:
-                print(f"Matrix room creation error: {e}")
-                matrix_logger.error(f"Failed to create Matrix room: {e}")
-            
-            # if room_id and input.get('group_icon_id'):
-            #      try:
-            #         print("Setting community room avatar and score...")
-            #         avatar_result = asyncio.run(set_room_avatar_and_score_from_image_id(
-            #             access_token=access_token,
-            #             user_id=matrix_user_id,
-            #             room_id=room_id,
-            #             image_id=input.get('group_icon_id')
-            #         ))
-                    
-            #         if avatar_result["success"]:
-            #             matrix_logger.info(f"Set avatar and score for community room {room_id}")
-            #             print(f"Community avatar and score set successfully: {avatar_result}")
-            #         else:
-            #             matrix_logger.warning(f"Failed to set community avatar: {avatar_result.get('error')}")
-            #             print(f"Failed to set community avatar: {avatar_result.get('error')}")
-                    
-            #      except Exception as e:
-            #         matrix_logger.warning(f"Error setting community avatar: {e}")
-            #         print(f"Error setting community avatar: {e}")
-            # else:
-            #     print(f"DEBUG: Avatar not set. room_id={room_id}, group_icon_id={input.get('group_icon_id')}, access_token={bool(access_token)}, matrix_user_id={bool(matrix_user_id)}")
-
             community = Community(
                 name=input.get('name', ''),
                 description=input.get('description', ''),
                 community_circle=input.get('community_circle').value,
                 community_type=input.get('community_type').value,
-                room_id=room_id,
                 category=input.get('category', ''),
                 group_icon_id=input.get('group_icon_id', ''),
                 cover_image_id=input.get('cover_image_id', ''),
@@ -247,41 +188,6 @@ class CreateCommunity(Mutation):
                         mention_context='description'
                     )
 
-                        
-            if community and access_token:
-                 try:
-
-                    community_data = {
-                         'community_type': community.community_type,
-                         'community_circle': community.community_circle,
-                         'category': community.category,
-                         'created_date': community.created_date,
-                         'community_uid': community.uid,
-                         'community_name': community.name,
-                    }
-                    print("Setting community room filter data...")
-                    filter_result = asyncio.run(set_room_avatar_score_and_filter(
-                        access_token=access_token,
-                        user_id=user_id,
-                        room_id=room_id,
-                        image_id=community.group_icon_id,
-                        community_data=community_data
-                    ))
-                    
-                    if filter_result["success"]:
-                        matrix_logger.info(f"Set avatar and score for community room {room_id}")
-                        print(f"Community filter data set successfully: {filter_result}")
-                    else:
-                        matrix_logger.warning(f"Failed to set community filter: {filter_result.get('error')}")
-                        print(f"Failed to set community filter data: {filter_result.get('error')}")
-                    
-                 except Exception as e:
-                    matrix_logger.warning(f"Error setting community filter data: {e}")
-                    print(f"Error setting community filter data: {e}")
-            else:
-                print(f"DEBUG: filter data not set. room_id={room_id}, access_token={bool(access_token)}, matrix_user_id={bool(matrix_user_id)}")
-
-
             print("Adding other members...")
             members_to_notify = []
             for member in member_uid:
@@ -326,31 +232,6 @@ class CreateCommunity(Mutation):
                 finally:
                     loop.close()
             
-            # Invite all members to the Matrix room if a room was created
-            if room_id:
-                print("Initiating Matrix room invitations in background...")
-                matrix_logger.info(f"Starting background process to invite {len(member_uid)} members to Matrix room {room_id}")
-                
-                # Print Matrix members being invited to the room
-                print(f"\n=== MATRIX ROOM MEMBERS FOR COMMUNITY '{community.name}' ===")
-                print(f"Room ID: {room_id}")
-                print(f"Total members to invite: {len(member_uid)}")
-                print("Members being invited:")
-                for i, uid in enumerate(member_uid, 1):
-                    try:
-                        user_node = Users.nodes.get(uid=uid)
-                        print(f"  {i}. {user_node.username} (UID: {uid})")
-                    except Exception as e:
-                        print(f"  {i}. Unknown user (UID: {uid}) - Error: {e}")
-                print("=" * 60)
-                
-                # Process member invites in a separate thread
-                process_matrix_invites(
-                    admin_user_id=user_id,
-                    room_id=room_id,
-                    member_ids=member_uid
-                )
-
             # Auto-assign agent to community after creation
             agent_assignment_success = False
             agent_name = None
@@ -389,23 +270,6 @@ class CreateCommunity(Mutation):
                         },
                         success=True
                     )
-                    
-                    # Add agent to Matrix room if room was created and agent has Matrix profile
-                    if room_id and assigned_agent:
-                        try:
-                            print(f"Adding agent {assigned_agent.name} to Matrix room {room_id}...")
-                            from agentic.matrix_utils import join_agent_to_community_matrix_room
-                            
-                            join_agent_to_community_matrix_room(
-                                agent=assigned_agent,
-                                community=community
-                            )
-                            print(f"Successfully added agent {assigned_agent.name} to Matrix room")
-                        except Exception as matrix_error:
-                            print(f"Failed to add agent to Matrix room (non-critical): {matrix_error}")
-                            # Don't fail community creation if agent Matrix join fails
-                            import traceback
-                            traceback.print_exc()
                 else:
                     print("No default agent available for assignment")
                     
@@ -414,6 +278,31 @@ class CreateCommunity(Mutation):
                 print(f"Agent assignment failed (non-critical): {agent_error}")
                 import traceback
                 traceback.print_exc()
+
+            # The Matrix room (with the members and the agent) is provisioned after
+            # the response; the worker writes room_id back to the community.
+            matrix_room_queued = False
+            try:
+                enqueue_room_provisioning(
+                    community,
+                    creator_user_id=user_id,
+                    member_uids=member_uid,
+                    agent_uid=assigned_agent.uid if assigned_agent else None,
+                    room_data={
+                        'image_id': community.group_icon_id,
+                        'community_data': {
+                            'community_type': community.community_type,
+                            'community_circle': community.community_circle,
+                            'category': community.category,
+                            'created_date': str(community.created_date),
+                            'community_uid': community.uid,
+                            'community_name': community.name,
+                        },
+                    },
+                )
+                matrix_room_queued = True
+            except Exception as matrix_error:
+                matrix_logger.error(f"Failed to queue Matrix room for community {community.uid}: {matrix_error}")
             
             # Process tags if provided
             tags = input.get('tags') or []
@@ -455,7 +344,7 @@ class CreateCommunity(Mutation):
                         "community_name": community.name,
                         "community_type": community.community_type,
                         "member_count": len(member_uid) if member_uid else 1,
-                        "has_matrix_room": bool(room_id),
+                        "has_matrix_room": matrix_room_queued,
                         "agent_assigned": agent_assignment_success
                     }
                 )
@@ -1017,6 +906,7 @@ class AddMember(Mutation):
                 membership.user.connect(user_node)
                 membership.community.connect(community)
                 community.members.connect(membership)
+                record_membership_change(user_node.user_id, community.uid, joined=True)
 
                 community.number_of_members=len(community.members.all())
                 community.save()
@@ -1172,11 +1062,14 @@ class RemoveMember(Mutation):
             removed_members = []
             for uid in membership_uid:
                 membership = Membership.nodes.get(uid=uid)
+                member = membership.user.single()
                 removed_members.append({
                     "membership_uid": uid,
-                    "user_uid": membership.user.single().uid if membership.user.single() else None
+                    "user_uid": member.uid if member else None
                 })
                 membership.delete()
+                if member:
+                    record_membership_change(member.user_id, community.uid, joined=False)
             
             # Track activity for analytics
             try:
@@ -3874,6 +3767,7 @@ class JoinGeneratedCommunity(Mutation):
                     membership.user.connect(user_node)
                     membership.community.connect(community)
                     community.members.connect(membership)
+                    record_membership_change(user_node.user_id, community.uid, joined=True)
 
             else:
                 for uid in user_uids:
@@ -3888,6 +3782,7 @@ class JoinGeneratedCommunity(Mutation):
                     membership.user.connect(user_node)
                     membership.community.connect(community)
                     community.members.connect(membership)
+                    record_membership_change(user_node.user_id, community.uid, joined=True)
         
             # Track activity for analytics
             try:
@@ -4184,20 +4079,8 @@ class CreateCommunityPost(Mutation):
                     
                     # Only add vibe if user hasn't already reacted
                     if not existing_results:
-                        # Create PostReactionManager for community post if it doesn't exist
-                        try:
-                            post_reaction_manager = PostReactionManager.objects.get(post_uid=post.uid)
-                        except PostReactionManager.DoesNotExist:
-                            post_reaction_manager = PostReactionManager(post_uid=post.uid)
-                            post_reaction_manager.initialize_reactions()
-                            post_reaction_manager.save()
-
                         # Add this reaction to the aggregated analytics
-                        post_reaction_manager.add_reaction(
-                            vibes_name=input.reaction,
-                            score=input.vibe
-                        )
-                        post_reaction_manager.save()
+                        reaction_counts.add_reaction(post.uid, input.reaction, input.vibe)
 
                         # Create the individual like record
                         like = Like(
@@ -4257,6 +4140,9 @@ class CreateCommunityPost(Mutation):
                 community.community_post.connect(post)
                 post.created_by_subcommunity.connect(community)
 
+            # Push the post into the warm feed candidate stores of members
+            fanout_community_post(community.uid, post.uid, post.created_at.timestamp())
+
             community_obj = community
             community_name = community_obj.name
             community_id = community_obj.uid
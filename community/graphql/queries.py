@@ -41,6 +41,8 @@ from community.utils.generate_community import generate_communities_based_on_int
 from graphql_jwt.decorators import login_required, superuser_required
 from community.utils.community_decorator import handle_graphql_community_errors 
 from auth_manager.Utils.generate_presigned_url import generate_file_info
+from post.utils.relationship_loader import prime
+from post.utils.file_url import FileURL
 
 
 class SubCommunityRoleManagerType(DjangoObjectType):
@@ -283,7 +285,9 @@ class Query(graphene.ObjectType):
                                         user_node.community.all()
                                         ))
 
-        return [CommunityType.from_neomodel(x) for x in my_communities]
+        nodes = prime(my_communities)
+        FileURL.store_file_urls_for(nodes, 'group_icon_id', 'cover_image_id')
+        return [CommunityType.from_neomodel(x) for x in nodes]
 
    
     # New query that returns communities grouped by type
@@ -357,7 +361,7 @@ class Query(graphene.ObjectType):
         """
         community = Community.nodes.get(uid=community_uid)
         communitymember = list(community.members.all())
-        return [MembershipType.from_neomodel(member) for member in communitymember]
+        return [MembershipType.from_neomodel(member) for member in prime(communitymember)]
 
     
     sub_community_members_by_sub_community_uid = graphene.List(
@@ -381,7 +385,7 @@ class Query(graphene.ObjectType):
         """
         community = SubCommunity.nodes.get(uid=sub_community_uid)
         communitymember = list(community.sub_community_members.all())
-        return [SubCommunityMembershipType.from_neomodel(member) for member in communitymember]
+        return [SubCommunityMembershipType.from_neomodel(member) for member in prime(communitymember)]
     
     
     community_member_by_community_uid_and_user_uid = graphene.List(
@@ -420,7 +424,7 @@ class Query(graphene.ObjectType):
                 if member.user.is_connected(user_node)
             ]
 
-        return [MembershipType.from_neomodel(member) for member in community_members]
+        return [MembershipType.from_neomodel(member) for member in prime(community_members)]
 
         
 
@@ -471,7 +475,7 @@ class Query(graphene.ObjectType):
             key=lambda member: member.join_date, reverse=True)
 
         # Return the memberships as list of MembershipType objects
-        return [MembershipType.from_neomodel(member) for member in community_members]
+        return [MembershipType.from_neomodel(member) for member in prime(community_members)]
 
         
 
@@ -501,7 +505,7 @@ class Query(graphene.ObjectType):
         community_member = []
         for member in my_communities:
             community_member.extend(list(member.members))
-        return [MembershipType.from_neomodel(x) for x in community_member]
+        return [MembershipType.from_neomodel(x) for x in prime(community_member)]
         
 
     user_community_membership = graphene.List(
@@ -592,7 +596,7 @@ class Query(graphene.ObjectType):
         memberships = [Membership.inflate(row[0]) for row in results]
 
         # Convert Membership objects to MembershipType GraphQL objects
-        return [MembershipType.from_neomodel(membership) for membership in memberships]
+        return [MembershipType.from_neomodel(membership) for membership in prime(memberships)]
 
     community_goal_by_community_uid = graphene.List(
         CommunityGoalType, community_uid=graphene.String(required=True))
@@ -618,12 +622,16 @@ class Query(graphene.ObjectType):
             community = Community.nodes.get(uid=community_uid)
             goals = community.communitygoal.all()
             community_goals = [goal for goal in goals if not goal.is_deleted]
-            return [CommunityGoalType.from_neomodel(goal) for goal in community_goals]
+            nodes = prime(community_goals)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityGoalType.from_neomodel(goal) for goal in nodes]
         except Community.DoesNotExist:
             community = SubCommunity.nodes.get(uid=community_uid)
             goals = community.communitygoal.all()
             community_goals = [goal for goal in goals if not goal.is_deleted]
-            return [CommunityGoalType.from_neomodel(goal) for goal in community_goals]     
+            nodes = prime(community_goals)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityGoalType.from_neomodel(goal) for goal in nodes]
         
 
     my_community_goals = graphene.List(CommunityGoalType)
@@ -648,7 +656,9 @@ class Query(graphene.ObjectType):
         goals = []
         for community in my_communities:
             goals.extend(list(community.communitygoal))
-        return [CommunityGoalType.from_neomodel(x) for x in goals]
+        nodes = prime(goals)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityGoalType.from_neomodel(x) for x in nodes]
     
 
     community_activity_by_community_uid = graphene.List(
@@ -675,12 +685,16 @@ class Query(graphene.ObjectType):
             community = Community.nodes.get(uid=community_uid)
             activities = community.communityactivity.all()
             community_activities = [activity for activity in activities if not activity.is_deleted]
-            return [CommunityActivityType.from_neomodel(activity) for activity in community_activities]
+            nodes = prime(community_activities)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityActivityType.from_neomodel(activity) for activity in nodes]
         except Community.DoesNotExist:
             community = SubCommunity.nodes.get(uid=community_uid)
             activities = community.communityactivity.all()
             community_activities = [activity for activity in activities if not activity.is_deleted]
-            return [CommunityActivityType.from_neomodel(activity) for activity in community_activities]
+            nodes = prime(community_activities)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityActivityType.from_neomodel(activity) for activity in nodes]
 
     
     my_community_activities = graphene.List(CommunityActivityType)
@@ -705,7 +719,9 @@ class Query(graphene.ObjectType):
         activities = []
         for community in my_communities:
             activities.extend(list(community.communityactivity))
-        return [CommunityActivityType.from_neomodel(x) for x in activities]
+        nodes = prime(activities)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityActivityType.from_neomodel(x) for x in nodes]
     
 
     community_affiliation_by_community_uid = graphene.List(
@@ -732,12 +748,16 @@ class Query(graphene.ObjectType):
             community = Community.nodes.get(uid=community_uid)
             affiliations = community.communityaffiliation.all()
             community_affiliations = [affiliation for affiliation in affiliations if not affiliation.is_deleted]
-            return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in community_affiliations]
+            nodes = prime(community_affiliations)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in nodes]
         except Community.DoesNotExist:
             community = SubCommunity.nodes.get(uid=community_uid)
             affiliations = community.communityaffiliation.all()
             community_affiliations = [affiliation for affiliation in affiliations if not affiliation.is_deleted]
-            return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in community_affiliations]
+            nodes = prime(community_affiliations)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in nodes]
 
 
     my_community_affiliations = graphene.List(CommunityAffiliationType)
@@ -762,7 +782,9 @@ class Query(graphene.ObjectType):
         affiliations = []
         for community in my_communities:
             affiliations.extend(list(community.communityaffiliation))
-        return [CommunityAffiliationType.from_neomodel(x) for x in affiliations]
+        nodes = prime(affiliations)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityAffiliationType.from_neomodel(x) for x in nodes]
         
         
     community_achievement_by_community_uid = graphene.List(
@@ -789,12 +811,16 @@ class Query(graphene.ObjectType):
             community = Community.nodes.get(uid=community_uid)
             achievements = community.communityachievement.all()
             community_achievements = [achievement for achievement in achievements if not achievement.is_deleted]
-            return [CommunityAchievementType.from_neomodel(achievement) for achievement in community_achievements]
+            nodes = prime(community_achievements)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityAchievementType.from_neomodel(achievement) for achievement in nodes]
         except Community.DoesNotExist:
             community = SubCommunity.nodes.get(uid=community_uid)
             achievements = community.communityachievement.all()
             community_achievements = [achievement for achievement in achievements if not achievement.is_deleted]
-            return [CommunityAchievementType.from_neomodel(achievement) for achievement in community_achievements]
+            nodes = prime(community_achievements)
+            FileURL.store_file_urls_for(nodes, 'file_id')
+            return [CommunityAchievementType.from_neomodel(achievement) for achievement in nodes]
 
 
     my_community_achievements = graphene.List(CommunityAchievementType)
@@ -819,7 +845,9 @@ class Query(graphene.ObjectType):
         achievements = []
         for community in my_communities:
             achievements.extend(list(community.communityachievement))
-        return [CommunityAchievementType.from_neomodel(x) for x in achievements]
+        nodes = prime(achievements)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityAchievementType.from_neomodel(x) for x in nodes]
         
 
     recommended_communities = graphene.List(
@@ -876,7 +904,9 @@ class Query(graphene.ObjectType):
             communities = [
                 c for c in communities if c.category == category.value]
 
-        return [CommunityType.from_neomodel(community) for community in communities]
+        nodes = prime(communities)
+        FileURL.store_file_urls_for(nodes, 'group_icon_id', 'cover_image_id')
+        return [CommunityType.from_neomodel(community) for community in nodes]
 
     community_role_manager_by_community_uid = graphene.List(
         CommunityRoleManagerDetailsType, community_uid=graphene.String(required=True))
@@ -1357,12 +1387,16 @@ class Query(graphene.ObjectType):
             community = Community.nodes.get(uid=community_uid)
             communitypost = community.community_post.all()
             communityposts=[post for post in communitypost if not post.is_deleted]
-            return [CommunityPostType.from_neomodel(post) for post in communityposts]
+            nodes = prime(communityposts)
+            FileURL.store_file_urls_for(nodes, 'post_file_id')
+            return [CommunityPostType.from_neomodel(post) for post in nodes]
         except Community.DoesNotExist:
             community = SubCommunity.nodes.get(uid=community_uid)
             communitypost = community.community_post.all()
             communityposts=[post for post in communitypost if not post.is_deleted]
-            return [CommunityPostType.from_neomodel(post) for post in communityposts]
+            nodes = prime(communityposts)
+            FileURL.store_file_urls_for(nodes, 'post_file_id')
+            return [CommunityPostType.from_neomodel(post) for post in nodes]
         
 
 
@@ -1415,7 +1449,9 @@ class Query(graphene.ObjectType):
             This API is not used in the frontend.
         """
         communities = Community.nodes.all()
-        return [CommunityType.from_neomodel(community) for community in communities]
+        nodes = prime(communities)
+        FileURL.store_file_urls_for(nodes, 'group_icon_id', 'cover_image_id')
+        return [CommunityType.from_neomodel(community) for community in nodes]
     
    
     
@@ -1437,7 +1473,7 @@ class Query(graphene.ObjectType):
         Note:
             This API is not used in the frontend.
         """
-        return [MembershipType.from_neomodel(membership) for membership in Membership.nodes.all()]
+        return [MembershipType.from_neomodel(membership) for membership in prime(Membership.nodes.all())]
 
     
     all_community_reviews = graphene.List(CommunityReviewType)
@@ -1458,7 +1494,9 @@ class Query(graphene.ObjectType):
         Note:
             This API is not used in the frontend.
         """
-        return [CommunityReviewType.from_neomodel(review) for review in CommunityReview.nodes.all()]
+        nodes = prime(CommunityReview.nodes.all())
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityReviewType.from_neomodel(review) for review in nodes]
 
     all_community_message = graphene.List(CommunityMessagesType)
 
@@ -1479,7 +1517,7 @@ class Query(graphene.ObjectType):
         Note:
             This API is not used in the frontend.
         """
-        return [CommunityMessagesType.from_neomodel(message) for message in CommunityMessages.nodes.all()]
+        return [CommunityMessagesType.from_neomodel(message) for message in prime(CommunityMessages.nodes.all())]
 
     all_community_goals = graphene.List(CommunityGoalType)
     
@@ -1500,7 +1538,9 @@ class Query(graphene.ObjectType):
             This API is not used in the frontend.
         """
         community_goals = CommunityGoal.nodes.all()
-        return [CommunityGoalType.from_neomodel(goal) for goal in community_goals]
+        nodes = prime(community_goals)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityGoalType.from_neomodel(goal) for goal in nodes]
 
 
     all_community_activities = graphene.List(CommunityActivityType)
@@ -1521,7 +1561,9 @@ class Query(graphene.ObjectType):
             This API is not used in the frontend.
         """
         community_activities = CommunityActivity.nodes.all()
-        return [CommunityActivityType.from_neomodel(activity) for activity in community_activities]
+        nodes = prime(community_activities)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityActivityType.from_neomodel(activity) for activity in nodes]
 
     
 
@@ -1547,7 +1589,9 @@ class Query(graphene.ObjectType):
             This API is not used in the frontend.
         """
         community_affiliations = CommunityAffiliation.nodes.all()
-        return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in community_affiliations]
+        nodes = prime(community_affiliations)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityAffiliationType.from_neomodel(affiliation) for affiliation in nodes]
 
     # New API: Get user admin communities with search and pagination
     user_admin_communities = graphene.Field(
@@ -1628,6 +1672,7 @@ class Query(graphene.ObjectType):
         data_results, _ = db.cypher_query(data_query, params)
         
         # Convert results to CommunityType objects efficiently
+        FileURL.store_file_urls_for([result[0] for result in data_results], 'group_icon_id', 'cover_image_id')
         admin_communities = []
         for result in data_results:
             community_data = result[0]
@@ -1649,14 +1694,13 @@ class Query(graphene.ObjectType):
     @staticmethod
     def _create_lightweight_community_type(community_data, member_count, has_leader):
         """Create a lightweight CommunityType object without expensive operations."""
-        from auth_manager.Utils import generate_presigned_url
         from datetime import datetime
         
         # Generate file URLs only if needed
         group_icon_url = None
         if community_data.get('group_icon_id'):
             try:
-                file_info = generate_presigned_url.generate_file_info(community_data['group_icon_id'])
+                file_info = FileURL.get_file_url(community_data['group_icon_id'])
                 if file_info and file_info.get('url'):
                     group_icon_url = FileDetailType(**file_info)
             except Exception:
@@ -1665,7 +1709,7 @@ class Query(graphene.ObjectType):
         cover_image_url = None
         if community_data.get('cover_image_id'):
             try:
-                file_info = generate_presigned_url.generate_file_info(community_data['cover_image_id'])
+                file_info = FileURL.get_file_url(community_data['cover_image_id'])
                 if file_info and file_info.get('url'):
                     cover_image_url = FileDetailType(**file_info)
             except Exception:
@@ -1718,7 +1762,9 @@ class Query(graphene.ObjectType):
             This API is not used in the frontend.
         """
         community_achievements = CommunityAchievement.nodes.all()
-        return [CommunityAchievementType.from_neomodel(achievement) for achievement in community_achievements]
+        nodes = prime(community_achievements)
+        FileURL.store_file_urls_for(nodes, 'file_id')
+        return [CommunityAchievementType.from_neomodel(achievement) for achievement in nodes]
     
     # Individual item queries
     community_goal_by_uid = graphene.Field(
@@ -2027,6 +2073,7 @@ class Query(graphene.ObjectType):
         data_results, _ = db.cypher_query(data_query, params)
         
         # Convert results to CommunityType objects efficiently
+        FileURL.store_file_urls_for([result[0] for result in data_results], 'group_icon_id', 'cover_image_id')
         communities = []
         for result in data_results:
             community_data = result[0]
@@ -2119,6 +2166,7 @@ class Query(graphene.ObjectType):
         data_results, _ = db.cypher_query(data_query, params)
         
         # Convert results to SubCommunityType objects efficiently
+        FileURL.store_file_urls_for([result[0] for result in data_results], 'group_icon_id', 'cover_image_id')
         subcommunities = []
         for result in data_results:
             subcommunity_data = result[0]
@@ -2140,14 +2188,13 @@ class Query(graphene.ObjectType):
     @staticmethod
     def _create_lightweight_subcommunity_type(subcommunity_data, member_count):
         """Create a lightweight SubCommunityType object without expensive operations."""
-        from auth_manager.Utils import generate_presigned_url
         from datetime import datetime
         
         # Generate file URLs only if needed
         group_icon_url = None
         if subcommunity_data.get('group_icon_id'):
             try:
-                file_info = generate_presigned_url.generate_file_info(subcommunity_data['group_icon_id'])
+                file_info = FileURL.get_file_url(subcommunity_data['group_icon_id'])
                 if file_info and file_info.get('url'):
                     group_icon_url = FileDetailType(**file_info)
             except Exception:
@@ -2156,7 +2203,7 @@ class Query(graphene.ObjectType):
         cover_image_url = None
         if subcommunity_data.get('cover_image_id'):
             try:
-                file_info = generate_presigned_url.generate_file_info(subcommunity_data['cover_image_id'])
+                file_info = FileURL.get_file_url(subcommunity_data['cover_image_id'])
                 if file_info and file_info.get('url'):
                     cover_image_url = FileDetailType(**file_info)
             except Exception:
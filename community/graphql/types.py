@@ -11,12 +11,13 @@ from ..utils import userlist, helperfunction
 from community.graphql.raw_queries.community_query import *
 from post.utils.reaction_manager import PostReactionUtils, IndividualVibeManager
 from post.redis import get_post_comment_count, get_post_like_count
-from post.models import PostReactionManager
 from vibe_manager.models import IndividualVibe, CommunityVibe
 from neomodel import db
 from community.redis import *
 from ..utils.post_data_helper import CommunityPostDataHelper
 from ..utils.enhanced_query_helper import EnhancedQueryHelper
+from post.utils.relationship_loader import load_one, load_all
+from post.utils.file_url import FileURL
 
 
 
@@ -119,7 +120,7 @@ class ProfileFeedType(ObjectType):
                 user_id=profile.get("user_id") if isinstance(profile, dict) else profile.user_id,
                 gender=profile.get("gender") if isinstance(profile, dict) else profile.gender,
                 profile_pic_id=profile_img_id,
-                profile_pic=([FileDetailType(**generate_presigned_url.generate_file_info(profile_img_id))]) if profile_img_id else None,
+                profile_pic=([FileDetailType(**FileURL.get_file_url(profile_img_id))]) if profile_img_id else None,
             )
         except Exception as e:
             print(f"Error in ProfileFeedType.from_neomodel: {e}")
@@ -210,7 +211,7 @@ class CommunityContentVibeType(ObjectType):
             individual_vibe_id=vibe.individual_vibe_id,
             vibe_name=vibe.vibe_name,
             vibe_intensity=vibe.vibe_intensity,
-            reacted_by=UserType.from_neomodel(vibe.reacted_by.single()) if vibe.reacted_by.single() else None,
+            reacted_by=UserType.from_neomodel(load_one(vibe, 'reacted_by')) if load_one(vibe, 'reacted_by') else None,
             timestamp=vibe.timestamp,
             is_active=vibe.is_active
         )
@@ -261,14 +262,16 @@ class CommunityType(ObjectType):
     agent_assignments = graphene.List('agentic.graphql.types.AgentAssignmentType')
     @classmethod
     def from_neomodel(cls, community, include_agent_assignments=True):
-        community.number_of_members = len(community.members.all())
-        community.save()
+        member_count = len(load_all(community, 'members'))
+        if community.number_of_members != member_count:
+            community.number_of_members = member_count
+            community.save()
         
         # Safely generate group icon URL - handle errors gracefully
         group_icon_url = None
         try:
             if community.group_icon_id:
-                file_info = generate_presigned_url.generate_file_info(community.group_icon_id)
+                file_info = FileURL.get_file_url(community.group_icon_id)
                 if file_info and file_info.get('url'):
                     group_icon_url = FileDetailType(**file_info)
         except Exception as e:
@@ -296,14 +299,18 @@ class CommunityType(ObjectType):
         cover_image_url = None
         try:
             if community.cover_image_id:
-                file_info = generate_presigned_url.generate_file_info(community.cover_image_id)
+                file_info = FileURL.get_file_url(community.cover_image_id)
                 if file_info and file_info.get('url'):
                     cover_image_url = FileDetailType(**file_info)
         except Exception as e:
             cover_image_url = None
             print(f"Error generating cover image URL: {e}")
             # Continue without the cover image URL
-        
+
+        messages = list(load_all(community, 'communitymessage'))
+        reviews = list(load_all(community, 'community_review'))
+        FileURL.store_file_urls_for(messages + reviews, 'file_id')
+
         return cls(
             uid=community.uid,
             name=community.name,
@@ -330,10 +337,10 @@ class CommunityType(ObjectType):
             contact_email=getattr(community, 'contact_email', None),
             enable_comments=getattr(community, 'enable_comments', True),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(community.created_by.single()) if community.created_by.single() and isinstance(community.created_by.single(), Users) else None,
-            communitymessage=[CommunityMessagesNonCommunityType.from_neomodel(x) for x in community.communitymessage],
-            community_review=[CommunityReviewNonCommunityType.from_neomodel(x) for x in community.community_review],
-            members=[MembershipNonCommunityType.from_neomodel(x) for x in community.members],
+            created_by=UserType.from_neomodel(load_one(community, 'created_by')) if load_one(community, 'created_by') and isinstance(load_one(community, 'created_by'), Users) else None,
+            communitymessage=[CommunityMessagesNonCommunityType.from_neomodel(x) for x in messages],
+            community_review=[CommunityReviewNonCommunityType.from_neomodel(x) for x in reviews],
+            members=[MembershipNonCommunityType.from_neomodel(x) for x in load_all(community, 'members')],
             mentioned_users=cls._get_description_mentioned_users(community),
 
             # Agent management fields
@@ -379,7 +386,7 @@ class CommunityType(ObjectType):
             
             mentioned_users = []
             for mention in mentions:
-                mentioned_user = mention.mentioned_user.single()
+                mentioned_user = load_one(mention, 'mentioned_user')
                 if mentioned_user:
                     mentioned_users.append(UserType.from_neomodel(mentioned_user))
             
@@ -412,7 +419,7 @@ class CommunityInformationType(ObjectType):
         group_icon_url = None
         try:
             if community.group_icon_id:
-                file_info = generate_presigned_url.generate_file_info(community.group_icon_id)
+                file_info = FileURL.get_file_url(community.group_icon_id)
                 if file_info and file_info.get('url'):
                     group_icon_url = FileDetailType(**file_info)
         except Exception as e:
@@ -432,7 +439,7 @@ class CommunityInformationType(ObjectType):
             group_icon_id=community.group_icon_id,
             group_icon_url=group_icon_url,
             category=community.category,
-            created_by=UserCommunityDetailsType.from_neomodel(community.created_by.single()) if community.created_by.single() else None,
+            created_by=UserCommunityDetailsType.from_neomodel(load_one(community, 'created_by')) if load_one(community, 'created_by') else None,
         )
 
 
@@ -453,8 +460,8 @@ class CommunityMessagesType(ObjectType):
     def from_neomodel(cls, message):
         return cls(
             uid=message.uid,
-            community=CommunityType.from_neomodel(message.community.single()) if message.community.single() else None,
-            sender=UserType.from_neomodel(message.sender.single()) if message.sender.single() else None,
+            community=CommunityType.from_neomodel(load_one(message, 'community')) if load_one(message, 'community') else None,
+            sender=UserType.from_neomodel(load_one(message, 'sender')) if load_one(message, 'sender') else None,
             content=message.content,
             file_id=message.file_id,
             file_url=generate_presigned_url.generate_presigned_url(message.file_id),
@@ -481,8 +488,8 @@ class MembershipType(ObjectType):
     def from_neomodel(cls, membership):
         return cls(
             uid=membership.uid,
-            community=CommunityType.from_neomodel(membership.community.single()) if membership.community.single() else None,
-            user=UserType.from_neomodel(membership.user.single()) if membership.user.single() else None,
+            community=CommunityType.from_neomodel(load_one(membership, 'community')) if load_one(membership, 'community') else None,
+            user=UserType.from_neomodel(load_one(membership, 'user')) if load_one(membership, 'user') else None,
             is_admin=membership.is_admin,
             is_leader=membership.is_leader,
             is_accepted=membership.is_accepted,
@@ -505,7 +512,7 @@ class CommunityPostType(ObjectType):
     def from_neomodel(cls, post):
         return cls(
             uid=post.uid,
-            community=CommunityType.from_neomodel(post.community.single()) if post.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(post, 'community')) if load_one(post, 'community') else None,
             post_id=post.post_id,
             is_accepted=post.is_accepted,
             created_date=post.created_date,
@@ -525,7 +532,7 @@ class CommunityProductType(ObjectType):
     def from_neomodel(cls, product):
         return cls(
             uid=product.uid,
-            community=CommunityType.from_neomodel(product.community.single()) if product.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(product, 'community')) if load_one(product, 'community') else None,
             product_id=product.product_id,
             is_accepted=product.is_accepted,
             created_date=product.created_date,
@@ -544,7 +551,7 @@ class CommunityStoryType(ObjectType):
     def from_neomodel(cls, story):
         return cls(
             uid=story.uid,
-            community=CommunityType.from_neomodel(story.community.single()) if story.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(story, 'community')) if load_one(story, 'community') else None,
             story_id=story.story_id,
             is_accepted=story.is_accepted,
             created_date=story.created_date,
@@ -564,7 +571,7 @@ class ElectionType(ObjectType):
     def from_neomodel(cls, election):
         return cls(
             uid=election.uid,
-            community=CommunityType.from_neomodel(election.community.single()) if election.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(election, 'community')) if load_one(election, 'community') else None,
             is_active=election.is_active,
             start_date=election.start_date,
             nomination_duration=election.nomination_duration,
@@ -584,8 +591,8 @@ class NominationType(ObjectType):
     def from_neomodel(cls, nomination):
         return cls(
             uid=nomination.uid,
-            election=ElectionType.from_neomodel(nomination.election.single()) if nomination.election.single() else None,
-            member=MembershipType.from_neomodel(nomination.member.single()) if nomination.member.single() else None,
+            election=ElectionType.from_neomodel(load_one(nomination, 'election')) if load_one(nomination, 'election') else None,
+            member=MembershipType.from_neomodel(load_one(nomination, 'member')) if load_one(nomination, 'member') else None,
             vibes_received=nomination.vibes_received,
             created_date=nomination.created_date,
             updated_date=nomination.updated_date
@@ -603,9 +610,9 @@ class VoteType(ObjectType):
     def from_neomodel(cls, vote):
         return cls(
             uid=vote.uid,
-            election=ElectionType.from_neomodel(vote.election.single()) if vote.election.single() else None,
-            voter=MembershipType.from_neomodel(vote.voter.single()) if vote.voter.single() else None,
-            nominee=NominationType.from_neomodel(vote.nominee.single()) if vote.nominee.single() else None,
+            election=ElectionType.from_neomodel(load_one(vote, 'election')) if load_one(vote, 'election') else None,
+            voter=MembershipType.from_neomodel(load_one(vote, 'voter')) if load_one(vote, 'voter') else None,
+            nominee=NominationType.from_neomodel(load_one(vote, 'nominee')) if load_one(vote, 'nominee') else None,
             created_date=vote.created_date,
             updated_date=vote.updated_date
         )
@@ -621,7 +628,7 @@ class RoleType(ObjectType):
     def from_neomodel(cls, role):
         return cls(
             uid=role.uid,
-            community=CommunityType.from_neomodel(role.community.single()) if role.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(role, 'community')) if load_one(role, 'community') else None,
             name=role.name,
             created_date=role.created_date,
             updated_date=role.updated_date
@@ -638,8 +645,8 @@ class CommunityRoleType(ObjectType):
     def from_neomodel(cls, community_role):
         return cls(
             uid=community_role.uid,
-            membership=MembershipType.from_neomodel(community_role.membership.single()) if community_role.membership.single() else None,
-            role=RoleType.from_neomodel(community_role.role.single()) if community_role.role.single() else None,
+            membership=MembershipType.from_neomodel(load_one(community_role, 'membership')) if load_one(community_role, 'membership') else None,
+            role=RoleType.from_neomodel(load_one(community_role, 'role')) if load_one(community_role, 'role') else None,
             created_date=community_role.created_date,
             updated_date=community_role.updated_date
         )
@@ -658,8 +665,8 @@ class MessageType(ObjectType):
     def from_neomodel(cls, message):
         return cls(
             uid=message.uid,
-            community=CommunityType.from_neomodel(message.community.single()) if message.community.single() else None,
-            sender=UserType.from_neomodel(message.sender.single()) if message.sender.single() else None,
+            community=CommunityType.from_neomodel(load_one(message, 'community')) if load_one(message, 'community') else None,
+            sender=UserType.from_neomodel(load_one(message, 'sender')) if load_one(message, 'sender') else None,
             content=message.content,
             timestamp=message.timestamp,
             is_hidden=message.is_hidden,
@@ -678,7 +685,7 @@ class CommunityKeywordType(ObjectType):
     def from_neomodel(cls, keyword):
         return cls(
             uid=keyword.uid,
-            community=CommunityType.from_neomodel(keyword.community.single()) if keyword.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(keyword, 'community')) if load_one(keyword, 'community') else None,
             keyword=keyword.keyword,
             created_date=keyword.created_date,
             updated_date=keyword.updated_date
@@ -696,8 +703,8 @@ class CommunityExitType(ObjectType):
     def from_neomodel(cls, exit):
         return cls(
             uid=exit.uid,
-            community=CommunityType.from_neomodel(exit.community.single()) if exit.community.single() else None,
-            user=UserType.from_neomodel(exit.user.single()) if exit.user.single() else None,
+            community=CommunityType.from_neomodel(load_one(exit, 'community')) if load_one(exit, 'community') else None,
+            user=UserType.from_neomodel(load_one(exit, 'user')) if load_one(exit, 'user') else None,
             exit_date=exit.exit_date,
             created_date=exit.created_date,
             updated_date=exit.updated_date
@@ -714,7 +721,7 @@ class CommunityRuleType(ObjectType):
     def from_neomodel(cls, rule):
         return cls(
             uid=rule.uid,
-            community=CommunityType.from_neomodel(rule.community.single()) if rule.community.single() else None,
+            community=CommunityType.from_neomodel(load_one(rule, 'community')) if load_one(rule, 'community') else None,
             rule_text=rule.rule_text,
             created_date=rule.created_date,
             updated_date=rule.updated_date
@@ -737,14 +744,14 @@ class CommunityReviewType(ObjectType):
     def from_neomodel(cls, review):
         return cls(
             uid=review.uid,
-            byuser=UserType.from_neomodel(review.byuser.single()) if review.byuser.single() else None,
+            byuser=UserType.from_neomodel(load_one(review, 'byuser')) if load_one(review, 'byuser') else None,
             # tocommunity=CommunityType.from_neomodel(review.tocommunity.single()) if review.tocommunity.single() else None,
             reaction=review.reaction,
             vibe=review.vibe,
             title=review.title,
             content=review.content,
             file_id=review.file_id,
-            file_url=FileDetailType(**generate_presigned_url.generate_file_info(review.file_id)),
+            file_url=FileDetailType(**FileURL.get_file_url(review.file_id)),
             is_deleted=review.is_deleted,
             timestamp=review.timestamp
         )
@@ -759,8 +766,8 @@ class CommunityUserBlockType(ObjectType):
     def from_neomodel(cls, block):
         return cls(
             uid=block.uid,
-            blocker=UserType.from_neomodel(block.blocker.single()) if block.blocker.single() else None,
-            blocked=UserType.from_neomodel(block.blocked.single()) if block.blocked.single() else None,
+            blocker=UserType.from_neomodel(load_one(block, 'blocker')) if load_one(block, 'blocker') else None,
+            blocked=UserType.from_neomodel(load_one(block, 'blocked')) if load_one(block, 'blocked') else None,
             created_at=block.created_at
         )
 
@@ -782,13 +789,13 @@ class CommunityMessagesNonCommunityType(ObjectType):
             uid=message.uid,
             content=message.content,
             file_id=message.file_id,
-            file_url=FileDetailType(**generate_presigned_url.generate_file_info(message.file_id)),
+            file_url=FileDetailType(**FileURL.get_file_url(message.file_id)),
             title=message.title,
             is_read=message.is_read,
             is_deleted=message.is_deleted,
             timestamp=message.timestamp,
             is_public=message.is_public,
-            sender=UserType.from_neomodel(message.sender.single()) if message.sender.single() else None,
+            sender=UserType.from_neomodel(load_one(message, 'sender')) if load_one(message, 'sender') else None,
         )
     
 class CommunityReviewNonCommunityType(ObjectType):
@@ -807,13 +814,13 @@ class CommunityReviewNonCommunityType(ObjectType):
     def from_neomodel(cls, review):
         return cls(
             uid=review.uid,
-            byuser=UserType.from_neomodel(review.byuser.single()) if review.byuser.single() else None,
+            byuser=UserType.from_neomodel(load_one(review, 'byuser')) if load_one(review, 'byuser') else None,
             reaction=review.reaction,
             vibe=review.vibe,
             title=review.title,
             content=review.content,
             file_id=review.file_id,
-            file_url=FileDetailType(**generate_presigned_url.generate_file_info(review.file_id)),
+            file_url=FileDetailType(**FileURL.get_file_url(review.file_id)),
             is_deleted=review.is_deleted,
             timestamp=review.timestamp
         )
@@ -833,7 +840,7 @@ class MembershipNonCommunityType(ObjectType):
     def from_neomodel(cls, membership):
         return cls(
             uid=membership.uid,
-            user=UserType.from_neomodel(membership.user.single()) if membership.user.single() else None,
+            user=UserType.from_neomodel(load_one(membership, 'user')) if load_one(membership, 'user') else None,
             is_admin=membership.is_admin,
             is_leader=membership.is_leader,
             is_accepted=membership.is_accepted,
@@ -876,9 +883,9 @@ class CommunityGoalType(ObjectType):
             name=goal.name,
             description=goal.description,
             file_id=goal.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in goal.file_id] if goal.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in goal.file_id] if goal.file_id else None),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(goal.created_by.single()) if goal.created_by.single() and isinstance(goal.created_by.single(), Users) else None,
+            created_by=UserType.from_neomodel(load_one(goal, 'created_by')) if load_one(goal, 'created_by') and isinstance(load_one(goal, 'created_by'), Users) else None,
             # community=CommunityType.from_neomodel(goal.community.single()) if goal.community.single() else None,
             timestamp=goal.timestamp,
             is_deleted=goal.is_deleted,
@@ -923,9 +930,9 @@ class CommunityActivityType(ObjectType):
             description=activity.description,
             activity_type=activity.activity_type,
             file_id=activity.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in activity.file_id] if activity.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in activity.file_id] if activity.file_id else None),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(activity.created_by.single()) if activity.created_by.single() and isinstance(activity.created_by.single(), Users) else None,
+            created_by=UserType.from_neomodel(load_one(activity, 'created_by')) if load_one(activity, 'created_by') and isinstance(load_one(activity, 'created_by'), Users) else None,
             # community=CommunityType.from_neomodel(activity.community.single()) if activity.community.single() else None,
             date=activity.date,
             is_deleted=activity.is_deleted,
@@ -970,9 +977,9 @@ class CommunityAffiliationType(ObjectType):
             date=affiliation.date,
             subject=affiliation.subject,
             file_id=affiliation.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in affiliation.file_id] if affiliation.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in affiliation.file_id] if affiliation.file_id else None),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(affiliation.created_by.single()) if affiliation.created_by.single() and isinstance(affiliation.created_by.single(), Users) else None,
+            created_by=UserType.from_neomodel(load_one(affiliation, 'created_by')) if load_one(affiliation, 'created_by') and isinstance(load_one(affiliation, 'created_by'), Users) else None,
             # community=CommunityType.from_neomodel(affiliation.community.single()) if affiliation.community.single() else None,
             timestamp=affiliation.timestamp,
             is_deleted=affiliation.is_deleted,
@@ -1017,9 +1024,9 @@ class CommunityAchievementType(ObjectType):
             date=achievement.date,
             subject=achievement.subject,
             file_id=achievement.file_id,
-            file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
+            file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in achievement.file_id] if achievement.file_id else None),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(achievement.created_by.single()) if achievement.created_by.single() and isinstance(achievement.created_by.single(), Users) else None,
+            created_by=UserType.from_neomodel(load_one(achievement, 'created_by')) if load_one(achievement, 'created_by') and isinstance(load_one(achievement, 'created_by'), Users) else None,
             # community=CommunityType.from_neomodel(achievement.community.single()) if achievement.community.single() else None,
             timestamp=achievement.timestamp,
             is_deleted=achievement.is_deleted,
@@ -1067,14 +1074,16 @@ class SubCommunityType(graphene.ObjectType):
 
     @classmethod
     def from_neomodel(cls, sub_community):
-        sub_community.number_of_members=len(sub_community.sub_community_members.all())
-        sub_community.save()
+        member_count = len(load_all(sub_community, 'sub_community_members'))
+        if sub_community.number_of_members != member_count:
+            sub_community.number_of_members = member_count
+            sub_community.save()
         
         # Safely generate group icon URL - handle errors gracefully
         group_icon_url = None
         try:
             if sub_community.group_icon_id:
-                file_info = generate_presigned_url.generate_file_info(sub_community.group_icon_id)
+                file_info = FileURL.get_file_url(sub_community.group_icon_id)
                 if file_info and file_info.get('url'):
                     group_icon_url = FileDetailType(**file_info)
         except Exception as e:
@@ -1085,7 +1094,7 @@ class SubCommunityType(graphene.ObjectType):
         cover_image_url = None
         try:
             if sub_community.cover_image_id:
-                file_info = generate_presigned_url.generate_file_info(sub_community.cover_image_id)
+                file_info = FileURL.get_file_url(sub_community.cover_image_id)
                 if file_info and file_info.get('url'):
                     cover_image_url = FileDetailType(**file_info)
         except Exception as e:
@@ -1119,8 +1128,8 @@ class SubCommunityType(graphene.ObjectType):
             contact_email=getattr(sub_community, 'contact_email', None),
             enable_comments=getattr(sub_community, 'enable_comments', True),
             # Fixed: Verify created_by is a Users object before passing to UserType
-            created_by=UserType.from_neomodel(sub_community.created_by.single()) if sub_community.created_by.single() and isinstance(sub_community.created_by.single(), Users) else None,
-            parent_community=CommunityType.from_neomodel(sub_community.parent_community.single()) if sub_community.parent_community.single() else None
+            created_by=UserType.from_neomodel(load_one(sub_community, 'created_by')) if load_one(sub_community, 'created_by') and isinstance(load_one(sub_community, 'created_by'), Users) else None,
+            parent_community=CommunityType.from_neomodel(load_one(sub_community, 'parent_community')) if load_one(sub_community, 'parent_community') else None
         )
 
 
@@ -1157,9 +1166,9 @@ class SubCommunityNoParentType(graphene.ObjectType):
             number_of_members=sub_community.number_of_members,  # Direct field
             group_invite_link=sub_community.group_invite_link,
             group_icon_id=sub_community.group_icon_id,
-            group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(sub_community.group_icon_id)),  # Define or import your function
+            group_icon_url=FileDetailType(**FileURL.get_file_url(sub_community.group_icon_id)),  # Define or import your function
             category=sub_community.category,
-            created_by=UserCommunityDetailsType.from_neomodel(sub_community.created_by.single()) if sub_community.created_by.single() else None,
+            created_by=UserCommunityDetailsType.from_neomodel(load_one(sub_community, 'created_by')) if load_one(sub_community, 'created_by') else None,
             
         )  
 
@@ -1193,7 +1202,7 @@ class UserCommunityDetailsType(ObjectType):
             created_by=user.created_by,
             updated_at=user.updated_at,
             updated_by=user.updated_by,
-            profile=ProfileCommunityDetailsType.from_neomodel(user.profile.single()) if user.profile.single() else None,
+            profile=ProfileCommunityDetailsType.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
             # connection=ConnectionNoUserType.from_neomodel(user.connection.single()) if user.connection.single() else None,
         )
 
@@ -1236,7 +1245,7 @@ class ProfileCommunityDetailsType(ObjectType):
             college=profile.college,
             lives_in=profile.lives_in,
             profile_pic_id=profile.profile_pic_id,
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile.profile_pic_id)) if profile.profile_pic_id else None,
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile.profile_pic_id)) if profile.profile_pic_id else None,
             
         )
 
@@ -1286,7 +1295,7 @@ class CommunityDetailsType(ObjectType):
 
             manager = CommunityMemberCountManager(community_uid=community.uid)
 
-            membercount=len(community.members.all())
+            membercount=len(load_all(community, 'members'))
             # Set counts
             manager.update_counts_if_needed(membercount,"community")
 
@@ -1320,7 +1329,7 @@ class CommunityDetailsType(ObjectType):
                     vibes_count = 0
 
             try:
-                post_count = len([post for post in community.community_post.all() if not post.is_deleted])
+                post_count = len([post for post in load_all(community, 'community_post') if not post.is_deleted])
             except Exception:
                 post_count = 0        
 
@@ -1346,28 +1355,28 @@ class CommunityDetailsType(ObjectType):
                     universemembercount=universe_member_count,
                     group_invite_link=community.group_invite_link,
                     group_icon_id=community.group_icon_id,
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(
                         community.group_icon_id)) if community.group_icon_id else None,
                     cover_image_id=community.cover_image_id,
-                    cover_image_url=FileDetailType(**generate_presigned_url.generate_file_info(
+                    cover_image_url=FileDetailType(**FileURL.get_file_url(
                         community.cover_image_id)) if community.cover_image_id else None,
                     category=community.category,
                     is_login_user_member=is_login_user_mem,
                     is_admin=i_admin,
                     community_level="Community",
                     created_by=UserCommunityDetailsType.from_neomodel(
-                        community.created_by.single()) if community.created_by.single() else None,
+                        load_one(community, 'created_by')) if load_one(community, 'created_by') else None,
                     
                     community_vibe_list=[VibeCommunityListType.from_neomodel(
                         vibe) for vibe in sorted_reactions],
                     my_community_vibe=[
                         CommunityReviewNonCommunityType.from_neomodel(review)
                         for review in sorted(
-                            community.community_review,
+                            load_all(community, 'community_review'),
                             key=lambda r: r.timestamp,  # Assuming there's a timestamp attribute to sort by
                             reverse=True
                         )
-                        if review.byuser.single().uid == user_node.uid
+                        if load_one(review, 'byuser').uid == user_node.uid
                     ],
                     # child_community=[SubCommunityNoParentType.from_neomodel(sub_community) for sub_community in community.child_communities.all()],
                     # sibling_community=[SubCommunityNoParentType.from_neomodel(sub_community) for sub_community in community.sibling_communities.all()],
@@ -1386,7 +1395,7 @@ class CommunityDetailsType(ObjectType):
 
             manager = CommunityMemberCountManager(community_uid=subcommunity.uid)
 
-            membercount=len(subcommunity.sub_community_members.all())
+            membercount=len(load_all(subcommunity, 'sub_community_members'))
             # Set counts
             manager.update_counts_if_needed(membercount,"subcommunity")
 
@@ -1412,7 +1421,7 @@ class CommunityDetailsType(ObjectType):
                     sorted_reactions = CommunityVibe.objects.all()[:10]
                     vibes_count = 0
             try:
-                post_count = len([post for post in subcommunity.community_post.all() if not post.is_deleted])
+                post_count = len([post for post in load_all(subcommunity, 'community_post') if not post.is_deleted])
             except Exception:
                 post_count = 0
 
@@ -1444,17 +1453,17 @@ class CommunityDetailsType(ObjectType):
                     universemembercount=universe_member_count,
                     group_invite_link=subcommunity.group_invite_link,
                     group_icon_id=subcommunity.group_icon_id,
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(
                         subcommunity.group_icon_id)),
                     cover_image_id=subcommunity.cover_image_id,
-                    cover_image_url=FileDetailType(**generate_presigned_url.generate_file_info(
+                    cover_image_url=FileDetailType(**FileURL.get_file_url(
                         subcommunity.cover_image_id)) if subcommunity.cover_image_id else None,
                     category=subcommunity.category,
                     is_login_user_member=is_login_user_mem,
                     is_admin=i_admin,
                     community_level="SubCommunity",
                     created_by=UserCommunityDetailsType.from_neomodel(
-                        subcommunity.created_by.single()) if subcommunity.created_by.single() else None,
+                        load_one(subcommunity, 'created_by')) if load_one(subcommunity, 'created_by') else None,
                     community_vibe_list=[VibeCommunityListType.from_neomodel(
                         vibe) for vibe in sorted_reactions],
                     my_community_vibe=[],
@@ -1548,8 +1557,8 @@ class SubCommunityMembershipType(graphene.ObjectType):
             can_message=membership.can_message,
             is_blocked=membership.is_blocked,
             is_notification_muted=membership.is_notification_muted,
-            user=UserType.from_neomodel(membership.user.single()) if membership.user.single() else None,
-            sub_community=SubCommunityType.from_neomodel(membership.sub_community.single()) if membership.sub_community.single() else None,
+            user=UserType.from_neomodel(load_one(membership, 'user')) if load_one(membership, 'user') else None,
+            sub_community=SubCommunityType.from_neomodel(load_one(membership, 'sub_community')) if load_one(membership, 'sub_community') else None,
         )
     
 
@@ -1630,6 +1639,9 @@ class CommunityInfoType(graphene.ObjectType):
         community_details=[]
         child_details=[]
         sibling_details=[]
+        FileURL.store_file_urls_for(
+            [result[0] for result in [*results1, *(results2 or [])]], 'group_icon_id', 'cover_image_id'
+        )
         for result in results1:
                 community_node=result[0]
                 community_details.append(ParentCommunityInfoType.from_neomodel(community_node))
@@ -1686,7 +1698,7 @@ class ParentCommunityInfoType(graphene.ObjectType):
             number_of_members=community_node.get("number_of_members"),
             group_invite_link=community_node.get("group_invite_link", ""),
             group_icon_id=community_node.get("group_icon_id"),
-            group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community_node.get("group_icon_id"))),  # Customize as needed
+            group_icon_url=FileDetailType(**FileURL.get_file_url(community_node.get("group_icon_id"))),  # Customize as needed
             category=community_node.get("category"),
         )
     
@@ -1724,7 +1736,7 @@ class SubCommunityInfoType(graphene.ObjectType):
             number_of_members=sub_community_node.get("number_of_members"),
             group_invite_link=sub_community_node.get("group_invite_link", ""),
             group_icon_id=sub_community_node.get("group_icon_id"),
-            group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(sub_community_node.get("group_icon_id"))),  # Customize URL as needed
+            group_icon_url=FileDetailType(**FileURL.get_file_url(sub_community_node.get("group_icon_id"))),  # Customize URL as needed
             category=sub_community_node.get("category")
         )
     
@@ -1798,7 +1810,7 @@ class ProfileCommunityListType(graphene.ObjectType):
             college = profile["college"],
             lives_in = profile["lives_in"],
             profile_pic_id = profile["profile_pic_id"],
-            profile_pic=FileDetailType(**generate_presigned_url.generate_file_info(profile["profile_pic_id"])),
+            profile_pic=FileDetailType(**FileURL.get_file_url(profile["profile_pic_id"])),
         )
     
 
@@ -1845,8 +1857,8 @@ class CommunitySubDetailsType(ObjectType):
     def from_neomodel(cls, community=None,subcommunity=None, community_type=None, community_circle=None):
 
         if community:
-            child_communities = community.child_communities.all()
-            sibling_communities = community.sibling_communities.all()
+            child_communities = load_all(community, 'child_communities')
+            sibling_communities = load_all(community, 'sibling_communities')
             
             # Apply filtering for child communities based on `community_circle` and `community_type`
             if community_circle:
@@ -1865,11 +1877,11 @@ class CommunitySubDetailsType(ObjectType):
                 ]
         
         elif subcommunity:
-            parent_community = subcommunity.parent_community.single()
+            parent_community = load_one(subcommunity, 'parent_community')
             
-            parent_sub_community = subcommunity.sub_community_parent.single()
-            child_communities = subcommunity.sub_community_children.all()
-            sibling_communities = subcommunity.sub_community_sibling.all() 
+            parent_sub_community = load_one(subcommunity, 'sub_community_parent')
+            child_communities = load_all(subcommunity, 'sub_community_children')
+            sibling_communities = load_all(subcommunity, 'sub_community_sibling') 
             
             flag=True
             if parent_sub_community:
@@ -1913,6 +1925,10 @@ class CommunitySubDetailsType(ObjectType):
                     c for c in sibling_communities if c.sub_community_group_type == community_type.value
                 ]
 
+        FileURL.store_file_urls_for(
+            [*(child_communities or []), *(sibling_communities or []), *([parent_community] if parent_community else [])],
+            'group_icon_id', 'cover_image_id',
+        )
         return cls(
             child_community=[SubCommunityNoParentType.from_neomodel(sub_community)for sub_community in child_communities]if child_communities else [],
             sibling_community=[SubCommunityNoParentType.from_neomodel(sub_community)for sub_community in sibling_communities]if sibling_communities else [],
@@ -1999,6 +2015,7 @@ class CommunityCategoryType(ObjectType):
                         results1,_ = db.cypher_query(query, params)
                     else:
                         results1,_ = db.cypher_query(fetch_popular_community_feed)
+                FileURL.store_file_urls_for([community[0] for community in results1], 'group_icon_id')
                 for community in results1:
                     community_node = community[0]
                     data.append(
@@ -2066,6 +2083,7 @@ class CommunityCategoryType(ObjectType):
                         results2,_ = db.cypher_query(query, params)
                     else:
                         results2,_ = db.cypher_query(fetch_newest_community_feed)
+                FileURL.store_file_urls_for([community[0] for community in results2], 'group_icon_id')
                 for community in results2:
                     community_node = community[0]
                     data.append(
@@ -2091,6 +2109,7 @@ class GroupedCommunityCategoryType(ObjectType):
 
 
             data=[]
+            FileURL.store_file_urls_for([community[0] for community in result1], 'group_icon_id')
             for community in result1:
                     community_node = community[0]
                     data.append(
@@ -2125,6 +2144,7 @@ class SecondaryCommunityCategoryType(ObjectType):
                   params = {"user_uid": user_uid}    
                   results,_ = db.cypher_query(get_all_user_communities, params)
 
+               FileURL.store_file_urls_for([community[0] for community in results], 'group_icon_id')
                for community in results:
                    community_node = community[0]
                    data.append(
@@ -2139,6 +2159,7 @@ class SecondaryCommunityCategoryType(ObjectType):
                     params = {"log_in_user_uid": log_in_uid,"user_uid":user_uid}    
                     results1,_ = db.cypher_query(get_mutual_community_query,params)
 
+                FileURL.store_file_urls_for([community[0] for community in results1], 'group_icon_id')
                 for community in results1:
                     community_node = community[0]
                     data.append(
@@ -2155,6 +2176,7 @@ class SecondaryCommunityCategoryType(ObjectType):
                     params = {"log_in_user_uid": log_in_uid,"user_uid":user_uid}    
                     results2,_ = db.cypher_query(get_common_interest_community_query,params)
 
+                FileURL.store_file_urls_for([community[0] for community in results2], 'group_icon_id')
                 for community in results2:
                     community_node = community[0]
                     data.append(
@@ -2195,7 +2217,7 @@ class CommunityFeedType(ObjectType):
                     number_of_members=community.number_of_members,
                     group_invite_link=community.group_invite_link,
                     group_icon_id=community.group_icon_id,
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community.group_icon_id)) if community.group_icon_id else None,
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(community.group_icon_id)) if community.group_icon_id else None,
                     category=community.category,
                     type=community.sub_community_type,
                     is_parent_community=False,
@@ -2210,7 +2232,7 @@ class CommunityFeedType(ObjectType):
                     number_of_members=community['number_of_members'],
                     group_invite_link=community['group_invite_link'],
                     group_icon_id=community['group_icon_id'],
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community['group_icon_id'])) if community['group_icon_id'] else None,
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(community['group_icon_id'])) if community['group_icon_id'] else None,
                     category=community['category'],
                     type=community['community_type'],
                     is_parent_community=community['community_type'] != None,
@@ -2226,7 +2248,7 @@ class CommunityFeedType(ObjectType):
                     number_of_members=community.number_of_members,
                     group_invite_link=community.group_invite_link,
                     group_icon_id=community.group_icon_id,
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community.group_icon_id)) if community.group_icon_id else None,
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(community.group_icon_id)) if community.group_icon_id else None,
                     category=community.category,
                     type=community.community_type,
                     is_parent_community=community.community_type != None,
@@ -2242,7 +2264,7 @@ class CommunityFeedType(ObjectType):
                     number_of_members=community['number_of_members'],
                     group_invite_link=community['group_invite_link'],
                     group_icon_id=community['group_icon_id'],
-                    group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community['group_icon_id'])) if community['group_icon_id'] else None,
+                    group_icon_url=FileDetailType(**FileURL.get_file_url(community['group_icon_id'])) if community['group_icon_id'] else None,
                     category=community['category'],
                     type=community['community_type'] if community['community_type'] else community['sub_community_type'],
                     is_parent_community=community['community_type'] != None,
@@ -2281,7 +2303,7 @@ class CommunityPostType(ObjectType):
                 post_text=post.post_text,
                 post_type=post.post_type,
                 post_file_id=post.post_file_id,
-                post_file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in post.post_file_id] if post.post_file_id else None),
+                post_file_url=([FileDetailType(**FileURL.get_file_url(file_id)) for file_id in post.post_file_id] if post.post_file_id else None),
                 privacy=post.privacy,
                 comment_count=get_post_comment_count(post.uid),
                 vibes_count=get_post_like_count(post.uid),
@@ -2289,7 +2311,7 @@ class CommunityPostType(ObjectType):
                 created_at=post.created_at,
                 updated_at=post.updated_at,
                 is_deleted=post.is_deleted,
-                creator=UserType.from_neomodel(post.creator.single()) if post.creator.single() else None,
+                creator=UserType.from_neomodel(load_one(post, 'creator')) if load_one(post, 'creator') else None,
                 score=generate_connection_score(),
             )
     def resolve_mentioned_users(self, info):
@@ -2301,7 +2323,7 @@ class CommunityPostType(ObjectType):
             
             mentioned_users = []
             for mention in mentions:
-                mentioned_user = mention.mentioned_user.single()
+                mentioned_user = load_one(mention, 'mentioned_user')
                 if mentioned_user:
                     mentioned_users.append(UserType.from_neomodel(mentioned_user))
             
@@ -2320,6 +2342,7 @@ class CommunityDetailsByCategoryType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, title, communities):
+        FileURL.store_file_urls_for(communities or [], 'group_icon_id')
         return cls(
             title=title,
             data=[CommunityFeedType.from_neomodel(community) for community in communities] if communities else []
@@ -2355,9 +2378,9 @@ class CommunityInfoItemType(ObjectType):
                 number_of_members=community.number_of_members,
                 group_invite_link=community.group_invite_link,
                 group_icon_id=community.group_icon_id,
-                group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community.group_icon_id)) if community.group_icon_id else None,
+                group_icon_url=FileDetailType(**FileURL.get_file_url(community.group_icon_id)) if community.group_icon_id else None,
                 category=community.category,
-                created_by=UserCommunityDetailsType.from_neomodel(community.created_by.single()) if community.created_by.single() else None
+                created_by=UserCommunityDetailsType.from_neomodel(load_one(community, 'created_by')) if load_one(community, 'created_by') else None
             )
         else:
             # This is a Community
@@ -2372,9 +2395,9 @@ class CommunityInfoItemType(ObjectType):
                 number_of_members=community.number_of_members,
                 group_invite_link=community.group_invite_link,
                 group_icon_id=community.group_icon_id,
-                group_icon_url=FileDetailType(**generate_presigned_url.generate_file_info(community.group_icon_id)) if community.group_icon_id else None,
+                group_icon_url=FileDetailType(**FileURL.get_file_url(community.group_icon_id)) if community.group_icon_id else None,
                 category=community.category,
-                created_by=UserCommunityDetailsType.from_neomodel(community.created_by.single()) if community.created_by.single() else None
+                created_by=UserCommunityDetailsType.from_neomodel(load_one(community, 'created_by')) if load_one(community, 'created_by') else None
             )
 
 class CommunityDetailsByUidType(ObjectType):
@@ -2389,8 +2412,8 @@ class CommunityDetailsByUidType(ObjectType):
         parent_communities = []
 
         if community:
-            child_communities = community.child_communities.all()
-            sibling_communities = community.sibling_communities.all()
+            child_communities = load_all(community, 'child_communities')
+            sibling_communities = load_all(community, 'sibling_communities')
             
             # Apply filtering for child communities based on `community_circle` and `community_type`
             if community_circle:
@@ -2409,11 +2432,11 @@ class CommunityDetailsByUidType(ObjectType):
                 ]
         
         elif subcommunity:
-            parent_community = subcommunity.parent_community.single()
+            parent_community = load_one(subcommunity, 'parent_community')
             
-            parent_sub_community = subcommunity.sub_community_parent.single()
-            child_communities = subcommunity.sub_community_children.all()
-            sibling_communities = subcommunity.sub_community_sibling.all() 
+            parent_sub_community = load_one(subcommunity, 'sub_community_parent')
+            child_communities = load_all(subcommunity, 'sub_community_children')
+            sibling_communities = load_all(subcommunity, 'sub_community_sibling') 
             
             flag = True
             if parent_sub_community:
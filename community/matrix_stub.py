@@ -0,0 +1,201 @@
+"""
+Local stand-in for the Matrix homeserver.
+
+Serves the client-server endpoints community room provisioning calls, under
+both /_matrix/client/v3 and /_matrix/client/r0:
+
+- GET  /_matrix/client/versions
+- POST /createRoom                 honours name, room_alias_name (M_ROOM_IN_USE
+                                   when taken), invite and
+                                   power_level_content_override
+- GET  /directory/room/{alias}
+- GET  /rooms/{room_id}/state/{type}[/{state_key}]
+- PUT  /rooms/{room_id}/state/{type}[/{state_key}]
+- POST /rooms/{room_id}/invite     {"user_id"}
+- POST /join/{room_id}             403 M_FORBIDDEN unless invited
+
+Access tokens (Authorization header or ?access_token=) are registered with
+`add_user(token, matrix_user_id)`; any other token gets 401 M_UNKNOWN_TOKEN. `latency_ms` delays every request,
+`fail_rate` answers that share of requests with 502, and
+`lose_create_responses` creates the room but answers 502 (a homeserver that
+timed out after committing), for idempotency tests.
+
+Used by community.tests.test_matrix_provisioning and
+`manage.py bench_community_provisioning`.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+PREFIXES = ('/_matrix/client/v3', '/_matrix/client/r0')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like a real homeserver
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def _dispatch(self, method):
+        stub = self.server.stub
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'{}') if length else {}
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        url = urlsplit(self.path)
+        path = url.path
+        if path == '/_matrix/client/versions':
+            return self._reply(200, {'versions': ['v1.6']})
+        for prefix in PREFIXES:
+            if path.startswith(prefix + '/'):
+                parts = [unquote(p) for p in path[len(prefix) + 1:].split('/')]
+                break
+        else:
+            return self._reply(404, {'errcode': 'M_UNRECOGNIZED', 'error': 'Unrecognized request'})
+
+        token = (self.headers.get('Authorization') or '').replace('Bearer ', '', 1)
+        token = token or parse_qs(url.query).get('access_token', [''])[0]
+        status, reply = stub.handle(method, parts, stub.users.get(token), body)
+        self._reply(status, reply)
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _error(status, errcode, error):
+    return status, {'errcode': errcode, 'error': error}
+
+
+class MatrixStubServer:
+    """Threaded in-memory homeserver that counts requests per endpoint."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0,
+                 fail_rate: float = 0.0, server_name: str = 'stub.local'):
+        self.latency = latency_ms / 1000.0
+        self.fail_rate = fail_rate
+        self.server_name = server_name
+        self.lose_create_responses = 0
+        self.users = {}      # access token -> matrix user id
+        self.rooms = {}      # room id -> {'name', 'members', 'invited', 'state'}
+        self.aliases = {}    # full alias -> room id
+        self.requests = 0
+        self.calls = {}      # endpoint -> count
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_user(self, access_token: str, matrix_user_id: str):
+        self.users[access_token] = matrix_user_id
+
+    def handle(self, method, parts, user, body):
+        with self._lock:
+            self.requests += 1
+            endpoint = f"rooms/{parts[2]}" if parts[0] == 'rooms' and len(parts) > 2 else parts[0]
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            if user is None:
+                return _error(401, 'M_UNKNOWN_TOKEN', 'Unrecognised access token')
+            if self.fail_rate and random.random() < self.fail_rate:
+                return _error(502, 'M_UNKNOWN', 'Bad gateway')
+
+            if method == 'POST' and parts == ['createRoom']:
+                return self._create_room(user, body)
+            if method == 'GET' and parts[:2] == ['directory', 'room'] and len(parts) == 3:
+                room_id = self.aliases.get(parts[2])
+                return (200, {'room_id': room_id}) if room_id else _error(404, 'M_NOT_FOUND', 'Room alias not found')
+            if method == 'POST' and parts[0] == 'join' and len(parts) == 2:
+                return self._join(user, parts[1])
+            if parts[0] == 'rooms' and len(parts) >= 3:
+                room = self.rooms.get(parts[1])
+                if room is None:
+                    return _error(404, 'M_NOT_FOUND', 'Unknown room')
+                if method == 'POST' and parts[2] == 'invite':
+                    return self._invite(user, room, body.get('user_id'))
+                if parts[2] == 'state' and len(parts) >= 4:
+                    key = (parts[3], parts[4] if len(parts) > 4 else '')
+                    if method == 'PUT':
+                        room['state'][key] = body
+                        return 200, {'event_id': f"${self.requests}"}
+                    if key in room['state']:
+                        return 200, room['state'][key]
+                    return _error(404, 'M_NOT_FOUND', 'Event not found')
+            return _error(404, 'M_UNRECOGNIZED', 'Unrecognized request')
+
+    def _create_room(self, user, body):
+        alias = None
+        if body.get('room_alias_name'):
+            alias = f"#{body['room_alias_name']}:{self.server_name}"
+            if alias in self.aliases:
+                return _error(400, 'M_ROOM_IN_USE', 'Room alias already taken')
+        room_id = f"!room{len(self.rooms) + 1}:{self.server_name}"
+        power_levels = {'users': {user: 100}, 'users_default': 0, 'invite': 50}
+        power_levels.update(body.get('power_level_content_override') or {})
+        self.rooms[room_id] = {
+            'name': body.get('name'),
+            'members': {user},
+            'invited': set(body.get('invite') or []),
+            'state': {('m.room.power_levels', ''): power_levels},
+        }
+        if alias:
+            self.aliases[alias] = room_id
+        if self.lose_create_responses:
+            self.lose_create_responses -= 1
+            return _error(502, 'M_UNKNOWN', 'Bad gateway')
+        return 200, {'room_id': room_id}
+
+    def _invite(self, user, room, invitee):
+        if user not in room['members']:
+            return _error(403, 'M_FORBIDDEN', 'You are not in the room')
+        if invitee in room['members']:
+            return _error(403, 'M_FORBIDDEN', f'{invitee} is already in the room.')
+        room['invited'].add(invitee)
+        return 200, {}
+
+    def _join(self, user, room_id):
+        room = self.rooms.get(room_id)
+        if room is None:
+            return _error(404, 'M_NOT_FOUND', 'Unknown room')
+        if user not in room['members'] and user not in room['invited']:
+            return _error(403, 'M_FORBIDDEN', 'You are not invited to this room.')
+        room['invited'].discard(user)
+        room['members'].add(user)
+        return 200, {'room_id': room_id}
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.calls = {}
+
+    def start(self) -> 'MatrixStubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='matrix-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.14 on 2026-10-16 23:10
+
+import community.models
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_generatedcommunityusermanager'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatrixRoomProvisioning',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('community_uid', models.CharField(max_length=255, unique=True)),
+                ('kind', models.CharField(choices=[('community', 'Community'), ('subcommunity', 'Sub Community')], default='community', max_length=20)),
+                ('creator_user_id', models.CharField(max_length=255)),
+                ('room_name', models.CharField(blank=True, default='', max_length=255)),
+                ('topic', models.TextField(blank=True, default='')),
+                ('member_uids', models.JSONField(default=list)),
+                ('agent_uid', models.CharField(blank=True, max_length=255, null=True)),
+                ('room_data', models.JSONField(default=dict)),
+                ('idempotency_key', models.CharField(default=community.models.new_idempotency_key, max_length=64, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('room_created', 'Room Created'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20)),
+                ('room_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('room_state_set', models.BooleanField(default=False)),
+                ('joined', models.JSONField(default=list)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Matrix Room Provisioning',
+                'verbose_name_plural': 'Matrix Room Provisionings',
+                'ordering': ['next_attempt_at'],
+            },
+        ),
+    ]
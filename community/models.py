@@ -12,6 +12,7 @@ from django.contrib.auth.models import User
 from django.db import models
 from django.utils import timezone
 from datetime import timedelta
+import uuid
 from vibe_manager.models import CommunityVibe
 from post.models import Like,Comment
 
@@ -1658,7 +1659,74 @@ class GeneratedCommunityUserManager(models.Model):
             self.save()
         else:
             return False
-        
+
+
+def new_idempotency_key():
+    return uuid.uuid4().hex
+
+
+class MatrixRoomProvisioning(models.Model):
+    """
+    Outbox row for the Matrix room of a newly created community.
+
+    CreateCommunity records one row per community instead of talking to the
+    Matrix homeserver inside the request; community.utils.matrix_provisioning
+    works the row off in a Celery worker and writes the room id back to the
+    Community node when the room exists.
+
+    Business Logic:
+    - One row per community (community_uid is unique), so a retried mutation
+      or a re-delivered task never provisions a second room
+    - `idempotency_key` becomes the room alias, which lets a retry find the
+      room an interrupted attempt already created instead of creating another
+    - Progress is saved step by step (room_id, room_state_set, joined), so a
+      retry only redoes what did not finish
+    - Failed attempts back off through next_attempt_at until MAX attempts,
+      then the row is left in 'failed' with the last error
+
+    Use Cases:
+    - Provisioning community chat rooms outside the request
+    - Finding communities whose room could not be created (status='failed')
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('room_created', 'Room Created'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    KIND_CHOICES = (
+        ('community', 'Community'),
+        ('subcommunity', 'Sub Community'),
+    )
+
+    community_uid = models.CharField(max_length=255, unique=True)  # Community (or SubCommunity) node uid
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='community')
+    creator_user_id = models.CharField(max_length=255)  # Django user id of the creator (room admin)
+    room_name = models.CharField(max_length=255, blank=True, default='')
+    topic = models.TextField(blank=True, default='')
+    member_uids = models.JSONField(default=list)  # Users node uids to invite and join
+    agent_uid = models.CharField(max_length=255, null=True, blank=True)  # Agent joined with power level 100
+    room_data = models.JSONField(default=dict)  # image_id / community_data for the avatar, score and filter state
+    idempotency_key = models.CharField(max_length=64, unique=True, default=new_idempotency_key)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    room_id = models.CharField(max_length=255, null=True, blank=True)
+    room_state_set = models.BooleanField(default=False)
+    joined = models.JSONField(default=list)  # Matrix user ids that have joined the room
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+    locked_until = models.DateTimeField(null=True, blank=True)  # Lease of the worker running the row
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Matrix Room Provisioning'
+        verbose_name_plural = 'Matrix Room Provisionings'
+        ordering = ['next_attempt_at']
+
+    def __str__(self):
+        return f"{self.kind} {self.community_uid} - {self.status}"
+
 
 class CommunityPost(DjangoNode, StructuredNode):
     """
@@ -0,0 +1,21 @@
+from celery import shared_task
+import logging
+
+from community.utils.matrix_provisioning import provision_due
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def provision_matrix_room(job_id):
+    """Provision the Matrix room recorded by CreateCommunity as MatrixRoomProvisioning `job_id`."""
+    return provision_due(job_id=job_id)
+
+
+@shared_task
+def provision_pending_matrix_rooms(limit=50):
+    """Retry due MatrixRoomProvisioning rows (scheduled every MATRIX_PROVISION_SWEEP_SECONDS)."""
+    attempted = provision_due(limit=limit)
+    if attempted:
+        logger.info(f"Attempted {attempted} Matrix room provisionings")
+    return attempted
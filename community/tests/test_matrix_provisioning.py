@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from community.matrix_stub import MatrixStubServer
+from community.models import MatrixRoomProvisioning
+from community.utils import matrix_provisioning
+from community.utils.matrix_provisioning import MatrixAccount, MatrixClient
+
+
+class TestMatrixRoomProvisioning(TestCase):
+    """The worker creates the room once, resumes after failures and joins everyone."""
+
+    def setUp(self):
+        self.stub = MatrixStubServer().start()
+        self.addCleanup(self.stub.stop)
+        self.client = MatrixClient(self.stub.url)
+        self.addCleanup(self.client.close)
+
+        self.creator = MatrixAccount('@creator:stub.local', 'creator-token')
+        self.agent = MatrixAccount('@agent:stub.local', 'agent-token')
+        self.members = [MatrixAccount(f'@member{i}:stub.local', f'member-token-{i}') for i in range(5)]
+        for account in [self.creator, self.agent, *self.members]:
+            self.stub.add_user(account.access_token, account.matrix_user_id)
+
+        patcher = mock.patch('community.utils.matrix_provisioning.db.cypher_query', return_value=([], None))
+        self.cypher_query = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.job = MatrixRoomProvisioning.objects.create(
+            community_uid='community-1', creator_user_id='1', room_name='Bench', member_uids=['u1', 'u2'],
+        )
+
+    def _run(self):
+        with mock.patch.multiple(
+            matrix_provisioning,
+            _creator_account=mock.Mock(return_value=self.creator),
+            _member_accounts=mock.Mock(return_value=self.members),
+            _agent_account=mock.Mock(return_value=self.agent),
+        ):
+            return matrix_provisioning.run_job(self.job, self.client)
+
+    def test_provisions_room_in_one_create(self):
+        job = self._run()
+
+        self.assertEqual(job.status, 'done')
+        room = self.stub.rooms[job.room_id]
+        expected = {a.matrix_user_id for a in [self.creator, self.agent, *self.members]}
+        self.assertEqual(room['members'], expected)
+        power = room['state'][('m.room.power_levels', '')]['users']
+        self.assertEqual(power, {self.creator.matrix_user_id: 100, self.agent.matrix_user_id: 100})
+        # createRoom carries the invites: no separate invite calls
+        self.assertEqual(self.stub.calls.get('createRoom'), 1)
+        self.assertNotIn('rooms/invite', self.stub.calls)
+        self.cypher_query.assert_called_with(mock.ANY, {'uid': 'community-1', 'room_id': job.room_id})
+
+    def test_lost_create_response_reuses_room(self):
+        self.stub.lose_create_responses = 1
+
+        job = self._run()
+        self.assertEqual((job.status, job.attempts, job.room_id), ('pending', 1, None))
+        self.assertGreater(job.next_attempt_at, job.updated_at)
+
+        job = self._run()
+        self.assertEqual(job.status, 'done')
+        self.assertEqual(len(self.stub.rooms), 1)
+        self.assertEqual(job.room_id, next(iter(self.stub.rooms)))
+
+    def test_retry_only_joins_missing_members(self):
+        late = self.members[-1]
+        del self.stub.users[late.access_token]
+
+        job = self._run()
+        self.assertEqual((job.status, job.attempts), ('room_created', 1))
+        self.assertNotIn(late.matrix_user_id, job.joined)
+        self.assertIn('1 of 6 joins failed', job.last_error)
+
+        self.stub.add_user(late.access_token, late.matrix_user_id)
+        self.stub.reset()
+        job.next_attempt_at = job.updated_at
+        job = self._run()
+        self.assertEqual(job.status, 'done')
+        self.assertEqual(self.stub.calls, {'join': 1})
+
+    def test_gives_up_after_max_attempts(self):
+        self.job.attempts = matrix_provisioning.PROVISION_MAX_ATTEMPTS - 1
+        with mock.patch.object(matrix_provisioning, '_creator_account', side_effect=Exception('no credentials')):
+            job = matrix_provisioning.run_job(self.job, self.client)
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.last_error, 'no credentials')
+
+    def test_claim_skips_leased_and_future_rows(self):
+        self.assertEqual(matrix_provisioning.claim_due_jobs(), [self.job])
+        self.assertEqual(matrix_provisioning.claim_due_jobs(), [])
+
+    def test_retry_delay_is_capped(self):
+        self.assertEqual(matrix_provisioning.retry_delay(1), matrix_provisioning.PROVISION_RETRY_SECONDS)
+        self.assertEqual(matrix_provisioning.retry_delay(30), matrix_provisioning.MAX_RETRY_SECONDS)
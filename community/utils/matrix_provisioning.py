@@ -0,0 +1,343 @@
+"""
+Matrix room provisioning for new communities, through an outbox table.
+
+CreateCommunity used to build the room inside the request:
+`asyncio.run(create_room(...))` checked /versions, created the room, read and
+rewrote the power levels, set the avatar / filter state, and a daemon thread
+then invited and joined every member one at a time. The response waited on
+four to five homeserver round trips, and a failure part way left a community
+without a room, or a room without its members, with nothing to retry it.
+
+The mutation now only records a MatrixRoomProvisioning row
+(`enqueue_room_provisioning`). community.tasks.provision_matrix_room works it
+off once the request commits, and the beat sweep
+community.tasks.provision_pending_matrix_rooms picks up rows whose task was
+lost or whose attempt failed. A run:
+
+1. creates the room with one createRoom call that already carries the
+   creator / agent power levels (power_level_content_override) and the
+   invites of every member with Matrix credentials. The room alias is the
+   row's idempotency key: if an earlier attempt created the room but died
+   before saving room_id, createRoom answers M_ROOM_IN_USE and the alias
+   resolves to that room
+2. writes room_id back to the Community / SubCommunity node
+3. sets the avatar, score and filter state (set_room_avatar_score_and_filter)
+4. joins the members and the agent with their own tokens,
+   MATRIX_PROVISION_CONCURRENCY at a time; a member without an invite is
+   invited first
+
+Each step saves its progress on the row, so a retry resumes where the last
+attempt stopped. Failed attempts back off exponentially from
+MATRIX_PROVISION_RETRY_SECONDS (capped at an hour) up to
+MATRIX_PROVISION_MAX_ATTEMPTS, after which the row stays 'failed' with
+last_error.
+"""
+
+import asyncio
+import logging
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import quote
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from neomodel import db
+from requests.adapters import HTTPAdapter
+
+from community.models import MatrixRoomProvisioning
+
+matrix_logger = logging.getLogger("matrix_logger")
+
+PROVISION_CONCURRENCY = int(os.getenv('MATRIX_PROVISION_CONCURRENCY', '8'))
+PROVISION_MAX_ATTEMPTS = int(os.getenv('MATRIX_PROVISION_MAX_ATTEMPTS', '8'))
+PROVISION_RETRY_SECONDS = int(os.getenv('MATRIX_PROVISION_RETRY_SECONDS', '30'))
+PROVISION_LEASE_SECONDS = int(os.getenv('MATRIX_PROVISION_LEASE_SECONDS', '300'))
+MAX_RETRY_SECONDS = 3600
+REQUEST_TIMEOUT = 10
+
+MatrixAccount = namedtuple('MatrixAccount', ['matrix_user_id', 'access_token'])
+
+
+class MatrixError(Exception):
+    def __init__(self, status, errcode='', error=''):
+        super().__init__(f"Matrix HTTP {status} {errcode}: {error}")
+        self.status = status
+        self.errcode = errcode
+
+
+class MatrixClient:
+    """Synchronous client-server API calls over one keep-alive requests.Session."""
+
+    def __init__(self, base_url: str = None, pool_size: int = PROVISION_CONCURRENCY, timeout: int = REQUEST_TIMEOUT):
+        self.base_url = (base_url or settings.MATRIX_SERVER_URL).rstrip('/')
+        self.timeout = timeout
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _call(self, method, path, access_token, body=None):
+        response = self.session.request(
+            method,
+            f"{self.base_url}/_matrix/client/v3{path}",
+            json=body,
+            headers={'Authorization': f'Bearer {access_token}'},
+            timeout=self.timeout,
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if response.status_code != 200:
+            raise MatrixError(response.status_code, data.get('errcode', ''), data.get('error', response.text[:200]))
+        return data
+
+    def create_room(self, access_token, body) -> str:
+        return self._call('POST', '/createRoom', access_token, body)['room_id']
+
+    def resolve_alias(self, access_token, alias) -> str:
+        return self._call('GET', f"/directory/room/{quote(alias, safe='')}", access_token)['room_id']
+
+    def invite(self, access_token, room_id, matrix_user_id):
+        self._call('POST', f"/rooms/{quote(room_id, safe='')}/invite", access_token, {'user_id': matrix_user_id})
+
+    def join(self, access_token, room_id):
+        self._call('POST', f"/join/{quote(room_id, safe='')}", access_token, {})
+
+    def close(self):
+        self.session.close()
+
+
+def enqueue_room_provisioning(community, creator_user_id, member_uids, agent_uid=None,
+                              room_data=None, kind='community') -> MatrixRoomProvisioning:
+    """Record the Matrix room of `community` for the worker; one row per community."""
+    job, created = MatrixRoomProvisioning.objects.get_or_create(
+        community_uid=community.uid,
+        defaults={
+            'kind': kind,
+            'creator_user_id': str(creator_user_id),
+            'room_name': community.name or '',
+            'topic': str(community.description or ''),
+            'member_uids': list(dict.fromkeys(member_uids)),
+            'agent_uid': agent_uid,
+            'room_data': room_data or {},
+        },
+    )
+    if created:
+        transaction.on_commit(lambda: _dispatch(job.id))
+    return job
+
+
+def _dispatch(job_id):
+    from community.tasks import provision_matrix_room
+    try:
+        provision_matrix_room.delay(job_id)
+    except Exception as e:
+        # The row is already stored; the beat sweep provisions it.
+        matrix_logger.warning(f"Could not queue Matrix room provisioning {job_id}: {e}")
+
+
+def retry_delay(attempts: int) -> int:
+    return min(PROVISION_RETRY_SECONDS * 2 ** (attempts - 1), MAX_RETRY_SECONDS)
+
+
+def claim_due_jobs(job_id=None, limit: int = 50):
+    """Lease due rows to the calling worker; rows leased by another worker are skipped."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = MatrixRoomProvisioning.objects.select_for_update(skip_locked=True).filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+            status__in=('pending', 'room_created'),
+            next_attempt_at__lte=now,
+        )
+        if job_id is not None:
+            rows = rows.filter(id=job_id)
+        jobs = list(rows.order_by('next_attempt_at')[:limit])
+        MatrixRoomProvisioning.objects.filter(id__in=[job.id for job in jobs]).update(
+            locked_until=now + timedelta(seconds=PROVISION_LEASE_SECONDS)
+        )
+    return jobs
+
+
+def _creator_account(creator_user_id):
+    from msg.models import MatrixProfile
+
+    profile = MatrixProfile.objects.filter(user_id=creator_user_id).first()
+    if not profile or not profile.matrix_user_id or not profile.access_token:
+        # Registration may still be pending; the retry picks the profile up later.
+        raise MatrixError(0, 'NO_CREDENTIALS', f"User {creator_user_id} has no Matrix credentials")
+    return MatrixAccount(profile.matrix_user_id, profile.access_token)
+
+
+def _member_accounts(member_uids):
+    """MatrixAccounts of the members that have Matrix credentials, in two queries."""
+    from msg.models import MatrixProfile
+
+    if not member_uids:
+        return []
+    rows, _ = db.cypher_query(
+        "MATCH (u:Users) WHERE u.uid IN $uids RETURN u.user_id",
+        {'uids': list(member_uids)},
+    )
+    user_ids = [row[0] for row in rows if row[0]]
+    return [
+        MatrixAccount(matrix_user_id, access_token)
+        for matrix_user_id, access_token in MatrixProfile.objects.filter(
+            user_id__in=user_ids
+        ).values_list('matrix_user_id', 'access_token')
+        if matrix_user_id and access_token
+    ]
+
+
+def _agent_account(agent_uid):
+    if not agent_uid:
+        return None
+    from agentic.models import Agent
+
+    agent = Agent.nodes.get_or_none(uid=agent_uid)
+    if agent and agent.matrix_user_id and agent.access_token:
+        return MatrixAccount(agent.matrix_user_id, agent.access_token)
+    return None
+
+
+def room_alias_localpart(job) -> str:
+    return f"community-{job.idempotency_key}"
+
+
+def _create_room(client, job, creator, invite, power_users):
+    body = {
+        'name': job.room_name,
+        'topic': job.topic,
+        'visibility': 'private',
+        'preset': 'private_chat',
+        'room_alias_name': room_alias_localpart(job),
+        'invite': invite,
+        'power_level_content_override': {'users': power_users},
+    }
+    try:
+        return client.create_room(creator.access_token, body)
+    except MatrixError as e:
+        if e.errcode != 'M_ROOM_IN_USE':
+            raise
+        # An earlier attempt created the room; find it through its alias.
+        server_name = creator.matrix_user_id.split(':', 1)[1]
+        return client.resolve_alias(creator.access_token, f"#{room_alias_localpart(job)}:{server_name}")
+
+
+def _write_back_room_id(job):
+    db.cypher_query(
+        "MATCH (c {uid: $uid}) WHERE c:Community OR c:SubCommunity SET c.room_id = $room_id",
+        {'uid': job.community_uid, 'room_id': job.room_id},
+    )
+
+
+def _set_room_state(job, creator):
+    from community.utils.matrix_avatar_manager import set_room_avatar_score_and_filter
+
+    result = asyncio.run(set_room_avatar_score_and_filter(
+        access_token=creator.access_token,
+        user_id=job.creator_user_id,
+        room_id=job.room_id,
+        image_id=job.room_data.get('image_id'),
+        community_data=job.room_data.get('community_data'),
+    ))
+    if not result.get('success'):
+        raise MatrixError(0, 'ROOM_STATE', result.get('error'))
+
+
+def _join(client, room_id, creator, account):
+    """None once `account` is in the room, else the error."""
+    try:
+        try:
+            client.join(account.access_token, room_id)
+        except MatrixError as e:
+            if e.status != 403:
+                raise
+            client.invite(creator.access_token, room_id, account.matrix_user_id)
+            client.join(account.access_token, room_id)
+        return None
+    except Exception as e:
+        return f"{account.matrix_user_id}: {e}"
+
+
+def provision(job, client, creator, members, agent=None):
+    """Run the steps `job` has not finished yet; raises on the first step that fails."""
+    accounts = {account.matrix_user_id: account for account in members}
+    if agent:
+        accounts[agent.matrix_user_id] = agent
+    accounts.pop(creator.matrix_user_id, None)
+
+    if not job.room_id:
+        power_users = {creator.matrix_user_id: 100}
+        if agent:
+            power_users[agent.matrix_user_id] = 100
+        job.room_id = _create_room(client, job, creator, sorted(accounts), power_users)
+        job.status = 'room_created'
+        job.save(update_fields=['room_id', 'status', 'updated_at'])
+    _write_back_room_id(job)
+
+    if job.room_data and not job.room_state_set:
+        _set_room_state(job, creator)
+        job.room_state_set = True
+        job.save(update_fields=['room_state_set', 'updated_at'])
+
+    joined = set(job.joined)
+    pending = [account for matrix_user_id, account in accounts.items() if matrix_user_id not in joined]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(PROVISION_CONCURRENCY, len(pending))) as pool:
+            errors = list(pool.map(lambda account: _join(client, job.room_id, creator, account), pending))
+        job.joined = job.joined + [account.matrix_user_id for account, error in zip(pending, errors) if error is None]
+        job.save(update_fields=['joined', 'updated_at'])
+        failed = [error for error in errors if error]
+        if failed:
+            raise MatrixError(0, 'JOIN_FAILED', f"{len(failed)} of {len(pending)} joins failed, first: {failed[0]}")
+
+    job.status = 'done'
+    job.last_error = ''
+
+
+def run_job(job, client):
+    """One attempt at `job`; records success, the retry time or the final failure."""
+    try:
+        provision(
+            job, client,
+            creator=_creator_account(job.creator_user_id),
+            members=_member_accounts(job.member_uids),
+            agent=_agent_account(job.agent_uid),
+        )
+        matrix_logger.info(f"Provisioned Matrix room {job.room_id} for {job.kind} {job.community_uid}")
+    except Exception as e:
+        job.attempts += 1
+        job.last_error = str(e)[:2000]
+        if job.attempts >= PROVISION_MAX_ATTEMPTS:
+            job.status = 'failed'
+            matrix_logger.error(f"Giving up on Matrix room for {job.kind} {job.community_uid}: {e}")
+        else:
+            job.next_attempt_at = timezone.now() + timedelta(seconds=retry_delay(job.attempts))
+            matrix_logger.warning(
+                f"Matrix room for {job.kind} {job.community_uid} failed (attempt {job.attempts}): {e}"
+            )
+    job.locked_until = None
+    job.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at', 'locked_until', 'updated_at'])
+    return job
+
+
+def provision_due(job_id=None, limit: int = 50, client: MatrixClient = None) -> int:
+    """Claim and run due rows (only `job_id` if given); returns how many were attempted."""
+    jobs = claim_due_jobs(job_id=job_id, limit=limit)
+    if not jobs:
+        return 0
+    own_client = client is None
+    client = client or MatrixClient()
+    try:
+        for job in jobs:
+            run_job(job, client)
+    finally:
+        if own_client:
+            client.close()
+    return len(jobs)
@@ -1,6 +1,7 @@
 from post.utils.reaction_manager import PostReactionUtils, IndividualVibeManager
-from post.redis import get_post_comment_count, get_post_like_count
-from post.models import PostReactionManager, Like
+from post.redis import PostCounters
+from post.models import Like
+from post.utils.reaction_counts import total_vibes
 from vibe_manager.models import IndividualVibe, CommunityVibe
 from neomodel import db
 from datetime import datetime
@@ -79,15 +80,9 @@ class CommunityPostDataHelper:
             if hasattr(community_item, 'vibe_reactions'):
                 vibe_count += len([vibe for vibe in community_item.vibe_reactions.all() if vibe.is_active])
             
-            # Fallback to PostReactionManager if available
+            # Fallback to the post's reaction aggregates if available
             if vibe_count == 0 and hasattr(community_item, 'uid'):
-                post_reaction_manager = PostReactionManager.objects.filter(
-                    post_uid=community_item.uid
-                ).first()
-                
-                if post_reaction_manager:
-                    all_reactions = post_reaction_manager.post_vibe
-                    vibe_count = sum(reaction.get('vibes_count', 0) for reaction in all_reactions)
+                vibe_count = total_vibes([community_item.uid])
             
             return vibe_count
         except Exception as e:
@@ -213,12 +208,11 @@ class CommunityPostDataHelper:
         try:
            
             
-            comment_count = get_post_comment_count(community_item_uid)
-            like_count = get_post_like_count(community_item_uid)
+            counters = PostCounters.fetch([community_item_uid], kinds=('comment', 'vibe'))
             
             return {
-                'comment_count': comment_count,
-                'like_count': like_count
+                'comment_count': counters.comment_count(community_item_uid),
+                'like_count': counters.like_count(community_item_uid)
             }
         except Exception as e:
             print(f"Error getting post metrics: {e}")
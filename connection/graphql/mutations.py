@@ -42,6 +42,8 @@ from auth_manager.Utils.matrix_avatar_manager import set_user_relations_data, ge
 from msg.models import MatrixProfile
 from user_activity.services.activity_service import ActivityService
 from connection.utils.dm_room_manager import update_dm_room_by_room_id
+from post.utils.feed_candidates import invalidate_candidates
+from notification.recipients import invalidate_connection_recipients
 
 class CreateConnection(Mutation):
     """Legacy Connection Creation Mutation (Deprecated)
@@ -285,9 +287,13 @@ class UpdateConnection(Mutation):
             sender=connection.created_by.single()
             if input.connection_status == 'Cancelled' and user_node.email == sender.email:
                 
+                was_accepted = connection.connection_status == 'Accepted'
                 for key, value in input.items():
                     setattr(connection, key, value)
                 connection.save()
+                if was_accepted:
+                    receiver = connection.receiver.single()
+                    invalidate_connection_recipients(sender.uid, receiver.uid if receiver else None)
                 return UpdateConnection(connection=ConnectionType.from_neomodel(connection), success=True, message=ConnectionMessages.CONNECTION_UPDATED)
             #Handle the logic:- This connection belong to login user or not
             receiver_node=connection.receiver.single() 
@@ -443,6 +449,11 @@ class UpdateConnection(Mutation):
 
             connection.save()
 
+            if input.connection_status == 'Accepted':
+                # Both feeds now include each other's posts
+                invalidate_candidates(sender.user_id, receiver_node.user_id)
+                invalidate_connection_recipients(sender.uid, receiver_node.uid)
+
             # Track activity for analytics
             try:
                 ActivityService.track_content_interaction_by_id(
@@ -536,7 +547,10 @@ class DeleteConnection(Mutation):
                 logger = logging.getLogger(__name__)
                 logger.error(f"Failed to track connection deletion activity: {e}")
             
+            participants = [u for u in (connection.created_by.single(), connection.receiver.single()) if u]
             connection.delete()
+            invalidate_candidates(*(u.user_id for u in participants))
+            invalidate_connection_recipients(*(u.uid for u in participants))
             return DeleteConnection(success=True, message= ConnectionMessages.CONNECTION_DELETED)
         except Exception as error:
             message=getattr(error , 'message' , str(error) )
@@ -19,6 +19,7 @@ from .types import *
 from auth_manager.graphql.types import ProfileNoUserType
 from auth_manager.models import Users
 from connection.models import Connection
+from post.utils.relationship_loader import prime
 
 
 class Query(graphene.ObjectType):
@@ -160,7 +161,7 @@ class Query(graphene.ObjectType):
             - Data export and backup operations
         """
         # Return all connections for administrative purposes
-        return [ConnectionType.from_neomodel(story) for story in Connection.nodes.all()]
+        return [ConnectionType.from_neomodel(story) for story in prime(Connection.nodes.all())]
 
    
     # Individual connection queries
@@ -255,7 +256,7 @@ class Query(graphene.ObjectType):
 
                 my_connections.append(connection)
 
-            return [ConnectionType.from_neomodel(x) for x in my_connections]
+            return [ConnectionType.from_neomodel(x) for x in prime(my_connections)]
 
         # Apply status-based filtering
         if status:
@@ -281,7 +282,7 @@ class Query(graphene.ObjectType):
                         my_connections.append(connection)
                 else:
                     my_connections.append(connection)
-            return [ConnectionType.from_neomodel(x) for x in my_connections]
+            return [ConnectionType.from_neomodel(x) for x in prime(my_connections)]
 
         
 
@@ -392,7 +393,7 @@ class Query(graphene.ObjectType):
         connection_node = [Connection.inflate(row[0]) for row in results]
 
         # Pass auth_user_id to from_neomodel so it can calculate the correct status
-        return [ConnectionIsConnectedType.from_neomodel(x, auth_user_id=user2_id) for x in connection_node]
+        return [ConnectionIsConnectedType.from_neomodel(x, auth_user_id=user2_id) for x in prime(connection_node)]
         
 
     # Sent connection queries
@@ -442,7 +443,7 @@ class Query(graphene.ObjectType):
 
         # Process and return connection results
         connection_node = [Connection.inflate(row[0]) for row in results]
-        return [ConnectionType.from_neomodel(x) for x in connection_node]
+        return [ConnectionType.from_neomodel(x) for x in prime(connection_node)]
 
         
 
@@ -753,13 +754,13 @@ class Query(graphene.ObjectType):
 
         if status:
             if status.value == "Received":
-                return [UserConnectedUserType.from_neomodel(user) for user in filter_connections("Received", lambda conn, email: conn.created_by.single().email != email)]
+                return [UserConnectedUserType.from_neomodel(user) for user in prime(filter_connections("Received", lambda conn, email: conn.created_by.single().email != email))]
             elif status.value == "Sent":
-                return [UserConnectedUserType.from_neomodel(user) for user in filter_connections("Received", lambda conn, email: conn.created_by.single().email == email)]
+                return [UserConnectedUserType.from_neomodel(user) for user in prime(filter_connections("Received", lambda conn, email: conn.created_by.single().email == email))]
             elif status.value == "Accepted":
-                return [UserConnectedUserType.from_neomodel(user) for user in filter_connections("Accepted")]
+                return [UserConnectedUserType.from_neomodel(user) for user in prime(filter_connections("Accepted"))]
             elif status.value == "Cancelled":
-                return [UserConnectedUserType.from_neomodel(user) for user in filter_connections("Cancelled")]
+                return [UserConnectedUserType.from_neomodel(user) for user in prime(filter_connections("Cancelled"))]
         else:
             # If no status is provided, filter by circle_type if given
             my_connections = []
@@ -780,7 +781,7 @@ class Query(graphene.ObjectType):
                 if receiver.email != email:
                     all_users.append(receiver)
 
-            return [UserConnectedUserType.from_neomodel(user) for user in all_users]
+            return [UserConnectedUserType.from_neomodel(user) for user in prime(all_users)]
 
         
 
@@ -859,7 +860,7 @@ class Query(graphene.ObjectType):
 
         if status:
             if status.value == "Accepted":
-                return [UserConnectedUserType.from_neomodel(user) for user in filter_connections("Accepted")]
+                return [UserConnectedUserType.from_neomodel(user) for user in prime(filter_connections("Accepted"))]
 
         else:
             # If no status is provided, filter by circle_type if given
@@ -881,7 +882,7 @@ class Query(graphene.ObjectType):
                 if receiver.email != email:
                     all_users.append(receiver)
 
-            return [UserConnectedUserType.from_neomodel(user) for user in all_users]
+            return [UserConnectedUserType.from_neomodel(user) for user in prime(all_users)]
 
         
 
@@ -8,6 +8,7 @@ from connection.utils import relation
 from connection.utils.score_generator import generate_connection_score
 from auth_manager.Utils import generate_presigned_url
 from connection.graphql.raw_queries import user_related_queries
+from post.utils.relationship_loader import load_one
 from neomodel import db
 from datetime import datetime
 
@@ -50,9 +51,9 @@ class ConnectionType(ObjectType):
     def from_neomodel(cls, connection):
         return cls(
             uid=connection.uid,
-            receiver=UserType.from_neomodel(connection.receiver.single()) if connection.receiver.single() else None,
-            created_by=UserType.from_neomodel(connection.created_by.single()) if connection.created_by.single() else None,
-            circle=CircleType.from_neomodel(connection.circle.single()) if connection.circle.single() else None,
+            receiver=UserType.from_neomodel(load_one(connection, 'receiver')) if load_one(connection, 'receiver') else None,
+            created_by=UserType.from_neomodel(load_one(connection, 'created_by')) if load_one(connection, 'created_by') else None,
+            circle=CircleType.from_neomodel(load_one(connection, 'circle')) if load_one(connection, 'circle') else None,
             connection_status=connection.connection_status,
             timestamp=connection.timestamp,
             
@@ -132,8 +133,8 @@ class ConnectionV2Type(ObjectType):
             first_name=user.first_name,
             last_name=user.last_name,
             user_type=user.user_type,
-            profile=ProfileForConnectedUserTypeV2.from_neomodel(user.profile.single()) if user.profile.single() else None,
-            connection=ConnectionConnectedUserType.from_neomodel(user.connection.single()) if user.connection.single() else None,
+            profile=ProfileForConnectedUserTypeV2.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
+            connection=ConnectionConnectedUserType.from_neomodel(load_one(user, 'connection')) if load_one(user, 'connection') else None,
             score=generate_connection_score(),
         )
 
@@ -164,7 +165,7 @@ class GroupedCommunityMemberType(ObjectType):
             last_name=user.last_name,
             user_type=user.user_type,
             score=generate_connection_score(),
-            profile=ProfileForConnectedUserTypeV2.from_neomodel(user.profile.single()) if user.profile.single() else None,
+            profile=ProfileForConnectedUserTypeV2.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
         )
 
 class ConnectionCategoryType(graphene.ObjectType):
@@ -257,8 +258,8 @@ class ConnectionIsConnectedType(ObjectType):
 
     def from_neomodel(cls, connection, auth_user_id=None):
         # Get the receiver and creator
-        receiver = connection.receiver.single()
-        created_by = connection.created_by.single()
+        receiver = load_one(connection, 'receiver')
+        created_by = load_one(connection, 'created_by')
         display_status = connection.connection_status
         
         if connection.connection_status == "Received" and auth_user_id:
@@ -271,7 +272,7 @@ class ConnectionIsConnectedType(ObjectType):
             uid=connection.uid,
             receiver=UserType.from_neomodel(receiver) if receiver else None,
             created_by=UserType.from_neomodel(created_by) if created_by else None,
-            circle=CircleType.from_neomodel(connection.circle.single()) if connection.circle.single() else None,
+            circle=CircleType.from_neomodel(load_one(connection, 'circle')) if load_one(connection, 'circle') else None,
             connection_status=display_status,
             timestamp=connection.timestamp,
         )
@@ -306,7 +307,7 @@ class RecommendedUserForCommunityType(graphene.ObjectType):
             created_by=user.created_by,
             updated_at=user.updated_at,
             updated_by=user.updated_by,
-            profile=ProfileType.from_neomodel(user.profile.single()) if user.profile.single() else None,
+            profile=ProfileType.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
             # connection=ConnectionType.from_neomodel(user.connection.single()) if user.connection.single() else None,
         )
     
@@ -325,7 +326,7 @@ class ConnectionConnectedUserType(ObjectType):
             uid=connection.uid,
             # receiver=UserType.from_neomodel(connection.receiver.single()) if connection.receiver.single() else None,
             # created_by=UserType.from_neomodel(connection.created_by.single()) if connection.created_by.single() else None,
-            circle=CircleType.from_neomodel(connection.circle.single()) if connection.circle.single() else None,
+            circle=CircleType.from_neomodel(load_one(connection, 'circle')) if load_one(connection, 'circle') else None,
             connection_status=connection.connection_status,
             timestamp=connection.timestamp,
             
@@ -362,9 +363,9 @@ class UserConnectedUserType(ObjectType):
             created_by=user.created_by,
             updated_at=user.updated_at,
             updated_by=user.updated_by,
-            connection_stat=ConnectionStatsType.from_neomodel(user.connection_stat.single()) if user.connection_stat.single() else 0,
-            profile=ProfileNoUserType.from_neomodel(user.profile.single()) if user.profile.single() else None,
-            connection=ConnectionConnectedUserType.from_neomodel(user.connection.single()) if user.connection.single() else None,
+            connection_stat=ConnectionStatsType.from_neomodel(load_one(user, 'connection_stat')) if load_one(user, 'connection_stat') else 0,
+            profile=ProfileNoUserType.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
+            connection=ConnectionConnectedUserType.from_neomodel(load_one(user, 'connection')) if load_one(user, 'connection') else None,
         )
     
 
@@ -662,7 +663,7 @@ class ConnectionConnectedUserTypeV2(ObjectType):
             uid=connection.uid,
             # receiver=UserType.from_neomodel(connection.receiver.single()) if connection.receiver.single() else None,
             # created_by=UserType.from_neomodel(connection.created_by.single()) if connection.created_by.single() else None,
-            circle=CircleTypeV2.from_neomodel(connection.circle.single(),user_uid) if connection.circle.single() else None,
+            circle=CircleTypeV2.from_neomodel(load_one(connection, 'circle'),user_uid) if load_one(connection, 'circle') else None,
             connection_status=connection.connection_status,
             timestamp=connection.timestamp,
             
@@ -716,8 +717,8 @@ class UserConnectedUserTypeV2(ObjectType):
             user_type=user.user_type,
             created_at=user.created_at,
             updated_at=user.updated_at,
-            connection_stat=ConnectionStatsType.from_neomodel(user.connection_stat.single()) if user.connection_stat.single() else 0,
-            profile=ProfileForConnectedUserTypeV2.from_neomodel(user.profile.single()) if user.profile.single() else None,
+            connection_stat=ConnectionStatsType.from_neomodel(load_one(user, 'connection_stat')) if load_one(user, 'connection_stat') else 0,
+            profile=ProfileForConnectedUserTypeV2.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
             connection=ConnectionConnectedUserTypeV2.from_neomodel(connection_details,login_user_uid) if connection_details else None,
         )
     
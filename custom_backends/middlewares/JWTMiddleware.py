@@ -1,14 +1,12 @@
-from graphql_jwt.utils import jwt_decode
 from graphql import GraphQLError
+from custom_backends.utils import get_request_payload
 
 class JWTMiddleware:
+    # Graphene runs this for every resolved field; the payload is decoded
+    # once per request and reused from info.context afterwards.
     def resolve(self, next, root, info, **kwargs):
-        auth_header = info.context.META.get('HTTP_AUTHORIZATION', None)
-        if auth_header:
-            try:
-                token = auth_header.split(' ')[1]
-                payload = jwt_decode(token)
-                info.context.payload = payload
-            except Exception as e:
-                raise GraphQLError(f"Invalid token: {str(e)}")
+        try:
+            get_request_payload(info.context)
+        except Exception as e:
+            raise GraphQLError(f"Invalid token: {str(e)}")
         return next(root, info, **kwargs)
@@ -0,0 +1,12 @@
+from post.utils.relationship_loader import current_scope
+
+
+class LoaderScopeMiddleware:
+    # Tells the request's LoaderScope which operation it serves; root fields
+    # are the only ones with root=None, so the check is cheap for the rest.
+    def resolve(self, next, root, info, **kwargs):
+        if root is None:
+            scope = current_scope()
+            if scope is not None and scope.operation is None:
+                scope.begin_operation(info.operation)
+        return next(root, info, **kwargs)
@@ -1,8 +1,20 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 from graphql_jwt.settings import jwt_settings
 from graphql_jwt.utils import jwt_payload
 from graphql_jwt.utils import jwt_decode
 from graphql import GraphQLError
 
+# Verified payloads keyed by token hash. Tokens don't expire in our settings
+# (JWT_VERIFY_EXPIRATION is off), so entries are also capped at a fixed TTL.
+_TOKEN_CACHE_SIZE = 1024
+_TOKEN_CACHE_MAX_TTL = 300
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 def custom_jwt_payload(user, context=None):
     payload = jwt_payload(user, context)
     payload['user_id'] = user.id
@@ -11,15 +23,60 @@ def custom_jwt_payload(user, context=None):
     return payload
 
 
+def cached_jwt_decode(token, context=None):
+    """
+    `jwt_decode` with a small LRU keyed by token hash.
+
+    Used as GRAPHQL_JWT['JWT_DECODE_HANDLER'] so graphql_jwt's backend and
+    our JWTMiddleware share one verification per token. Entries expire at the
+    token's `exp` when expiration is verified, otherwise after a fixed TTL.
+    """
+    key = hashlib.sha256(token.encode() if isinstance(token, str) else token).hexdigest()
+    now = time.time()
+    with _token_cache_lock:
+        hit = _token_cache.get(key)
+        if hit is not None and hit[0] > now:
+            _token_cache.move_to_end(key)
+            return hit[1]
+
+    payload = jwt_decode(token, context)
+
+    expires_at = now + _TOKEN_CACHE_MAX_TTL
+    if jwt_settings.JWT_VERIFY_EXPIRATION and payload.get('exp'):
+        expires_at = min(expires_at, float(payload['exp']))
+    with _token_cache_lock:
+        _token_cache[key] = (expires_at, payload)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
+
+
+def get_request_payload(request):
+    """
+    Decode the bearer token of `request` once and memoize it on the request.
+
+    Returns None when there is no Authorization header.
+    """
+    auth_header = request.META.get('HTTP_AUTHORIZATION', None)
+    if not auth_header:
+        return None
+    if getattr(request, '_jwt_auth_header', None) == auth_header:
+        return request.payload
+    token = auth_header.split(' ')[1]
+    payload = cached_jwt_decode(token, request)
+    request.payload = payload
+    request._jwt_auth_header = auth_header
+    return payload
+
+
 def get_user_from_info(info):
     auth_header = info.context.META.get('HTTP_AUTHORIZATION', None)
     if not auth_header:
         raise GraphQLError("Authorization header missing")
 
     try:
-        token = auth_header.split(' ')[1]
-        payload = jwt_decode(token)
-        return payload
+        return get_request_payload(info.context)
     except Exception as e:
         raise GraphQLError(f"Invalid token: {str(e)}")
 
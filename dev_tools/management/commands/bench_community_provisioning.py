@@ -0,0 +1,103 @@
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from community.matrix_stub import MatrixStubServer
+from community.models import MatrixRoomProvisioning
+from community.utils.matrix_provisioning import (
+    MatrixAccount,
+    MatrixClient,
+    enqueue_room_provisioning,
+    provision,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the Matrix work of CreateCommunity against the local Matrix stub: '
+        'the previous in-request room creation and one-by-one invites vs the outbox worker. '
+        'Writes (and removes) MatrixRoomProvisioning rows; run it against a development database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--members', type=int, default=50)
+        parser.add_argument('--latency-ms', type=float, default=20, help='Simulated homeserver latency per request')
+
+    def _accounts(self, stub, members):
+        creator = MatrixAccount(f'@creator:{stub.server_name}', 'creator-token')
+        accounts = [MatrixAccount(f'@member{i}:{stub.server_name}', f'member-token-{i}') for i in range(members)]
+        for account in [creator, *accounts]:
+            stub.add_user(account.access_token, account.matrix_user_id)
+        return creator, accounts
+
+    def _legacy(self, stub, creator, accounts):
+        """The calls the previous CreateCommunity made: create_room in the request, then invite + join each member."""
+        try:
+            from community.utils.create_matrix_room_with_token import create_room
+            from community.utils.matrix_invites import auto_join_room, invite_user_to_room
+        except ImportError as e:
+            raise CommandError(f'matrix-nio is needed for the previous path: {e}')
+
+        settings.MATRIX_SERVER_URL = stub.url
+        start = time.perf_counter()
+        room_id = asyncio.run(create_room(
+            access_token=creator.access_token, user_id=creator.matrix_user_id,
+            room_name='bench', topic='', visibility='private', preset='private_chat',
+        ))
+        in_request = time.perf_counter() - start
+
+        async def invite_all():
+            for account in accounts:
+                await invite_user_to_room(creator.access_token, creator.matrix_user_id, room_id, account.matrix_user_id)
+                await auto_join_room(account.access_token, account.matrix_user_id, room_id)
+
+        asyncio.run(invite_all())
+        return in_request, time.perf_counter() - start, room_id
+
+    def _outbox(self, stub, creator, accounts, run_id):
+        community = SimpleNamespace(uid=f'bench-{run_id}', name='bench', description='')
+        start = time.perf_counter()
+        with transaction.atomic():
+            enqueue_room_provisioning(community, creator_user_id='0', member_uids=[])
+            # Measure the insert without handing the row to a real worker.
+            transaction.set_rollback(True)
+        in_request = time.perf_counter() - start
+
+        job = MatrixRoomProvisioning.objects.create(community_uid=community.uid, creator_user_id='0', room_name='bench')
+        client = MatrixClient(stub.url)
+        start = time.perf_counter()
+        try:
+            provision(job, client, creator, accounts)
+        finally:
+            client.close()
+        return in_request, time.perf_counter() - start, job.room_id
+
+    def _report(self, label, stub, members, in_request, elapsed, room_id):
+        joined = len(stub.rooms[room_id]['members']) - 1
+        self.stdout.write(
+            f'{label:<26} in request {in_request * 1000:8.1f}ms  all joined {elapsed:6.2f}s  '
+            f'{stub.requests:5d} HTTP requests  {joined}/{members} joined'
+        )
+
+    def handle(self, *args, **options):
+        members = options['members']
+        run_id = uuid.uuid4().hex[:8]
+        stub = MatrixStubServer(latency_ms=options['latency_ms']).start()
+        original_url = settings.MATRIX_SERVER_URL
+        try:
+            creator, accounts = self._accounts(stub, members)
+            self.stdout.write(f'{members} members, {options["latency_ms"]:.0f}ms per homeserver request\n')
+
+            stub.reset()
+            self._report('before: in-request', stub, members, *self._legacy(stub, creator, accounts))
+            stub.reset()
+            self._report('after: outbox worker', stub, members, *self._outbox(stub, creator, accounts, run_id))
+        finally:
+            settings.MATRIX_SERVER_URL = original_url
+            MatrixRoomProvisioning.objects.filter(community_uid=f'bench-{run_id}').delete()
+            stub.stop()
@@ -0,0 +1,137 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from neomodel import db
+
+from auth_manager.models import Users
+from post.models import Like, Post, PostReactionManager, PostVibeCount
+from post.redis import increment_post_like_count
+from post.services.like_service import queue_like_side_effects, upsert_like
+from post.utils.request_context import get_vibe_catalog
+from post.utils.side_effects import get_side_effect_queue
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark likes/sec on one hot post: the previous CreateLike sequence vs the '
+        'MERGE fast path, and check for lost reaction updates. Creates and removes its '
+        'own Users / Post nodes; run it against a development database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500, help='Distinct users liking the post')
+        parser.add_argument('--concurrency', type=int, default=16)
+
+    def _setup(self, run_id, users):
+        post_uid = f'bench-{run_id}'
+        user_ids = [f'bench-{run_id}-{i}' for i in range(users)]
+        db.cypher_query(
+            "UNWIND $user_ids AS user_id CREATE (:Users {uid: user_id, user_id: user_id, username: user_id})",
+            {'user_ids': user_ids},
+        )
+        db.cypher_query(
+            "MATCH (creator:Users {user_id: $creator}) "
+            "CREATE (:Post {uid: $post_uid, post_title: 'bench', post_type: 'bench', is_deleted: false})-[:HAS_USER]->(creator)",
+            {'creator': user_ids[0], 'post_uid': post_uid},
+        )
+        return post_uid, user_ids
+
+    def _cleanup(self, run_id, post_uids):
+        db.cypher_query(
+            "MATCH (p:Post) WHERE p.uid IN $post_uids OPTIONAL MATCH (p)-[:HAS_LIKE]->(l:Like) DETACH DELETE p, l",
+            {'post_uids': post_uids},
+        )
+        db.cypher_query("MATCH (u:Users) WHERE u.user_id STARTS WITH $prefix DETACH DELETE u", {'prefix': f'bench-{run_id}'})
+        PostReactionManager.objects.filter(post_uid__in=post_uids).delete()
+        PostVibeCount.objects.filter(post_uid__in=post_uids).delete()
+
+    def _legacy_like(self, user_id, post_uid, reaction, vibe):
+        """The round trips the previous CreateLike made for a new like."""
+        user_node = Users.nodes.get(user_id=user_id)
+        post = Post.nodes.get(uid=post_uid)
+        db.cypher_query(
+            "MATCH (user:Users {user_id: $user_id})-[r:HAS_USER]->(like:Like) "
+            "MATCH (like)-[:HAS_POST]->(post {uid: $post_uid}) RETURN like",
+            {'user_id': user_id, 'post_uid': post_uid},
+        )
+        manager, _ = PostReactionManager.objects.get_or_create(post_uid=post_uid, defaults={})
+        if not manager.post_vibe:
+            manager.initialize_reactions()
+        manager.add_reaction(vibes_name=reaction, score=vibe)
+        like = Like(reaction=reaction, vibe=vibe)
+        like.save()
+        like.user.connect(user_node)
+        post.like.connect(like)
+        manager.save()
+        increment_post_like_count(post_uid)
+
+    def _fast_like(self, user_id, post_uid, reaction, vibe):
+        result = upsert_like(user_id, post_uid, reaction, vibe)
+        queue_like_side_effects(result)
+
+    def _run(self, fn, user_ids, post_uid, reaction, vibe, concurrency):
+        def like(user_id):
+            try:
+                fn(user_id, post_uid, reaction, vibe)
+            finally:
+                close_old_connections()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(like, user_ids))
+        return time.perf_counter() - start
+
+    def _like_nodes(self, post_uid):
+        rows, _ = db.cypher_query("MATCH (:Post {uid: $uid})-[:HAS_LIKE]->(l:Like) RETURN count(l)", {'uid': post_uid})
+        return rows[0][0]
+
+    def _report(self, label, users, elapsed, counted, like_nodes):
+        self.stdout.write(
+            f'{label:<30} {elapsed:7.2f}s  {users / elapsed:8.1f} likes/s  '
+            f'{counted}/{users} counted ({users - counted} lost)  {like_nodes} Like nodes'
+        )
+
+    def handle(self, *args, **options):
+        users, concurrency = options['users'], options['concurrency']
+        catalog = get_vibe_catalog()
+        if not catalog:
+            raise CommandError('No IndividualVibe rows; load the vibe catalog first.')
+        reaction, other_reaction = catalog[0].name_of_vibe, catalog[-1].name_of_vibe
+
+        run_id = uuid.uuid4().hex[:8]
+        legacy_post, user_ids = self._setup(f'{run_id}a', users)
+        fast_post, fast_user_ids = self._setup(f'{run_id}b', users)
+        try:
+            self.stdout.write(f'{users} users liking one post, concurrency {concurrency}\n')
+
+            elapsed = self._run(self._legacy_like, user_ids, legacy_post, reaction, 4.0, concurrency)
+            manager = PostReactionManager.objects.get(post_uid=legacy_post)
+            counted = sum(r['vibes_count'] for r in manager.post_vibe)
+            self._report('before: CreateLike sequence', users, elapsed, counted, self._like_nodes(legacy_post))
+
+            elapsed = self._run(self._fast_like, fast_user_ids, fast_post, reaction, 4.0, concurrency)
+            drain_start = time.perf_counter()
+            get_side_effect_queue().join()
+            drained = time.perf_counter() - drain_start
+            counted = sum(PostVibeCount.objects.filter(post_uid=fast_post).values_list('vibes_count', flat=True))
+            self._report('after: MERGE fast path', users, elapsed, counted, self._like_nodes(fast_post))
+            self.stdout.write(f'{"":<30} side effects drained {drained:.2f}s after the last response')
+
+            # Every user reacts again with another vibe: still one Like each, nothing lost.
+            elapsed = self._run(self._fast_like, fast_user_ids, fast_post, other_reaction, 2.0, concurrency)
+            get_side_effect_queue().join()
+            counts = dict(PostVibeCount.objects.filter(post_uid=fast_post).values_list('vibe_name', 'vibes_count'))
+            self._report('after: re-react (updates)', users, elapsed, sum(counts.values()), self._like_nodes(fast_post))
+
+            ok = counts.get(other_reaction) == users and self._like_nodes(fast_post) == users
+            if reaction != other_reaction:
+                ok = ok and not counts.get(reaction)
+            self.stdout.write(
+                self.style.SUCCESS('\nFast path: no lost or duplicated reactions') if ok
+                else self.style.ERROR(f'\nFast path counts are off: {counts}')
+            )
+        finally:
+            self._cleanup(run_id, [legacy_post, fast_post])
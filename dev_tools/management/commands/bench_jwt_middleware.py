@@ -0,0 +1,51 @@
+import time
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from graphql_jwt.utils import jwt_decode, jwt_encode
+
+from custom_backends.middlewares.JWTMiddleware import JWTMiddleware
+from custom_backends.utils import custom_jwt_payload
+
+
+class _PerFieldDecodeMiddleware:
+    # Previous JWTMiddleware behaviour: decode the token for every field.
+    def resolve(self, next, root, info, **kwargs):
+        token = info.context.META['HTTP_AUTHORIZATION'].split(' ')[1]
+        info.context.payload = jwt_decode(token)
+        return next(root, info, **kwargs)
+
+
+class Command(BaseCommand):
+    help = 'Measure JWTMiddleware CPU per request for a deep GraphQL query'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=20, help='Feed items in the simulated response')
+        parser.add_argument('--fields', type=int, default=150, help='Resolved fields per feed item (nested profile, vibes, files...)')
+        parser.add_argument('--requests', type=int, default=50)
+
+    def _run(self, middleware, token, resolves, requests):
+        def next_(root, info, **kwargs):
+            return None
+
+        start = time.process_time()
+        for _ in range(requests):
+            # A fresh context per request, like a real HttpRequest.
+            info = SimpleNamespace(context=SimpleNamespace(META={'HTTP_AUTHORIZATION': f'Bearer {token}'}))
+            for _ in range(resolves):
+                middleware.resolve(next_, None, info)
+        return (time.process_time() - start) / requests
+
+    def handle(self, *args, **options):
+        user = get_user_model()(id=1, username='bench', email='bench@example.com')
+        token = jwt_encode(custom_jwt_payload(user))
+        resolves = options['posts'] * options['fields']
+
+        before = self._run(_PerFieldDecodeMiddleware(), token, resolves, options['requests'])
+        after = self._run(JWTMiddleware(), token, resolves, options['requests'])
+
+        self.stdout.write(f'Resolved fields per request: {resolves}')
+        self.stdout.write(f'Per-field decode:   {before * 1000:.2f} ms CPU/request')
+        self.stdout.write(f'Once per request:   {after * 1000:.2f} ms CPU/request')
+        self.stdout.write(self.style.SUCCESS(f'Speed-up: {before / after if after else float("inf"):.1f}x'))
@@ -0,0 +1,83 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notification.dispatcher import NotificationDispatcher
+from notification.fanout import FanoutEngine
+from notification.models import UserNotification
+from notification.push_stub import PushStubServer
+
+
+class Command(BaseCommand):
+    help = 'Benchmark a community broadcast against the local push stub: per-token vs multicast'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--members', type=int, default=10000)
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=16, help='Dispatcher / fan-out engine HTTP concurrency')
+        parser.add_argument('--latency-ms', type=float, default=2, help='Simulated push service latency per request')
+
+    def _notifications(self, members):
+        # Unsaved rows: send_batch only sets status in memory, so no database is needed.
+        return [
+            UserNotification(user_uid=f'user-{i}', device_id=f'token-{i}', notification_type='community_post')
+            for i in range(members)
+        ]
+
+    def _run_dispatcher(self, stub, members, multicast, options):
+        dispatcher = NotificationDispatcher(
+            stub.url, http_concurrency=options['concurrency'],
+            multicast=multicast, chunk_size=options['chunk_size']
+        )
+        notifications = self._notifications(members)
+        data = {'title': 'New post in Bench', 'body': 'bench posted: hello', 'priority': 'high'}
+        stub.reset()
+        start = time.perf_counter()
+        dispatcher.send_batch(notifications, data, 'community_post')
+        elapsed = time.perf_counter() - start
+        sent = sum(1 for n in notifications if n.status == 'sent')
+        return elapsed, stub.requests, sent
+
+    def _run_fanout(self, stub, members, multicast, options):
+        engine = FanoutEngine(
+            stub.url, concurrency=options['concurrency'],
+            chunk_size=options['chunk_size'], multicast=multicast
+        )
+        member_list = [{'device_id': f'token-{i}'} for i in range(members)]
+        # No data.type, so the NotificationPreference filter (and its query) is skipped.
+        data = {'title': 'New post in Bench', 'body': 'bench posted: hello', 'priority': 'high'}
+        stub.reset()
+        start = time.perf_counter()
+        try:
+            results = engine.send_sync(member_list, data)
+        finally:
+            engine.close()
+        elapsed = time.perf_counter() - start
+        return elapsed, stub.requests, sum(1 for ok, _ in results.values() if ok)
+
+    def _report(self, label, members, elapsed, requests, sent):
+        self.stdout.write(
+            f'{label:<34} {elapsed:7.2f}s  {requests:6d} HTTP requests  '
+            f'{requests / elapsed:8.1f} req/s  {members / elapsed:9.1f} notifications/s  ({sent}/{members} sent)'
+        )
+
+    def handle(self, *args, **options):
+        members = options['members']
+        stub = PushStubServer(latency_ms=options['latency_ms']).start()
+        try:
+            self.stdout.write(
+                f'Broadcast to {members} members, stub latency {options["latency_ms"]}ms, '
+                f'chunk size {options["chunk_size"]}, concurrency {options["concurrency"]}\n'
+            )
+            per_token = self._run_dispatcher(stub, members, False, options)
+            self._report('dispatcher, per-token', members, *per_token)
+            multicast = self._run_dispatcher(stub, members, True, options)
+            self._report('dispatcher, multicast', members, *multicast)
+            self._report('fan-out engine, per-token', members, *self._run_fanout(stub, members, False, options))
+            self._report('fan-out engine, multicast', members, *self._run_fanout(stub, members, True, options))
+            self.stdout.write(self.style.SUCCESS(
+                f'\nMulticast speed-up (dispatcher): {per_token[0] / multicast[0]:.1f}x, '
+                f'{per_token[1] // max(multicast[1], 1)}x fewer requests'
+            ))
+        finally:
+            stub.stop()
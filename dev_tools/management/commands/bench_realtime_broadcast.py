@@ -0,0 +1,65 @@
+import time
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.management.base import BaseCommand
+
+from realtime.broadcaster import RealtimeBroadcaster
+
+
+class Command(BaseCommand):
+    help = 'Measure RealtimeBroadcaster latency for 1k/10k recipients against the configured Redis channel layer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+        parser.add_argument('--connected', type=float, default=0.3,
+                            help='Fraction of recipients with a subscribed channel (online users)')
+        parser.add_argument('--skip-loop', action='store_true',
+                            help='Skip the per-recipient send_notification baseline (slow at 10k)')
+
+    def _subscribe(self, layer, uids):
+        async def subscribe():
+            channels = []
+            for uid in uids:
+                channel = await layer.new_channel()
+                await layer.group_add(f'user_{uid}', channel)
+                channels.append((uid, channel))
+            return channels
+        return async_to_sync(subscribe)()
+
+    def _cleanup(self, layer, channels):
+        async def cleanup():
+            for uid, channel in channels:
+                await layer.group_discard(f'user_{uid}', channel)
+        async_to_sync(cleanup)()
+
+    def handle(self, *args, **options):
+        layer = get_channel_layer()
+        broadcaster = RealtimeBroadcaster()
+        data = {'title': 'bench', 'body': 'realtime broadcast benchmark', 'notification_type': 'bench'}
+
+        for size in options['sizes']:
+            uids = [f'bench-{size}-{i}' for i in range(size)]
+            channels = self._subscribe(layer, uids[:int(size * options['connected'])])
+            try:
+                self.stdout.write(f'\n{size} recipients ({len(channels)} connected)')
+
+                if not options['skip_loop']:
+                    start = time.perf_counter()
+                    for uid in uids:
+                        broadcaster.send_notification(uid, data)
+                    self.stdout.write(f'  send_notification loop:  {time.perf_counter() - start:8.3f}s')
+
+                stats = broadcaster.broadcast_to_multiple(uids, data)
+                self.stdout.write(f'  broadcast_to_multiple:   {stats["seconds"]:8.3f}s ({stats["failed"]} failed)')
+
+                start = time.perf_counter()
+                future = broadcaster.broadcast_in_background(uids, {'type': 'live_notification', 'data': data})
+                returned = time.perf_counter() - start
+                stats = future.result()
+                self.stdout.write(
+                    f'  broadcast_in_background: {returned * 1000:8.3f}ms to return, '
+                    f'{stats["seconds"]:.3f}s to deliver'
+                )
+            finally:
+                self._cleanup(layer, channels)
@@ -0,0 +1,66 @@
+import time
+
+from asgiref.sync import async_to_sync
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from graphql_jwt.utils import jwt_encode
+
+from custom_backends.utils import custom_jwt_payload
+from realtime.identity import invalidate_identity
+from realtime.middleware import JWTAuthMiddlewareStack
+from realtime.routing import websocket_urlpatterns
+
+IN_MEMORY_LAYERS = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+
+
+class Command(BaseCommand):
+    help = 'Measure WebSocket connects/sec for /ws/events/ against an in-memory channel layer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connects', type=int, default=500)
+        parser.add_argument('--username', help='Existing user to connect as (defaults to the first user)')
+
+    def _connect_rate(self, application, token, connects, before_each=None):
+        async def run():
+            accepted = 0
+            start = time.perf_counter()
+            for _ in range(connects):
+                if before_each:
+                    before_each()
+                communicator = WebsocketCommunicator(application, f'/ws/events/?token={token}')
+                connected, _ = await communicator.connect()
+                accepted += bool(connected)
+                await communicator.disconnect()
+            return connects / (time.perf_counter() - start), accepted
+        return async_to_sync(run)()
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = User.objects.filter(username=options['username']) if options['username'] else User.objects.order_by('id')
+        user = users.first()
+        if user is None:
+            raise CommandError('No user to connect as')
+
+        claims_token = jwt_encode(custom_jwt_payload(user))
+        legacy_payload = custom_jwt_payload(user)
+        legacy_payload.pop('username')  # forces the ORM fallback, like the old middleware
+        legacy_token = jwt_encode(legacy_payload)
+
+        connects = options['connects']
+        with override_settings(CHANNEL_LAYERS=IN_MEMORY_LAYERS):
+            application = JWTAuthMiddlewareStack(URLRouter(websocket_urlpatterns))
+            cold = lambda: invalidate_identity(user.id)
+
+            runs = [
+                ('ORM user + Neo4j lookup per connect', legacy_token, cold),
+                ('JWT claims + Neo4j lookup per connect', claims_token, cold),
+                ('JWT claims + identity cache', claims_token, None),
+            ]
+            self.stdout.write(f'{connects} connects as user {user.id}\n')
+            invalidate_identity(user.id)
+            for label, token, before_each in runs:
+                rate, accepted = self._connect_rate(application, token, connects, before_each)
+                self.stdout.write(f'{label:<40} {rate:8.1f} connects/s ({accepted}/{connects} accepted)')
@@ -1,12 +1,18 @@
 from django.core.management.base import BaseCommand
-from post.redis import update_database_comment_counts
+from post.redis import write_back_counters
 class Command(BaseCommand):
     help = 'Sync comment counts from Redis to the database'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='Posts written per UNWIND query')
+
     def handle(self, *args, **kwargs):
         try:
-            update_database_comment_counts()  # Call the function to update counts
-            self.stdout.write(self.style.SUCCESS('Successfully synced comment counts from Redis to the database.'))
+            stats = write_back_counters(chunk_size=kwargs['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f"Synced {stats['rows']} posts in {stats['chunks']} chunks "
+                f"({stats['rows_per_sec']} rows/sec), backlog: {stats['backlog']}"
+            ))
             
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error syncing comment counts: {e}'))
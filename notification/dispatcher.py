@@ -0,0 +1,383 @@
+"""
+Queue-backed push notification dispatcher.
+
+GlobalNotificationService.send() used to start a thread per call that created
+one UserNotification row and made one blocking HTTP request (with sleeps
+between retries) per recipient. This dispatcher replaces that with:
+
+- one bounded in-process queue of notification jobs, drained by a fixed set of
+  worker threads (NOTIFICATION_DISPATCH_WORKERS)
+- one bulk_create of the UserNotification rows per job
+- sends over a shared keep-alive requests.Session, with at most
+  NOTIFICATION_HTTP_CONCURRENCY requests in flight across all jobs; retries
+  with backoff are handled by the session's urllib3 Retry policy
+- multicast: every recipient of a job gets the same rendered template, so the
+  tokens go to `{NOTIFICATION_SERVICE_URL}/notifications/batch` in chunks of
+  MULTICAST_CHUNK_SIZE, and the per-token results are mapped back to the
+  UserNotification rows. If the push service answers 404/405 for the batch
+  endpoint the dispatcher falls back to one request per token
+- one bulk_update of the send status per job
+
+Queue depth and throughput are available from `get_dispatcher().stats()` and
+are published to the cache for `manage.py notification_stats`.
+"""
+
+import os
+import queue
+import socket
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import UserNotification, NotificationLog
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_QUEUE_SIZE = int(os.getenv('NOTIFICATION_DISPATCH_QUEUE_SIZE', '1000'))
+DISPATCH_WORKERS = int(os.getenv('NOTIFICATION_DISPATCH_WORKERS', '2'))
+HTTP_CONCURRENCY = int(os.getenv('NOTIFICATION_HTTP_CONCURRENCY', '16'))
+HTTP_TIMEOUT = (3, 10)  # connect, read (seconds)
+DB_BATCH_SIZE = 500
+STATS_CACHE_PREFIX = "notification_dispatcher:stats"
+STATS_PUBLISH_SECONDS = 10
+THROUGHPUT_WINDOW_SECONDS = 60
+MULTICAST_CHUNK_SIZE = int(os.getenv('NOTIFICATION_MULTICAST_CHUNK_SIZE', '500'))
+MULTICAST_ENABLED = os.getenv('NOTIFICATION_MULTICAST', 'true').lower() == 'true'
+BATCH_UNSUPPORTED_STATUSES = (404, 405)
+
+
+def build_session(pool_size: int = HTTP_CONCURRENCY, max_retries: int = 3) -> requests.Session:
+    """Keep-alive session sized for the dispatcher's concurrency."""
+    retry = Retry(
+        total=max_retries - 1,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['POST']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    })
+    return session
+
+
+def build_payload(device_id: str, notification_data: Dict[str, Any], event_type: str) -> Dict[str, Any]:
+    payload = {
+        "title": notification_data['title'],
+        "body": notification_data['body'],
+        "token": device_id,
+        "priority": notification_data.get('priority', 'normal'),
+        "click_action": notification_data.get('click_action', '/'),
+        "deep_link": notification_data.get('deep_link', ''),
+        "web_link": notification_data.get('web_link', ''),
+        "data": {
+            "type": event_type,
+            **notification_data.get('data', {})
+        }
+    }
+    if notification_data.get('image_url'):
+        payload['image_url'] = notification_data['image_url']
+    return payload
+
+
+def build_multicast_payload(tokens: List[str], notification_data: Dict[str, Any], event_type: str) -> Dict[str, Any]:
+    """The single-token payload with `token` replaced by a `tokens` list."""
+    payload = build_payload(None, notification_data, event_type)
+    del payload['token']
+    payload['tokens'] = list(tokens)
+    return payload
+
+
+def chunked(items: list, size: int = MULTICAST_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def parse_multicast_results(body: Any, tokens: List[str]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Per-token (ok, error) for a 200 batch response, aligned with `tokens`.
+
+    The batch endpoint answers {"results": [{"token", "success", "error"}, ...]}
+    in request order. Entries are matched by token when present, otherwise by
+    position; tokens missing from the response count as failed.
+    """
+    results = body.get('results') if isinstance(body, dict) else None
+    if not isinstance(results, list):
+        return [(False, 'Malformed batch response')] * len(tokens)
+
+    by_token = {}
+    for i, entry in enumerate(results):
+        if not isinstance(entry, dict):
+            continue
+        key = entry.get('token')
+        by_token.setdefault(key if key is not None else i, []).append(entry)
+
+    parsed = []
+    for i, token in enumerate(tokens):
+        entries = by_token.get(token) or by_token.get(i)
+        if not entries:
+            parsed.append((False, 'Missing from batch response'))
+            continue
+        entry = entries.pop(0)
+        if entry.get('success'):
+            parsed.append((True, None))
+        else:
+            parsed.append((False, str(entry.get('error') or 'Rejected by push service')))
+    return parsed
+
+
+class NotificationDispatcher:
+    """Bounded queue + worker pool that delivers formatted notifications in batches."""
+
+    def __init__(self, service_url: str, workers: int = DISPATCH_WORKERS,
+                 http_concurrency: int = HTTP_CONCURRENCY, queue_size: int = DISPATCH_QUEUE_SIZE,
+                 multicast: bool = MULTICAST_ENABLED, chunk_size: int = MULTICAST_CHUNK_SIZE):
+        self.service_url = service_url
+        self.multicast = multicast
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.http_concurrency = http_concurrency
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._session = build_session(http_concurrency)
+        self._http_pool = ThreadPoolExecutor(max_workers=http_concurrency, thread_name_prefix='notify-http')
+        self._threads = []
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._dropped = 0
+        self._jobs = 0
+        self._http_requests = 0
+        self._recent = deque()  # (timestamp, delivered) for the throughput window
+        self._last_publish = 0.0
+
+    # ------------------------------------------------------------------ queue
+
+    def submit(self, event_type: str, recipients: List[Dict[str, str]],
+               notification_data: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+        """Queue a job; returns False (and counts a drop) when the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((event_type, recipients, notification_data, metadata))
+            return True
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += len(recipients)
+            logger.error(f"Notification queue full, dropped {event_type} for {len(recipients)} recipients")
+            return False
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f'notify-dispatch-{i}', daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            try:
+                close_old_connections()
+                self.deliver(*job)
+            except Exception as e:
+                logger.error(f"Notification job failed: {e}")
+            finally:
+                self._queue.task_done()
+                close_old_connections()
+                self._maybe_publish_stats()
+
+    # --------------------------------------------------------------- delivery
+
+    def deliver(self, event_type: str, recipients: List[Dict[str, str]],
+                notification_data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, int]:
+        """Create, send and record one notification for every recipient (runs on a worker)."""
+        log = NotificationLog.objects.create(
+            notification_type=event_type,
+            recipient_count=len(recipients),
+            status='pending',
+            metadata=metadata
+        )
+
+        notifications = UserNotification.objects.bulk_create([
+            UserNotification(
+                user_uid=r['uid'],
+                notification_type=event_type,
+                title=notification_data.get('title', ''),
+                body=notification_data.get('body', ''),
+                device_id=r['device_id'],
+                status='pending',
+                priority=notification_data.get('priority', 'normal'),
+                click_action=notification_data.get('click_action'),
+                deep_link=notification_data.get('deep_link'),
+                web_link=notification_data.get('web_link'),
+                image_url=notification_data.get('image_url'),
+                data=notification_data.get('data', {})
+            )
+            for r in recipients
+        ], batch_size=DB_BATCH_SIZE)
+
+        self.send_batch(notifications, notification_data, event_type)
+
+        UserNotification.objects.bulk_update(
+            notifications, ['status', 'sent_at', 'error_message'], batch_size=DB_BATCH_SIZE
+        )
+
+        successful = sum(1 for n in notifications if n.status == 'sent')
+        failed = len(notifications) - successful
+        log.successful_count = successful
+        log.failed_count = failed
+        log.status = 'sent' if failed == 0 else ('partial' if successful > 0 else 'failed')
+        log.save(update_fields=['successful_count', 'failed_count', 'status'])
+
+        self._record(successful, failed)
+        logger.info(f"Notification batch {event_type}: {successful}/{len(notifications)} sent")
+        return {'successful': successful, 'failed': failed}
+
+    def send_batch(self, notifications: List[UserNotification],
+                   notification_data: Dict[str, Any], event_type: str) -> None:
+        """Send every notification through the shared HTTP pool and set its status in memory."""
+        if self.multicast and len(notifications) > 1:
+            futures = [
+                (chunk, self._http_pool.submit(self._send_chunk, [n.device_id for n in chunk],
+                                               notification_data, event_type))
+                for chunk in chunked(notifications, self.chunk_size)
+            ]
+            outcomes = [(n, result) for chunk, future in futures for n, result in zip(chunk, future.result())]
+        else:
+            futures = [
+                (n, self._http_pool.submit(self._post, build_payload(n.device_id, notification_data, event_type)))
+                for n in notifications
+            ]
+            outcomes = [(n, future.result()) for n, future in futures]
+
+        for notification, (ok, error) in outcomes:
+            if ok:
+                notification.status = 'sent'
+                notification.sent_at = timezone.now()
+            else:
+                notification.status = 'failed'
+                notification.error_message = error
+
+    def _send_chunk(self, tokens: List[str], notification_data: Dict[str, Any],
+                    event_type: str) -> List[Tuple[bool, Optional[str]]]:
+        """One multicast request for up to chunk_size tokens (runs on the HTTP pool)."""
+        if self.multicast:
+            payload = build_multicast_payload(tokens, notification_data, event_type)
+            self._count_request()
+            try:
+                response = self._session.post(
+                    f"{self.service_url}/notifications/batch", json=payload, timeout=HTTP_TIMEOUT
+                )
+            except Exception as e:
+                return [(False, str(e))] * len(tokens)
+            if response.status_code == 200:
+                try:
+                    return parse_multicast_results(response.json(), tokens)
+                except ValueError:
+                    return [(False, 'Malformed batch response')] * len(tokens)
+            if response.status_code not in BATCH_UNSUPPORTED_STATUSES:
+                return [(False, f"Status {response.status_code}: {response.text}")] * len(tokens)
+            logger.warning("Push service has no batch endpoint, falling back to per-token sends")
+            self.multicast = False
+        # Per-token fallback within this pool task; other chunks keep their slots.
+        return [self._post(build_payload(token, notification_data, event_type)) for token in tokens]
+
+    def _post(self, payload: Dict[str, Any]):
+        self._count_request()
+        try:
+            response = self._session.post(
+                f"{self.service_url}/notifications", json=payload, timeout=HTTP_TIMEOUT
+            )
+        except Exception as e:
+            return False, str(e)
+        if response.status_code == 200:
+            return True, None
+        return False, f"Status {response.status_code}: {response.text}"
+
+    def _count_request(self):
+        with self._stats_lock:
+            self._http_requests += 1
+
+    # ---------------------------------------------------------------- metrics
+
+    def _record(self, successful: int, failed: int):
+        now = time.monotonic()
+        with self._stats_lock:
+            self._sent += successful
+            self._failed += failed
+            self._jobs += 1
+            self._recent.append((now, successful + failed))
+            while self._recent and now - self._recent[0][0] > THROUGHPUT_WINDOW_SECONDS:
+                self._recent.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._stats_lock:
+            while self._recent and now - self._recent[0][0] > THROUGHPUT_WINDOW_SECONDS:
+                self._recent.popleft()
+            window_total = sum(count for _, count in self._recent)
+            return {
+                'queue_depth': self._queue.qsize(),
+                'queue_capacity': self._queue.maxsize,
+                'workers': self.workers,
+                'http_concurrency': self.http_concurrency,
+                'multicast': self.multicast,
+                'http_requests': self._http_requests,
+                'jobs': self._jobs,
+                'sent': self._sent,
+                'failed': self._failed,
+                'dropped': self._dropped,
+                'throughput_per_sec': round(window_total / THROUGHPUT_WINDOW_SECONDS, 2),
+            }
+
+    def _maybe_publish_stats(self):
+        now = time.monotonic()
+        if now - self._last_publish < STATS_PUBLISH_SECONDS:
+            return
+        self._last_publish = now
+        try:
+            key = f"{STATS_CACHE_PREFIX}:{socket.gethostname()}:{os.getpid()}"
+            cache.set(key, self.stats(), STATS_PUBLISH_SECONDS * 6)
+        except Exception as e:
+            logger.debug(f"Could not publish dispatcher stats: {e}")
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    """Process-wide dispatcher shared by every GlobalNotificationService."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                from settings.base import NOTIFICATION_SERVICE_URL
+                _dispatcher = NotificationDispatcher(NOTIFICATION_SERVICE_URL)
+    return _dispatcher
+
+
+def published_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats published by every running dispatcher, keyed by host:pid."""
+    keys = cache.keys(f"{STATS_CACHE_PREFIX}:*")
+    values = cache.get_many(keys) if keys else {}
+    return {key[len(STATS_CACHE_PREFIX) + 1:]: value for key, value in values.items()}
@@ -0,0 +1,276 @@
+"""
+Async fan-out engine shared by the per-module NotificationService classes.
+
+Every module (community, post, connection, story, msg, auth_manager) used to
+open its own aiohttp.ClientSession per call and POST one member at a time.
+They now render their template and hand it to `FanoutNotificationService`,
+which forwards to one process-wide `FanoutEngine` per push service URL:
+
+- one background event loop and one aiohttp session (keep-alive connection
+  pool of NOTIFICATION_FANOUT_CONCURRENCY connections), shared by all callers
+  whatever event loop they run on
+- an asyncio.Semaphore bounding requests in flight, so N per-token sends take
+  about N / concurrency round trips instead of N
+- recipients deduplicated by device token and filtered against
+  NotificationPreference with a single query
+- multicast chunks to /notifications/batch (see dispatcher.py), falling back to
+  one request per token when the push service has no batch endpoint
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from django.db import close_old_connections
+
+from .dispatcher import (
+    BATCH_UNSUPPORTED_STATUSES,
+    MULTICAST_CHUNK_SIZE,
+    MULTICAST_ENABLED,
+    chunked,
+    parse_multicast_results,
+)
+
+logger = logging.getLogger(__name__)
+
+FANOUT_CONCURRENCY = int(os.getenv('NOTIFICATION_FANOUT_CONCURRENCY', '32'))
+FANOUT_TIMEOUT_SECONDS = 10
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+Result = Tuple[bool, Optional[str]]
+
+
+def filter_recipients(recipients: List[Dict[str, Any]], notification_type: Optional[str] = None) -> List[str]:
+    """
+    Deduplicated device tokens of the recipients who have not disabled
+    `notification_type`.
+
+    Recipients are {'device_id', 'uid'} dicts (optionally with the Django
+    'user_id'). Missing user ids are resolved with one UNWIND query, and the
+    opted-out users come from one NotificationPreference query.
+    """
+    by_token = {}
+    for recipient in recipients:
+        token = recipient.get('device_id')
+        if token and token not in by_token:
+            by_token[token] = recipient
+    if not notification_type or not by_token:
+        return list(by_token)
+
+    user_ids = {r['uid']: str(r['user_id']) for r in by_token.values() if r.get('uid') and r.get('user_id')}
+    missing = list({r['uid'] for r in by_token.values() if r.get('uid') and r['uid'] not in user_ids})
+    try:
+        if missing:
+            from neomodel import db
+            rows, _ = db.cypher_query(
+                "UNWIND $uids AS uid MATCH (u:Users {uid: uid}) RETURN u.uid, u.user_id",
+                {'uids': missing},
+            )
+            user_ids.update({uid: str(user_id) for uid, user_id in rows if user_id})
+        if not user_ids:
+            return list(by_token)
+
+        from .models import NotificationPreference
+        disabled = {
+            str(user_id) for user_id in NotificationPreference.objects.filter(
+                notification_type=notification_type,
+                is_enabled=False,
+                user_id__in=[i for i in set(user_ids.values()) if i.isdigit()],
+            ).values_list('user_id', flat=True)
+        }
+    except Exception as e:
+        logger.warning(f"Preference filter skipped for {notification_type}: {e}")
+        return list(by_token)
+    finally:
+        close_old_connections()
+
+    return [
+        token for token, r in by_token.items()
+        if user_ids.get(r.get('uid'), str(r.get('user_id', ''))) not in disabled
+    ]
+
+
+class FanoutEngine:
+    """Shared session + semaphore that sends one rendered notification to many devices."""
+
+    def __init__(self, service_url: str, concurrency: int = FANOUT_CONCURRENCY,
+                 chunk_size: int = MULTICAST_CHUNK_SIZE, multicast: bool = MULTICAST_ENABLED):
+        self.service_url = service_url
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.multicast = multicast
+        self.requests = 0
+        self._loop = None
+        self._session = None
+        self._semaphore = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name='notify-fanout', daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    def submit(self, recipients: List[Dict[str, Any]], notification_data: Dict[str, Any],
+               personalize: Callable[[Dict[str, Any]], Dict[str, Any]] = None) -> Future:
+        """
+        Schedule a fan-out on the engine loop; usable from any thread.
+
+        `personalize(recipient)` returns per-recipient overrides of
+        notification_data; such sends go one token per request.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._fanout(recipients, notification_data, personalize), self._ensure_loop()
+        )
+
+    async def send(self, recipients: List[Dict[str, Any]], notification_data: Dict[str, Any],
+                   personalize: Callable[[Dict[str, Any]], Dict[str, Any]] = None) -> Dict[str, Result]:
+        """Await a fan-out from any event loop. Returns {token: (ok, error)}."""
+        return await asyncio.wrap_future(self.submit(recipients, notification_data, personalize))
+
+    def send_sync(self, recipients: List[Dict[str, Any]], notification_data: Dict[str, Any],
+                  personalize: Callable[[Dict[str, Any]], Dict[str, Any]] = None) -> Dict[str, Result]:
+        return self.submit(recipients, notification_data, personalize).result()
+
+    def close(self):
+        if self._loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = self._session = self._semaphore = None
+
+    # ------------------------------------------------------ engine loop only
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                headers=HEADERS,
+                timeout=aiohttp.ClientTimeout(total=FANOUT_TIMEOUT_SECONDS),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _fanout(self, recipients, notification_data, personalize=None) -> Dict[str, Result]:
+        notification_type = (notification_data.get('data') or {}).get('type')
+        tokens = await asyncio.get_running_loop().run_in_executor(
+            None, filter_recipients, recipients, notification_type
+        )
+        if not tokens:
+            return {}
+        session = self._get_session()
+        if personalize:
+            by_token = {}
+            for recipient in recipients:
+                by_token.setdefault(recipient.get('device_id'), recipient)
+            results = await asyncio.gather(*(
+                self._send_one(session, token, {**notification_data, **personalize(by_token[token])})
+                for token in tokens
+            ))
+            results = dict(zip(tokens, results))
+        elif self.multicast and len(tokens) > 1:
+            parts = await asyncio.gather(*(
+                self._send_chunk(session, chunk, notification_data)
+                for chunk in chunked(tokens, self.chunk_size)
+            ))
+            results = {token: result for part in parts for token, result in part.items()}
+        else:
+            results = await self._send_singles(session, tokens, notification_data)
+
+        failed = sum(1 for ok, _ in results.values() if not ok)
+        logger.info(f"Fan-out {notification_type}: {len(results) - failed}/{len(results)} sent")
+        return results
+
+    async def _send_chunk(self, session, tokens: List[str], notification_data) -> Dict[str, Result]:
+        if self.multicast:
+            async with self._semaphore:
+                self.requests += 1
+                try:
+                    async with session.post(
+                        f"{self.service_url}/notifications/batch",
+                        json={**notification_data, "tokens": tokens},
+                    ) as response:
+                        if response.status == 200:
+                            body = await response.json(content_type=None)
+                            return dict(zip(tokens, parse_multicast_results(body, tokens)))
+                        error = f"Status {response.status}: {await response.text()}"
+                except Exception as e:
+                    return {token: (False, str(e)) for token in tokens}
+            if response.status not in BATCH_UNSUPPORTED_STATUSES:
+                return {token: (False, error) for token in tokens}
+            logger.warning("Push service has no batch endpoint, falling back to per-token sends")
+            self.multicast = False
+        return await self._send_singles(session, tokens, notification_data)
+
+    async def _send_singles(self, session, tokens: List[str], notification_data) -> Dict[str, Result]:
+        results = await asyncio.gather(*(self._send_one(session, token, notification_data) for token in tokens))
+        return dict(zip(tokens, results))
+
+    async def _send_one(self, session, token: str, notification_data) -> Result:
+        async with self._semaphore:
+            self.requests += 1
+            try:
+                async with session.post(
+                    f"{self.service_url}/notifications",
+                    json={**notification_data, "token": token},
+                ) as response:
+                    if response.status == 200:
+                        return True, None
+                    return False, f"Status {response.status}: {await response.text()}"
+            except Exception as e:
+                return False, str(e)
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_fanout_engine(service_url: str = None) -> FanoutEngine:
+    """Process-wide engine per push service URL."""
+    if service_url is None:
+        from settings.base import NOTIFICATION_SERVICE_URL
+        service_url = NOTIFICATION_SERVICE_URL
+    engine = _engines.get(service_url)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.setdefault(service_url, FanoutEngine(service_url))
+    return engine
+
+
+class FanoutNotificationService:
+    """
+    Base for the per-module NotificationService classes.
+
+    Subclasses only render templates and call `_fanout` (many recipients) or
+    `_notify_device` (one known device token).
+    """
+
+    def __init__(self):
+        from settings.base import NOTIFICATION_SERVICE_URL
+        self.notification_service_url = NOTIFICATION_SERVICE_URL
+
+    async def _fanout(self, recipients: List[Dict[str, Any]], notification_data: Dict[str, Any],
+                      personalize: Callable[[Dict[str, Any]], Dict[str, Any]] = None) -> Dict[str, Result]:
+        try:
+            return await get_fanout_engine(self.notification_service_url).send(
+                recipients, notification_data, personalize
+            )
+        except Exception as e:
+            logger.error(f"Error sending {(notification_data.get('data') or {}).get('type')} notification: {e}")
+            return {}
+
+    async def _notify_device(self, device_id: str, notification_data: Dict[str, Any]) -> Dict[str, Result]:
+        if not device_id:
+            return {}
+        return await self._fanout([{'device_id': device_id}], notification_data)
@@ -3,6 +3,7 @@ Show notification statistics
 """
 from django.core.management.base import BaseCommand
 from notification.models import UserNotification, NotificationLog
+from notification.dispatcher import published_stats
 from django.db.models import Count
 
 
@@ -51,4 +52,20 @@ class Command(BaseCommand):
                 f'{log.successful_count}/{log.recipient_count} sent ({log.status})'
             )
         
+        # Live dispatcher metrics (published by each web/worker process)
+        self.stdout.write('\n🚚 Dispatchers:')
+        try:
+            dispatchers = published_stats()
+        except Exception as e:
+            dispatchers = {}
+            self.stdout.write(f'   unavailable: {e}')
+        for name, stats in sorted(dispatchers.items()):
+            self.stdout.write(
+                f'   {name}: queue {stats["queue_depth"]}/{stats["queue_capacity"]}, '
+                f'{stats["throughput_per_sec"]}/s, sent {stats["sent"]}, '
+                f'failed {stats["failed"]}, dropped {stats["dropped"]}, '
+                f'{stats.get("http_requests", 0)} HTTP requests '
+                f'({"multicast" if stats.get("multicast") else "per-token"})'
+            )
+        
         self.stdout.write('\n')
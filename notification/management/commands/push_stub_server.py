@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from notification.push_stub import PushStubServer
+
+
+class Command(BaseCommand):
+    help = 'Run a local stub of the push notification service (point NOTIFICATION_SERVICE_URL at it)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency-ms', type=float, default=0, help='Simulated upstream latency per request')
+        parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of tokens reported as failed')
+        parser.add_argument('--no-batch', action='store_true', help='Answer 404 on /notifications/batch')
+
+    def handle(self, *args, **options):
+        server = PushStubServer(
+            options['host'], options['port'], options['latency_ms'],
+            options['fail_rate'], batch=not options['no_batch']
+        )
+        self.stdout.write(f'Push stub listening on {server.url} (batch endpoint {"off" if options["no_batch"] else "on"})')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+            self.stdout.write(f'Served {server.requests} requests for {server.tokens} tokens')
@@ -0,0 +1,97 @@
+"""
+Local stand-in for the push notification service.
+
+Serves the two endpoints the backend calls:
+
+- POST /notifications        one `token` per request
+- POST /notifications/batch  a `tokens` list; answers {"results": [...]} with
+                             one {"token", "success", "error"} per token
+
+Used by `manage.py push_stub_server` and `manage.py bench_push_broadcast`.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real service
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if self.path == '/notifications':
+            payload = json.loads(body or b'{}')
+            ok = stub.record([payload.get('token')])[0]
+            self._reply(200 if ok else 400, {'success': ok})
+        elif self.path == '/notifications/batch' and stub.batch:
+            tokens = json.loads(body or b'{}').get('tokens') or []
+            flags = stub.record(tokens)
+            self._reply(200, {'results': [
+                {'token': t, 'success': ok, 'error': None if ok else 'InvalidRegistration'}
+                for t, ok in zip(tokens, flags)
+            ]})
+        else:
+            self._reply(404, {'error': 'Not found'})
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PushStubServer:
+    """Threaded HTTP stub that counts requests and delivered tokens."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0,
+                 fail_rate: float = 0.0, batch: bool = True):
+        self.latency = latency_ms / 1000.0
+        self.fail_rate = fail_rate
+        self.batch = batch
+        self.requests = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, tokens):
+        with self._lock:
+            self.requests += 1
+            self.tokens += len(tokens)
+        return [bool(t) and random.random() >= self.fail_rate for t in tokens]
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.tokens = 0
+
+    def start(self) -> 'PushStubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='push-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
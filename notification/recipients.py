@@ -0,0 +1,124 @@
+"""
+Push recipients of a user's accepted connections.
+
+CreatePost used to walk `created_by.connection.all()` and call `.single()` on
+each connection's created_by / receiver and on the other user's profile, so
+the time to publish grew with the creator's connection count (3-4 Cypher
+round trips per connection) before the notification was even queued.
+
+`connection_recipients(user_uid, notification_type)` returns the recipients
+as {'uid', 'user_id', 'device_id', 'enabled'} dicts:
+
+- the (uid, user_id, device_id) list of the connections comes from one Cypher
+  query and is cached per user for RECIPIENT_CACHE_SECONDS
+- 'enabled' is the connection's NotificationPreference for
+  `notification_type`, read with one query per call (preferences are not
+  cached, so opting out takes effect immediately)
+
+Cached lists are dropped by `invalidate_connection_recipients` when a
+connection between two users is accepted, cancelled or deleted, and by
+`invalidate_device_token` when a user's device token changes (every list the
+user appears in).
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from neomodel import db
+
+logger = logging.getLogger(__name__)
+
+RECIPIENT_CACHE_SECONDS = int(os.getenv('NOTIFICATION_RECIPIENT_CACHE_SECONDS', '3600'))
+
+connection_recipients_query = """
+        MATCH (me:Users {uid: $uid})-[:HAS_CONNECTION]->(:Connection {connection_status: "Accepted"})<-[:HAS_CONNECTION]-(friend:Users)
+        WHERE friend.uid <> $uid
+        MATCH (friend)-[:HAS_PROFILE]->(profile:Profile)
+        WHERE profile.device_id IS NOT NULL AND profile.device_id <> ""
+        RETURN friend.uid, friend.user_id, head(collect(profile.device_id))
+"""
+
+connection_uids_query = """
+        MATCH (me:Users {uid: $uid})-[:HAS_CONNECTION]->(:Connection {connection_status: "Accepted"})<-[:HAS_CONNECTION]-(friend:Users)
+        WHERE friend.uid <> $uid
+        RETURN DISTINCT friend.uid
+"""
+
+
+def _key(user_uid: str) -> str:
+    return f"notification_recipients:{user_uid}"
+
+
+def _connection_tokens(user_uid: str) -> List[tuple]:
+    """Cached [(uid, user_id, device_id)] of the user's accepted connections."""
+    key = _key(user_uid)
+    tokens = cache.get(key)
+    if tokens is None:
+        rows, _ = db.cypher_query(connection_recipients_query, {'uid': user_uid})
+        tokens = [(uid, str(user_id) if user_id is not None else None, device_id) for uid, user_id, device_id in rows]
+        cache.set(key, tokens, timeout=RECIPIENT_CACHE_SECONDS)
+    return tokens
+
+
+def _disabled_user_ids(user_ids, notification_type: str) -> set:
+    from .models import NotificationPreference
+
+    user_ids = [i for i in set(user_ids) if i and i.isdigit()]
+    if not user_ids:
+        return set()
+    return {
+        str(user_id) for user_id in NotificationPreference.objects.filter(
+            notification_type=notification_type,
+            is_enabled=False,
+            user_id__in=user_ids,
+        ).values_list('user_id', flat=True)
+    }
+
+
+def connection_recipients(user_uid: str, notification_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Recipients of a notification sent to every accepted connection of a user.
+
+    Connections without a device token are left out. Without
+    `notification_type` every recipient is 'enabled'. A failed lookup returns
+    no recipients rather than failing the caller's write.
+    """
+    try:
+        tokens = _connection_tokens(user_uid)
+    except Exception as e:
+        logger.warning(f"Recipient lookup failed for {user_uid}: {e}")
+        return []
+    disabled = set()
+    if notification_type and tokens:
+        try:
+            disabled = _disabled_user_ids((user_id for _, user_id, _ in tokens), notification_type)
+        except Exception as e:
+            logger.warning(f"Preference lookup skipped for {notification_type}: {e}")
+    return [
+        {'uid': uid, 'user_id': user_id, 'device_id': device_id, 'enabled': user_id not in disabled}
+        for uid, user_id, device_id in tokens
+    ]
+
+
+def invalidate_connection_recipients(*user_uids) -> None:
+    """Drop the cached lists of users whose connection set changed."""
+    keys = [_key(uid) for uid in user_uids if uid]
+    if not keys:
+        return
+    try:
+        cache.delete_many(keys)
+    except Exception as e:
+        logger.warning(f"Recipient cache invalidate failed users={user_uids}: {e}")
+
+
+def invalidate_device_token(user_uid: str) -> None:
+    """Drop every cached list holding the user's device token."""
+    if not user_uid:
+        return
+    try:
+        rows, _ = db.cypher_query(connection_uids_query, {'uid': user_uid})
+        invalidate_connection_recipients(*(row[0] for row in rows))
+    except Exception as e:
+        logger.warning(f"Recipient cache invalidate failed for device change of {user_uid}: {e}")
@@ -10,6 +10,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from notification.services import UnifiedNotificationService, NotificationBuilder, NotificationDispatcher
 from notification.enums import NotificationType, NotificationPriority
 from notification.models import NotificationLog, NotificationPreference
+from notification import recipients
 
 
 class NotificationBuilderTestCase(TestCase):
@@ -217,3 +218,43 @@ class NotificationEnumTestCase(TestCase):
         self.assertEqual(category, "connection")
 
 
+class ConnectionRecipientsTestCase(TestCase):
+    """Connection recipients come from one cached Cypher query"""
+
+    ROWS = [('u1', 1, 'token-1'), ('u2', 2, 'token-2')]
+
+    def setUp(self):
+        self.store = {}
+        cache = MagicMock()
+        cache.get.side_effect = self.store.get
+        cache.set.side_effect = lambda key, value, timeout=None: self.store.__setitem__(key, value)
+        cache.delete_many.side_effect = lambda keys: [self.store.pop(k, None) for k in keys]
+        patcher = patch.object(recipients, 'cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookup_is_cached(self):
+        with patch.object(recipients.db, 'cypher_query', return_value=(self.ROWS, None)) as query:
+            first = recipients.connection_recipients('me')
+            second = recipients.connection_recipients('me')
+
+        self.assertEqual(query.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual([r['device_id'] for r in first], ['token-1', 'token-2'])
+        self.assertTrue(all(r['enabled'] for r in first))
+
+    def test_preference_marks_recipient_disabled(self):
+        User.objects.create(id=2, username='muted')
+        NotificationPreference.objects.create(user_id=2, notification_type='new_post_from_connection', is_enabled=False)
+        with patch.object(recipients.db, 'cypher_query', return_value=(self.ROWS, None)):
+            result = recipients.connection_recipients('me', 'new_post_from_connection')
+
+        self.assertEqual({r['uid']: r['enabled'] for r in result}, {'u1': True, 'u2': False})
+
+    def test_device_change_invalidates_connection_lists(self):
+        with patch.object(recipients.db, 'cypher_query', return_value=(self.ROWS, None)):
+            recipients.connection_recipients('u1')
+        with patch.object(recipients.db, 'cypher_query', return_value=([('u1',)], None)):
+            recipients.invalidate_device_token('me')
+
+        self.assertNotIn(recipients._key('u1'), self.store)
@@ -46,7 +46,7 @@ from opportunity.utils.redis_helper import (
     increment_opportunity_like_count,
     increment_opportunity_share_count
 )
-from post.models import PostReactionManager
+from post.utils import reaction_counts
 from user_activity.services.activity_service import ActivityService
 from post.utils.mention_extractor import MentionExtractor
 from post.services.mention_service import MentionService
@@ -777,19 +777,8 @@ class CreateOpportunityLike(graphene.Mutation):
                 opportunity.like.connect(like)
                 like.opportunity.connect(opportunity)
 
-                # Update PostReactionManager for analytics
-                try:
-                    post_reaction_manager = PostReactionManager.objects.get(post_uid=opportunity.uid)
-                except PostReactionManager.DoesNotExist:
-                    post_reaction_manager = PostReactionManager(post_uid=opportunity.uid)
-                    post_reaction_manager.initialize_reactions()
-                    post_reaction_manager.save()
-
-                post_reaction_manager.add_reaction(
-                    vibes_name=individual_vibe.name_of_vibe,
-                    score=input.vibe
-                )
-                post_reaction_manager.save()
+                # Update the reaction aggregates for analytics
+                reaction_counts.add_reaction(opportunity.uid, individual_vibe.name_of_vibe, input.vibe)
 
                 # Increment like count in Redis
                 increment_opportunity_like_count(opportunity.uid)
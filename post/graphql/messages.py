@@ -23,4 +23,5 @@ class PostMessages:
     POST_PINNED=_("You have pin the post")
     POST_UNPINNED=_("You have unpinned the post")
     POST_DELETE_PERMISSION_DENIED=_("You do not have permission to delete this post.")
+    POST_NOT_FOUND=_("Post not found.")
 
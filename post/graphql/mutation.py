@@ -28,7 +28,7 @@ from post.models import *
 from .inputs import *
 from .messages import PostMessages
 from graphql_jwt.decorators import login_required,superuser_required
-from post.redis import increment_post_comment_count,get_post_comment_count,increment_post_like_count
+from post.redis import increment_post_comment_count,get_post_comment_count,increment_post_like_count,increment_post_share_count,increment_post_view_count
 from vibe_manager.models import IndividualVibe
 from community.models import CommunityPost
 from post.utils.post_decorator import handle_graphql_post_errors
@@ -41,6 +41,11 @@ from user_activity.services.activity_service import ActivityService
 from vibe_manager.services.vibe_activity_service import VibeActivityService
 from post.services.mention_service import MentionService
 from post.utils.feed_history import hide_post_today, mute_creator
+from post.utils.feed_candidates import fanout_connection_post
+from notification.recipients import connection_recipients
+from post.utils.interest_vectors import record_post_interaction
+from post.utils import reaction_counts
+from post.services.like_service import upsert_like, queue_like_side_effects
 
 
 
@@ -111,6 +116,9 @@ class CreatePost(Mutation):
             # Establish bidirectional relationships between post and creator
             post.created_by.connect(created_by)
             created_by.post.connect(post)
+
+            # Push the post into the warm feed candidate stores of connections
+            fanout_connection_post(user_id, post.uid, post.created_at.timestamp())
             
             # Extract mentions from post content (title and text)
             from post.utils.mention_extractor import MentionExtractor
@@ -165,20 +173,8 @@ class CreatePost(Mutation):
                     
                     # Only add vibe if user hasn't already reacted
                     if not existing_results:
-                        # Create PostReactionManager for user post if it doesn't exist
-                        try:
-                            post_reaction_manager = PostReactionManager.objects.get(post_uid=post.uid)
-                        except PostReactionManager.DoesNotExist:
-                            post_reaction_manager = PostReactionManager(post_uid=post.uid)
-                            post_reaction_manager.initialize_reactions()
-                            post_reaction_manager.save()
-
                         # Add this reaction to the aggregated analytics
-                        post_reaction_manager.add_reaction(
-                            vibes_name=input.reaction,
-                            score=input.vibe
-                        )
-                        post_reaction_manager.save()
+                        reaction_counts.add_reaction(post.uid, input.reaction, input.vibe)
 
                         # Create the individual like record
                         like = Like(
@@ -199,20 +195,11 @@ class CreatePost(Mutation):
                     print(f"Error adding vibe to user post: {str(vibe_error)}")
 
             # ============= NOTIFICATION CODE START =============
-            # Get all connections of the post creator for notification delivery
-            connections = created_by.connection.all()
-            recipients = []
-            
-            for connection in connections:
-                # Get the other user in the connection (not the post creator)
-                other_user = connection.receiver.single() if connection.created_by.single().uid == created_by.uid else connection.created_by.single()
-                if other_user:
-                    profile = other_user.profile.single()
-                    if profile and profile.device_id:
-                        recipients.append({
-                            'device_id': profile.device_id,
-                            'uid': other_user.uid
-                        })
+            # Device tokens of the creator's accepted connections (one cached query)
+            recipients = [
+                r for r in connection_recipients(created_by.uid, "new_post_from_connection")
+                if r['enabled']
+            ]
             
             # === OLD NOTIFICATION CODE (COMMENTED - CAN BE REMOVED AFTER TESTING) ===
             # if followers:
@@ -349,18 +336,7 @@ class CreateDebate(Mutation):
                     check_params = {'user_id': user_id, 'post_uid': post.uid}
                     existing_results, _ = db.cypher_query(check_query, check_params)
                     if not existing_results:
-                        try:
-                            post_reaction_manager = PostReactionManager.objects.get(post_uid=post.uid)
-                        except PostReactionManager.DoesNotExist:
-                            post_reaction_manager = PostReactionManager(post_uid=post.uid)
-                            post_reaction_manager.initialize_reactions()
-                            post_reaction_manager.save()
-
-                        post_reaction_manager.add_reaction(
-                            vibes_name=input.reaction,
-                            score=input.vibe
-                        )
-                        post_reaction_manager.save()
+                        reaction_counts.add_reaction(post.uid, input.reaction, input.vibe)
 
                         like = Like(reaction=input.reaction, vibe=input.vibe)
                         like.save()
@@ -1074,6 +1050,7 @@ class CreateComment(Mutation):
 
             # EXISTING LOGIC - Increment comment count in Redis for performance
             increment_post_comment_count(target_post.uid)
+            record_post_interaction(user_id, target_post, 'comment')
 
             # Extract mentions from comment content
             if comment and input.content:
@@ -1312,8 +1289,9 @@ class CreateLike(Mutation):
     Used in: Reaction buttons, post engagement, vibe analytics
     Expects: CreateLikeInput with post UID, reaction type, and vibe score
     Returns: Created LikeType object
-    Side effects: Updates PostReactionManager analytics, increments Redis counters
-    Note: Contains complex analytics logic that needs review and optimization
+    Side effects: Updates PostVibeCount aggregates, increments Redis counters
+    (queued after commit)
+    Note: A user has one live Like per post; reacting again updates it
     """
     like = graphene.Field(LikeType)
     success = graphene.Boolean()
@@ -1330,122 +1308,23 @@ class CreateLike(Mutation):
             raise GraphQLError("Authentication Failure")
         payload = info.context.payload
         user_id = payload.get('user_id')
-        user_node = Users.nodes.get(user_id=user_id)
         
         try:
-            try:
-                post = Post.nodes.get(uid=input.post_uid)
-            except Post.DoesNotExist:
-                post = CommunityPost.nodes.get(uid=input.post_uid)
-
-            query = (
-                "MATCH (user:Users {user_id: $user_id})-[r:HAS_USER]->(like:Like) "
-                "MATCH (like)-[:HAS_POST]->(post {uid: $post_uid}) "
-                "RETURN like"
+            # One MERGE creates or updates the user's Like and returns what the
+            # response and the side effects need (see post.services.like_service)
+            result = upsert_like(user_id, input.post_uid, input.reaction, input.vibe)
+            if result is None:
+                return CreateLike(like=None, success=False, message=PostMessages.POST_NOT_FOUND)
+
+            # Aggregates, counters, notification and tracking run after commit
+            queue_like_side_effects(
+                result,
+                ip_address=info.context.META.get('REMOTE_ADDR'),
+                user_agent=info.context.META.get('HTTP_USER_AGENT', ''),
             )
-            params = {'user_id': user_id, 'post_uid': input.post_uid}
-            results, _ = db.cypher_query(query, params)
-            existing_like_node = [Like.inflate(row[0]) for row in results]
-
-            post_reaction_manager, _ = PostReactionManager.objects.get_or_create(
-                post_uid=input.post_uid,
-                defaults={}
-            )
-            if not post_reaction_manager.post_vibe:
-                post_reaction_manager.initialize_reactions()
-
-            message = ""
-            if existing_like_node:
-                like = existing_like_node[0]
-                old_reaction = like.reaction
-                old_vibe = like.vibe
-
-                post_reaction_manager.update_reaction(
-                    old_vibes_name=old_reaction,
-                    new_vibes_name=input.reaction,
-                    old_score=old_vibe,
-                    new_score=input.vibe
-                )
-
-                like.reaction = input.reaction
-                like.vibe = input.vibe
-                like.save()
-                message = PostMessages.POST_REACTION_UPDATED
-            else:
-                post_reaction_manager.add_reaction(
-                    vibes_name=input.reaction,
-                    score=input.vibe
-                )
-                like = Like(reaction=input.reaction, vibe=input.vibe)
-                like.save()
-                like.user.connect(user_node)
-                post.like.connect(like)
-                increment_post_like_count(post.uid)
-                message = PostMessages.POST_REACTION_CREATED
-                
-                # ============= NOTIFICATION CODE START =============
-                # Notify post creator about new vibe reaction (only for new likes, not updates)
-                try:
-                    from notification.global_service import GlobalNotificationService
-                    
-                    post_creator = post.created_by.single()
-                    if post_creator and post_creator.uid != user_node.uid:
-                        creator_profile = post_creator.profile.single()
-                        if creator_profile and creator_profile.device_id:
-                            service = GlobalNotificationService()
-                            service.send(
-                                event_type="vibe_reaction_on_post",
-                                recipients=[{
-                                    'device_id': creator_profile.device_id,
-                                    'uid': post_creator.uid
-                                }],
-                                username=user_node.username,
-                                vibe_type=input.reaction,
-                                post_id=post.uid
-                            )
-                except Exception as e:
-                    print(f"Failed to send vibe reaction notification: {e}")
-                # ============= NOTIFICATION CODE END =============
-
-            post_reaction_manager.save()
-
-            try:
-                ActivityService.track_content_interaction(
-                    user=user_node,
-                    content_type='post',
-                    content_id=post.uid,
-                    interaction_type='like',
-                    metadata={
-                        'reaction': input.reaction,
-                        'vibe_score': input.vibe,
-                        'like_id': like.uid
-                    }
-                )
-                post_owner = post.created_by.single()
-                VibeActivityService.track_vibe_sending(
-                    sender=user_node,
-                    receiver_id=post_owner.user_id if post_owner else None,
-                    vibe_data={
-                        'vibe_id': like.uid,
-                        'vibe_name': input.reaction,
-                        'vibe_type': 'individual',
-                        'category': 'post_reaction'
-                    },
-                    vibe_score=input.vibe,
-                    ip_address=info.context.META.get('REMOTE_ADDR'),
-                    user_agent=info.context.META.get('HTTP_USER_AGENT', ''),
-                    metadata={
-                        'post_id': post.uid,
-                        'like_id': like.uid,
-                        'post_type': getattr(post, 'post_type', 'unknown')
-                    }
-                )
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to track like activity: {str(e)}")
 
-            return CreateLike(like=LikeType.from_neomodel(like), success=True, message=message)
+            message = PostMessages.POST_REACTION_CREATED if result.created else PostMessages.POST_REACTION_UPDATED
+            return CreateLike(like=LikeType.from_neomodel(result.like, user=result.user), success=True, message=message)
         except Exception as error:
             message = getattr(error, 'message', str(error))
             return CreateLike(like=None, success=False, message=message)
@@ -1460,7 +1339,7 @@ class UpdateLike(Mutation):
     Used in: Reaction management, user preference updates
     Expects: UpdateLikeInput with like UID and fields to update
     Returns: Updated LikeType object
-    Note: Should update PostReactionManager analytics when vibe scores change
+    Note: Should update PostVibeCount aggregates (reaction_counts.update_reaction) when vibe scores change
     """
     like = graphene.Field(LikeType)
     success = graphene.Boolean()
@@ -1542,7 +1421,7 @@ class DeleteLike(Mutation):
     Used in: Reaction removal, user preference changes
     Expects: DeleteInput with like UID
     Returns: Success status and message
-    Note: Should update PostReactionManager analytics when reactions are deleted
+    Note: Should update PostVibeCount aggregates (reaction_counts.remove_reaction) when reactions are deleted
     """
     success = graphene.Boolean()
     message = graphene.String()
@@ -1649,6 +1528,8 @@ class CreatePostShare(Mutation):
             post_share.post.connect(post)
             post_share.user.connect(user_node)
             post.postshare.connect(post_share)
+            increment_post_share_count(post.uid)
+            record_post_interaction(user_id, post, 'share')
 
             # Track activity for analytics
             try:
@@ -1716,6 +1597,7 @@ class CreatePostView(Mutation):
             post_view.post.connect(post)
             post_view.user.connect(user_node)
             post.view.connect(post_view)
+            increment_post_view_count(post.uid)
             
             # Track activity for analytics
             try:
@@ -1781,6 +1663,7 @@ class CreateSavedPost(Mutation):
             saved_post.post.connect(post)
             saved_post.user.connect(user_node)
             post.postsave.connect(saved_post)
+            record_post_interaction(user_id, post, 'save')
 
             return CreateSavedPost(saved_post=SavedPostType.from_neomodel(saved_post), success=True, message=PostMessages.POST_SAVED)
         except Exception as error:
@@ -10,11 +10,13 @@ from post.utils.reaction_manager import PostReactionUtils, IndividualVibeManager
 from post.utils.feed_metrics import log_feed_metrics, monitor_feed_performance
 from post.utils.feed_validation import validate_feed_algorithm_requirements, validate_feed_quality
 from post.utils.feed_fallbacks import get_appropriate_fallback_feed
-from post.utils.feed_history import get_viewed_today, mark_viewed, get_hidden_today, get_muted_creators, get_creator_counts, increment_creator_counts
+from post.utils.feed_history import get_feed_history, seen_or_hidden, mark_viewed, increment_creator_counts_bulk
 from post.utils.feed_selection import diversify, compose_with_quotas, creator_key, inject_exploration
 from post.utils.ab_config import get_feed_config
 from post.utils.trending import fetch_trending
 from post.utils.interest_vectors import get_user_interest_vector
+from post.utils.feed_candidates import get_feed_candidates
+from post.redis import PostCounters
 from .types import *
 from auth_manager.models import Users, Profile
 from post.models import *
@@ -26,6 +28,7 @@ from community.models import CommunityPost
 
 from post.graphql.raw_queries import users, post_queries
 from post.utils.feed_algorithm import apply_feed_algorithm
+from post.utils.relationship_loader import prime
 from datetime import datetime
 import time
 import logging
@@ -42,7 +45,9 @@ class Query(graphene.ObjectType):
     @login_required
     @superuser_required
     def resolve_all_posts(self, info):
-        return [PostType.from_neomodel(post, info) for post in Post.nodes.all()]
+        posts = prime(Post.nodes.all())
+        counters = PostCounters.fetch([post.uid for post in posts])
+        return [PostType.from_neomodel(post, info, counters) for post in posts]
 
     post_by_uid = graphene.Field(
         PostType, post_uid=graphene.String(required=True))
@@ -91,7 +96,8 @@ class Query(graphene.ObjectType):
         my_post = list(user_node.post.all())
         my_posts = [post for post in my_post if not post.is_deleted]
 
-        return [PostType.from_neomodel(post, info) for post in my_posts]
+        counters = PostCounters.fetch([post.uid for post in my_posts])
+        return [PostType.from_neomodel(post, info, counters) for post in prime(my_posts)]
 
     # Tag Queries
     all_tags = graphene.List(TagType)
@@ -99,7 +105,7 @@ class Query(graphene.ObjectType):
     @login_required
     @superuser_required
     def resolve_all_tags(self, info):
-        return [TagType.from_neomodel(tag) for tag in Tag.nodes.all()]
+        return [TagType.from_neomodel(tag) for tag in prime(Tag.nodes.all())]
 
     # Tag Queries by Post
     tags_by_post_uid = graphene.List(
@@ -109,7 +115,7 @@ class Query(graphene.ObjectType):
     def resolve_tags_by_post_uid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         tags = list(post_node.tag.all())
-        return [TagType.from_neomodel(tag) for tag in tags]
+        return [TagType.from_neomodel(tag) for tag in prime(tags)]
 
     # My Tags
     my_posttags = graphene.List(TagType)
@@ -125,15 +131,15 @@ class Query(graphene.ObjectType):
             tags = []
             for post in my_posts:
                 tags.extend(list(post.tag))
-            return [TagType.from_neomodel(x) for x in tags]
+            return [TagType.from_neomodel(x) for x in prime(tags)]
         except Exception as e:
             raise Exception(e)
 
-    my_feed = graphene.List(FeedTestType, circle_type=CircleTypeEnum(), first=graphene.Int(default_value=20), after=graphene.String())
+    my_feed = graphene.List(FeedTestType, circle_type=CircleTypeEnum(), first=graphene.Int(default_value=20), after=graphene.String(), refresh=graphene.Boolean(default_value=False))
 
     @handle_graphql_post_errors
     @login_required
-    def resolve_my_feed(self, info, circle_type=None, first=20, after=None):
+    def resolve_my_feed(self, info, circle_type=None, first=20, after=None, refresh=False):
         payload = info.context.payload
         user_id = payload.get('user_id')
         try:
@@ -182,20 +188,27 @@ class Query(graphene.ObjectType):
                 cursor_timestamp = None
                 cursor_post_uid = None
 
-        params = {
-            "log_in_user_node_id": str(user_id),
-            "cursor_timestamp": cursor_timestamp,
-            "cursor_post_uid": cursor_post_uid,
-            "limit": first * 3
-        }
-
-        results, _ = db.cypher_query(post_queries.post_feed_query, params)
+        # Served from the per-user candidate store; the full post_feed_query
+        # only runs on a cold start or when the client forces a refresh.
+        results = get_feed_candidates(
+            str(user_id),
+            cursor_timestamp=cursor_timestamp,
+            cursor_post_uid=cursor_post_uid,
+            limit=first * 3,
+            force_rebuild=bool(refresh) and not after
+        )
         interests = get_user_interest_vector(str(user_id))
         print("feed_interests", user_id, sorted(interests.get('post_types', {}).items(), key=lambda x: x[1], reverse=True)[:3])
 
-        viewed = get_viewed_today(str(user_id))
-        hidden = get_hidden_today(str(user_id))
-        muted = get_muted_creators(str(user_id))
+        # Viewed/hidden membership for the whole page, muted creators and
+        # today's creator counts in one pipelined Redis call
+        try:
+            history = get_feed_history(str(user_id), [r[0].get('uid') for r in results if r and r[0]])
+        except Exception:
+            history = {'viewed': set(), 'hidden': set(), 'muted': set(), 'creator_counts': {}}
+        viewed = history['viewed']
+        hidden = history['hidden']
+        muted = history['muted']
 
         def get_blocked_creators(u_id: str):
             try:
@@ -298,7 +311,7 @@ class Query(graphene.ObjectType):
 
         scored = sorted(filtered, key=final_score, reverse=True)
         cfg = get_feed_config(str(user_id))
-        session_counts = get_creator_counts(str(user_id))
+        session_counts = history['creator_counts']
         selected = compose_with_quotas(
             scored,
             first,
@@ -318,6 +331,10 @@ class Query(graphene.ObjectType):
                 if uid:
                     exclude_uids.add(uid)
             trending_rows = fetch_trending(max(exploration_count * 2, 5), exclude_uids)
+            try:
+                trending_seen = seen_or_hidden(str(user_id), [r[0].get('uid') for r in trending_rows if r and r[0]])
+            except Exception:
+                trending_seen = set()
             safe_trending = []
             for r in trending_rows:
                 pd = r[0] if r else {}
@@ -328,7 +345,7 @@ class Query(graphene.ObjectType):
                     puid = getattr(pd, 'uid', None) or getattr(pd, 'post_uid', None)
                 ck2 = creator_key(r)
                 allow2 = ck2 not in muted and ck2 not in blocked
-                if puid and (puid in viewed or puid in hidden) and len(selected) >= 10:
+                if puid and puid in trending_seen and len(selected) >= 10:
                     allow2 = False
                 if allow2:
                     safe_trending.append(r)
@@ -343,6 +360,10 @@ class Query(graphene.ObjectType):
                 if uid2:
                     exclude_uids2.add(uid2)
             more_trending = fetch_trending(max(extra_needed * 2, 10), exclude_uids2)
+            try:
+                more_seen = seen_or_hidden(str(user_id), [r[0].get('uid') for r in more_trending if r and r[0]])
+            except Exception:
+                more_seen = set()
             safe_more = []
             for r in more_trending:
                 pd = r[0] if r else {}
@@ -353,7 +374,7 @@ class Query(graphene.ObjectType):
                     puid = getattr(pd, 'uid', None) or getattr(pd, 'post_uid', None)
                 ck3 = creator_key(r)
                 allow3 = ck3 not in muted and ck3 not in blocked
-                if puid and (puid in viewed or puid in hidden) and len(selected) >= 10:
+                if puid and puid in more_seen and len(selected) >= 10:
                     allow3 = False
                 if allow3:
                     safe_more.append(r)
@@ -414,11 +435,22 @@ class Query(graphene.ObjectType):
                     for i in ids:
                         if i:
                             fids.append(i)
+                # Creator avatars resolve through the same bulk lookup
+                profile_node = r[2] if len(r) > 2 else None
+                pic_id = profile_node.get('profile_pic_id') if hasattr(profile_node, 'get') else None
+                if pic_id:
+                    fids.append(pic_id)
             if fids:
                 FileURL.store_file_urls(fids)
         except Exception:
             pass
 
+        try:
+            # Comment/vibe/share/view counters for the whole page in one MGET
+            counters = PostCounters.fetch([r[0].get('uid') for r in selected if r and r[0]])
+        except Exception:
+            counters = None
+
         feed_items = []
         for row in selected:
             try:
@@ -455,7 +487,8 @@ class Query(graphene.ObjectType):
                         user_node=user_node,
                         profile=profile_node,
                         query_share_count=share_count,
-                        query_overall_score=overall_score
+                        query_overall_score=overall_score,
+                        counters=counters
                     )
                     if item is not None:
                         feed_items.append(item)
@@ -464,8 +497,11 @@ class Query(graphene.ObjectType):
 
         try:
             mark_viewed(str(user_id), [x.uid for x in feed_items if hasattr(x, 'uid')])
+            served_creators = {}
             for r in selected:
-                increment_creator_counts(str(user_id), creator_key(r), 1)
+                ck = creator_key(r)
+                served_creators[ck] = served_creators.get(ck, 0) + 1
+            increment_creator_counts_bulk(str(user_id), served_creators)
         except Exception:
             pass
 
@@ -477,7 +513,7 @@ class Query(graphene.ObjectType):
     @login_required
     @superuser_required
     def resolve_all_postreactions(self, info):
-        return [LikeType.from_neomodel(like) for like in Like.nodes.all()]
+        return [LikeType.from_neomodel(like) for like in prime(Like.nodes.all())]
 
     # Tag Queries by Post
     post_reactions_by_post_uid = graphene.List(
@@ -494,7 +530,7 @@ class Query(graphene.ObjectType):
             like_node = post_node.like.all()
             likes_detail = like_node[:10]
             likes = list(likes_detail)
-            return [LikeType.from_neomodel(like) for like in likes]
+            return [LikeType.from_neomodel(like) for like in prime(likes)]
         except Post.DoesNotExist:
             post_node = CommunityPost.nodes.get(uid=post_uid)
             if post_node.is_deleted:
@@ -502,7 +538,7 @@ class Query(graphene.ObjectType):
             like_node = post_node.like.all()
             likes_detail = like_node[:10]
             likes = list(likes_detail)
-            return [LikeType.from_neomodel(like) for like in likes]
+            return [LikeType.from_neomodel(like) for like in prime(likes)]
 
     post_reactions_analytic_by_post_uid = graphene.List(
         VibeAnalyticType, post_uid=graphene.String(required=True))
@@ -543,7 +579,7 @@ class Query(graphene.ObjectType):
                 return None
 
             # Get aggregated vibe analytics
-            post_reaction_manager = PostReactionManager.objects.filter(post_uid=post_uid).first()
+            all_reactions = PostReactionUtils.get_post_vibes(post_uid)
             
             # Get all likes for this post
             all_likes = list(post_node.like.all())
@@ -553,8 +589,7 @@ class Query(graphene.ObjectType):
             overall_average_vibe = sum(like.vibe for like in active_likes) / total_vibers if total_vibers > 0 else 0
             
             # Get top vibes data
-            if post_reaction_manager:
-                all_reactions = post_reaction_manager.post_vibe
+            if all_reactions:
                 # Sort by count first, then by average score
                 sorted_reactions = sorted(
                     all_reactions, 
@@ -611,14 +646,14 @@ class Query(graphene.ObjectType):
         reactions = []
         for post in my_posts:
             reactions.extend(list(post.like))
-        return [LikeType.from_neomodel(x) for x in reactions]
+        return [LikeType.from_neomodel(x) for x in prime(reactions)]
 
     all_postcomments = graphene.List(CommentType)
 
     @login_required
     @superuser_required
     def resolve_all_postcomments(self, info):
-        return [CommentType.from_neomodel(comment) for comment in Comment.nodes.all()]
+        return [CommentType.from_neomodel(comment) for comment in prime(Comment.nodes.all())]
 
     # Tag Queries by Post
     postcomments_by_post_uid = graphene.List(
@@ -877,7 +912,7 @@ class Query(graphene.ObjectType):
             post_node = Post.nodes.get(uid=post_uid)
             comments = list(post_node.comment.all())
             answers = [c for c in comments if getattr(c, 'is_answer', False) and not c.is_deleted]
-            return [CommentType.from_neomodel(c, info) for c in answers]
+            return [CommentType.from_neomodel(c, info) for c in prime(answers)]
         except Post.DoesNotExist:
             return []
            
@@ -1034,14 +1069,14 @@ class Query(graphene.ObjectType):
         comments = []
         for post in my_posts:
             comments.extend(list(post.comment))
-        return [CommentType.from_neomodel(x) for x in comments]
+        return [CommentType.from_neomodel(x) for x in prime(comments)]
 
     all_postreviews = graphene.List(ReviewType)
 
     @login_required
     @superuser_required
     def resolve_all_postreviews(self, info):
-        return [ReviewType.from_neomodel(review) for review in Review.nodes.all()]
+        return [ReviewType.from_neomodel(review) for review in prime(Review.nodes.all())]
 
     # Tag Queries by Post
     postreviews_by_post_uid = graphene.List(
@@ -1052,7 +1087,7 @@ class Query(graphene.ObjectType):
     def resolve_postreviews_by_post_uid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         review = list(post_node.review.all())
-        return [ReviewType.from_neomodel(review) for review in review]
+        return [ReviewType.from_neomodel(review) for review in prime(review)]
 
     # My Tags
     my_postreview = graphene.List(ReviewType)
@@ -1067,14 +1102,14 @@ class Query(graphene.ObjectType):
         reviews = []
         for post in my_posts:
             reviews.extend(list(post.review))
-        return [ReviewType.from_neomodel(x) for x in reviews]
+        return [ReviewType.from_neomodel(x) for x in prime(reviews)]
 
     all_postview = graphene.List(PostViewType)
 
     @login_required
     @superuser_required
     def resolve_all_postview(self, info):
-        return [PostViewType.from_neomodel(view) for view in PostView.nodes.all()]
+        return [PostViewType.from_neomodel(view) for view in prime(PostView.nodes.all())]
 
     postview_byuid = graphene.List(
         PostViewType, post_uid=graphene.String(required=True))
@@ -1084,7 +1119,7 @@ class Query(graphene.ObjectType):
     def resolve_postview_byuid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         postview = list(post_node.view.all())
-        return [PostViewType.from_neomodel(view) for view in postview]
+        return [PostViewType.from_neomodel(view) for view in prime(postview)]
 
     my_post_views = graphene.List(PostViewType)
 
@@ -1098,14 +1133,14 @@ class Query(graphene.ObjectType):
         views = []
         for post in my_posts:
             views.extend(list(post.view))
-        return [PostViewType.from_neomodel(x) for x in views]
+        return [PostViewType.from_neomodel(x) for x in prime(views)]
 
     all_postshare = graphene.List(PostShareType)
 
     @superuser_required
     @login_required
     def resolve_all_postshare(self, info):
-        return [PostShareType.from_neomodel(share) for share in PostShare.nodes.all()]
+        return [PostShareType.from_neomodel(share) for share in prime(PostShare.nodes.all())]
 
     postshare_byuid = graphene.List(
         PostShareType, post_uid=graphene.String(required=True))
@@ -1115,7 +1150,7 @@ class Query(graphene.ObjectType):
     def resolve_postshare_byuid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         postshare = list(post_node.postshare.all())
-        return [PostShareType.from_neomodel(share) for share in postshare]
+        return [PostShareType.from_neomodel(share) for share in prime(postshare)]
 
     my_post_shares = graphene.List(PostShareType)
 
@@ -1129,14 +1164,14 @@ class Query(graphene.ObjectType):
         shares = []
         for post in my_posts:
             shares.extend(list(post.postshare))
-        return [PostShareType.from_neomodel(x) for x in shares]
+        return [PostShareType.from_neomodel(x) for x in prime(shares)]
 
     all_postpined = graphene.List(PinedPostType)
 
     @superuser_required
     @login_required
     def resolve_all_postpined(self, info):
-        return [PinedPostType.from_neomodel(pined, info) for pined in PinedPost.nodes.all()]
+        return [PinedPostType.from_neomodel(pined, info) for pined in prime(PinedPost.nodes.all())]
 
     postpined_byuid = graphene.List(PinedPostType, post_uid=graphene.String())
 
@@ -1145,7 +1180,7 @@ class Query(graphene.ObjectType):
     def resolve_postshare_byuid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         pinpost = list(post_node.pinpost.all())
-        return [PinedPostType.from_neomodel(pined, info) for pined in pinpost]
+        return [PinedPostType.from_neomodel(pined, info) for pined in prime(pinpost)]
 
     my_post_pined = graphene.List(PinedPostType)
 
@@ -1159,14 +1194,14 @@ class Query(graphene.ObjectType):
         pined = []
         for post in my_posts:
             pined.extend(list(post.postpin))
-        return [PinedPostType.from_neomodel(x) for x in pined]
+        return [PinedPostType.from_neomodel(x) for x in prime(pined)]
 
     all_savedpost = graphene.List(SavedPostType)
 
     @superuser_required
     @login_required
     def resolve_all_savedpost(self, info):
-        return [SavedPostType.from_neomodel(saved) for saved in SavedPost.nodes.all()]
+        return [SavedPostType.from_neomodel(saved) for saved in prime(SavedPost.nodes.all())]
 
     savedpost_byuid = graphene.List(
         SavedPostType, post_uid=graphene.String(required=True))
@@ -1176,7 +1211,7 @@ class Query(graphene.ObjectType):
     def resolve_savedpost_byuid(self, info, post_uid):
         post_node = Post.nodes.get(uid=post_uid)
         savedpost = list(post_node.postsave.all())
-        return [SavedPostType.from_neomodel(x) for x in savedpost]
+        return [SavedPostType.from_neomodel(x) for x in prime(savedpost)]
 
     my_post_saved = graphene.List(SavedPostType)
 
@@ -1190,7 +1225,7 @@ class Query(graphene.ObjectType):
         saved = []
         for post in my_posts:
             saved.extend(list(post.postsave))
-        return [SavedPostType.from_neomodel(x) for x in saved]
+        return [SavedPostType.from_neomodel(x) for x in prime(saved)]
 
     # Optimisation and review required for this query
     # my_feed = graphene.List(FeedType, circle_type=CircleTypeEnum())
@@ -1279,7 +1314,8 @@ class Query(graphene.ObjectType):
         my_post = list(user_node.post.all())
         my_posts = [post for post in my_post if not post.is_deleted]
 
-        return [PostType.from_neomodel(post, info) for post in my_posts]
+        counters = PostCounters.fetch([post.uid for post in my_posts])
+        return [PostType.from_neomodel(post, info, counters) for post in prime(my_posts)]
 
     # This is optimised feed
     # my_feed_test = graphene.List(FeedTestType,circle_type=CircleTypeEnum())
@@ -1507,8 +1543,8 @@ class Query(graphene.ObjectType):
             
             # Step 7: Initialize feed utilities and convert to GraphQL response
             if final_results:
-                Query.initialize_feed_utilities(final_results)
-                feed_items = Query.build_feed_response(final_results, circle_type)
+                counters = Query.initialize_feed_utilities(final_results)
+                feed_items = Query.build_feed_response(final_results, circle_type, counters)
                 
                 # Track viewed content for future duplicate prevention
                 Query._track_viewed_content(user_id, [item.uid for item in feed_items if hasattr(item, 'uid')], content_source='analytics_feed')
@@ -1939,8 +1975,8 @@ class Query(graphene.ObjectType):
                 
                 # If we have filtered results, use them
                 if filtered_results:
-                    Query.initialize_feed_utilities(filtered_results)
-                    fallback_feed = Query.build_feed_response(filtered_results, None)
+                    counters = Query.initialize_feed_utilities(filtered_results)
+                    fallback_feed = Query.build_feed_response(filtered_results, None, counters)
                     
                     # Track fallback content as viewed
                     fallback_uids = [item.uid for item in fallback_feed if hasattr(item, 'uid')]
@@ -1955,8 +1991,8 @@ class Query(graphene.ObjectType):
                     # Smart randomization to avoid same sequence on every refresh
                     fresh_results = Query._smart_randomize_content(results, user_id, limit, 'fallback_cycle')
                     
-                    Query.initialize_feed_utilities(fresh_results)
-                    fresh_fallback_feed = Query.build_feed_response(fresh_results, None)
+                    counters = Query.initialize_feed_utilities(fresh_results)
+                    fresh_fallback_feed = Query.build_feed_response(fresh_results, None, counters)
                     
                     # Track as new fallback cycle
                     fresh_uids = [item.uid for item in fresh_fallback_feed if hasattr(item, 'uid')]
@@ -1999,8 +2035,8 @@ class Query(graphene.ObjectType):
                 # Smart randomization for emergency content
                 emergency_results = Query._smart_randomize_content(results, user_id, min(limit, 10), 'emergency')
                 
-                Query.initialize_feed_utilities(emergency_results)
-                emergency_feed = Query.build_feed_response(emergency_results, None)
+                counters = Query.initialize_feed_utilities(emergency_results)
+                emergency_feed = Query.build_feed_response(emergency_results, None, counters)
                 
                 # Track emergency content as viewed
                 emergency_uids = [item.uid for item in emergency_feed if hasattr(item, 'uid')]
@@ -2130,9 +2166,11 @@ class Query(graphene.ObjectType):
 
         if file_ids:
             FileURL.store_file_urls(file_ids)
+
+        return PostCounters.fetch([post[0].get('uid') for post in results if post and post[0]])
     
     @staticmethod
-    def build_feed_response(sorted_results, circle_type):
+    def build_feed_response(sorted_results, circle_type, counters=None):
         """Build the final feed response from sorted results."""
 
         result_feed = []
@@ -2192,7 +2230,8 @@ class Query(graphene.ObjectType):
                         user_node=user_node,
                         profile=profile_node,
                         query_share_count=share_count,
-                        query_overall_score=calculated_overall_score
+                        query_overall_score=calculated_overall_score,
+                        counters=counters
                     )
                     # Only add non-None feed items
                     if feed_item is not None:
@@ -2217,10 +2256,10 @@ class Query(graphene.ObjectType):
 
         try:
             # Initialize utilities for fallback content
-            Query.initialize_feed_utilities(fallback_results)
+            counters = Query.initialize_feed_utilities(fallback_results)
 
             # Build response using same logic
-            return Query.build_feed_response(fallback_results, None)
+            return Query.build_feed_response(fallback_results, None, counters)
 
         except Exception as e:
             logger.error(f"Error processing fallback feed: {e}")
@@ -2233,7 +2272,7 @@ class Query(graphene.ObjectType):
 
         try:
             # Process emergency fallback directly
-            Query.initialize_feed_utilities(emergency_feed)
+            counters = Query.initialize_feed_utilities(emergency_feed)
 
             # Build emergency feed response
             emergency_result = []
@@ -2258,7 +2297,8 @@ class Query(graphene.ObjectType):
                         user_node=user_node,
                         profile=profile_node,
                         query_share_count=share_count,
-                        query_overall_score=calculated_overall_score
+                        query_overall_score=calculated_overall_score,
+                        counters=counters
                     )
                     emergency_result.append(feed_item)
                 except Exception as item_error:
@@ -2303,11 +2343,7 @@ class Query(graphene.ObjectType):
         def fetch_posts(query, params=None):
             params = params or {}
             results, _ = db.cypher_query(query, params)
-            items = []
-            for row in results:
-                post_data = row[0]
-                items.append(PostRecommendedType.from_neomodel(post_data))
-            return items
+            return PostRecommendedType.from_rows(results)
 
         # Top in World: best debate posts by vibe_score
         world_query = (
@@ -414,6 +414,70 @@ LIMIT toInteger($limit * 0.4)
         LIMIT $limit;
 """
 
+# Feed candidate store (post/utils/feed_candidates.py): hydrate stored uids
+# into rows with the same columns as post_feed_query.
+feed_candidate_hydrate_query="""
+        UNWIND $uids AS puid
+        CALL {
+            WITH puid
+            MATCH (post:Post {uid: puid, is_deleted: false})<-[:HAS_POST]-(user:Users)-[:HAS_PROFILE]->(profile:Profile)
+            OPTIONAL MATCH (me:Users {user_id: $log_in_user_node_id})-[:HAS_CONNECTION]->(conn:Connection {connection_status: "Accepted"})<-[:HAS_CONNECTION]-(user)
+            OPTIONAL MATCH (conn)-[:HAS_CIRCLE]->(circle:Circle)
+            OPTIONAL MATCH (post)-[:HAS_LIKE]->(vibe:Like)
+            OPTIONAL MATCH (post)-[:HAS_POST_SHARE]->(share:PostShare)
+            OPTIONAL MATCH (post)-[:HAS_COMMENT]->(comment:Comment)
+            WITH post, user, profile, conn, circle, collect(vibe) AS reactions,
+                 COUNT(DISTINCT share) AS share_count,
+                 COUNT(DISTINCT comment) AS comment_count,
+                 COUNT(DISTINCT vibe) AS like_count
+            RETURN post, user, profile, reactions,
+                   CASE WHEN conn IS NULL THEN NULL ELSE {uid: conn.uid, connection_status: conn.connection_status, timestamp: toString(conn.timestamp)} END AS connection,
+                   CASE WHEN conn IS NULL THEN NULL ELSE {uid: circle.uid, circle_type: circle.circle_type, sub_relation: circle.sub_relation} END AS circle,
+                   share_count,
+                   CASE
+                      WHEN post.vibe_score IS NOT NULL
+                      THEN round(post.vibe_score + ((comment_count + like_count + share_count) * 0.1), 1)
+                      ELSE 2.0
+                   END AS calculated_overall_score,
+                   post.created_at AS created_at
+
+            UNION
+
+            WITH puid
+            MATCH (post:CommunityPost {uid: puid, is_deleted: false})-[:HAS_COMMUNITY|HAS_SUBCOMMUNITY]->(community)
+            OPTIONAL MATCH (post)-[:HAS_POST_SHARE]->(share:PostShare)
+            OPTIONAL MATCH (post)-[:HAS_COMMENT]->(comment:Comment)
+            OPTIONAL MATCH (post)-[:HAS_LIKE]->(like:Like)
+            WITH post, community,
+                 COUNT(DISTINCT share) AS share_count,
+                 COUNT(DISTINCT comment) AS comment_count,
+                 COUNT(DISTINCT like) AS like_count
+            RETURN post, community AS user, community AS profile, NULL AS reactions,
+                   NULL AS connection, NULL AS circle, share_count,
+                   CASE
+                      WHEN post.vibe_score IS NOT NULL
+                      THEN round(post.vibe_score + ((comment_count + like_count + share_count) * 0.1), 1)
+                      ELSE 2.0
+                   END AS calculated_overall_score,
+                   post.created_at AS created_at
+        }
+        RETURN post, user, profile, reactions, connection, circle, share_count, calculated_overall_score, created_at
+"""
+
+# Users whose candidate store receives a new Post from $user_id
+feed_candidate_connection_audience_query="""
+        MATCH (me:Users {user_id: $user_id})-[:HAS_CONNECTION]->(:Connection {connection_status: "Accepted"})<-[:HAS_CONNECTION]-(friend:Users)
+        WHERE friend.user_id <> $user_id
+        RETURN DISTINCT friend.user_id
+"""
+
+# Users whose candidate store receives a new CommunityPost from $community_uid
+feed_candidate_community_audience_query="""
+        MATCH (community {uid: $community_uid})-[:MEMBER_OF]->(membership)-[:MEMBER]->(member:Users)
+        WHERE community:Community OR community:SubCommunity
+        RETURN DISTINCT member.user_id
+"""
+
 get_top_vibes_meme_query="""
                 MATCH (p:Post) 
                 RETURN p 
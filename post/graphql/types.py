@@ -5,16 +5,16 @@ from auth_manager.graphql.types import UserType,ProfileNoUserType
 from auth_manager.Utils import generate_presigned_url
 from auth_manager.models import Profile, Users
 from vibe_manager.models import IndividualVibe
-from post.redis import increment_post_comment_count,get_post_comment_count,get_post_like_count
+from post.redis import increment_post_comment_count,get_post_comment_count,get_post_like_count,PostCounters
 from connection.utils.score_generator import generate_connection_score
 
 from connection.utils import relation as RELATIONUTILLS
 from post.utils.time_format import time_ago 
-from post.models import PostReactionManager
 from datetime import datetime, timezone
 from post.graphql.raw_queries import users,post_queries
 from post.utils.reaction_manager import PostReactionUtils,IndividualVibeManager
 from post.utils.file_url import FileURL
+from post.utils.relationship_loader import load_one, load_all
 from neomodel import db
 import logging
 
@@ -55,17 +55,14 @@ class PostType(ObjectType):
 
 
     @classmethod
-    def from_neomodel(cls, post, info):
+    def from_neomodel(cls, post, info, counters=None):
         if post.is_deleted==False:
-            reactions_nodes = post.like.all()
+            reactions_nodes = load_all(post, 'like')
             uid=post.uid
         
-            post_reaction_manager = PostReactionUtils.get_reaction_manager(uid)
+            all_reactions = PostReactionUtils.get_post_vibes(uid)
 
-            post_reaction_manager = PostReactionManager.objects.filter(post_uid=post.uid).first()
-
-            if post_reaction_manager:
-                all_reactions = post_reaction_manager.post_vibe
+            if all_reactions:
                 sorted_reactions = sorted(all_reactions, key=lambda x: x.get('cumulative_vibe_score', 0), reverse=True)
             else:
                 # Handle case when data hasn't been stored yet
@@ -86,11 +83,11 @@ class PostType(ObjectType):
             post_creator = None
             if isinstance(post, CommunityPost):
                 # For community posts, creator points to Users
-                post_creator = post.creator.single() if post.creator else None
+                post_creator = load_one(post, 'creator') if post.creator else None
             else:
                 # For regular posts, created_by points to Users
-                post_creator = post.created_by.single() if post.created_by else None
-            profile = user_node.profile.single() if user_node.profile.single() else None
+                post_creator = load_one(post, 'created_by') if post.created_by else None
+            profile = load_one(user_node, 'profile') if load_one(user_node, 'profile') else None
             
             # Get connection between viewing user and post creator
             connection_node = None
@@ -144,8 +141,8 @@ class PostType(ObjectType):
                 post_file_id=post.post_file_id,
                 post_file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in post.post_file_id] if post.post_file_id else None),
                 privacy=post.privacy,
-                comment_count=get_post_comment_count(post.uid),
-                vibes_count=get_post_like_count(post.uid),
+                comment_count=counters.comment_count(post.uid) if counters else get_post_comment_count(post.uid),
+                vibes_count=counters.like_count(post.uid) if counters else get_post_like_count(post.uid),
                 vibe_score=post.vibe_score,
                 score=generate_connection_score(),
                 created_at=post.created_at,
@@ -175,8 +172,8 @@ class TagType(ObjectType):
         return cls(
             names=tag.names,
             created_on=tag.created_on,
-            created_by=UserType.from_neomodel(tag.created_by.single()) if tag.created_by.single() else None,
-            post=PostType.from_neomodel(tag.post.single()) if tag.post.single() else None,
+            created_by=UserType.from_neomodel(load_one(tag, 'created_by')) if load_one(tag, 'created_by') else None,
+            post=PostType.from_neomodel(load_one(tag, 'post')) if load_one(tag, 'post') else None,
             is_deleted=tag.is_deleted,
             uid=tag.uid
         )
@@ -218,7 +215,7 @@ class CommentType(ObjectType):
         # related_post = comment.post.single() if comment.post.single() else None
         related_post = None
         try:
-            related_post = comment.post.single()
+            related_post = load_one(comment, 'post')
         except Exception as e:
             print(f"Could not get post relationship: {e}")
             related_post = None
@@ -234,10 +231,10 @@ class CommentType(ObjectType):
             try:
                 post_metrics = {
                     'score': getattr(related_post, 'vibe_score', 2.0),
-                    'views': len([view for view in related_post.view.all() if not view.is_deleted]) if hasattr(related_post, 'view') else 0,
-                    'comments': len([c for c in related_post.comment.all() if not c.is_deleted]) if hasattr(related_post, 'comment') else 0,
-                    'shares': len([share for share in related_post.postshare.all() if not share.is_deleted]) if hasattr(related_post, 'postshare') else 0,
-                    'vibes': len([like for like in related_post.like.all() if not like.is_deleted]) if hasattr(related_post, 'like') else 0
+                    'views': len([view for view in load_all(related_post, 'view') if not view.is_deleted]) if hasattr(related_post, 'view') else 0,
+                    'comments': len([c for c in load_all(related_post, 'comment') if not c.is_deleted]) if hasattr(related_post, 'comment') else 0,
+                    'shares': len([share for share in load_all(related_post, 'postshare') if not share.is_deleted]) if hasattr(related_post, 'postshare') else 0,
+                    'vibes': len([like for like in load_all(related_post, 'like') if not like.is_deleted]) if hasattr(related_post, 'like') else 0
                 }
             except Exception as e:
                 print(f"Error calculating post metrics: {e}")
@@ -265,7 +262,7 @@ class CommentType(ObjectType):
         try:
             # Get parent comment if this is a reply
             if hasattr(comment, 'parent_comment'):
-                parent_comment_node = comment.parent_comment.single()
+                parent_comment_node = load_one(comment, 'parent_comment')
                 if parent_comment_node and not parent_comment_node.is_deleted:
                     is_reply = True
                     # Don't fetch nested structure for parent to avoid infinite recursion
@@ -279,7 +276,7 @@ class CommentType(ObjectType):
             # Get direct replies if we haven't reached max depth
             if hasattr(comment, 'replies') and current_depth < max_reply_depth:
                 try:
-                    direct_replies = list(comment.replies.all())
+                    direct_replies = list(load_all(comment, 'replies'))
                     # Filter out deleted replies and sort by timestamp
                     active_replies = [r for r in direct_replies if not r.is_deleted]
                     active_replies.sort(key=lambda x: x.timestamp)
@@ -301,7 +298,7 @@ class CommentType(ObjectType):
             elif hasattr(comment, 'replies'):
                 # Just count replies at max depth without fetching them
                 try:
-                    reply_count = len([r for r in comment.replies.all() if not r.is_deleted])
+                    reply_count = len([r for r in load_all(comment, 'replies') if not r.is_deleted])
                 except Exception as e:
                     print(f"Error counting replies: {e}")
                     reply_count = 0
@@ -322,7 +319,7 @@ class CommentType(ObjectType):
         try:
             print(f"DEBUG: Checking vibe reactions for comment {comment.uid}")
             if hasattr(comment, 'vibe_reactions'):
-                vibe_reaction_nodes = list(comment.vibe_reactions.all())
+                vibe_reaction_nodes = list(load_all(comment, 'vibe_reactions'))
                 print(f"DEBUG: Found {len(vibe_reaction_nodes)} vibe reaction nodes")
                 if vibe_reaction_nodes:
                     # Filter out inactive reactions and sort by timestamp
@@ -344,7 +341,7 @@ class CommentType(ObjectType):
         return cls(
             uid=comment.uid,
             post=PostType.from_neomodel(related_post, info) if related_post else None,
-            user=UserType.from_neomodel(comment.user.single()) if comment.user.single() else None,
+            user=UserType.from_neomodel(load_one(comment, 'user')) if load_one(comment, 'user') else None,
             content=comment.content,
             timestamp=comment.timestamp,
             is_deleted=comment.is_deleted,
@@ -377,7 +374,7 @@ class CommentType(ObjectType):
         # Extract mentioned users
            mentioned_users = []
            for mention in mentions:
-              mentioned_user = mention.mentioned_user.single()
+              mentioned_user = load_one(mention, 'mentioned_user')
               if mentioned_user:
                 mentioned_users.append(UserType.from_neomodel(mentioned_user))
         
@@ -437,11 +434,12 @@ class LikeType(ObjectType):
     is_deleted = graphene.Boolean()
 
     @classmethod
-    def from_neomodel(cls, like):
+    def from_neomodel(cls, like, user=None):
+        user = user or load_one(like, 'user')
         return cls(
             uid=like.uid,
             # post=PostType.from_neomodel(like.post.single()) if like.post.single() else None,
-            user=UserType.from_neomodel(like.user.single()) if like.user.single() else None,
+            user=UserType.from_neomodel(user) if user else None,
             reaction=like.reaction,
             vibe=like.vibe,
             timestamp=like.timestamp,
@@ -462,11 +460,11 @@ class VibeUserType(graphene.ObjectType):
 
     @classmethod
     def from_neomodel(cls, like):
-        user = like.user.single()
+        user = load_one(like, 'user')
         return cls(
             uid=user.uid,
             username=user.username,
-            profile=ProfileNoUserType.from_neomodel(user.profile.single()) if user.profile.single() else None,
+            profile=ProfileNoUserType.from_neomodel(load_one(user, 'profile')) if load_one(user, 'profile') else None,
             reaction=like.reaction,
             vibe_score=like.vibe,
             timestamp=like.timestamp
@@ -482,7 +480,7 @@ class VibeDetailType(graphene.ObjectType):
 
     @classmethod
     def from_neomodel(cls, vibe_data):
-        # If vibe_data comes from PostReactionManager
+        # If vibe_data is a post_vibe entry (post.utils.reaction_counts)
         if isinstance(vibe_data, dict):
             return cls(
                 vibe_id=vibe_data.get('vibes_id'),
@@ -523,8 +521,8 @@ class PostShareType(ObjectType):
     def from_neomodel(cls, post_share):
         return cls(
             uid=post_share.uid,
-            post=PostType.from_neomodel(post_share.post.single()) if post_share.post.single() else None,
-            user=UserType.from_neomodel(post_share.user.single()) if post_share.user.single() else None,
+            post=PostType.from_neomodel(load_one(post_share, 'post')) if load_one(post_share, 'post') else None,
+            user=UserType.from_neomodel(load_one(post_share, 'user')) if load_one(post_share, 'user') else None,
             timestamp=post_share.timestamp,
             is_deleted=post_share.is_deleted,
             share_type=post_share.share_type,
@@ -541,8 +539,8 @@ class PostViewType(ObjectType):
     def from_neomodel(cls, post_view):
         return cls(
             uid=post_view.uid,
-            post=PostType.from_neomodel(post_view.post.single()) if post_view.post.single() else None,
-            user=UserType.from_neomodel(post_view.user.single()) if post_view.user.single() else None,
+            post=PostType.from_neomodel(load_one(post_view, 'post')) if load_one(post_view, 'post') else None,
+            user=UserType.from_neomodel(load_one(post_view, 'user')) if load_one(post_view, 'user') else None,
             viewed_at=post_view.viewed_at
         )
 
@@ -556,8 +554,8 @@ class SavedPostType(ObjectType):
     def from_neomodel(cls, saved_post):
         return cls(
             uid=saved_post.uid,
-            post=PostType.from_neomodel(saved_post.post.single()) if saved_post.post.single() else None,
-            user=UserType.from_neomodel(saved_post.user.single()) if saved_post.user.single() else None,
+            post=PostType.from_neomodel(load_one(saved_post, 'post')) if load_one(saved_post, 'post') else None,
+            user=UserType.from_neomodel(load_one(saved_post, 'user')) if load_one(saved_post, 'user') else None,
             saved_at=saved_post.saved_at
         )
 
@@ -574,8 +572,8 @@ class ReviewType(ObjectType):
     def from_neomodel(cls, review):
         return cls(
             uid=review.uid,
-            post=PostType.from_neomodel(review.post.single()) if review.post.single() else None,
-            user=UserType.from_neomodel(review.user.single()) if review.user.single() else None,
+            post=PostType.from_neomodel(load_one(review, 'post')) if load_one(review, 'post') else None,
+            user=UserType.from_neomodel(load_one(review, 'user')) if load_one(review, 'user') else None,
             rating=review.rating,
             review_text=review.review_text,
             timestamp=review.timestamp,
@@ -593,8 +591,8 @@ class PinedPostType(ObjectType):
     def from_neomodel(cls, pined_post):
         return cls(
             uid=pined_post.uid,
-            post=PostType.from_neomodel(pined_post.post.single()) if pined_post.post.single() else None,
-            user=UserType.from_neomodel(pined_post.user.single()) if pined_post.user.single() else None,
+            post=PostType.from_neomodel(load_one(pined_post, 'post')) if load_one(pined_post, 'post') else None,
+            user=UserType.from_neomodel(load_one(pined_post, 'user')) if load_one(pined_post, 'user') else None,
             name=pined_post.name,
             pined_at=pined_post.pined_at
         )
@@ -611,7 +609,7 @@ class TagNonPostType(ObjectType):
         return cls(
             names=tag.names,
             created_on=tag.created_on,
-            created_by=UserType.from_neomodel(tag.created_by.single()) if tag.created_by.single() else None,    
+            created_by=UserType.from_neomodel(load_one(tag, 'created_by')) if load_one(tag, 'created_by') else None,    
             is_deleted=tag.is_deleted,
             uid=tag.uid
         )
@@ -628,7 +626,7 @@ class CommentNonPostType(ObjectType):
     def from_neomodel(cls, comment):
         return cls(
             uid=comment.uid,
-            user=UserType.from_neomodel(comment.user.single()) if comment.user.single() else None,
+            user=UserType.from_neomodel(load_one(comment, 'user')) if load_one(comment, 'user') else None,
             content=comment.content,
             timestamp=comment.timestamp,
             is_deleted=comment.is_deleted,
@@ -647,7 +645,7 @@ class LikeNonPostType(ObjectType):
     def from_neomodel(cls, like):
         return cls(
             uid=like.uid,
-            user=UserType.from_neomodel(like.user.single()) if like.user.single() else None,
+            user=UserType.from_neomodel(load_one(like, 'user')) if load_one(like, 'user') else None,
             reaction=like.reaction,
             vibe=like.vibe,
             timestamp=like.timestamp,
@@ -688,7 +686,7 @@ class CommentVibeType(ObjectType):
         return cls(
             uid=comment_vibe.uid,
             comment=None,  # Avoid circular reference - don't include full comment object
-            user=UserType.from_neomodel(comment_vibe.reacted_by.single()) if comment_vibe.reacted_by.single() else None,
+            user=UserType.from_neomodel(load_one(comment_vibe, 'reacted_by')) if load_one(comment_vibe, 'reacted_by') else None,
             individual_vibe_id=str(comment_vibe.individual_vibe_id),
             vibe_name=comment_vibe.vibe_name,
             vibe_intensity=comment_vibe.vibe_intensity,
@@ -712,7 +710,7 @@ class PostShareNonPostType(ObjectType):
     def from_neomodel(cls, post_share):
         return cls(
             uid=post_share.uid,
-            user=UserType.from_neomodel(post_share.user.single()) if post_share.user.single() else None,
+            user=UserType.from_neomodel(load_one(post_share, 'user')) if load_one(post_share, 'user') else None,
             timestamp=post_share.timestamp,
             is_deleted=post_share.is_deleted,
             share_type=post_share.share_type,
@@ -728,7 +726,7 @@ class PostViewNonPostType(ObjectType):
     def from_neomodel(cls, post_view):
         return cls(
             uid=post_view.uid,
-            user=UserType.from_neomodel(post_view.user.single()) if post_view.user.single() else None,
+            user=UserType.from_neomodel(load_one(post_view, 'user')) if load_one(post_view, 'user') else None,
             viewed_at=post_view.viewed_at
         )
     
@@ -741,7 +739,7 @@ class SavedNonPostType(ObjectType):
     def from_neomodel(cls, saved_post):
         return cls(
             uid=saved_post.uid,
-            user=UserType.from_neomodel(saved_post.user.single()) if saved_post.user.single() else None,
+            user=UserType.from_neomodel(load_one(saved_post, 'user')) if load_one(saved_post, 'user') else None,
             saved_at=saved_post.saved_at
         )
     
@@ -757,7 +755,7 @@ class ReviewNonPostType(ObjectType):
     def from_neomodel(cls, review):
         return cls(
             uid=review.uid,
-            user=UserType.from_neomodel(review.user.single()) if review.user.single() else None,
+            user=UserType.from_neomodel(load_one(review, 'user')) if load_one(review, 'user') else None,
             rating=review.rating,
             review_text=review.review_text,
             timestamp=review.timestamp,
@@ -774,7 +772,7 @@ class PinedNonPostType(ObjectType):
     def from_neomodel(cls, pined_post):
         return cls(
             uid=pined_post.uid,
-            user=UserType.from_neomodel(pined_post.user.single()) if pined_post.user.single() else None,
+            user=UserType.from_neomodel(load_one(pined_post, 'user')) if load_one(pined_post, 'user') else None,
             name=pined_post.name,
             pined_at=pined_post.pined_at
         )
@@ -827,12 +825,9 @@ class FeedType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, post,connection_node,circle_node,log_in_user_node):
-        post_reaction_manager = PostReactionManager.objects.filter(post_uid=post.uid).first()
+        all_reactions = PostReactionUtils.get_post_vibes(post.uid)
 
-        # Extract all reactions from the post_vibe field
-        # all_reactions = post_reaction_manager.post_vibe
-        if post_reaction_manager:
-            all_reactions = post_reaction_manager.post_vibe
+        if all_reactions:
             sorted_reactions = sorted(all_reactions, key=lambda x: x.get('cumulative_vibe_score', 0), reverse=True)
         else:
             sorted_reactions = IndividualVibe.objects.all()[:10]
@@ -860,10 +855,10 @@ class FeedType(ObjectType):
                     key=lambda l: l.timestamp,
                     reverse=True
                 )
-                if like.user.single().uid == log_in_user_node.uid
+                if load_one(like, 'user').uid == log_in_user_node.uid
             ],
-            created_by=UserType.from_neomodel(post.created_by.single()) if post.created_by.single() else None,
-            updated_by=UserType.from_neomodel(post.updated_by.single()) if post.updated_by.single() else None,
+            created_by=UserType.from_neomodel(load_one(post, 'created_by')) if load_one(post, 'created_by') else None,
+            updated_by=UserType.from_neomodel(load_one(post, 'updated_by')) if load_one(post, 'updated_by') else None,
             vibe_feed_List=[VibeFeedListType.from_neomodel(vibe) for vibe in sorted_reactions] 
         )
     
@@ -947,7 +942,7 @@ class FeedTestType(ObjectType):
 
 
     @classmethod
-    def from_neomodel(cls, post_data,reactions_nodes=None,connection_node=None,circle_node=None,user_node=None,profile=None,query_share_count=None, query_overall_score=None):
+    def from_neomodel(cls, post_data,reactions_nodes=None,connection_node=None,circle_node=None,user_node=None,profile=None,query_share_count=None, query_overall_score=None, counters=None):
         # Handle None post_data
         if not post_data:
             logger.error("FeedTestType.from_neomodel called with None post_data")
@@ -961,12 +956,10 @@ class FeedTestType(ObjectType):
             logger.error("FeedTestType.from_neomodel called with missing uid")
             return None
             
-        post_reaction_manager = PostReactionUtils.get_reaction_manager(uid[0])
+        all_reactions = PostReactionUtils.get_post_vibes(uid[0])
 
         
-        if post_reaction_manager:
-           
-            all_reactions = post_reaction_manager.post_vibe
+        if all_reactions:
             sorted_reactions = sorted(all_reactions, key=lambda x: x.get('cumulative_vibe_score', 0), reverse=True)
         else:
             sorted_reactions = IndividualVibeManager.get_data()
@@ -995,8 +988,8 @@ class FeedTestType(ObjectType):
             created_at=time_ago(created_at),
             updated_at=post_data.get('updated_at'),
             is_deleted=post_data.get('is_deleted'),
-            comment_count=get_post_comment_count(uid[0]),
-            vibes_count=get_post_like_count(uid[0]),
+            comment_count=counters.comment_count(uid[0]) if counters else get_post_comment_count(uid[0]),
+            vibes_count=counters.like_count(uid[0]) if counters else get_post_like_count(uid[0]),
             share_count=post_data.get('share_count'),
             created_by=UserFeedType.from_neomodel(user_node,profile) if user_node and profile else None,
 
@@ -1187,11 +1180,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.get_top_vibes_meme_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
                     
             elif detail=="Top Vibes - Podcasts":
                 if search:
@@ -1199,11 +1188,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.get_top_vibes_podcasts_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Top Vibes - Videos":
                 if search:
@@ -1211,11 +1196,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.get_top_vibes_videos_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
                     
             elif detail=="Top Vibes - Music":
                 if search:
@@ -1223,11 +1204,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.get_top_vibes_music_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Top Vibes - Articles":
                 if search:
@@ -1235,11 +1212,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.get_top_vibes_articles_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Post From Connection":
                 if search:
@@ -1252,11 +1225,7 @@ class PostCategoryType(ObjectType):
                 else:
                     results1,_ = db.cypher_query(post_queries.recommended_post_from_connected_user_query, params)
                 
-                for post in results1:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results1))
 
             elif detail=="Popular Post":
                 if search:
@@ -1274,11 +1243,7 @@ class PostCategoryType(ObjectType):
                     results2,_ = db.cypher_query(query, params)
                 else:
                     results2,_ = db.cypher_query(post_queries.recommended_post_highest_engagement_score_query)
-                for post in results2:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results2))
                 
             elif detail=="Recent Post":
                 if search:
@@ -1289,11 +1254,7 @@ class PostCategoryType(ObjectType):
                     results3,_ = db.cypher_query(query, params)
                 else:
                     results3,_ = db.cypher_query(post_queries.recommended_recent_post_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             # Sort data by created_at_datetime in descending order (latest first)
             data.sort(key=lambda post: post.created_at_datetime or datetime.min, reverse=True)
@@ -1325,7 +1286,14 @@ class PostRecommendedType(ObjectType):
     
 
     @classmethod
-    def from_neomodel(cls, post):
+    def from_rows(cls, rows):
+        """Build one item per result row, reading the page's counters with one MGET."""
+        nodes = [row[0] for row in rows]
+        counters = PostCounters.fetch([node.get('uid') for node in nodes])
+        return [cls.from_neomodel(node, counters) for node in nodes]
+
+    @classmethod
+    def from_neomodel(cls, post, counters=None):
         created_at_unix=post.get('created_at'),
         created_at=datetime.fromtimestamp(created_at_unix[0])
         uid=post.get('uid'),
@@ -1338,8 +1306,8 @@ class PostRecommendedType(ObjectType):
             post_file_id=post['post_file_id'],
             post_file_url=([FileDetailType(**generate_presigned_url.generate_file_info(file_id)) for file_id in post['post_file_id']] if post['post_file_id'] else None),
             privacy=post['privacy'],
-            comment_count=get_post_comment_count(uid[0]),
-            vibes_count=get_post_like_count(uid[0]),
+            comment_count=counters.comment_count(uid[0]) if counters else get_post_comment_count(uid[0]),
+            vibes_count=counters.like_count(uid[0]) if counters else get_post_like_count(uid[0]),
             vibe_score=post['vibe_score'],
             score=generate_connection_score(),
             created_at=time_ago (created_at),
@@ -1359,12 +1327,11 @@ class VibeAnalyticType(ObjectType):
 
     @classmethod
     def from_neomodel(cls, post_uid):
-        post_reaction_manager = PostReactionManager.objects.filter(post_uid=post_uid).first()
+        all_reactions = PostReactionUtils.get_post_vibes(post_uid)
 
-        if not post_reaction_manager or not post_reaction_manager.post_vibe:
+        if not all_reactions:
             return []
 
-        all_reactions = post_reaction_manager.post_vibe
         filtered_vibes = [vibe for vibe in all_reactions if vibe.get('vibes_count', 0) != 0]
 
         # Sort the filtered vibes by cumulative_vibe_score in descending order
@@ -1442,12 +1409,10 @@ class FeedTestTypeV2(ObjectType):
         created_at=datetime.utcfromtimestamp(created_at_unix[0])
         uid=post_data.get('uid'),
         
-        post_reaction_manager = PostReactionUtils.get_reaction_manager(uid[0])
+        all_reactions = PostReactionUtils.get_post_vibes(uid[0])
 
         
-        if post_reaction_manager:
-           
-            all_reactions = post_reaction_manager.post_vibe
+        if all_reactions:
             sorted_reactions = sorted(all_reactions, key=lambda x: x.get('cumulative_vibe_score', 0), reverse=True)
         else:
             sorted_reactions = IndividualVibeManager.get_data()
@@ -1491,70 +1456,38 @@ class PostCategoryTypeV2(ObjectType):
 
             if detail=="Top Vibes - Meme":
                 results3,_ = db.cypher_query(post_queries.get_top_vibes_meme_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
                     
             elif detail=="Top Vibes - Podcasts":
                 results3,_ = db.cypher_query(post_queries.get_top_vibes_podcasts_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Top Vibes - Videos":
                 results3,_ = db.cypher_query(post_queries.get_top_vibes_videos_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
                     
             elif detail=="Top Vibes - Music":
                 results3,_ = db.cypher_query(post_queries.get_top_vibes_music_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Top Vibes - Articles":
                 results3,_ = db.cypher_query(post_queries.get_top_vibes_articles_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             elif detail=="Post From Connection":
 
                 results1,_ = db.cypher_query(post_queries.recommended_post_from_connected_user_queryV2, params)
                 
-                for post in results1:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results1))
 
             elif detail=="Popular Post":
 
                 results2,_ = db.cypher_query(post_queries.recommended_post_highest_engagement_score_query)
-                for post in results2:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results2))
                 
             elif detail=="Recent Post":
                 results3,_ = db.cypher_query(post_queries.recommended_recent_post_query)
-                for post in results3:
-                    post_node = post[0]
-                    data.append(
-                        PostRecommendedType.from_neomodel(post_node)
-                        )
+                data.extend(PostRecommendedType.from_rows(results3))
 
             return cls(
                 title=detail,
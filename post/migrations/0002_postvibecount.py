@@ -0,0 +1,60 @@
+# Generated by Django 4.2.14 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+
+def backfill_vibe_counts(apps, schema_editor):
+    """One PostVibeCount row per reacted vibe of every PostReactionManager.post_vibe list."""
+    PostReactionManager = apps.get_model('post', 'PostReactionManager')
+    PostVibeCount = apps.get_model('post', 'PostVibeCount')
+
+    batch = []
+    for post_uid, post_vibe in PostReactionManager.objects.exclude(post_uid=None).values_list('post_uid', 'post_vibe').iterator():
+        seen = set()
+        for reaction in post_vibe or []:
+            vibe_id = reaction.get('vibes_id', reaction.get('id'))
+            count = int(reaction.get('vibes_count') or 0)
+            if vibe_id is None or count <= 0 or vibe_id in seen:
+                continue
+            seen.add(vibe_id)
+            # cumulative_vibe_score holds the average score of the vibe
+            batch.append(PostVibeCount(
+                post_uid=post_uid,
+                vibe_id=vibe_id,
+                vibe_name=reaction.get('vibes_name') or '',
+                vibes_count=count,
+                score_total=float(reaction.get('cumulative_vibe_score') or 0) * count,
+            ))
+        if len(batch) >= 1000:
+            PostVibeCount.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        PostVibeCount.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostVibeCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post_uid', models.CharField(max_length=255)),
+                ('vibe_id', models.IntegerField()),
+                ('vibe_name', models.CharField(max_length=255)),
+                ('vibes_count', models.IntegerField(default=0)),
+                ('score_total', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Post Vibe Count',
+                'verbose_name_plural': 'Post Vibe Counts',
+                'unique_together': {('post_uid', 'vibe_id')},
+            },
+        ),
+        migrations.RunPython(backfill_vibe_counts, migrations.RunPython.noop),
+    ]
@@ -515,6 +515,9 @@ class PostReactionManager(models.Model):
     Expects: post_uid and initializes with first 10 individual vibes
     Returns: Aggregated reaction data with counts and scores
     Performance note: JSON field operations can be expensive, consider optimization
+
+    Superseded by PostVibeCount: reactions are no longer written here. Rows are
+    kept as the source of the 0002 backfill.
     """
     post_uid = models.CharField(max_length=255, unique=True, null=True, blank=True)  # Reference to Neo4j post
     post_vibe = models.JSONField(default=list)  # Aggregated vibe data as JSON array
@@ -607,3 +610,33 @@ class PostReactionManager(models.Model):
         
         # Add the new reaction
         self.add_reaction(new_vibes_name, new_score)
+
+
+class PostVibeCount(models.Model):
+    """
+    PostVibeCount - one reaction aggregate per (post, vibe).
+
+    Replaces the PostReactionManager JSON list. Reactions change a row with a
+    single F() increment (see post.utils.reaction_counts), so concurrent
+    reactions on a hot post no longer overwrite each other and a reaction
+    no longer rewrites every vibe of the post.
+
+    Connected to: CreateLike / CreatePost / CreateDebate / community and
+    opportunity vibes (writers), feed and analytics types (readers)
+    Returns: vibes_count and score_total; the average score is
+    score_total / vibes_count
+    """
+    post_uid = models.CharField(max_length=255)  # Reference to Neo4j post
+    vibe_id = models.IntegerField()               # IndividualVibe id
+    vibe_name = models.CharField(max_length=255)
+    vibes_count = models.IntegerField(default=0)
+    score_total = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Post Vibe Count'
+        verbose_name_plural = 'Post Vibe Counts'
+        unique_together = ('post_uid', 'vibe_id')  # also serves post_uid lookups
+
+    def __str__(self):
+        return f"{self.vibe_name} x{self.vibes_count} on post {self.post_uid}"
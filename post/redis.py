@@ -1,54 +1,211 @@
+import time
+import logging
 from django.core.cache import cache
+from django_redis import get_redis_connection
+from neomodel import db
 from celery import shared_task
-from .models import Post
+
+logger = logging.getLogger(__name__)
+
+# Redis keys of the per-post engagement counters
+COUNTER_KEYS = {
+    'comment': "post:{uid}:commentcount",
+    'vibe': "post:{uid}:vibecount",
+    'share': "post:{uid}:sharecount",
+    'view': "post:{uid}:viewcount",
+}
+
+# Counters the post types read when serializing a page
+FEED_COUNTER_KINDS = ('comment', 'vibe')
+
+# Redis set of post uids whose counters changed since the last write-back
+DIRTY_POSTS_KEY = "post:counters:dirty"
+
+# Counter kind -> Post property it is written back to
+WRITE_BACK_FIELDS = {
+    'comment': 'comment_count',
+    'vibe': 'vibes_count',
+    'share': 'share_count',
+}
+
+WRITE_BACK_CHUNK_SIZE = 500
+
+write_back_query = """
+UNWIND $rows AS r
+MATCH (p:Post {uid: r.uid})
+SET p.comment_count = coalesce(r.comment_count, p.comment_count),
+    p.vibes_count = coalesce(r.vibes_count, p.vibes_count),
+    p.share_count = coalesce(r.share_count, p.share_count)
+RETURN count(p)
+"""
+
+
+def _mark_dirty(post_uid):
+    try:
+        get_redis_connection("default").sadd(DIRTY_POSTS_KEY, str(post_uid))
+    except Exception as e:
+        logger.warning(f"Could not mark post {post_uid} counters dirty: {e}")
+
+
+def _increment_counter(redis_key, amount=1, post_uid=None):
+    # add() is SET NX and incr() is an atomic INCRBY on an existing key, so
+    # concurrent first increments can no longer overwrite each other.
+    cache.add(redis_key, 0, timeout=None)
+    try:
+        value = cache.incr(redis_key, amount)
+    except ValueError:
+        # Key evicted between add() and incr()
+        cache.add(redis_key, 0, timeout=None)
+        value = cache.incr(redis_key, amount)
+    if post_uid:
+        _mark_dirty(post_uid)
+    return value
+
+
+class PostCounters:
+    """
+    Engagement counters for a page of posts, fetched with a single MGET.
+
+    Build one per request (``PostCounters.fetch(uids)``) and hand it to the
+    types so serializing a page doesn't cost two Redis round trips per post.
+    """
+
+    def __init__(self, values=None):
+        self._values = values or {}
+
+    @classmethod
+    def fetch(cls, post_uids, kinds=FEED_COUNTER_KINDS):
+        keys = {}
+        for uid in post_uids:
+            if not uid:
+                continue
+            for kind in kinds:
+                keys[COUNTER_KEYS[kind].format(uid=uid)] = (uid, kind)
+        values = {}
+        if keys:
+            for key, count in cache.get_many(list(keys)).items():
+                uid, kind = keys[key]
+                values[(uid, kind)] = int(count) if count else 0
+        return cls(values)
+
+    def get(self, post_uid, kind, default=0):
+        return self._values.get((post_uid, kind), default)
+
+    def comment_count(self, post_uid):
+        return self.get(post_uid, 'comment')
+
+    def like_count(self, post_uid):
+        return self.get(post_uid, 'vibe')
+
 
 # Example helper to get comment count
 def get_post_comment_count(post_uid):
-    redis_key = f"post:{post_uid}:commentcount"
+    redis_key = COUNTER_KEYS['comment'].format(uid=post_uid)
     count = cache.get(redis_key)
     return int(count) if count else 0
 
 # Example helper to increment comment count
 def increment_post_comment_count(post_uid):
-    redis_key = f"post:{post_uid}:commentcount"
-    if cache.get(redis_key) is not None:
-        cache.incr(redis_key)
-    else:
-        # Initialize count if it doesn't exist
-        cache.set(redis_key, 1, timeout=None)  # Set with no expiration by default
-
-@shared_task
-def update_database_comment_counts():
-    posts = Post.nodes.all()  # Fetch all posts
-    for post in posts:
-        # Get the comment count from Redis
-        comment_count = get_post_comment_count(post.uid)
-        if comment_count is not None:
-            post.comment_count = int(comment_count)  # Update the count in the model
-            post.save()  # Save the updated count in the database
+    return _increment_counter(COUNTER_KEYS['comment'].format(uid=post_uid), post_uid=post_uid)
 
 # Example helper to get like count
 def get_post_like_count(post_uid):
-    redis_key = f"post:{post_uid}:vibecount"
+    redis_key = COUNTER_KEYS['vibe'].format(uid=post_uid)
     count = cache.get(redis_key)
     return int(count) if count else 0
 
 # Example helper to increment like count
 def increment_post_like_count(post_uid):
-    redis_key = f"post:{post_uid}:vibecount"
-    if cache.get(redis_key) is not None:
-        cache.incr(redis_key)
-    else:
-        # Initialize count if it doesn't exist
-        cache.set(redis_key, 1, timeout=None)  # Set with no expiration by default
-        print("key setup")
+    return _increment_counter(COUNTER_KEYS['vibe'].format(uid=post_uid), post_uid=post_uid)
+
+share_count_query = """
+MATCH (p:Post {uid: $uid})-[:HAS_POST_SHARE]->(s:PostShare)
+RETURN count(DISTINCT s)
+"""
+
+
+def _stored_share_count(post_uid):
+    rows, _ = db.cypher_query(share_count_query, {'uid': str(post_uid)})
+    return int(rows[0][0]) if rows else 0
+
+
+def increment_post_share_count(post_uid):
+    """Count a share that is already connected to the post."""
+    redis_key = COUNTER_KEYS['share'].format(uid=post_uid)
+    if cache.get(redis_key) is None:
+        # No counter yet (first share since it was introduced, or evicted):
+        # seed it from the PostShare nodes stored before this one, so the
+        # written-back share_count covers shares made before the counter.
+        cache.add(redis_key, max(_stored_share_count(post_uid) - 1, 0), timeout=None)
+    return _increment_counter(redis_key, post_uid=post_uid)
+
+def increment_post_view_count(post_uid):
+    # Views have no Post property, so they are not queued for write-back.
+    return _increment_counter(COUNTER_KEYS['view'].format(uid=post_uid))
+
+
+def counter_backlog():
+    """Number of posts waiting for their counters to be written back."""
+    return get_redis_connection("default").scard(DIRTY_POSTS_KEY)
+
+
+def write_back_counters(chunk_size=WRITE_BACK_CHUNK_SIZE, max_chunks=None):
+    """
+    Drain the dirty-post set and copy the Redis counters onto the Post nodes.
+
+    Each chunk is popped with one SPOP, read with one MGET and applied with a
+    single UNWIND query. Counters missing from Redis (evicted) leave the stored
+    value untouched. A chunk that fails to write is put back in the set.
+    Returns rows written, elapsed seconds, rows/sec and the remaining backlog.
+    """
+    redis = get_redis_connection("default")
+    rows_written = 0
+    chunks = 0
+    start = time.monotonic()
+
+    while max_chunks is None or chunks < max_chunks:
+        popped = redis.spop(DIRTY_POSTS_KEY, chunk_size)
+        if not popped:
+            break
+        uids = [u.decode() if isinstance(u, bytes) else str(u) for u in popped]
+        try:
+            counters = PostCounters.fetch(uids, kinds=tuple(WRITE_BACK_FIELDS))
+            rows = []
+            for uid in uids:
+                row = {'uid': uid}
+                for kind, field in WRITE_BACK_FIELDS.items():
+                    row[field] = counters.get(uid, kind, None)
+                rows.append(row)
+            db.cypher_query(write_back_query, {'rows': rows})
+        except Exception:
+            redis.sadd(DIRTY_POSTS_KEY, *uids)
+            raise
+        rows_written += len(rows)
+        chunks += 1
+
+    elapsed = time.monotonic() - start
+    stats = {
+        'rows': rows_written,
+        'chunks': chunks,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(rows_written / elapsed, 1) if elapsed > 0 else 0.0,
+        'backlog': counter_backlog(),
+    }
+    logger.info(f"Post counter write-back: {stats}")
+    return stats
+
+
+@shared_task
+def write_back_post_counters(chunk_size=WRITE_BACK_CHUNK_SIZE):
+    return write_back_counters(chunk_size=chunk_size)
+
+
+# Kept for existing schedules; both counters are written back together now.
+@shared_task
+def update_database_comment_counts():
+    return write_back_counters()
+
 
 @shared_task
 def update_database_like_counts():
-    posts = Post.nodes.all()  # Fetch all posts
-    for post in posts:
-        # Get the like count from Redis
-        like_count = get_post_like_count(post.uid)
-        if like_count is not None:
-            post.vibes_count = int(like_count)  # Update the like count in the model
-            post.save()  # Save the updated count in the database
+    return write_back_counters()
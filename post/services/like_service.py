@@ -0,0 +1,181 @@
+"""
+CreateLike fast path.
+
+CreateLike used to make about ten sequential round trips before answering:
+user lookup, post lookup (Post, then CommunityPost), existing-like check, Like
+create, two connects, reaction aggregate read-modify-write, counter
+increment, interest vector update, creator / profile lookups for the
+notification and activity tracking.
+
+`upsert_like` does the write in one parameterized Cypher statement:
+
+- MATCHes the user and the (Post or CommunityPost) post
+- MERGEs the user's live Like on the post, so a repeated or concurrent tap
+  updates one Like instead of creating another (MERGE locks the bound post
+  and user nodes while it runs)
+- returns the Like, the user, whether it was created, the previous reaction
+  and everything the side effects need (post labels and type, creator uid /
+  user_id / device token)
+
+The reaction counts are updated right after commit on the request thread
+(run_after_commit): moving a reaction is only correct if it lands after the
+add it undoes. Everything else is queued with
+post.utils.side_effects.after_commit and runs after the response is built.
+"""
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from neomodel import db
+
+from auth_manager.models import Users
+from post.models import Like, Post
+from post.utils import reaction_counts
+from post.utils.side_effects import after_commit, run_after_commit
+
+logger = logging.getLogger(__name__)
+
+like_upsert_query = """
+        MATCH (user:Users {user_id: $user_id})
+        MATCH (post {uid: $post_uid})
+        WHERE post:Post OR post:CommunityPost
+        MERGE (post)-[:HAS_LIKE]->(like:Like {is_deleted: false})-[:HAS_USER]->(user)
+          ON CREATE SET like.uid = $like_uid, like.reaction = $reaction, like.vibe = $vibe, like.timestamp = $now
+        WITH user, post, like ORDER BY like.timestamp DESC LIMIT 1
+        WITH user, post, like, like.uid = $like_uid AS created, like.reaction AS old_reaction, like.vibe AS old_vibe
+        SET like.reaction = $reaction, like.vibe = $vibe, like.timestamp = $now
+        WITH user, post, like, created, old_reaction, old_vibe
+        OPTIONAL MATCH (post)-[:HAS_USER|HAS_CREATOR]->(creator:Users)
+        OPTIONAL MATCH (creator)-[:HAS_PROFILE]->(creator_profile:Profile)
+        RETURN like, user, post, labels(post), created, old_reaction, old_vibe,
+               creator.uid, creator.user_id, creator_profile.device_id
+        LIMIT 1
+"""
+
+
+@dataclass
+class LikeResult:
+    like: Like
+    user: Users
+    post: object
+    created: bool
+    old_reaction: Optional[str]
+    old_vibe: Optional[float]
+    creator_uid: Optional[str]
+    creator_user_id: Optional[str]
+    creator_device_id: Optional[str]
+
+
+def upsert_like(user_id, post_uid, reaction, vibe) -> Optional[LikeResult]:
+    """Create or update the user's Like on a post; None if the user or post is missing."""
+    reaction_counts.get_vibe(reaction)  # unknown vibes are rejected before the write
+    rows, _ = db.cypher_query(like_upsert_query, {
+        'user_id': str(user_id),
+        'post_uid': post_uid,
+        'reaction': reaction,
+        'vibe': vibe,
+        'like_uid': uuid.uuid4().hex,
+        'now': time.time(),
+    })
+    if not rows:
+        return None
+    like, user, post, labels, created, old_reaction, old_vibe, creator_uid, creator_user_id, device_id = rows[0]
+    if 'Post' in labels:
+        post = Post.inflate(post)
+    else:
+        from community.models import CommunityPost
+        post = CommunityPost.inflate(post)
+    return LikeResult(
+        like=Like.inflate(like), user=Users.inflate(user), post=post, created=created,
+        old_reaction=old_reaction, old_vibe=old_vibe, creator_uid=creator_uid,
+        creator_user_id=str(creator_user_id) if creator_user_id is not None else None,
+        creator_device_id=device_id,
+    )
+
+
+def _update_reaction_counts(result: LikeResult):
+    like = result.like
+    if result.created:
+        reaction_counts.add_reaction(result.post.uid, like.reaction, like.vibe)
+    elif (result.old_reaction, result.old_vibe) != (like.reaction, like.vibe):
+        reaction_counts.update_reaction(
+            result.post.uid,
+            old_vibes_name=result.old_reaction,
+            new_vibes_name=like.reaction,
+            old_score=result.old_vibe,
+            new_score=like.vibe,
+        )
+
+
+def _update_engagement(result: LikeResult):
+    from post.redis import increment_post_like_count
+    from post.utils.interest_vectors import record_post_interaction
+
+    increment_post_like_count(result.post.uid)
+    record_post_interaction(result.user.user_id, result.post, 'like')
+
+
+def _notify_creator(result: LikeResult):
+    if not result.creator_device_id or result.creator_uid == result.user.uid:
+        return
+    from notification.global_service import GlobalNotificationService
+
+    GlobalNotificationService().send(
+        event_type="vibe_reaction_on_post",
+        recipients=[{
+            'device_id': result.creator_device_id,
+            'uid': result.creator_uid
+        }],
+        username=result.user.username,
+        vibe_type=result.like.reaction,
+        post_id=result.post.uid
+    )
+
+
+def _track_activity(result: LikeResult, ip_address=None, user_agent=''):
+    from user_activity.services.activity_service import ActivityService
+    from vibe_manager.services.vibe_activity_service import VibeActivityService
+
+    like, post = result.like, result.post
+    ActivityService.track_content_interaction(
+        user=result.user,
+        content_type='post',
+        content_id=post.uid,
+        interaction_type='like',
+        metadata={
+            'reaction': like.reaction,
+            'vibe_score': like.vibe,
+            'like_id': like.uid
+        }
+    )
+    VibeActivityService.track_vibe_sending(
+        sender=result.user,
+        receiver_id=result.creator_user_id,
+        vibe_data={
+            'vibe_id': like.uid,
+            'vibe_name': like.reaction,
+            'vibe_type': 'individual',
+            'category': 'post_reaction'
+        },
+        vibe_score=like.vibe,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        metadata={
+            'post_id': post.uid,
+            'like_id': like.uid,
+            'post_type': getattr(post, 'post_type', 'unknown')
+        }
+    )
+
+
+def queue_like_side_effects(result: LikeResult, ip_address=None, user_agent=''):
+    """Aggregates, counters, notification and tracking of a like, after commit."""
+    # A single F() update; run in order so a quick re-reaction can't overtake its add.
+    run_after_commit('like_reaction_counts', _update_reaction_counts, result)
+    if result.created:
+        after_commit('like_engagement', _update_engagement, result)
+        after_commit('like_notification', _notify_creator, result)
+    after_commit('like_activity', _track_activity, result, ip_address, user_agent)
@@ -0,0 +1,29 @@
+from celery import shared_task
+import logging
+
+from post.utils.trending import refresh_trending_snapshot as _refresh_trending_snapshot
+from post.utils.interest_vectors import seed_interest_vector, compact_interest_vectors as _compact_interest_vectors
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_trending_snapshot():
+    """Recompute the shared trending snapshot (scheduled every TRENDING_REFRESH_SECONDS)."""
+    try:
+        return _refresh_trending_snapshot()
+    except Exception as exc:
+        logger.error(f"Failed to refresh trending snapshot: {exc}")
+        raise
+
+
+@shared_task
+def seed_user_interest_vector(user_id):
+    """Build the interest vector of a user that has none yet."""
+    seed_interest_vector(user_id)
+
+
+@shared_task
+def compact_interest_vectors():
+    """Apply decay, prune tiny weights and cap every stored interest vector."""
+    return _compact_interest_vectors()
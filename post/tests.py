@@ -1,3 +1,238 @@
-from django.test import TestCase
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+
+from post.utils import feed_candidates, reaction_counts
+from post.utils.relationship_loader import LoaderScope
+from post.utils.file_url import FileURL
+from post.utils.request_context import feed_request_context, get_feed_context
+from post.utils.side_effects import SideEffectQueue, run_after_commit
+from post.services import like_service
+from post import redis as post_redis
+
+
+class Node(SimpleNamespace):
+    pass
+
+
+class GraphNode:
+    """Stands in for a neo4j Node: properties via .get(), no attributes."""
+
+    def __init__(self, **props):
+        self._props = props
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+
+class TestFeedCandidates(SimpleTestCase):
+    """Feed rows from post_feed_query are read as graph nodes, not attribute objects."""
+
+    def setUp(self):
+        self.rows = [
+            [GraphNode(uid=f'p{i}', created_at=1000.0 - i)] + [None] * 8
+            for i in range(3)
+        ]
+        self.redis = mock.MagicMock()
+        patcher = mock.patch('post.utils.feed_candidates._redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rebuild_stores_node_uids(self):
+        feed_candidates.rebuild_candidates('u1', self.rows)
+
+        pipe = self.redis.pipeline.return_value
+        pipe.zadd.assert_called_once_with(
+            'feed_candidates:u1', {'p0': 1000.0, 'p1': 999.0, 'p2': 998.0},
+        )
+
+    def test_cold_start_serves_the_rebuilt_rows(self):
+        self.redis.exists.return_value = False
+        with mock.patch('post.utils.feed_candidates.db.cypher_query', return_value=(self.rows, None)) as query:
+            page = feed_candidates.get_feed_candidates('u1', limit=2)
+
+        self.assertEqual([r[0].get('uid') for r in page], ['p0', 'p1'])
+        self.assertEqual(query.call_count, 1)
+
+
+class TestShareCounter(SimpleTestCase):
+    """A missing share counter starts from the shares already in the graph."""
+
+    def test_first_share_is_seeded_from_the_graph(self):
+        with mock.patch('post.redis.cache') as cache, \
+                mock.patch('post.redis.db.cypher_query', return_value=([[3]], None)), \
+                mock.patch('post.redis._mark_dirty'):
+            cache.get.return_value = None
+            post_redis.increment_post_share_count('p1')
+
+        self.assertEqual(cache.add.call_args_list[0], mock.call('post:p1:sharecount', 2, timeout=None))
+        cache.incr.assert_called_once_with('post:p1:sharecount', 1)
+
+
+class TestFeedRequestContext(SimpleTestCase):
+    """Maps are shared inside a request and never stored outside one."""
+
+    def test_context_outside_a_request_is_not_kept(self):
+        get_feed_context().post_vibes['p1'] = []
+        self.assertNotIn('p1', get_feed_context().post_vibes)
+
+    def test_context_is_shared_within_a_request(self):
+        with feed_request_context() as context:
+            get_feed_context().post_vibes['p1'] = []
+            self.assertIs(get_feed_context(), context)
+        self.assertNotIn('p1', get_feed_context().post_vibes)
+
+
+class TestFileURL(SimpleTestCase):
+    """File ids of a whole list are resolved with one bulk lookup."""
+
+    @mock.patch('post.utils.file_url.generate_presigned_url.generate_file_info_bulk')
+    def test_ids_from_nodes_and_dicts_are_fetched_together(self, bulk):
+        bulk.return_value = {'1': {'url': 'a'}, '2': {'url': 'b'}, '3': {'url': 'c'}}
+        items = [Node(profile_pic_id='1', file_id=None), GraphNode(file_id=['2', '3']), None]
+        with feed_request_context():
+            FileURL.store_file_urls_for(items, 'profile_pic_id', 'file_id')
+            self.assertEqual(FileURL.get_file_url('3'), {'url': 'c'})
+        bulk.assert_called_once_with(['1', '2', '3'])
+
+
+class TestLoaderScope(SimpleTestCase):
+    """Relationship lookups are batched across siblings and served from the scope."""
+
+    def setUp(self):
+        self.scope = LoaderScope()
+        self.nodes = [Node(uid=f'c{i}', members=object()) for i in range(3)]
+        self.scope.remember(self.nodes)
+
+    def _fetch(self, manager, uids):
+        self.fetched.append(list(uids))
+        return {uid: [Node(uid=f'{uid}-m', user=object())] for uid in uids if uid != 'c2'}
+
+    def test_first_lookup_loads_all_siblings(self):
+        self.fetched = []
+        with mock.patch('post.utils.relationship_loader._fetch', self._fetch):
+            first = self.scope.load(self.nodes[0], 'members')
+            second = self.scope.load(self.nodes[1], 'members')
+            missing = self.scope.load(self.nodes[2], 'members')
+
+        self.assertEqual(self.fetched, [['c0', 'c1', 'c2']])
+        self.assertEqual([n.uid for n in first], ['c0-m'])
+        self.assertEqual([n.uid for n in second], ['c1-m'])
+        self.assertEqual(missing, [])
+
+    def test_targets_of_a_batch_are_siblings(self):
+        self.fetched = []
+        with mock.patch('post.utils.relationship_loader._fetch', self._fetch):
+            members = self.scope.load(self.nodes[0], 'members')
+            self.scope.load(self.nodes[1], 'members')
+            self.scope.load(members[0], 'user')
+
+        self.assertEqual(self.fetched[-1], ['c0-m', 'c1-m'])
+
+    def test_unrelated_nodes_are_not_batched(self):
+        self.fetched = []
+        stranger = Node(uid='x', members=object())
+        with mock.patch('post.utils.relationship_loader._fetch', self._fetch):
+            self.scope.load(stranger, 'members')
+
+        self.assertEqual(self.fetched, [['x']])
+
+
+class TestReactionCounts(TestCase):
+    """Reactions are per-vibe increments read back in the post_vibe shape."""
+
+    def setUp(self):
+        catalog = [Node(id=1, name_of_vibe='Cheerful'), Node(id=2, name_of_vibe='Calm')]
+        patcher = mock.patch('post.utils.reaction_counts.get_vibe_catalog', return_value=catalog)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reactions_add_up(self):
+        reaction_counts.add_reaction('p1', 'Cheerful', 4)
+        reaction_counts.add_reaction('p1', 'Cheerful', 2)
+        reaction_counts.add_reaction('p2', 'Calm', 5)
+
+        vibes = reaction_counts.get_post_vibes(['p1', 'p2', 'p3'])
+
+        self.assertEqual(set(vibes), {'p1', 'p2'})
+        self.assertEqual([v['vibes_name'] for v in vibes['p1']], ['Cheerful', 'Calm'])
+        self.assertEqual(vibes['p1'][0]['vibes_count'], 2)
+        self.assertEqual(vibes['p1'][0]['cumulative_vibe_score'], 3)
+        self.assertEqual(vibes['p1'][1]['vibes_count'], 0)
+        self.assertEqual(reaction_counts.total_vibes(['p1', 'p2']), 3)
+
+    def test_update_moves_the_reaction(self):
+        reaction_counts.add_reaction('p1', 'Cheerful', 4)
+        reaction_counts.update_reaction('p1', 'Cheerful', 'Calm', 4, 3)
+
+        cheerful, calm = reaction_counts.get_post_vibe('p1')
+        self.assertEqual((cheerful['vibes_count'], cheerful['cumulative_vibe_score']), (0, 0))
+        self.assertEqual((calm['vibes_count'], calm['cumulative_vibe_score']), (1, 3))
+
+    def test_unknown_vibe_is_rejected(self):
+        with self.assertRaises(ValueError):
+            reaction_counts.add_reaction('p1', 'Unknown', 1)
+
+
+class TestSideEffectQueue(SimpleTestCase):
+    """Jobs run off the request thread; a failing job does not stop the others."""
+
+    def test_jobs_run_and_failures_are_isolated(self):
+        queue = SideEffectQueue(maxsize=10, workers=1)
+        done = []
+
+        def fail():
+            raise RuntimeError('boom')
+
+        queue.submit('fail', fail)
+        queue.submit('ok', done.append, 1)
+        queue.join()
+
+        self.assertEqual(done, [1])
+        self.assertEqual(queue.stats()['failed'], 1)
+
+    def test_full_queue_runs_inline(self):
+        queue = SideEffectQueue(maxsize=1, workers=0)
+        done = []
+        queue.submit('first', done.append, 1)
+        queue.submit('second', done.append, 2)
+
+        self.assertEqual(done, [2])
+        self.assertEqual(queue.stats()['inline'], 1)
+
+    def test_ordered_jobs_run_on_the_caller_thread(self):
+        done = []
+        with mock.patch('post.utils.side_effects.transaction.on_commit', side_effect=lambda fn: fn()):
+            run_after_commit('add', done.append, 'add')
+            run_after_commit('move', done.append, 'move')
+
+        self.assertEqual(done, ['add', 'move'])
+
+
+class TestLikeService(SimpleTestCase):
+    """The like upsert is one Cypher statement; side effects depend on whether it created."""
+
+    def setUp(self):
+        patcher = mock.patch('post.services.like_service.reaction_counts.get_vibe')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_missing_post_returns_none(self):
+        with mock.patch('post.services.like_service.db.cypher_query', return_value=([], None)) as query:
+            self.assertIsNone(like_service.upsert_like('1', 'missing', 'Cheerful', 4))
+        self.assertEqual(query.call_count, 1)
+
+    def test_update_skips_creation_side_effects(self):
+        result = Node(created=False)
+        with mock.patch('post.services.like_service.after_commit') as after_commit, \
+                mock.patch('post.services.like_service.run_after_commit') as run_after_commit:
+            like_service.queue_like_side_effects(result)
+        self.assertEqual(
+            [c.args[0] for c in after_commit.call_args_list],
+            ['like_activity'],
+        )
+        self.assertEqual(
+            [c.args[0] for c in run_after_commit.call_args_list],
+            ['like_reaction_counts'],
+        )
@@ -25,6 +25,7 @@ from post.models import Post
 from connection.models import Connection, Circle
 from vibe_manager.models import Vibe
 from community.models import Community
+from post.utils.trending import get_trending_tags
 
 logger = logging.getLogger(__name__)
 
@@ -161,36 +162,12 @@ class FeedAlgorithm:
             return {'image': 0.4, 'video': 0.3, 'text': 0.2, 'product': 0.1}
     
     def _get_trending_data(self) -> Dict[str, List[str]]:
-        """Get current trending hashtags and interests."""
+        """Get current trending hashtags and interests from the shared snapshot."""
         try:
-            # Get trending hashtags based on recent usage
-            hashtag_query = """
-            MATCH (post:Post {is_deleted: false})
-            WHERE post.created_at > datetime() - duration('P7D')  // Last 7 days
-            AND post.hashtags IS NOT NULL
-            UNWIND post.hashtags as hashtag
-            RETURN hashtag, count(*) as usage_count
-            ORDER BY usage_count DESC
-            LIMIT 20
-            """
-            hashtag_results, _ = db.cypher_query(hashtag_query)
-            trending_hashtags = [result[0] for result in hashtag_results if result[1] > 5]
-            
-            # Get trending interests based on user interest patterns
-            interest_query = """
-            MATCH (profile:Profile)-[:HAS_INTEREST]->(interest:Interest)
-            WHERE profile.created_at > datetime() - duration('P30D')  // Last 30 days
-            UNWIND interest.names as interest_name
-            RETURN interest_name, count(*) as interest_count
-            ORDER BY interest_count DESC
-            LIMIT 15
-            """
-            interest_results, _ = db.cypher_query(interest_query)
-            trending_interests = [result[0].lower().replace(' ', '') for result in interest_results if result[1] > 10]
-            
+            tags = get_trending_tags()
             return {
-                'hashtags': trending_hashtags,
-                'interests': trending_interests
+                'hashtags': list(tags.get('hashtags', [])),
+                'interests': list(tags.get('interests', []))
             }
         except Exception as e:
             logger.error(f"Error getting trending data: {e}")
@@ -0,0 +1,226 @@
+"""
+Per-user feed candidate store.
+
+Keeps a bounded Redis sorted set per user (member = post uid, score = post
+created_at) so `resolve_my_feed` can page candidates without running the full
+`post_feed_query` union on every request. The store is filled on write when a
+connection or community publishes, rebuilt from `post_feed_query` on a cold
+start (or when a rebuild is forced), and hydrated page by page with a single
+uid-keyed Cypher lookup.
+"""
+
+import os
+import logging
+from neomodel import db
+from django_redis import get_redis_connection
+
+from post.graphql.raw_queries import post_queries
+
+logger = logging.getLogger(__name__)
+
+FEED_CANDIDATE_MAX = int(os.getenv('FEED_CANDIDATE_MAX', '500'))
+FEED_CANDIDATE_TTL = int(os.getenv('FEED_CANDIDATE_TTL', '21600'))
+
+
+def _key(user_id: str) -> str:
+    return f"feed_candidates:{user_id}"
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def _row_uid(row):
+    pd = row[0] if row else {}
+    # neo4j Node rows expose properties through .get(), not attributes.
+    if hasattr(pd, 'get'):
+        return pd.get('uid') or pd.get('post_uid')
+    return getattr(pd, 'uid', None) or getattr(pd, 'post_uid', None)
+
+
+def _row_created_at(row) -> float:
+    created = row[8] if len(row) > 8 and row[8] is not None else None
+    if created is None:
+        pd = row[0] if row else {}
+        created = pd.get('created_at') if hasattr(pd, 'get') else getattr(pd, 'created_at', None)
+    try:
+        return float(created.timestamp()) if hasattr(created, 'timestamp') else float(created or 0)
+    except Exception:
+        return 0.0
+
+
+def _after_cursor(score: float, uid: str, cursor_timestamp, cursor_post_uid) -> bool:
+    if cursor_timestamp is None:
+        return True
+    if score < float(cursor_timestamp):
+        return True
+    return score == float(cursor_timestamp) and bool(cursor_post_uid) and uid > cursor_post_uid
+
+
+def has_candidates(user_id: str) -> bool:
+    try:
+        return bool(_redis().exists(_key(user_id)))
+    except Exception:
+        return False
+
+
+def invalidate_candidates(*user_ids) -> None:
+    """Drop candidate stores so the next feed request rebuilds them."""
+    keys = [_key(str(u)) for u in user_ids if u]
+    if not keys:
+        return
+    try:
+        _redis().delete(*keys)
+    except Exception as e:
+        logger.warning(f"feed_candidates invalidate failed users={user_ids}: {e}")
+
+
+def rebuild_candidates(user_id: str, rows: list) -> None:
+    """Replace the user's store with the uids of `rows` (full feed query output)."""
+    mapping = {}
+    for r in rows:
+        uid = _row_uid(r)
+        if uid:
+            mapping[str(uid)] = _row_created_at(r)
+    key = _key(user_id)
+    try:
+        pipe = _redis().pipeline()
+        pipe.delete(key)
+        if mapping:
+            pipe.zadd(key, mapping)
+            pipe.zremrangebyrank(key, 0, -(FEED_CANDIDATE_MAX + 1))
+            pipe.expire(key, FEED_CANDIDATE_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"feed_candidates rebuild failed user={user_id}: {e}")
+
+
+def push_candidate(user_ids, post_uid: str, created_at: float) -> int:
+    """
+    Add a freshly published post to the stores of `user_ids`.
+
+    Only warm stores are touched; a missing store means the user will rebuild
+    from the full query on their next request anyway, and seeding it with a
+    single post would make it look warm.
+    """
+    user_ids = [str(u) for u in user_ids if u]
+    if not user_ids or not post_uid:
+        return 0
+    try:
+        r = _redis()
+        pipe = r.pipeline()
+        for u in user_ids:
+            pipe.exists(_key(u))
+        warm = [u for u, ok in zip(user_ids, pipe.execute()) if ok]
+        if not warm:
+            return 0
+        pipe = r.pipeline()
+        for u in warm:
+            k = _key(u)
+            pipe.zadd(k, {str(post_uid): float(created_at)})
+            pipe.zremrangebyrank(k, 0, -(FEED_CANDIDATE_MAX + 1))
+        pipe.execute()
+        return len(warm)
+    except Exception as e:
+        logger.warning(f"feed_candidates push failed post={post_uid}: {e}")
+        return 0
+
+
+def fanout_connection_post(creator_user_id: str, post_uid: str, created_at: float) -> int:
+    """Push a new Post to every accepted connection of its creator."""
+    try:
+        rows, _ = db.cypher_query(post_queries.feed_candidate_connection_audience_query, {"user_id": str(creator_user_id)})
+        return push_candidate([r[0] for r in rows if r and r[0]], post_uid, created_at)
+    except Exception as e:
+        logger.warning(f"feed_candidates fanout failed post={post_uid}: {e}")
+        return 0
+
+
+def fanout_community_post(community_uid: str, post_uid: str, created_at: float) -> int:
+    """Push a new CommunityPost to every member of its community or sub-community."""
+    try:
+        rows, _ = db.cypher_query(post_queries.feed_candidate_community_audience_query, {"community_uid": str(community_uid)})
+        return push_candidate([r[0] for r in rows if r and r[0]], post_uid, created_at)
+    except Exception as e:
+        logger.warning(f"feed_candidates fanout failed post={post_uid}: {e}")
+        return 0
+
+
+def _page_uids(user_id: str, cursor_timestamp, cursor_post_uid, limit: int):
+    """Return (uids, exhausted) for the next page; `exhausted` means the store ran out."""
+    key = _key(user_id)
+    r = _redis()
+    hi = '+inf' if cursor_timestamp is None else float(cursor_timestamp)
+    # Over-fetch so same-timestamp entries before the cursor can be skipped.
+    entries = r.zrevrangebyscore(key, hi, '-inf', start=0, num=limit + 10, withscores=True)
+    uids = []
+    for member, score in entries:
+        uid = member.decode() if isinstance(member, bytes) else str(member)
+        if _after_cursor(score, uid, cursor_timestamp, cursor_post_uid):
+            uids.append(uid)
+        if len(uids) >= limit:
+            break
+    exhausted = len(uids) < limit and r.zcard(key) >= FEED_CANDIDATE_MAX
+    return uids, exhausted
+
+
+def hydrate_candidates(user_id: str, uids: list) -> list:
+    """Load feed rows for `uids` in one query, preserving the store order."""
+    if not uids:
+        return []
+    rows, _ = db.cypher_query(post_queries.feed_candidate_hydrate_query, {
+        "log_in_user_node_id": str(user_id),
+        "uids": list(uids),
+    })
+    by_uid = {}
+    for r in rows:
+        uid = _row_uid(r)
+        if uid and uid not in by_uid:
+            by_uid[uid] = r
+    missing = [u for u in uids if u not in by_uid]
+    if missing:
+        # Deleted or detached posts: drop them so they are not hydrated again.
+        try:
+            _redis().zrem(_key(user_id), *missing)
+        except Exception:
+            pass
+    return [by_uid[u] for u in uids if u in by_uid]
+
+
+def get_feed_candidates(user_id: str, cursor_timestamp=None, cursor_post_uid=None, limit: int = 60, force_rebuild: bool = False) -> list:
+    """
+    Return up to `limit` feed rows (same shape as `post_feed_query`) after the cursor.
+
+    Warm path: one ZREVRANGEBYSCORE plus one uid-keyed hydration query.
+    Cold start / forced rebuild: run `post_feed_query` once with
+    FEED_CANDIDATE_MAX rows, store the uids and serve the page from those rows.
+    Pages deeper than the bounded store fall back to the cursor query.
+    """
+    user_id = str(user_id)
+    params = {
+        "log_in_user_node_id": user_id,
+        "cursor_timestamp": cursor_timestamp,
+        "cursor_post_uid": cursor_post_uid,
+        "limit": limit,
+    }
+    try:
+        if force_rebuild or not has_candidates(user_id):
+            rows, _ = db.cypher_query(post_queries.post_feed_query, {
+                "log_in_user_node_id": user_id,
+                "cursor_timestamp": None,
+                "cursor_post_uid": None,
+                "limit": FEED_CANDIDATE_MAX,
+            })
+            rebuild_candidates(user_id, rows)
+            logger.info(f"feed_candidates rebuild user={user_id} size={len(rows)} forced={force_rebuild}")
+            page = [r for r in rows if _row_uid(r) and _after_cursor(_row_created_at(r), _row_uid(r), cursor_timestamp, cursor_post_uid)]
+            if len(page) >= limit or len(rows) < FEED_CANDIDATE_MAX:
+                return page[:limit]
+        else:
+            uids, exhausted = _page_uids(user_id, cursor_timestamp, cursor_post_uid, limit)
+            if not exhausted:
+                return hydrate_candidates(user_id, uids)
+    except Exception as e:
+        logger.warning(f"feed_candidates unavailable user={user_id}: {e}")
+    rows, _ = db.cypher_query(post_queries.post_feed_query, params)
+    return rows
@@ -1,91 +1,132 @@
-from django.core.cache import cache
+"""
+Per-user feed history kept in native Redis structures.
+
+Viewed and hidden posts are daily sets, muted creators a set and per-creator
+impression counts a daily hash. Every write is a single SADD/HINCRBY plus
+EXPIRE, so concurrent requests no longer overwrite each other, and
+`get_feed_history` answers membership for a whole candidate page in one
+pipelined round trip.
+"""
+
 from datetime import datetime
-_mem = {}
+from django_redis import get_redis_connection
+
+DAY_TTL = 86400
+MUTE_TTL = 2592000
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else str(value)
 
 def _today_key(user_id: str) -> str:
     d = datetime.utcnow().strftime('%Y-%m-%d')
     return f"feed_viewed:{user_id}:{d}"
 
 def get_viewed_today(user_id: str) -> set:
-    key = _today_key(user_id)
-    data = cache.get(key)
-    if not data:
-        data = _mem.get(key)
-    if not data:
-        return set()
-    return set(data)
+    return {_decode(v) for v in _redis().smembers(_today_key(user_id))}
 
 def mark_viewed(user_id: str, post_uids: list) -> None:
+    uids = [str(uid) for uid in post_uids if uid]
+    if not uids:
+        return
     key = _today_key(user_id)
-    cur = cache.get(key) or _mem.get(key) or []
-    s = set(cur)
-    for uid in post_uids:
-        if uid:
-            s.add(str(uid))
-    cache.set(key, list(s), 86400)
-    _mem[key] = list(s)
+    pipe = _redis().pipeline()
+    pipe.sadd(key, *uids)
+    pipe.expire(key, DAY_TTL)
+    pipe.execute()
 
 def _hidden_key(user_id: str) -> str:
     d = datetime.utcnow().strftime('%Y-%m-%d')
     return f"feed_hidden:{user_id}:{d}"
 
 def get_hidden_today(user_id: str) -> set:
-    k = _hidden_key(user_id)
-    v = cache.get(k)
-    if not v:
-        v = _mem.get(k)
-    if not v:
-        return set()
-    return set(v)
+    return {_decode(v) for v in _redis().smembers(_hidden_key(user_id))}
 
 def hide_post_today(user_id: str, post_uid: str) -> None:
+    if not post_uid:
+        return
     k = _hidden_key(user_id)
-    cur = cache.get(k) or _mem.get(k) or []
-    s = set(cur)
-    if post_uid:
-        s.add(str(post_uid))
-    cache.set(k, list(s), 86400)
-    _mem[k] = list(s)
+    pipe = _redis().pipeline()
+    pipe.sadd(k, str(post_uid))
+    pipe.expire(k, DAY_TTL)
+    pipe.execute()
 
 def _muted_key(user_id: str) -> str:
     return f"feed_muted:{user_id}"
 
 def get_muted_creators(user_id: str) -> set:
-    k = _muted_key(user_id)
-    v = cache.get(k)
-    if not v:
-        v = _mem.get(k)
-    if not v:
-        return set()
-    return set(v)
+    return {_decode(v) for v in _redis().smembers(_muted_key(user_id))}
 
 def mute_creator(user_id: str, creator_uid: str) -> None:
+    if not creator_uid:
+        return
     k = _muted_key(user_id)
-    cur = cache.get(k) or _mem.get(k) or []
-    s = set(cur)
-    if creator_uid:
-        s.add(str(creator_uid))
-    cache.set(k, list(s), 2592000)
-    _mem[k] = list(s)
+    pipe = _redis().pipeline()
+    pipe.sadd(k, str(creator_uid))
+    pipe.expire(k, MUTE_TTL)
+    pipe.execute()
 
 def _count_key(user_id: str) -> str:
     d = datetime.utcnow().strftime('%Y-%m-%d')
     return f"feed_creator_counts:{user_id}:{d}"
 
 def get_creator_counts(user_id: str) -> dict:
-    k = _count_key(user_id)
-    v = cache.get(k)
-    if not v:
-        v = _mem.get(k)
-    if not v:
-        return {}
-    return dict(v)
+    return {_decode(k): int(v) for k, v in _redis().hgetall(_count_key(user_id)).items()}
 
 def increment_creator_counts(user_id: str, creator_uid: str, inc: int = 1) -> None:
     if not creator_uid:
         return
+    increment_creator_counts_bulk(user_id, {creator_uid: inc})
+
+def increment_creator_counts_bulk(user_id: str, counts: dict) -> None:
+    """HINCRBY every creator of a served page in one pipeline."""
+    counts = {str(c): int(n) for c, n in counts.items() if c}
+    if not counts:
+        return
     k = _count_key(user_id)
-    cur = cache.get(k) or _mem.get(k) or {}
-    cur[str(creator_uid)] = int(cur.get(str(creator_uid), 0)) + int(inc)
-    cache.set(k, cur, 86400)
-    _mem[k] = cur
+    pipe = _redis().pipeline()
+    for creator_uid, inc in counts.items():
+        pipe.hincrby(k, creator_uid, inc)
+    pipe.expire(k, DAY_TTL)
+    pipe.execute()
+
+def seen_or_hidden(user_id: str, post_uids) -> set:
+    """Subset of `post_uids` the user viewed or hid today, in one pipelined call."""
+    uids = [str(u) for u in dict.fromkeys(post_uids) if u]
+    if not uids:
+        return set()
+    viewed_key, hidden_key = _today_key(user_id), _hidden_key(user_id)
+    pipe = _redis().pipeline()
+    for uid in uids:
+        pipe.sismember(viewed_key, uid)
+        pipe.sismember(hidden_key, uid)
+    flags = pipe.execute()
+    return {uid for i, uid in enumerate(uids) if flags[2 * i] or flags[2 * i + 1]}
+
+def get_feed_history(user_id: str, post_uids) -> dict:
+    """
+    Everything the feed resolver filters on, for one candidate page.
+
+    Returns the viewed and hidden subsets of `post_uids`, the muted creators
+    and today's per-creator counts from a single pipeline.
+    """
+    uids = [str(u) for u in dict.fromkeys(post_uids) if u]
+    viewed_key, hidden_key = _today_key(user_id), _hidden_key(user_id)
+    pipe = _redis().pipeline()
+    for uid in uids:
+        pipe.sismember(viewed_key, uid)
+        pipe.sismember(hidden_key, uid)
+    pipe.smembers(_muted_key(user_id))
+    pipe.hgetall(_count_key(user_id))
+    replies = pipe.execute()
+    flags, muted, counts = replies[:-2], replies[-2], replies[-1]
+    return {
+        'viewed': {uid for i, uid in enumerate(uids) if flags[2 * i]},
+        'hidden': {uid for i, uid in enumerate(uids) if flags[2 * i + 1]},
+        'muted': {_decode(v) for v in muted},
+        'creator_counts': {_decode(k): int(v) for k, v in counts.items()},
+    }
@@ -1,27 +1,54 @@
 from auth_manager.Utils import generate_presigned_url
-import time
+from post.utils.request_context import get_feed_context
 
 class FileURL:
-    _file_url_map = {}
+    """
+    Resolved file info for the current request.
+
+    The map lives on the request's FeedRequestContext, so it is dropped with
+    the request instead of growing for the life of the worker.
+    """
 
     @classmethod
     def store_file_urls(cls, file_ids):
         """
         Fetch and store URLs for a list of file IDs.
         """
-        for file_id in file_ids:
-            if file_id not in cls._file_url_map:
-                file_url = generate_presigned_url.generate_file_info(file_id)
-                cls._file_url_map[file_id] = file_url
+        file_url_map = get_feed_context().file_urls
+        missing = [file_id for file_id in file_ids if file_id not in file_url_map]
+        if not missing:
+            return
+        resolved = generate_presigned_url.generate_file_info_bulk(missing)
+        for file_id in missing:
+            file_url_map[file_id] = resolved.get(str(file_id), generate_presigned_url.generate_file_info(None))
+
+    @classmethod
+    def store_file_urls_for(cls, items, *fields):
+        """
+        store_file_urls for the ids held in `fields` of each item (nodes or
+        dicts; a field may hold one id or a list of them).
+        """
+        file_ids = []
+        for item in items:
+            if item is None:
+                continue
+            for field in fields:
+                getter = getattr(item, 'get', None)
+                value = getter(field) if callable(getter) else getattr(item, field, None)
+                if isinstance(value, (list, tuple)):
+                    file_ids.extend(file_id for file_id in value if file_id)
+                elif value:
+                    file_ids.append(value)
+        cls.store_file_urls(file_ids)
 
     @classmethod
     def get_file_url(cls, file_id):
         """
         Retrieve the cached URL for a specific file ID.
         """
-        
-        if file_id not in cls._file_url_map:
-            raise ValueError(f"File URL not found for file_id: {file_id}. Make sure to call `store_file_urls` first.")
-        
-        
-        return cls._file_url_map[file_id]
\ No newline at end of file
+        file_url_map = get_feed_context().file_urls
+        if file_id not in file_url_map:
+            # Not stored for this request (or called outside one): resolve it on its own.
+            resolved = generate_presigned_url.generate_file_info_bulk([file_id])
+            file_url_map[file_id] = resolved.get(str(file_id), generate_presigned_url.generate_file_info(None))
+        return file_url_map[file_id]
@@ -1,24 +1,269 @@
+"""
+Incrementally maintained user interest vectors.
+
+Each user has three Redis hashes (post types, tags, community keywords) plus a
+meta hash holding the vector's decay epoch. Likes, comments, shares, saves and
+membership changes apply a weighted delta with `record_post_interaction` /
+`record_membership_change` instead of the feed rebuilding the vector from the
+user's full history.
+
+Time decay uses a forward-decay epoch: a delta of weight w at time t is stored
+as w * exp(lambda * (t - epoch)). Older entries therefore shrink relative to
+newer ones without rewriting the hash, and since the feed only reads the
+vector normalized by its max, the common scale cancels out. The periodic
+`compact_interest_vectors` job folds the scale back in (moving the epoch to
+now), prunes tiny weights and caps each hash at INTEREST_MAX_FIELDS.
+
+A user whose vector was never seeded reads whatever deltas exist so far while
+a one-off seed from the graph is queued in the background.
+"""
+
+import math
+import os
+import time
+import logging
 from django.core.cache import cache
+from django_redis import get_redis_connection
 from neomodel import db
-import logging
 
 logger = logging.getLogger(__name__)
 
-def _cache_key(user_id: str) -> str:
-    return f"interest_vector:{user_id}"
+DIMENSIONS = ('post_types', 'tags', 'keywords')
+
+INTEREST_HALF_LIFE_DAYS = float(os.getenv('INTEREST_HALF_LIFE_DAYS', '30'))
+INTEREST_DECAY_LAMBDA = math.log(2) / (INTEREST_HALF_LIFE_DAYS * 86400)
+INTEREST_VECTOR_TTL = int(os.getenv('INTEREST_VECTOR_TTL', str(90 * 86400)))
+INTEREST_PRUNE_RATIO = float(os.getenv('INTEREST_PRUNE_RATIO', '0.01'))
+INTEREST_MAX_FIELDS = int(os.getenv('INTEREST_MAX_FIELDS', '200'))
+
+# Delta weight per interaction kind
+INTERACTION_WEIGHTS = {
+    'like': 1.0,
+    'comment': 1.5,
+    'share': 2.0,
+    'save': 2.0,
+    'membership': 1.0,
+}
+
+_APPLY_DELTAS = """
+local now = tonumber(ARGV[1])
+local lambda = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local epoch = tonumber(redis.call('HGET', KEYS[1], 'epoch'))
+if not epoch then
+    epoch = now
+    redis.call('HSET', KEYS[1], 'epoch', now)
+end
+local scale = math.exp(lambda * (now - epoch))
+local i = 4
+while i <= #ARGV do
+    redis.call('HINCRBYFLOAT', KEYS[tonumber(ARGV[i])], ARGV[i + 1], tonumber(ARGV[i + 2]) * scale)
+    i = i + 3
+end
+for k = 1, #KEYS do
+    redis.call('EXPIRE', KEYS[k], ttl)
+end
+return 1
+"""
+
+_COMPACT = """
+local now = tonumber(ARGV[1])
+local lambda = tonumber(ARGV[2])
+local prune_ratio = tonumber(ARGV[3])
+local max_fields = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+local epoch = tonumber(redis.call('HGET', KEYS[1], 'epoch'))
+if not epoch then
+    return 0
+end
+local decay = math.exp(-lambda * (now - epoch))
+-- Rewriting a hash drops its TTL: carry the vector's remaining TTL over so
+-- compaction neither strips nor extends it.
+local remaining = redis.call('PTTL', KEYS[1])
+local kept = 0
+for k = 2, #KEYS do
+    local flat = redis.call('HGETALL', KEYS[k])
+    local entries = {}
+    local top = 0
+    for i = 1, #flat, 2 do
+        local v = tonumber(flat[i + 1]) * decay
+        if v > 0 then
+            table.insert(entries, {flat[i], v})
+            if v > top then top = v end
+        end
+    end
+    table.sort(entries, function(a, b) return a[2] > b[2] end)
+    redis.call('DEL', KEYS[k])
+    for i = 1, math.min(#entries, max_fields) do
+        if entries[i][2] >= top * prune_ratio then
+            redis.call('HSET', KEYS[k], entries[i][1], tostring(entries[i][2]))
+            kept = kept + 1
+        end
+    end
+    if remaining > 0 then
+        redis.call('PEXPIRE', KEYS[k], remaining)
+    else
+        redis.call('EXPIRE', KEYS[k], ttl)
+    end
+end
+redis.call('HSET', KEYS[1], 'epoch', now)
+if remaining <= 0 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+return kept
+"""
+
+_scripts = {}
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def _script(name, source):
+    if name not in _scripts:
+        _scripts[name] = _redis().register_script(source)
+    return _scripts[name]
+
+
+def _meta_key(user_id: str) -> str:
+    return f"interest_vec:{user_id}:meta"
+
+
+def _keys(user_id: str) -> list:
+    return [_meta_key(user_id)] + [f"interest_vec:{user_id}:{dim}" for dim in DIMENSIONS]
+
+
+def apply_interest_deltas(user_id: str, deltas: dict) -> None:
+    """
+    Add weighted deltas to a user's vector atomically.
+
+    `deltas` maps a dimension ('post_types', 'tags', 'keywords') to
+    {field: weight}; negative weights undo an interaction.
+    """
+    args = [time.time(), INTEREST_DECAY_LAMBDA, INTEREST_VECTOR_TTL]
+    for index, dim in enumerate(DIMENSIONS, start=2):
+        for field, weight in (deltas.get(dim) or {}).items():
+            if field and weight:
+                field = str(field) if dim == 'post_types' else str(field).lower()
+                args.extend([index, field, float(weight)])
+    if len(args) > 3:
+        _script('apply', _APPLY_DELTAS)(keys=_keys(str(user_id)), args=args)
+
+
+def _post_tag_names(post_uid: str) -> list:
+    rows, _ = db.cypher_query(
+        "MATCH (p:Post {uid:$uid})-[:TAG_BELONG_TO]->(t:Tag) RETURN t.names",
+        {"uid": str(post_uid)},
+    )
+    names = []
+    for r in rows:
+        if r[0] and isinstance(r[0], list):
+            names.extend(n for n in r[0] if n)
+    return names
+
+
+def record_post_interaction(user_id: str, post, kind: str, undo: bool = False) -> None:
+    """Apply the delta for a like/comment/share/save on `post` (never raises)."""
+    try:
+        weight = INTERACTION_WEIGHTS[kind] * (-1 if undo else 1)
+        deltas = {'tags': {}}
+        post_type = getattr(post, 'post_type', None)
+        if post_type:
+            deltas['post_types'] = {post_type: weight}
+        for name in _post_tag_names(post.uid):
+            deltas['tags'][name] = deltas['tags'].get(name, 0) + weight
+        apply_interest_deltas(user_id, deltas)
+    except Exception as e:
+        logger.warning(f"interest_vector update failed user={user_id} kind={kind}: {e}")
+
+
+def record_membership_change(user_id: str, community_uid: str, joined: bool = True) -> None:
+    """Apply the community keyword delta for a join (or leave) (never raises)."""
+    try:
+        rows, _ = db.cypher_query(
+            "MATCH (kw:CommunityKeyword)-[:KEYWORD_FOR]->(c:Community {uid:$uid}) RETURN kw.keyword",
+            {"uid": str(community_uid)},
+        )
+        weight = INTERACTION_WEIGHTS['membership'] * (1 if joined else -1)
+        apply_interest_deltas(user_id, {'keywords': {r[0]: weight for r in rows if r[0]}})
+    except Exception as e:
+        logger.warning(f"interest_vector membership update failed user={user_id}: {e}")
+
+
+def _normalize(raw: dict) -> dict:
+    values = {}
+    for k, v in raw.items():
+        v = float(v)
+        if v > 0:
+            values[k.decode() if isinstance(k, bytes) else k] = v
+    if not values:
+        return {}
+    m = max(values.values())
+    return {k: (v / m) for k, v in values.items()}
+
 
 def get_user_interest_vector(user_id: str) -> dict:
-    key = _cache_key(user_id)
-    v = cache.get(key)
-    if v:
-        logger.info(f"interest_vector cache_hit user={user_id} pt={len(v.get('post_types', {}))} tags={len(v.get('tags', {}))} kw={len(v.get('keywords', {}))}")
-        return v
-    v = _compute_user_interest_vector(user_id)
-    cache.set(key, v, 3600)
-    logger.info(f"interest_vector cache_miss user={user_id} pt={len(v.get('post_types', {}))} tags={len(v.get('tags', {}))} kw={len(v.get('keywords', {}))}")
+    keys = _keys(str(user_id))
+    try:
+        pipe = _redis().pipeline()
+        pipe.hget(keys[0], 'seeded')
+        for key in keys[1:]:
+            pipe.hgetall(key)
+        seeded, *hashes = pipe.execute()
+    except Exception as e:
+        logger.warning(f"interest_vector read failed user={user_id}: {e}")
+        return {dim: {} for dim in DIMENSIONS}
+    if not seeded:
+        _queue_seed(str(user_id))
+    v = {dim: _normalize(raw) for dim, raw in zip(DIMENSIONS, hashes)}
+    logger.info(f"interest_vector user={user_id} seeded={bool(seeded)} pt={len(v['post_types'])} tags={len(v['tags'])} kw={len(v['keywords'])}")
     return v
 
-def _compute_user_interest_vector(user_id: str) -> dict:
+
+def _queue_seed(user_id: str) -> None:
+    if not cache.add(f"interest_vector_seed:{user_id}", 1, timeout=600):
+        return
+    try:
+        from post.tasks import seed_user_interest_vector
+        seed_user_interest_vector.delay(user_id)
+    except Exception as e:
+        logger.warning(f"interest_vector seed not queued user={user_id}: {e}")
+
+
+def seed_interest_vector(user_id: str) -> None:
+    """One-off full build from the graph for a user whose vector was never seeded."""
+    counts = _compute_user_interest_counts(user_id)
+    apply_interest_deltas(user_id, counts)
+    meta_key = _meta_key(str(user_id))
+    pipe = _redis().pipeline()
+    pipe.hsetnx(meta_key, 'epoch', time.time())
+    pipe.hset(meta_key, 'seeded', 1)
+    pipe.expire(meta_key, INTEREST_VECTOR_TTL)
+    pipe.execute()
+
+
+def compact_interest_vectors(batch_size: int = 500) -> dict:
+    """Fold decay into every stored vector, prune tiny weights and cap each hash."""
+    r = _redis()
+    compact = _script('compact', _COMPACT)
+    start = time.monotonic()
+    users = 0
+    fields = 0
+    for meta_key in r.scan_iter(match="interest_vec:*:meta", count=batch_size):
+        meta_key = meta_key.decode() if isinstance(meta_key, bytes) else meta_key
+        user_id = meta_key[len("interest_vec:"):-len(":meta")]
+        fields += compact(
+            keys=_keys(user_id),
+            args=[time.time(), INTEREST_DECAY_LAMBDA, INTEREST_PRUNE_RATIO, INTEREST_MAX_FIELDS, INTEREST_VECTOR_TTL],
+        ) or 0
+        users += 1
+    stats = {'users': users, 'fields': fields, 'seconds': round(time.monotonic() - start, 3)}
+    logger.info(f"interest_vector compaction: {stats}")
+    return stats
+
+
+def _compute_user_interest_counts(user_id: str) -> dict:
     try:
         post_type_counts = {}
         tag_counts = {}
@@ -59,18 +304,10 @@ def _compute_user_interest_vector(user_id: str) -> dict:
             if k:
                 kw_counts[k.lower()] = kw_counts.get(k.lower(), 0) + 1
 
-        def normalize(d: dict) -> dict:
-            if not d:
-                return {}
-            m = max(d.values())
-            if m <= 0:
-                return {}
-            return {k: (v / m) for k, v in d.items()}
-
         return {
-            "post_types": normalize(post_type_counts),
-            "tags": normalize(tag_counts),
-            "keywords": normalize(kw_counts),
+            "post_types": post_type_counts,
+            "tags": tag_counts,
+            "keywords": kw_counts,
         }
     except Exception:
         return {"post_types": {}, "tags": {}, "keywords": {}}
@@ -0,0 +1,124 @@
+"""
+Per-(post, vibe) reaction aggregates.
+
+Reactions used to be folded into `PostReactionManager.post_vibe`, a JSON list
+of every vibe of the post: each reaction loaded the row, edited the list in
+Python and saved the whole blob, so two reactions on the same post at the same
+time lost one of the updates.
+
+PostVibeCount keeps one row per (post_uid, vibe_id). A reaction is a single
+`UPDATE ... SET vibes_count = vibes_count + 1, score_total = score_total + s`
+(the row is created by the first reaction of that vibe), so concurrent
+reactions add up and only the reacted vibe is written.
+
+Readers get the same list the JSON held - the vibe catalog in order, each
+{'id', 'vibes_id', 'vibes_name', 'vibes_count', 'cumulative_vibe_score'}
+with cumulative_vibe_score the average score - for any number of posts with
+one query (`get_post_vibes`). Posts without reactions have no entry.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, Sum, Value, When
+from django.utils import timezone
+
+from post.models import PostVibeCount
+from post.utils.request_context import get_vibe_catalog
+
+
+def get_vibe(vibes_name):
+    """The catalog IndividualVibe named `vibes_name`; ValueError if there is none."""
+    for vibe in get_vibe_catalog():
+        if vibe.name_of_vibe == vibes_name:
+            return vibe
+    raise ValueError(f"No initialized reaction for vibes_name {vibes_name} found.")
+
+
+def _add(post_uid, vibe, score):
+    updated = PostVibeCount.objects.filter(post_uid=post_uid, vibe_id=vibe.id).update(
+        vibes_count=F('vibes_count') + 1,
+        score_total=F('score_total') + score,
+        updated_at=timezone.now(),
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            PostVibeCount.objects.create(
+                post_uid=post_uid, vibe_id=vibe.id, vibe_name=vibe.name_of_vibe,
+                vibes_count=1, score_total=score,
+            )
+    except IntegrityError:
+        # A concurrent first reaction created the row; count this one on top.
+        _add(post_uid, vibe, score)
+
+
+def add_reaction(post_uid, vibes_name, score):
+    """Count one `vibes_name` reaction with `score` on the post."""
+    _add(post_uid, get_vibe(vibes_name), float(score or 0))
+
+
+def remove_reaction(post_uid, vibes_name, score):
+    """Take back one reaction; the score resets with the last one."""
+    vibe = get_vibe(vibes_name)
+    PostVibeCount.objects.filter(post_uid=post_uid, vibe_id=vibe.id, vibes_count__gt=0).update(
+        vibes_count=F('vibes_count') - 1,
+        score_total=Case(
+            When(vibes_count__lte=1, then=Value(0.0)),
+            default=F('score_total') - float(score or 0),
+        ),
+        updated_at=timezone.now(),
+    )
+
+
+def update_reaction(post_uid, old_vibes_name, new_vibes_name, old_score, new_score):
+    """Move a user's reaction from one vibe / score to another."""
+    with transaction.atomic():
+        remove_reaction(post_uid, old_vibes_name, old_score)
+        add_reaction(post_uid, new_vibes_name, new_score)
+
+
+def _entry(vibe_id, vibe_name, count, total):
+    return {
+        'id': vibe_id,
+        'vibes_id': vibe_id,
+        'vibes_name': vibe_name,
+        'vibes_count': count,
+        'cumulative_vibe_score': total / count if count else 0,
+    }
+
+
+def get_post_vibes(post_uids) -> dict:
+    """{post_uid: post_vibe list} of the posts that have reactions, in one query."""
+    post_uids = [uid for uid in set(post_uids) if uid]
+    if not post_uids:
+        return {}
+    rows = {}
+    for post_uid, vibe_id, vibe_name, count, total in PostVibeCount.objects.filter(
+        post_uid__in=post_uids
+    ).values_list('post_uid', 'vibe_id', 'vibe_name', 'vibes_count', 'score_total'):
+        rows.setdefault(post_uid, {})[vibe_id] = (vibe_name, count, total)
+
+    catalog = get_vibe_catalog()
+    result = {}
+    for post_uid, by_vibe in rows.items():
+        entries = []
+        for vibe in catalog:
+            _, count, total = by_vibe.pop(vibe.id, (None, 0, 0))
+            entries.append(_entry(vibe.id, vibe.name_of_vibe, count, total))
+        # Vibes that have since left the catalog keep their counts.
+        entries.extend(_entry(vibe_id, *row) for vibe_id, row in by_vibe.items())
+        result[post_uid] = entries
+    return result
+
+
+def get_post_vibe(post_uid):
+    """The post_vibe list of one post, or None if it has no reactions."""
+    return get_post_vibes([post_uid]).get(post_uid)
+
+
+def total_vibes(post_uids) -> int:
+    """Number of reactions on the posts."""
+    post_uids = [uid for uid in post_uids if uid]
+    if not post_uids:
+        return 0
+    return PostVibeCount.objects.filter(post_uid__in=post_uids).aggregate(n=Sum('vibes_count'))['n'] or 0
@@ -1,42 +1,52 @@
-from post.models import PostReactionManager
-from vibe_manager.models import IndividualVibe
+from post.utils.reaction_counts import get_post_vibe, get_post_vibes
+from post.utils.request_context import get_feed_context
 
 class PostReactionUtils:
-    reaction_manager_map = {}
+    """
+    Reaction aggregates for the posts of the current request.
+
+    The map lives on the request's FeedRequestContext, not on the class.
+    """
 
     @classmethod
     def initialize_map(cls, results):
         """
-        Initialize the reaction_manager_map using the results.
+        Load the post_vibe lists of a feed page with one query.
         """
         uids = [post[0].get('uid') for post in results]
-        reaction_managers = PostReactionManager.objects.filter(post_uid__in=uids)
-        cls.reaction_manager_map = {manager.post_uid: manager for manager in reaction_managers}
+        post_vibes = get_post_vibes(uids)
+        get_feed_context().post_vibes.update({uid: post_vibes.get(uid) for uid in uids})
 
     @classmethod
-    def get_reaction_manager(cls, uid):
+    def get_post_vibes(cls, uid):
         """
-        Retrieve the PostReactionManager for a given post_uid.
+        Retrieve the post_vibe list of a given post_uid (None without reactions).
+
+        Posts outside the loaded page are looked up once and remembered.
         """
-        return cls.reaction_manager_map.get(uid)
-    
+        post_vibes = get_feed_context().post_vibes
+        if uid not in post_vibes:
+            post_vibes[uid] = get_post_vibe(uid)
+        return post_vibes[uid]
+
 
 class IndividualVibeManager:
-    _stored_data = None  # Private variable to store the fetched data
+    """
+    The IndividualVibe catalog used as the default reaction list.
+
+    Backed by a process-wide TTL cache (see request_context.get_vibe_catalog).
+    """
 
     @classmethod
     def store_data(cls):
         """
-        Retrieve and store the first 10 IndividualVibe objects.
+        Make sure the catalog is loaded for the current request.
         """
-        cls._stored_data = list(IndividualVibe.objects.all()[:10])
+        get_feed_context().vibe_catalog
 
     @classmethod
     def get_data(cls):
         """
-        Retrieve the stored IndividualVibe objects.
+        Retrieve the IndividualVibe catalog.
         """
-        if cls._stored_data is None:
-            raise ValueError("No data has been stored yet. Call `store_data` to fetch and store data.")
-        return cls._stored_data
-
+        return list(get_feed_context().vibe_catalog)
@@ -0,0 +1,184 @@
+"""
+Request-scoped batching of neomodel relationship lookups.
+
+GraphQL types build nested objects in `from_neomodel` with
+`node.rel.single()` / `node.rel.all()`, one Cypher round trip per edge (often
+two, since the idiom is `X.from_neomodel(n.rel.single()) if n.rel.single()`).
+A list of 20 communities with their members, creators and profiles turned into
+hundreds of calls.
+
+`load_one(node, 'rel')` / `load_all(node, 'rel')` replace those calls. Inside a
+`LoaderScope`, nodes that arrive together - a list handed to `prime()`, or the
+targets of one loader batch - are remembered as siblings. The first lookup of a
+relationship on a node resolves it for all of its siblings at once:
+
+    UNWIND $uids AS uid
+    MATCH (s:Source {uid: uid})-[:REL]->(t:Target)
+    RETURN uid, collect(t)
+
+Later lookups on the siblings are served from the scope. Nested levels batch
+the same way, because the targets of one batch are siblings of each other
+(members -> member.user -> user.profile is three queries for the whole list).
+Only siblings are batched, so loading one user's posts never pulls the posts
+of every user the request happened to touch.
+
+The scope is opened per GraphQL query by RequestContextGraphQLView and
+LoaderScopeMiddleware. Mutations and code outside a request (Celery,
+management commands) get the plain relationship calls, so they never read a
+cached edge they have just changed.
+
+The scope also counts every `db.cypher_query` made while it is active, which
+the view reports per GraphQL operation.
+"""
+
+import logging
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from neomodel import StructuredNode, db
+
+logger = logging.getLogger(__name__)
+
+LOADER_BATCH_SIZE = int(os.getenv('GRAPHQL_LOADER_BATCH_SIZE', '500'))
+
+# neomodel relationship directions
+OUTGOING, INCOMING, EITHER = 1, -1, 0
+
+
+class LoaderScope:
+    """Sibling groups, loaded edges and the Cypher call count of one GraphQL operation."""
+
+    def __init__(self):
+        self.batching = False
+        self.operation = None
+        self.operation_name = None
+        self.cypher_calls = 0
+        self.batches = 0
+        self._siblings = {}  # (node class, uid) -> nodes that arrived with it
+        self._loaded = {}    # (node class, rel name) -> {uid: [nodes]}
+
+    def begin_operation(self, operation):
+        """Called once with the operation AST; only queries batch."""
+        self.operation = operation
+        self.operation_name = operation.name.value if operation.name else None
+        self.batching = operation.operation.value == 'query'
+
+    def remember(self, nodes):
+        """Record `nodes` as one sibling group (per class); earlier groups win."""
+        groups = defaultdict(list)
+        for node in nodes:
+            if getattr(node, 'uid', None):
+                groups[type(node)].append(node)
+        for cls, group in groups.items():
+            for node in group:
+                self._siblings.setdefault((cls, node.uid), group)
+
+    def load(self, node, name):
+        cls = type(node)
+        loaded = self._loaded.setdefault((cls, name), {})
+        if node.uid not in loaded:
+            siblings = self._siblings.get((cls, node.uid), ())
+            pending = [n.uid for n in siblings if n.uid not in loaded and n.uid != node.uid]
+            uids = [node.uid] + list(dict.fromkeys(pending))[:LOADER_BATCH_SIZE - 1]
+            targets = _fetch(getattr(node, name), uids)
+            self.batches += 1
+            for uid in uids:
+                loaded[uid] = targets.get(uid, [])
+            self.remember(t for ts in targets.values() for t in ts)
+        return loaded[node.uid]
+
+
+def _arrow(relation_type, direction):
+    if direction == OUTGOING:
+        return f'-[:`{relation_type}`]->'
+    if direction == INCOMING:
+        return f'<-[:`{relation_type}`]-'
+    return f'-[:`{relation_type}`]-'
+
+
+def _fetch(manager, uids):
+    """{source uid: [target nodes]} for one relationship of many source nodes."""
+    definition = manager.definition
+    target_class = definition['node_class']
+    query = (
+        f"UNWIND $uids AS uid "
+        f"MATCH (s:`{manager.source_class.__label__}` {{uid: uid}})"
+        f"{_arrow(definition['relation_type'], definition['direction'])}"
+        f"(t:`{target_class.__label__}`) "
+        f"RETURN uid, collect(t)"
+    )
+    rows, _ = db.cypher_query(query, {'uids': uids})
+    return {uid: [target_class.inflate(t) for t in targets] for uid, targets in rows}
+
+
+_current_scope = ContextVar('loader_scope', default=None)
+
+
+@contextmanager
+def loader_scope():
+    """Open a scope for the duration of a GraphQL request."""
+    _install_cypher_counter()
+    token = _current_scope.set(LoaderScope())
+    try:
+        yield _current_scope.get()
+    finally:
+        _current_scope.reset(token)
+
+
+def current_scope():
+    return _current_scope.get()
+
+
+def _batching_scope(node):
+    scope = _current_scope.get()
+    if scope is None or not scope.batching or not isinstance(node, StructuredNode) or not node.uid:
+        return None
+    return scope
+
+
+def prime(nodes):
+    """Register sibling nodes so their relationship lookups are batched together."""
+    nodes = list(nodes)
+    scope = _current_scope.get()
+    if scope is not None and scope.batching:
+        scope.remember(nodes)
+    return nodes
+
+
+def load_one(node, name):
+    """`node.<name>.single()`, batched within the current query."""
+    scope = _batching_scope(node)
+    if scope is None:
+        return getattr(node, name).single()
+    targets = scope.load(node, name)
+    return targets[0] if targets else None
+
+
+def load_all(node, name):
+    """`node.<name>.all()`, batched within the current query."""
+    scope = _batching_scope(node)
+    if scope is None:
+        return getattr(node, name).all()
+    return list(scope.load(node, name))
+
+
+_counter_installed = False
+
+
+def _install_cypher_counter():
+    """Wrap db.cypher_query once so active scopes can count their round trips."""
+    global _counter_installed
+    if _counter_installed:
+        return
+    _counter_installed = True
+    cypher_query = db.cypher_query
+
+    def counted_cypher_query(*args, **kwargs):
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.cypher_calls += 1
+        return cypher_query(*args, **kwargs)
+
+    db.cypher_query = counted_cypher_query
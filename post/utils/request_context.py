@@ -0,0 +1,89 @@
+"""
+Request-scoped state for feed serialization.
+
+`PostReactionUtils`, `IndividualVibeManager` and `FileURL` used to keep their
+lookup maps on class attributes, which every feed request overwrote and every
+worker thread shared. The maps now live on a `FeedRequestContext` that the
+GraphQL view opens per request (`feed_request_context()`) and drops when the
+response is rendered. The context is tracked with a ContextVar, so it follows
+the request across threads and async tasks without leaking into other ones.
+
+The IndividualVibe catalog is the same for every request, so it is kept in a
+process-wide cache with a TTL instead of being queried on every feed call.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+VIBE_CATALOG_TTL = int(os.getenv('VIBE_CATALOG_TTL', '300'))
+VIBE_CATALOG_SIZE = 10
+
+
+class FeedRequestContext:
+    """Maps built while serializing one request's feed."""
+
+    def __init__(self):
+        self.post_vibes = {}
+        self.file_urls = {}
+        self._vibe_catalog = None
+
+    @property
+    def vibe_catalog(self):
+        # Pinned on first use so one response never mixes two catalog versions.
+        if self._vibe_catalog is None:
+            self._vibe_catalog = get_vibe_catalog()
+        return self._vibe_catalog
+
+
+_current_context = ContextVar('feed_request_context', default=None)
+
+
+@contextmanager
+def feed_request_context():
+    """Open a fresh context for the duration of a request."""
+    token = _current_context.set(FeedRequestContext())
+    try:
+        yield _current_context.get()
+    finally:
+        _current_context.reset(token)
+
+
+def get_feed_context():
+    """
+    Return the active request context.
+
+    Code running outside `feed_request_context()` (Celery workers, management
+    commands, shell) gets a fresh context that is not stored, so nothing it
+    memoizes outlives the call. Wrap such code in `feed_request_context()` to
+    share the maps across calls.
+    """
+    context = _current_context.get()
+    if context is None:
+        return FeedRequestContext()
+    return context
+
+
+_catalog_lock = threading.Lock()
+_catalog_cache = {'expires_at': 0.0, 'data': None}
+
+
+def get_vibe_catalog():
+    """The first IndividualVibe rows, cached per process for VIBE_CATALOG_TTL seconds."""
+    now = time.monotonic()
+    if _catalog_cache['data'] is not None and _catalog_cache['expires_at'] > now:
+        return list(_catalog_cache['data'])
+    with _catalog_lock:
+        if _catalog_cache['data'] is None or _catalog_cache['expires_at'] <= now:
+            from vibe_manager.models import IndividualVibe
+            _catalog_cache['data'] = tuple(IndividualVibe.objects.all()[:VIBE_CATALOG_SIZE])
+            _catalog_cache['expires_at'] = now + VIBE_CATALOG_TTL
+        return list(_catalog_cache['data'])
+
+
+def invalidate_vibe_catalog():
+    with _catalog_lock:
+        _catalog_cache['data'] = None
+        _catalog_cache['expires_at'] = 0.0
@@ -0,0 +1,131 @@
+"""
+Post-commit queue for the side effects of engagement writes.
+
+A like used to run its counters, interest vector update, activity tracking
+and notification inline, each with its own database or HTTP round trip, so
+the response waited on all of them. Mutations now make the write that
+defines the result (see post.services.like_service) and hand the rest to
+`after_commit(name, fn, *args)`:
+
+- the job is queued when the surrounding Django transaction commits (right
+  away outside one), so a rolled back request queues nothing
+- a fixed set of daemon workers (POST_SIDE_EFFECT_WORKERS) runs the jobs in
+  order of arrival; a failing job is logged and does not affect the others
+- the queue is bounded (POST_SIDE_EFFECT_QUEUE_SIZE). When it is full the job
+  runs on the caller's thread instead of being dropped, so a burst slows the
+  mutation down rather than losing counter updates
+
+Queued jobs run on several workers in no fixed order, so only jobs that are
+idempotent or purely additive (F() / HINCRBY increments) belong on the queue.
+Jobs whose effect depends on the order they run in, such as moving a reaction
+from one vibe to another, use `run_after_commit` instead: it runs the job on
+the caller's thread right after commit, so a user's successive writes apply
+in the order they were made. Jobs still queued when the process is killed are
+lost, as with ActivityBuffer.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+SIDE_EFFECT_QUEUE_SIZE = int(os.getenv('POST_SIDE_EFFECT_QUEUE_SIZE', '10000'))
+SIDE_EFFECT_WORKERS = int(os.getenv('POST_SIDE_EFFECT_WORKERS', '4'))
+
+
+class SideEffectQueue:
+    """Bounded job queue drained by a fixed pool of worker threads."""
+
+    def __init__(self, maxsize: int = SIDE_EFFECT_QUEUE_SIZE, workers: int = SIDE_EFFECT_WORKERS):
+        self._jobs = queue.Queue(maxsize=maxsize)
+        self.workers = workers
+        self._threads = []
+        self._start_lock = threading.Lock()
+        self.submitted = 0
+        self.inline = 0
+        self.failed = 0
+
+    def submit(self, name: str, fn, *args, **kwargs) -> None:
+        self._ensure_started()
+        self.submitted += 1
+        try:
+            self._jobs.put_nowait((name, fn, args, kwargs))
+        except queue.Full:
+            self.inline += 1
+            self._run_job(name, fn, args, kwargs)
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        with self._start_lock:
+            if not self._threads:
+                for i in range(self.workers):
+                    thread = threading.Thread(target=self._run, name=f'post-side-effects-{i}', daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+
+    def _run(self):
+        while True:
+            name, fn, args, kwargs = self._jobs.get()
+            try:
+                self._run_job(name, fn, args, kwargs)
+            finally:
+                close_old_connections()
+                self._jobs.task_done()
+
+    def _run_job(self, name, fn, args, kwargs):
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Side effect {name} failed: {e}")
+
+    def join(self):
+        """Block until every queued job has run (tests, benchmarks, shutdown)."""
+        self._jobs.join()
+
+    def stats(self) -> dict:
+        return {
+            'queued': self._jobs.qsize(),
+            'submitted': self.submitted,
+            'inline': self.inline,
+            'failed': self.failed,
+        }
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_side_effect_queue() -> SideEffectQueue:
+    """Process-wide queue shared by the engagement mutations."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = SideEffectQueue()
+                atexit.register(_drain_at_exit)
+    return _queue
+
+
+def after_commit(name: str, fn, *args, **kwargs) -> None:
+    """Queue `fn(*args, **kwargs)` once the current transaction commits."""
+    transaction.on_commit(lambda: get_side_effect_queue().submit(name, fn, *args, **kwargs))
+
+
+def run_after_commit(name: str, fn, *args, **kwargs) -> None:
+    """Run `fn(*args, **kwargs)` on the caller's thread once the current transaction commits."""
+    transaction.on_commit(lambda: get_side_effect_queue()._run_job(name, fn, args, kwargs))
+
+
+def _drain_at_exit():
+    try:
+        if _queue is not None and _queue.stats()['queued']:
+            _queue.join()
+    except Exception as e:
+        logger.error(f"Side effect drain at exit failed: {e}")
@@ -1,51 +1,176 @@
+"""
+Shared trending snapshot.
+
+The trending ranking is the same for every user, so it is computed once per
+TRENDING_REFRESH_SECONDS by the `post.tasks.refresh_trending_snapshot` Celery
+task and stored in Redis. Callers read the snapshot (kept in process memory for
+TRENDING_LOCAL_TTL seconds) and apply their own exclusions in Python instead of
+running the global aggregation on every feed request.
+"""
+
+import os
+import time
+import logging
+import threading
+from django.core.cache import cache
 from neomodel import db
 
+logger = logging.getLogger(__name__)
+
+TRENDING_SNAPSHOT_KEY = "trending:snapshot"
+TRENDING_TAGS_KEY = "trending:tags"
+TRENDING_LOCK_KEY = "trending:snapshot:lock"
+TRENDING_SNAPSHOT_SIZE = int(os.getenv('TRENDING_SNAPSHOT_SIZE', '500'))
+TRENDING_REFRESH_SECONDS = int(os.getenv('TRENDING_REFRESH_SECONDS', '60'))
+# Redis copy outlives a few missed refreshes so a stalled beat does not empty the feed
+TRENDING_SNAPSHOT_TTL = TRENDING_REFRESH_SECONDS * 10
+TRENDING_LOCAL_TTL = int(os.getenv('TRENDING_LOCAL_TTL', '15'))
+
+trending_posts_query = (
+    "MATCH (post:Post {is_deleted: false})<-[:HAS_POST]-(user:Users)-[:HAS_PROFILE]->(profile:Profile) "
+    "OPTIONAL MATCH (post)-[:HAS_LIKE]->(like:Like) "
+    "OPTIONAL MATCH (post)-[:HAS_POST_SHARE]->(share:PostShare) "
+    "OPTIONAL MATCH (post)-[:HAS_COMMENT]->(comment:Comment) "
+    "WITH post, user, profile, collect(like) AS reactions, "
+    "     COUNT(DISTINCT share) AS share_count, "
+    "     COUNT(DISTINCT comment) AS comment_count, "
+    "     COUNT(DISTINCT like) AS like_count, toFloat(post.created_at) AS created_at "
+    "WITH post, user, profile, reactions, share_count, comment_count, like_count, created_at, "
+    "     (comment_count + like_count + share_count) AS engagement_score "
+    "WITH post, user, profile, reactions, share_count, engagement_score, created_at, "
+    "     CASE WHEN post.vibe_score IS NOT NULL THEN round(post.vibe_score + (engagement_score * 0.1), 1) ELSE 2.0 END AS calculated_overall_score "
+    "RETURN post { .uid, .post_title, .post_text, .post_type, .post_file_id, .privacy, vibe_score: post.vibe_score, created_at: created_at, updated_at: toString(post.updated_at), is_deleted: post.is_deleted, share_count: share_count } AS post, "
+    "       user, profile, reactions, NULL AS connection, NULL AS circle, share_count, calculated_overall_score, created_at "
+    "UNION ALL "
+    "MATCH (community_post:CommunityPost {is_deleted: false})<-[:HAS_POST]-(community:Community) "
+    "OPTIONAL MATCH (community_post)-[:HAS_POST_SHARE]->(share:PostShare) "
+    "OPTIONAL MATCH (community_post)-[:HAS_COMMENT]->(comment:Comment) "
+    "OPTIONAL MATCH (community_post)-[:HAS_LIKE]->(like:Like) "
+    "WITH community_post, community, "
+    "     COUNT(DISTINCT share) AS share_count, "
+    "     COUNT(DISTINCT comment) AS comment_count, "
+    "     COUNT(DISTINCT like) AS like_count, toFloat(community_post.created_at) AS created_at "
+    "WITH community_post, community, share_count, comment_count, like_count, created_at, "
+    "     (comment_count + like_count + share_count) AS engagement_score "
+    "WITH community_post AS cp, community AS cm, share_count AS sc, engagement_score AS es, created_at AS ca "
+    "WITH cp, cm, sc, es, ca, CASE WHEN cp.vibe_score IS NOT NULL THEN round(cp.vibe_score + (es * 0.1), 1) ELSE 2.0 END AS calculated_overall_score "
+    "RETURN cp { .uid, .post_title, .post_text, .post_type, .post_file_id, .privacy, vibe_score: cp.vibe_score, created_at: ca, updated_at: toString(cp.updated_at), is_deleted: cp.is_deleted, share_count: sc } AS post, "
+    "       cm AS user, cm AS profile, [] AS reactions, NULL AS connection, NULL AS circle, sc AS share_count, calculated_overall_score, ca AS created_at "
+    "ORDER BY calculated_overall_score DESC, created_at DESC "
+    "LIMIT $limit"
+)
+
+trending_hashtags_query = """
+MATCH (post:Post {is_deleted: false})
+WHERE post.created_at > datetime() - duration('P7D')  // Last 7 days
+AND post.hashtags IS NOT NULL
+UNWIND post.hashtags as hashtag
+RETURN hashtag, count(*) as usage_count
+ORDER BY usage_count DESC
+LIMIT 20
+"""
+
+trending_interests_query = """
+MATCH (profile:Profile)-[:HAS_INTEREST]->(interest:Interest)
+WHERE profile.created_at > datetime() - duration('P30D')  // Last 30 days
+UNWIND interest.names as interest_name
+RETURN interest_name, count(*) as interest_count
+ORDER BY interest_count DESC
+LIMIT 15
+"""
+
+_local = {}
+_local_lock = threading.Lock()
+
+
+def _plain(value):
+    # Nodes are reduced to their properties so the snapshot can be cached;
+    # the feed types read them with [] / .get() either way.
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if hasattr(value, 'items') and hasattr(value, 'labels'):
+        return dict(value.items())
+    return value
+
+
+def _row_uid(row):
+    pd = row[0] if row else {}
+    if isinstance(pd, dict):
+        return pd.get('uid') or pd.get('post_uid')
+    return getattr(pd, 'uid', None) or getattr(pd, 'post_uid', None)
+
+
+def compute_trending_snapshot(size: int = TRENDING_SNAPSHOT_SIZE) -> list:
+    rows, _ = db.cypher_query(trending_posts_query, {"limit": int(size)})
+    return [[_plain(v) for v in row] for row in rows]
+
+
+def compute_trending_tags() -> dict:
+    hashtag_results, _ = db.cypher_query(trending_hashtags_query)
+    interest_results, _ = db.cypher_query(trending_interests_query)
+    return {
+        'hashtags': [result[0] for result in hashtag_results if result[1] > 5],
+        'interests': [result[0].lower().replace(' ', '') for result in interest_results if result[1] > 10],
+    }
+
+
+def refresh_trending_snapshot() -> dict:
+    """Recompute the ranked posts and trending tags and publish them."""
+    start = time.monotonic()
+    rows = compute_trending_snapshot()
+    tags = compute_trending_tags()
+    now = time.time()
+    cache.set(TRENDING_SNAPSHOT_KEY, {'computed_at': now, 'rows': rows}, TRENDING_SNAPSHOT_TTL)
+    cache.set(TRENDING_TAGS_KEY, {'computed_at': now, 'tags': tags}, TRENDING_SNAPSHOT_TTL)
+    with _local_lock:
+        _local[TRENDING_SNAPSHOT_KEY] = (time.monotonic(), rows)
+        _local[TRENDING_TAGS_KEY] = (time.monotonic(), tags)
+    stats = {'rows': len(rows), 'hashtags': len(tags['hashtags']), 'seconds': round(time.monotonic() - start, 3)}
+    logger.info(f"Trending snapshot refreshed: {stats}")
+    return stats
+
+
+def _read(key, field, compute):
+    cached = _local.get(key)
+    if cached and time.monotonic() - cached[0] < TRENDING_LOCAL_TTL:
+        return cached[1]
+    value = None
+    try:
+        stored = cache.get(key)
+        if stored:
+            value = stored[field]
+    except Exception as e:
+        logger.warning(f"Trending snapshot read failed key={key}: {e}")
+    if value is None:
+        # Beat has not run yet (or Redis was flushed): one worker computes it inline
+        if cache.add(TRENDING_LOCK_KEY, 1, timeout=TRENDING_REFRESH_SECONDS):
+            try:
+                refresh_trending_snapshot()
+                return _local[key][1]
+            finally:
+                cache.delete(TRENDING_LOCK_KEY)
+        return cached[1] if cached else compute()
+    with _local_lock:
+        _local[key] = (time.monotonic(), value)
+    return value
+
+
+def get_trending_snapshot() -> list:
+    return _read(TRENDING_SNAPSHOT_KEY, 'rows', lambda: compute_trending_snapshot(100))
+
+
+def get_trending_tags() -> dict:
+    return _read(TRENDING_TAGS_KEY, 'tags', compute_trending_tags)
+
+
 def fetch_trending(limit: int, exclude_uids: set[str] = set()):
-    print("fetching trending...")
-    q = (
-        "MATCH (post:Post {is_deleted: false})<-[:HAS_POST]-(user:Users)-[:HAS_PROFILE]->(profile:Profile) "
-        "OPTIONAL MATCH (post)-[:HAS_LIKE]->(like:Like) "
-        "OPTIONAL MATCH (post)-[:HAS_POST_SHARE]->(share:PostShare) "
-        "OPTIONAL MATCH (post)-[:HAS_COMMENT]->(comment:Comment) "
-        "WITH post, user, profile, collect(like) AS reactions, "
-        "     COUNT(DISTINCT share) AS share_count, "
-        "     COUNT(DISTINCT comment) AS comment_count, "
-        "     COUNT(DISTINCT like) AS like_count, toFloat(post.created_at) AS created_at "
-        "WITH post, user, profile, reactions, share_count, comment_count, like_count, created_at, "
-        "     (comment_count + like_count + share_count) AS engagement_score "
-        "WITH post, user, profile, reactions, share_count, engagement_score, created_at, "
-        "     CASE WHEN post.vibe_score IS NOT NULL THEN round(post.vibe_score + (engagement_score * 0.1), 1) ELSE 2.0 END AS calculated_overall_score "
-        "RETURN post { .uid, .post_title, .post_text, .post_type, .post_file_id, .privacy, vibe_score: post.vibe_score, created_at: created_at, updated_at: toString(post.updated_at), is_deleted: post.is_deleted, share_count: share_count } AS post, "
-        "       user, profile, reactions, NULL AS connection, NULL AS circle, share_count, calculated_overall_score, created_at "
-        "UNION ALL "
-        "MATCH (community_post:CommunityPost {is_deleted: false})<-[:HAS_POST]-(community:Community) "
-        "OPTIONAL MATCH (community_post)-[:HAS_POST_SHARE]->(share:PostShare) "
-        "OPTIONAL MATCH (community_post)-[:HAS_COMMENT]->(comment:Comment) "
-        "OPTIONAL MATCH (community_post)-[:HAS_LIKE]->(like:Like) "
-        "WITH community_post, community, "
-        "     COUNT(DISTINCT share) AS share_count, "
-        "     COUNT(DISTINCT comment) AS comment_count, "
-        "     COUNT(DISTINCT like) AS like_count, toFloat(community_post.created_at) AS created_at "
-        "WITH community_post, community, share_count, comment_count, like_count, created_at, "
-        "     (comment_count + like_count + share_count) AS engagement_score "
-        "WITH community_post AS cp, community AS cm, share_count AS sc, engagement_score AS es, created_at AS ca "
-        "WITH cp, cm, sc, es, ca, CASE WHEN cp.vibe_score IS NOT NULL THEN round(cp.vibe_score + (es * 0.1), 1) ELSE 2.0 END AS calculated_overall_score "
-        "RETURN cp { .uid, .post_title, .post_text, .post_type, .post_file_id, .privacy, vibe_score: cp.vibe_score, created_at: ca, updated_at: toString(cp.updated_at), is_deleted: cp.is_deleted, share_count: sc } AS post, "
-        "       cm AS user, cm AS profile, [] AS reactions, NULL AS connection, NULL AS circle, sc AS share_count, calculated_overall_score, ca AS created_at "
-        "ORDER BY calculated_overall_score DESC, created_at DESC "
-        "LIMIT $limit"
-    )
-    rows, _ = db.cypher_query(q, {"limit": int(limit)})
-    if exclude_uids:
-        filtered = []
-        for r in rows:
-            pd = r[0] if r else {}
-            puid = None
-            if isinstance(pd, dict):
-                puid = pd.get('uid') or pd.get('post_uid')
-            else:
-                puid = getattr(pd, 'uid', None) or getattr(pd, 'post_uid', None)
-            if puid and puid not in exclude_uids:
-                filtered.append(r)
-        return filtered
-    return rows
+    rows = get_trending_snapshot()
+    result = []
+    for r in rows:
+        puid = _row_uid(r)
+        if not puid or puid in exclude_uids:
+            continue
+        result.append(r)
+        if len(result) >= limit:
+            break
+    return result
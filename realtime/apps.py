@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class RealtimeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'realtime'
-    verbose_name = 'Real-time Services'
\ No newline at end of file
+    verbose_name = 'Real-time Services'
+
+    def ready(self):
+        import realtime.signals
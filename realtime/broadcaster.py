@@ -1,13 +1,42 @@
 """
 Broadcast live updates from backend to connected WebSocket clients.
 Use this when backend events should update frontend in real-time.
+
+Multi-recipient broadcasts go through `broadcast_many` / `abroadcast_many`,
+which issue every `user_{uid}` group_send from one event-loop pass with up to
+REALTIME_BROADCAST_CONCURRENCY calls in flight, instead of one sync-to-async
+hop and one serial Redis round trip per recipient. `broadcast_in_background`
+hands the same work to a shared background loop so mutations return
+immediately.
 """
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from concurrent.futures import Future
+import asyncio
 import logging
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+BROADCAST_CONCURRENCY = int(os.getenv('REALTIME_BROADCAST_CONCURRENCY', '100'))
+
+_background_loop = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide loop (own thread) for fire-and-forget broadcasts from sync code."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='realtime-broadcast', daemon=True).start()
+                _background_loop = loop
+    return _background_loop
+
 
 class RealtimeBroadcaster:
     """
@@ -18,6 +47,12 @@ class RealtimeBroadcaster:
         
         broadcaster = RealtimeBroadcaster()
         broadcaster.send_notification(user_uid, notification_data)
+        
+        # Many recipients, without blocking the request thread
+        broadcaster.broadcast_in_background(member_uids, {
+            'type': 'live_notification',
+            'data': notification_data
+        })
     """
     
     def __init__(self):
@@ -75,5 +110,72 @@ class RealtimeBroadcaster:
             user_uids: List of user UIDs
             notification_data: Notification payload
         """
-        for user_uid in user_uids:
-            self.send_notification(user_uid, notification_data)
\ No newline at end of file
+        return self.broadcast_many(user_uids, {
+            'type': 'live_notification',
+            'data': notification_data
+        })
+    
+    def broadcast_update_to_multiple(self, user_uids: list, update_type: str, update_data: dict):
+        """
+        Send the same live update to multiple users at once.
+        """
+        return self.broadcast_many(user_uids, {
+            'type': 'live_update',
+            'update_type': update_type,
+            'data': update_data
+        })
+    
+    def broadcast_many(self, user_uids: list, message: dict) -> dict:
+        """
+        Send one channel-layer message to every `user_{uid}` group, blocking
+        until all sends finish (a single sync-to-async hop).
+        
+        Returns:
+            {'recipients', 'failed', 'seconds'}
+        """
+        try:
+            return async_to_sync(self.abroadcast_many)(user_uids, message)
+        except Exception as e:
+            logger.error(f"Error broadcasting to {len(user_uids)} users: {e}")
+            return {'recipients': len(user_uids), 'failed': len(user_uids), 'seconds': 0.0}
+    
+    async def abroadcast_many(self, user_uids: list, message: dict,
+                              concurrency: int = BROADCAST_CONCURRENCY) -> dict:
+        """
+        Async-native bulk broadcast for consumers and other async callers.
+        
+        Recipients are deduplicated; group_send calls overlap on the layer's
+        connection pool, bounded by `concurrency`.
+        """
+        groups = [f'user_{uid}' for uid in dict.fromkeys(user_uids) if uid]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        start = time.perf_counter()
+        
+        async def send(group):
+            async with semaphore:
+                try:
+                    await self.channel_layer.group_send(group, message)
+                    return True
+                except Exception as e:
+                    logger.error(f"Error broadcasting {message.get('type')} to {group}: {e}")
+                    return False
+        
+        results = await asyncio.gather(*(send(group) for group in groups))
+        stats = {
+            'recipients': len(groups),
+            'failed': results.count(False),
+            'seconds': round(time.perf_counter() - start, 4),
+        }
+        logger.info(f"Live {message.get('type')} broadcasted: {stats}")
+        return stats
+    
+    def broadcast_in_background(self, user_uids: list, message: dict) -> Future:
+        """
+        Fire-and-forget bulk broadcast for sync callers such as mutations.
+        
+        Runs `abroadcast_many` on a shared background event loop and returns a
+        concurrent.futures.Future immediately.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.abroadcast_many(list(user_uids), message), _get_background_loop()
+        )
@@ -11,6 +11,8 @@ import json
 import logging
 from typing import Dict, Any, Optional
 
+from .identity import get_cached_neo4j_uid, get_neo4j_uid
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,15 +56,15 @@ class RealtimeEventConsumer(AsyncWebsocketConsumer):
                 await self.close(code=4001)
                 return
             
-            # Get Neo4j user node to fetch uid
-            user_node = await self._get_neo4j_user(self.user.id)
-            if not user_node:
+            # Neo4j uid from the identity cache (Neo4j only on a miss)
+            user_uid = get_cached_neo4j_uid(self.user.id) or await self._get_neo4j_uid(self.user.id)
+            if not user_uid:
                 logger.error(f"Neo4j user not found for Django user {self.user.id}")
                 await self.close(code=4003)
                 return
             
             # Store user info (uid from Neo4j)
-            self.user_uid = user_node.uid
+            self.user_uid = user_uid
             
             # Join user-specific channel group to receive notifications
             self.user_channel = f'user_{self.user_uid}'
@@ -89,11 +91,10 @@ class RealtimeEventConsumer(AsyncWebsocketConsumer):
             await self.close(code=4002)
     
     @database_sync_to_async
-    def _get_neo4j_user(self, user_id):
-        """Get Neo4j Users node from Django user id"""
+    def _get_neo4j_uid(self, user_id):
+        """Get the Neo4j Users uid for a Django user id (cached)"""
         try:
-            from auth_manager.models import Users
-            return Users.nodes.get(user_id=str(user_id))
+            return get_neo4j_uid(user_id)
         except Exception as e:
             logger.error(f"Error fetching Neo4j user: {e}")
             return None
@@ -0,0 +1,109 @@
+"""
+Identity lookups for WebSocket connects.
+
+A connect needs two things: the Django user behind the JWT, and the Neo4j
+uid that names the user's channel group. Both used to cost a database hit per
+connect (User.objects.get + Users.nodes.get), so a reconnect storm after a
+deploy hit Postgres and Neo4j once per client.
+
+- `user_from_claims` builds the user from the verified token's own claims
+  (user_id, username, email from custom_jwt_payload); the ORM is only used for
+  tokens that lack them.
+- `get_neo4j_uid` maps Django user id -> Neo4j uid through a short
+  process-local TTL map in front of the shared cache. Entries are dropped by
+  `invalidate_identity` when the Django user or its Users node is deleted;
+  other processes' local entries age out after IDENTITY_LOCAL_TTL.
+"""
+import os
+import threading
+import time
+import logging
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+IDENTITY_CACHE_TTL = int(os.getenv('REALTIME_IDENTITY_CACHE_TTL', '86400'))
+IDENTITY_LOCAL_TTL = 60
+IDENTITY_LOCAL_SIZE = 10000
+
+_local = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _key(user_id) -> str:
+    return f"realtime:identity:{user_id}"
+
+
+def _local_get(user_id):
+    with _local_lock:
+        hit = _local.get(str(user_id))
+        if hit is None:
+            return None
+        if hit[0] < time.monotonic():
+            del _local[str(user_id)]
+            return None
+        _local.move_to_end(str(user_id))
+        return hit[1]
+
+
+def _local_set(user_id, uid):
+    with _local_lock:
+        _local[str(user_id)] = (time.monotonic() + IDENTITY_LOCAL_TTL, uid)
+        _local.move_to_end(str(user_id))
+        while len(_local) > IDENTITY_LOCAL_SIZE:
+            _local.popitem(last=False)
+
+
+def get_cached_neo4j_uid(user_id):
+    """Process-local hit only; safe to call from the event loop."""
+    return _local_get(user_id)
+
+
+def get_neo4j_uid(user_id):
+    """
+    Neo4j uid for a Django user id, or None if there is no Users node.
+
+    Blocking (cache / Neo4j); call through database_sync_to_async from async code.
+    """
+    uid = _local_get(user_id)
+    if uid:
+        return uid
+    uid = cache.get(_key(user_id))
+    if not uid:
+        from neomodel import db
+        rows, _ = db.cypher_query(
+            "MATCH (u:Users {user_id: $user_id}) RETURN u.uid LIMIT 1",
+            {'user_id': str(user_id)},
+        )
+        uid = rows[0][0] if rows else None
+        if not uid:
+            return None
+        cache.set(_key(user_id), uid, IDENTITY_CACHE_TTL)
+    _local_set(user_id, uid)
+    return uid
+
+
+def invalidate_identity(user_id) -> None:
+    with _local_lock:
+        _local.pop(str(user_id), None)
+    try:
+        cache.delete(_key(user_id))
+    except Exception as e:
+        logger.warning(f"Could not invalidate realtime identity for {user_id}: {e}")
+
+
+def user_from_claims(payload):
+    """
+    An authenticated User built from verified JWT claims, or None when the
+    token predates the user_id/username claims and needs an ORM lookup.
+    """
+    from django.contrib.auth import get_user_model
+
+    user_id = payload.get('user_id')
+    username = payload.get('username')
+    if not user_id or not username:
+        return None
+    User = get_user_model()
+    return User(id=user_id, username=username, email=payload.get('email') or '')
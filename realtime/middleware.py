@@ -11,27 +11,41 @@ logger = logging.getLogger(__name__)
 
 
 @database_sync_to_async
-def get_user_from_token(token):
+def get_user_by_id(user_id):
     """
-    Get user from JWT token
+    ORM fallback for tokens without username claims
     """
+    from django.contrib.auth import get_user_model
+    
+    User = get_user_model()
     try:
-        from graphql_jwt.utils import jwt_decode
-        from django.contrib.auth import get_user_model
+        return User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        logger.warning(f"User with id {user_id} not found")
+        return AnonymousUser()
+
+
+async def get_user_from_token(token):
+    """
+    Get user from JWT token.
+    
+    The user is built from the verified token's claims; the database is only
+    hit for older tokens that don't carry them. Whether the user still exists
+    is checked by the consumer's Neo4j identity lookup.
+    """
+    try:
+        from custom_backends.utils import cached_jwt_decode
+        from .identity import user_from_claims
         
-        User = get_user_model()
+        # Decode (and verify) the token
+        payload = cached_jwt_decode(token)
+        user = user_from_claims(payload)
+        if user is not None:
+            return user
         
-        # Decode the token
-        payload = jwt_decode(token)
         user_id = payload.get('user_id')
-        
         if user_id:
-            try:
-                user = User.objects.get(id=user_id)
-                return user
-            except User.DoesNotExist:
-                logger.warning(f"User with id {user_id} not found")
-                return AnonymousUser()
+            return await get_user_by_id(user_id)
         
         return AnonymousUser()
         
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+
+from .identity import invalidate_identity
+
+
+@receiver(post_delete, sender=User)
+def drop_realtime_identity(sender, instance, **kwargs):
+    invalidate_identity(instance.id)
@@ -178,6 +178,28 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+CELERY_BEAT_SCHEDULE = {
+    'refresh-trending-snapshot': {
+        'task': 'post.tasks.refresh_trending_snapshot',
+        'schedule': float(os.getenv('TRENDING_REFRESH_SECONDS', '60')),
+    },
+    'compact-interest-vectors': {
+        'task': 'post.tasks.compact_interest_vectors',
+        'schedule': 3600.0,
+    },
+    'apply-queued-vibes': {
+        'task': 'vibe_manager.tasks.apply_queued_vibes',
+        'schedule': 5.0,
+    },
+    'aggregate-activities': {
+        'task': 'user_activity.tasks.aggregate_daily_activities',
+        'schedule': float(os.getenv('ACTIVITY_ROLLUP_SECONDS', '900')),
+    },
+    'provision-matrix-rooms': {
+        'task': 'community.tasks.provision_pending_matrix_rooms',
+        'schedule': float(os.getenv('MATRIX_PROVISION_SWEEP_SECONDS', '30')),
+    },
+}
 
 
 
@@ -203,6 +225,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 GRAPHQL_JWT = {
     'JWT_PAYLOAD_HANDLER': 'custom_backends.utils.custom_jwt_payload',
+    'JWT_DECODE_HANDLER': 'custom_backends.utils.cached_jwt_decode',
     'JWT_VERIFY_EXPIRATION': False,  # Disable token expiration
     'JWT_LONG_RUNNING_REFRESH_TOKEN': True,
     'JWT_SECRET_KEY': SECRET_KEY,
@@ -253,6 +276,7 @@ GRAPHENE = {
     "MIDDLEWARE": [
         "graphql_jwt.middleware.JSONWebTokenMiddleware",
         "custom_backends.middlewares.JWTMiddleware.JWTMiddleware",
+        "custom_backends.middlewares.LoaderScopeMiddleware.LoaderScopeMiddleware",
     ],
 }
 
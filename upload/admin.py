@@ -6,7 +6,7 @@ from .models import UploadFiles
 
 
 class UploadFilesAdmin(admin.ModelAdmin):
-    list_display = ('id', 'username', 'file', 'uploaded_at')  # Include all fields you want to display
+    list_display = ('id', 'username', 'file', 'mime_type', 'file_size', 'uploaded_at')  # Include all fields you want to display
     search_fields = ('username',)  # Allow searching by username
     list_filter = ('uploaded_at',)  # Add filters for uploaded date
 
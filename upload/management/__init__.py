@@ -0,0 +1 @@
+# Upload management commands
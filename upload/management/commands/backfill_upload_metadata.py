@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from upload.models import UploadFiles
+from upload.utils import extract_file_metadata
+
+
+class Command(BaseCommand):
+    help = 'Fill size, MIME type, dimensions and content hash for uploads stored before they were captured'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        updated = failed = 0
+        pending = UploadFiles.objects.filter(content_hash__isnull=True).order_by('id')
+        fields = ['file_size', 'mime_type', 'width', 'height', 'content_hash']
+
+        batch = []
+        for upload in pending.iterator(chunk_size=batch_size):
+            try:
+                with upload.file.open('rb') as f:
+                    metadata = extract_file_metadata(f)
+                for key, value in metadata.items():
+                    setattr(upload, key, value)
+                batch.append(upload)
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.WARNING(f'Skipping upload {upload.id}: {e}'))
+            if len(batch) >= batch_size:
+                UploadFiles.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+        if batch:
+            UploadFiles.objects.bulk_update(batch, fields)
+            updated += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {updated} uploads ({failed} failed).'))
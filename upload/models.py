@@ -5,6 +5,12 @@ class UploadFiles(models.Model):
     username = models.CharField(max_length=999)
     file = models.FileField(upload_to='feeds/')
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # Metadata captured once at upload time so read paths never touch storage
+    file_size = models.BigIntegerField(null=True, blank=True)
+    mime_type = models.CharField(max_length=255, null=True, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    content_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
 
     def __str__(self):
         return self.file.name
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from .models import UploadFiles
-from .utils import get_user_from_token
+from .utils import get_user_from_token, extract_file_metadata
 
 class ImageSerializer(serializers.ModelSerializer):
     class Meta:
@@ -20,7 +20,13 @@ class MultipleImageUploadSerializer(serializers.Serializer):
         user=get_user_from_token(request)
         images = []
         for file in files:
-            image = UploadFiles.objects.create(file=file, username=user.username)
+            metadata = extract_file_metadata(file)
+            # Same content already stored: reuse the object instead of uploading it again
+            existing = UploadFiles.objects.filter(content_hash=metadata['content_hash']).first()
+            if existing:
+                image = UploadFiles.objects.create(file=existing.file.name, username=user.username, **metadata)
+            else:
+                image = UploadFiles.objects.create(file=file, username=user.username, **metadata)
             images.append(image)
 
         return {'uploaded_files': ImageSerializer(images, many=True).data}
@@ -57,3 +57,42 @@ def get_image_url(image_id, context):
     except requests.exceptions.RequestException as e:
         print(f"Error fetching image URL: {e}")
         return None
+
+
+def extract_file_metadata(file):
+    """
+    Compute size, MIME type, image dimensions and SHA-256 of an uploaded file.
+
+    Reads the file in chunks and rewinds it so it can still be saved afterwards.
+    Dimensions are only filled for images and only when Pillow is available.
+    """
+    import hashlib
+    import mimetypes
+
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in file.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+
+    mime_type = getattr(file, 'content_type', None) or mimetypes.guess_type(file.name)[0] or 'application/octet-stream'
+
+    width = height = None
+    if mime_type.startswith('image/'):
+        try:
+            from PIL import Image
+            with Image.open(file) as img:
+                width, height = img.size
+        except Exception:
+            pass
+        finally:
+            file.seek(0)
+
+    return {
+        'file_size': size,
+        'mime_type': mime_type,
+        'width': width,
+        'height': height,
+        'content_hash': digest.hexdigest(),
+    }
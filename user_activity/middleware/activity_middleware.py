@@ -1,3 +1,4 @@
+import hashlib
 import time
 import uuid
 from django.utils.deprecation import MiddlewareMixin
@@ -29,10 +30,6 @@ class ActivityTrackingMiddleware(MiddlewareMixin):
             'path': request.path,
             'query_params': dict(request.GET),
         }
-        
-        # Track session activity for authenticated users
-        if hasattr(request, 'user') and not isinstance(request.user, AnonymousUser):
-            self.track_session_activity(request)
     
     def process_response(self, request, response):
         """Process response and log activity data."""
@@ -46,9 +43,10 @@ class ActivityTrackingMiddleware(MiddlewareMixin):
                 'response_size': len(response.content) if hasattr(response, 'content') else 0,
             })
             
-            # Track navigation activity for authenticated users
+            # Track session and navigation activity for authenticated users
+            # (one buffered append; written by the activity flusher)
             if hasattr(request, 'user') and not isinstance(request.user, AnonymousUser):
-                self.track_navigation_activity(request, response)
+                self.track_request_activity(request, response)
         
         return response
     
@@ -72,66 +70,54 @@ class ActivityTrackingMiddleware(MiddlewareMixin):
             except Exception as e:
                 logger.error(f"Failed to track error activity: {e}")
     
-    def track_session_activity(self, request):
-        """Track or update session activity."""
-        try:
-            session_id = request.session.session_key
-            if not session_id:
-                # Create session if it doesn't exist
-                request.session.create()
-                session_id = request.session.session_key
-            
-            # Get or create session activity
-            session_activity, created = SessionActivity.objects.get_or_create(
-                user=request.user,
-                session_id=session_id,
-                end_time__isnull=True,  # Active session
-                defaults={
-                    'session_type': self.detect_session_type(request),
-                    'ip_address': request.activity_data['ip_address'],
-                    'user_agent': request.activity_data['user_agent'],
-                    'referrer': request.activity_data.get('referer'),
-                    'device_info': self.extract_device_info(request),
-                }
-            )
-            
-            if not created:
-                # Update existing session
-                session_activity.pages_visited += 1
-                session_activity.save(update_fields=['pages_visited', 'updated_at'])
-            
-            request.session_activity = session_activity
-            
-        except Exception as e:
-            logger.error(f"Failed to track session activity: {e}")
+    def get_session_id(self, request):
+        """
+        Session key if the request has one; otherwise a stable id derived from
+        the bearer token, so API clients aren't given a database session.
+        """
+        session = getattr(request, 'session', None)
+        if session is not None and session.session_key:
+            return session.session_key
+        auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+        if auth_header:
+            return 'jwt:' + hashlib.sha1(auth_header.encode()).hexdigest()[:32]
+        return f'user:{request.user.pk}'
     
-    def track_navigation_activity(self, request, response):
-        """Track navigation patterns."""
+    def track_request_activity(self, request, response):
+        """Count the page against the session and log navigation for successful loads."""
         try:
+            navigation = None
             # Only track successful page loads
             if 200 <= response.status_code < 400:
-                self.activity_service.track_activity_async(
-                    user=request.user,
-                    activity_type='navigation',
-                    description=f"Visited {request.path}",
-                    ip_address=request.activity_data['ip_address'],
-                    user_agent=request.activity_data['user_agent'],
-                    metadata={
+                navigation = {
+                    'activity_type': 'navigation',
+                    'description': f"Visited {request.path}",
+                    'ip_address': request.activity_data['ip_address'],
+                    'user_agent': request.activity_data['user_agent'],
+                    'metadata': {
                         'path': request.path,
                         'method': request.method,
                         'duration_ms': request.activity_data.get('duration_ms'),
                         'referer': request.activity_data.get('referer'),
                         'query_params': request.activity_data.get('query_params'),
                     }
-                )
-                
-                # Update session activity with current page
-                if hasattr(request, 'session_activity'):
-                    request.session_activity.actions_performed += 1
-                    request.session_activity.save(update_fields=['actions_performed', 'updated_at'])
+                }
+            
+            self.activity_service.track_request(
+                user=request.user,
+                session_id=self.get_session_id(request),
+                session_defaults={
+                    'session_type': self.detect_session_type(request),
+                    'ip_address': request.activity_data['ip_address'],
+                    'user_agent': request.activity_data['user_agent'],
+                    'referrer': request.activity_data.get('referer') or None,
+                    'device_info': self.extract_device_info(request),
+                },
+                navigation=navigation,
+            )
         
         except Exception as e:
-            logger.error(f"Failed to track navigation activity: {e}")
+            logger.error(f"Failed to track request activity: {e}")
     
     def get_client_ip(self, request):
         """Extract client IP address from request."""
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.14 on 2026-10-16 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_activity', '0004_alter_contentinteraction_content_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activityaggregation',
+            name='hour',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='activityaggregation',
+            name='aggregation_type',
+            field=models.CharField(choices=[('hourly', 'Hourly'), ('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly')], max_length=10),
+        ),
+        migrations.AlterUniqueTogether(
+            name='activityaggregation',
+            unique_together={('user', 'aggregation_type', 'date', 'hour')},
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['timestamp'], name='user_activi_timesta_85b358_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['created_at'], name='user_activi_created_646acc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contentinteraction',
+            index=models.Index(fields=['timestamp'], name='content_int_timesta_58230e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contentinteraction',
+            index=models.Index(fields=['created_at'], name='content_int_created_72f2f4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profileactivity',
+            index=models.Index(fields=['timestamp'], name='profile_act_timesta_561a40_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profileactivity',
+            index=models.Index(fields=['created_at'], name='profile_act_created_904ae9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mediainteraction',
+            index=models.Index(fields=['timestamp'], name='media_inter_timesta_dfe8ab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mediainteraction',
+            index=models.Index(fields=['created_at'], name='media_inter_created_f5f44f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='socialinteraction',
+            index=models.Index(fields=['timestamp'], name='social_inte_timesta_f8b3f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='socialinteraction',
+            index=models.Index(fields=['created_at'], name='social_inte_created_406f1d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionactivity',
+            index=models.Index(fields=['start_time'], name='session_act_start_t_63657b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionactivity',
+            index=models.Index(fields=['created_at'], name='session_act_created_f95268_idx'),
+        ),
+    ]
@@ -64,6 +64,9 @@ class UserActivity(BaseActivityModel):
             models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['activity_type', 'timestamp']),
             models.Index(fields=['user', 'activity_type']),
+            # Range scans by the activity rollup
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -120,6 +123,9 @@ class ContentInteraction(BaseActivityModel):
             models.Index(fields=['content_type', 'content_id']),
             models.Index(fields=['interaction_type', 'timestamp']),
             models.Index(fields=['user', 'content_type', 'interaction_type']),
+            # Range scans by the activity rollup
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -158,6 +164,9 @@ class ProfileActivity(BaseActivityModel):
             models.Index(fields=['profile_owner', 'timestamp']),
             models.Index(fields=['activity_type', 'timestamp']),
             models.Index(fields=['visitor', 'profile_owner']),
+            # Range scans by the activity rollup
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -207,6 +216,9 @@ class MediaInteraction(BaseActivityModel):
             models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['media_type', 'media_id']),
             models.Index(fields=['interaction_type', 'timestamp']),
+            # Range scans by the activity rollup
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -248,6 +260,9 @@ class SocialInteraction(BaseActivityModel):
             models.Index(fields=['target_user', 'timestamp']),
             models.Index(fields=['interaction_type', 'timestamp']),
             models.Index(fields=['user', 'target_user']),
+            # Range scans by the activity rollup
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -286,6 +301,9 @@ class SessionActivity(BaseActivityModel):
             models.Index(fields=['user', 'start_time']),
             models.Index(fields=['session_id']),
             models.Index(fields=['session_type', 'start_time']),
+            # Range scans by the activity rollup
+            models.Index(fields=['start_time']),
+            models.Index(fields=['created_at']),
         ]
 
     def save(self, *args, **kwargs):
@@ -364,6 +382,7 @@ class ActivityAggregation(models.Model):
     """Aggregated activity data for analytics and reporting."""
     
     AGGREGATION_TYPES = [
+        ('hourly', 'Hourly'),
         ('daily', 'Daily'),
         ('weekly', 'Weekly'),
         ('monthly', 'Monthly'),
@@ -372,6 +391,7 @@ class ActivityAggregation(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_aggregations')
     aggregation_type = models.CharField(max_length=10, choices=AGGREGATION_TYPES)
     date = models.DateField()
+    hour = models.PositiveSmallIntegerField(default=0)  # UTC hour of 'hourly' buckets, 0 otherwise
     activity_counts = models.JSONField(default=dict)  # {"posts_created": 5, "likes_given": 20, etc.}
     engagement_score = models.FloatField(default=0.0)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -381,7 +401,7 @@ class ActivityAggregation(models.Model):
         db_table = 'activity_aggregation'
         verbose_name = 'Activity Aggregation'
         verbose_name_plural = 'Activity Aggregations'
-        unique_together = ['user', 'aggregation_type', 'date']
+        unique_together = ['user', 'aggregation_type', 'date', 'hour']
         indexes = [
             models.Index(fields=['user', 'date']),
             models.Index(fields=['aggregation_type', 'date']),
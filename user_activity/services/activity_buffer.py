@@ -0,0 +1,295 @@
+"""
+In-process ingestion buffer for activity events.
+
+The request path (ActivityTrackingMiddleware, ActivityService) only appends a
+compact tuple to a bounded deque. A daemon flusher thread drains it every
+ACTIVITY_FLUSH_SECONDS, or as soon as ACTIVITY_FLUSH_BATCH events are waiting,
+and writes:
+
+- UserActivity and ContentInteraction rows with one bulk_create each
+- SessionActivity: per (user, session) the page and action counts of the
+  batch are summed, existing open sessions get a single F() increment and new
+  ones are bulk_created
+
+Each kind is written in its own transaction. If a batch is rejected (a value
+the column can't hold, a user deleted meanwhile) it is retried row by row, so
+only the offending rows are lost; ActivityService already clips values to
+their column lengths when it appends them.
+
+Events are analytics, not state: when the buffer is full the oldest are
+dropped (and counted), and whatever is buffered at exit is flushed by atexit.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_BUFFER_SIZE = int(os.getenv('ACTIVITY_BUFFER_SIZE', '50000'))
+ACTIVITY_FLUSH_BATCH = int(os.getenv('ACTIVITY_FLUSH_BATCH', '1000'))
+ACTIVITY_FLUSH_SECONDS = float(os.getenv('ACTIVITY_FLUSH_SECONDS', '2'))
+
+# Event tuples, first element is the kind:
+#   ('activity', ts, user_id, activity_type, description, success, ip, user_agent, metadata)
+#   ('content',  ts, user_id, content_type, content_id, interaction_type, duration, scroll_depth, ip, user_agent, metadata)
+#   ('session',  ts, user_id, session_id, pages, actions, defaults)
+ACTIVITY, CONTENT, SESSION = 'activity', 'content', 'session'
+
+
+class ActivityBuffer:
+    """Bounded deque + flusher thread that bulk-writes activity events."""
+
+    def __init__(self, maxlen: int = ACTIVITY_BUFFER_SIZE, batch_size: int = ACTIVITY_FLUSH_BATCH,
+                 interval: float = ACTIVITY_FLUSH_SECONDS):
+        self._events = deque()
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.interval = interval
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.appended = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+    def append(self, event: tuple) -> bool:
+        """Non-blocking append from the request path."""
+        self._ensure_started()
+        if len(self._events) >= self.maxlen:
+            try:
+                self._events.popleft()
+                self.dropped += 1
+            except IndexError:
+                pass
+        self._events.append(event)
+        self.appended += 1
+        if len(self._events) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def extend(self, events: list) -> bool:
+        """Append several events of one request in a single call."""
+        self._ensure_started()
+        overflow = len(self._events) + len(events) - self.maxlen
+        for _ in range(max(overflow, 0)):
+            try:
+                self._events.popleft()
+                self.dropped += 1
+            except IndexError:
+                break
+        self._events.extend(events)
+        self.appended += len(events)
+        if len(self._events) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='activity-flush', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                close_old_connections()
+                while self._events:
+                    self.flush()
+            except Exception as e:
+                logger.error(f"Activity flush failed: {e}")
+            finally:
+                close_old_connections()
+
+    def _drain(self, limit: int) -> list:
+        events = []
+        try:
+            while len(events) < limit:
+                events.append(self._events.popleft())
+        except IndexError:
+            pass
+        return events
+
+    def flush(self, limit: int = None) -> dict:
+        """Write up to `limit` (default batch_size) buffered events; returns row counts."""
+        with self._flush_lock:
+            events = self._drain(limit or self.batch_size)
+            if not events:
+                return {'activities': 0, 'interactions': 0, 'sessions_created': 0, 'sessions_updated': 0, 'failed': 0}
+            stats = write_events(events)
+            self.written += len(events) - stats['failed']
+            self.failed += stats['failed']
+            return stats
+
+    def stats(self) -> dict:
+        return {
+            'buffered': len(self._events),
+            'appended': self.appended,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+        }
+
+
+def write_events(events: list) -> dict:
+    """Bulk-write one batch of buffered events."""
+    from django.contrib.auth.models import User
+    from user_activity.models import UserActivity, ContentInteraction
+
+    user_ids = {e[2] for e in events}
+    known = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+
+    activities = [
+        UserActivity(
+            user_id=user_id, activity_type=activity_type, description=description, success=success,
+            ip_address=ip, user_agent=user_agent, metadata=metadata or {}, timestamp=ts,
+        )
+        for kind, ts, user_id, activity_type, description, success, ip, user_agent, metadata
+        in (e for e in events if e[0] == ACTIVITY) if user_id in known
+    ]
+    interactions = [
+        ContentInteraction(
+            user_id=user_id, content_type=content_type, content_id=content_id,
+            interaction_type=interaction_type, duration_seconds=duration,
+            scroll_depth_percentage=scroll_depth, ip_address=ip, user_agent=user_agent,
+            metadata=metadata or {}, timestamp=ts,
+        )
+        for kind, ts, user_id, content_type, content_id, interaction_type, duration, scroll_depth, ip, user_agent, metadata
+        in (e for e in events if e[0] == CONTENT) if user_id in known
+    ]
+
+    # (user_id, session_id) -> [first_ts, pages, actions, defaults]
+    sessions = {}
+    for kind, ts, user_id, session_id, pages, actions, defaults in (e for e in events if e[0] == SESSION):
+        if user_id not in known:
+            continue
+        entry = sessions.setdefault((user_id, session_id), [ts, 0, 0, defaults])
+        entry[1] += pages
+        entry[2] += actions
+
+    sessions_created, sessions_updated, session_failures = _write_sessions(sessions)
+    activities_written = _bulk_create(UserActivity, activities)
+    interactions_written = _bulk_create(ContentInteraction, interactions)
+
+    return {
+        'activities': activities_written,
+        'interactions': interactions_written,
+        'sessions_created': sessions_created,
+        'sessions_updated': sessions_updated,
+        'failed': (len(activities) - activities_written) + (len(interactions) - interactions_written) + session_failures,
+    }
+
+
+def _bulk_create(model, objs: list) -> int:
+    """
+    bulk_create `objs`; if the batch is rejected, insert them one by one so a
+    single bad row only loses itself. Returns the number of rows written.
+    """
+    if not objs:
+        return 0
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(objs, batch_size=500)
+        return len(objs)
+    except Exception as e:
+        logger.warning(f"Activity batch of {len(objs)} {model.__name__} rows rejected, retrying per row: {e}")
+    written = 0
+    for obj in objs:
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([obj])
+            written += 1
+        except Exception as e:
+            logger.error(f"Dropping {model.__name__} row for user {obj.user_id}: {e}")
+    return written
+
+
+def _write_sessions(sessions: dict):
+    """Apply the batch's session counts; returns (created, updated, failed)."""
+    if not sessions:
+        return 0, 0, 0
+    try:
+        with transaction.atomic():
+            created, updated = _apply_sessions(sessions)
+        return created, updated, 0
+    except Exception as e:
+        logger.warning(f"Activity batch of {len(sessions)} sessions rejected, retrying per session: {e}")
+    created = updated = failed = 0
+    for key, entry in sessions.items():
+        try:
+            with transaction.atomic():
+                c, u = _apply_sessions({key: entry})
+            created += c
+            updated += u
+        except Exception as e:
+            failed += 1
+            logger.error(f"Dropping session counts for user {key[0]}: {e}")
+    return created, updated, failed
+
+
+def _apply_sessions(sessions: dict):
+    from user_activity.models import SessionActivity
+
+    open_sessions = {
+        (s['user_id'], s['session_id']): s['id']
+        for s in SessionActivity.objects.filter(
+            user_id__in={k[0] for k in sessions},
+            session_id__in={k[1] for k in sessions},
+            end_time__isnull=True,
+        ).values('id', 'user_id', 'session_id')
+    }
+    new_sessions = []
+    updated = 0
+    now = timezone.now()
+    for key, (ts, pages, actions, defaults) in sessions.items():
+        if key in open_sessions:
+            SessionActivity.objects.filter(id=open_sessions[key]).update(
+                pages_visited=F('pages_visited') + pages,
+                actions_performed=F('actions_performed') + actions,
+                updated_at=now,
+            )
+            updated += 1
+        else:
+            # The first request of a session opens it without counting a page.
+            new_sessions.append(SessionActivity(
+                user_id=key[0], session_id=key[1], start_time=ts, timestamp=ts,
+                pages_visited=max(pages - 1, 0), actions_performed=actions, **(defaults or {})
+            ))
+    if new_sessions:
+        SessionActivity.objects.bulk_create(new_sessions, batch_size=500)
+    return len(new_sessions), updated
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_activity_buffer() -> ActivityBuffer:
+    """Process-wide buffer shared by the middleware and ActivityService."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = ActivityBuffer()
+                atexit.register(_flush_at_exit)
+    return _buffer
+
+
+def _flush_at_exit():
+    try:
+        while _buffer is not None and _buffer.stats()['buffered']:
+            _buffer.flush()
+    except Exception as e:
+        logger.error(f"Activity flush at exit failed: {e}")
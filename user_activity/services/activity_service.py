@@ -1,20 +1,142 @@
+import ipaddress
 import logging
+from functools import lru_cache
+
+from django.utils import timezone
+
+from user_activity.services.activity_buffer import get_activity_buffer, ACTIVITY, CONTENT, SESSION
 
 logger = logging.getLogger(__name__)
 
 
+def _django_user_id(user=None, user_id=None):
+    """
+    Django user id from a Django User, a Neo4j Users node (its user_id) or a
+    raw id; None when it can't be resolved.
+    """
+    if user is not None:
+        if hasattr(user, 'single'):  # neomodel relationship manager
+            user = user.single()
+        user_id = getattr(user, 'user_id', None) if not hasattr(user, '_meta') else user.pk
+    try:
+        return int(user_id) if user_id is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _max_length(model_name, field):
+    from user_activity import models
+    return getattr(models, model_name)._meta.get_field(field).max_length
+
+
+def _clip(value, model_name, field):
+    """`value` cut to the column's max_length so one long value can't fail a whole flush."""
+    if value is None:
+        return None
+    value = str(value)
+    limit = _max_length(model_name, field)
+    if len(value) > limit:
+        logger.debug(f"Clipping {model_name}.{field} value {value!r} to {limit} chars")
+        return value[:limit]
+    return value
+
+
+def _ip(value):
+    """Normalised IP address, or None for anything GenericIPAddressField would reject."""
+    if not value:
+        return None
+    try:
+        return str(ipaddress.ip_address(str(value).strip()))
+    except ValueError:
+        return None
+
+
+def _session_defaults(defaults):
+    if not defaults:
+        return {}
+    defaults = dict(defaults)
+    for field in ('session_type', 'referrer', 'exit_page'):
+        if field in defaults:
+            defaults[field] = _clip(defaults[field], 'SessionActivity', field)
+    if 'ip_address' in defaults:
+        defaults['ip_address'] = _ip(defaults['ip_address'])
+    return defaults
+
+
 class ActivityService:
+    """
+    Activity tracking entry points.
+
+    Every call appends one compact event to the process-wide ActivityBuffer
+    and returns immediately; the buffer's flusher bulk-writes them.
+    """
+
     def __init__(self):
         pass
 
     @staticmethod
     def track_content_interaction(user=None, content_type=None, content_id=None, interaction_type=None, **kwargs):
-        return True
+        user_id = _django_user_id(user, kwargs.get('user_id'))
+        if user_id is None or not content_type or not interaction_type:
+            return False
+        return get_activity_buffer().append((
+            CONTENT, timezone.now(), user_id,
+            _clip(content_type, 'ContentInteraction', 'content_type'),
+            _clip(content_id or '', 'ContentInteraction', 'content_id'),
+            _clip(interaction_type, 'ContentInteraction', 'interaction_type'),
+            kwargs.get('duration_seconds'), kwargs.get('scroll_depth_percentage'),
+            _ip(kwargs.get('ip_address')), kwargs.get('user_agent'), kwargs.get('metadata') or {},
+        ))
 
     @staticmethod
     def track_content_interaction_by_id(user_id=None, content_type=None, interaction_type=None, content_id=None, metadata=None):
-        return True
+        return ActivityService.track_content_interaction(
+            user_id=user_id, content_type=content_type, content_id=content_id,
+            interaction_type=interaction_type, metadata=metadata,
+        )
+
+    def track_activity_async(self, user=None, activity_type=None, description=None, success=True,
+                             ip_address=None, user_agent=None, metadata=None, **kwargs):
+        user_id = _django_user_id(user, kwargs.get('user_id'))
+        if user_id is None or not activity_type:
+            return False
+        return get_activity_buffer().append((
+            ACTIVITY, timezone.now(), user_id, _clip(activity_type, 'UserActivity', 'activity_type'),
+            description, success, _ip(ip_address), user_agent, metadata or {},
+        ))
 
-    def track_activity_async(self, *args, **kwargs):
-        return True
+    def track_session_activity(self, user=None, session_id=None, pages=1, actions=0, defaults=None, **kwargs):
+        """
+        Count pages/actions against the user's open session; `defaults` are
+        used if the flush has to open it.
+        """
+        user_id = _django_user_id(user, kwargs.get('user_id'))
+        if user_id is None or not session_id:
+            return False
+        return get_activity_buffer().append((
+            SESSION, timezone.now(), user_id, _clip(session_id, 'SessionActivity', 'session_id'), pages, actions,
+            _session_defaults(defaults),
+        ))
 
+    def track_request(self, user=None, session_id=None, session_defaults=None, navigation=None, **kwargs):
+        """
+        One request's session count and (optional) navigation activity,
+        appended together. `navigation` takes track_activity_async's kwargs.
+        """
+        user_id = _django_user_id(user, kwargs.get('user_id'))
+        if user_id is None or not session_id:
+            return False
+        now = timezone.now()
+        events = [(
+            SESSION, now, user_id, _clip(session_id, 'SessionActivity', 'session_id'),
+            1, 1 if navigation else 0, _session_defaults(session_defaults),
+        )]
+        if navigation:
+            events.append((
+                ACTIVITY, now, user_id, _clip(navigation.get('activity_type', 'navigation'), 'UserActivity', 'activity_type'),
+                navigation.get('description'), navigation.get('success', True),
+                _ip(navigation.get('ip_address')), navigation.get('user_agent'),
+                navigation.get('metadata') or {},
+            ))
+        return get_activity_buffer().extend(events)
@@ -0,0 +1,222 @@
+"""
+Activity rollups.
+
+`AggregationService.aggregate_daily_activities` (Celery beat, every
+ACTIVITY_ROLLUP_SECONDS) turns the raw activity tables into ActivityAggregation
+buckets: one 'hourly' row per (user, UTC hour) and one 'daily' row per
+(user, UTC day) with activity.
+
+A run is two queries against the raw tables:
+
+1. the earliest event `timestamp` among rows inserted (`created_at`) since the
+   previous run's watermark. Late events, e.g. ones flushed from the activity
+   buffer minutes after they happened, carry their original timestamp, so this
+   points at the oldest bucket they land in.
+2. one UNION ALL + GROUP BY (user, hour, source, type) over every row from the
+   start of that day onwards.
+
+Daily buckets are summed from the hourly ones in Python. The buckets of the
+recomputed window are deleted and rewritten in one transaction, so a run
+overwrites rather than increments, and rerunning it (or running it after late
+events) is idempotent. Buckets are UTC.
+
+activity_counts of a bucket:
+
+    {
+        "user_activities": 12, "content_interactions": 30, ...,   # per source
+        "types": {"user_activities": {"login": 2, ...},
+                  "content_interactions": {"post/like": 5, ...}, ...},
+        "active_hours": 4,                                          # daily only
+    }
+
+Content interaction types are "<content_type>/<interaction_type>".
+"""
+
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from user_activity.models import ActivityAggregation
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_DEFAULT_LOOKBACK_HOURS = int(os.getenv('ACTIVITY_ROLLUP_LOOKBACK_HOURS', '48'))
+ROLLUP_MAX_LOOKBACK_DAYS = int(os.getenv('ACTIVITY_ROLLUP_MAX_LOOKBACK_DAYS', '30'))
+# Rows inserted by transactions still open when a run starts get picked up by the next one.
+ROLLUP_WATERMARK_SKEW = timedelta(minutes=5)
+ROLLUP_WATERMARK_KEY = 'activity_rollup:watermark'
+ROLLUP_LOCK_KEY = 'activity_rollup:lock'
+ROLLUP_LOCK_SECONDS = 600
+
+# source name -> (table, user column, type expression, event time column)
+ROLLUP_SOURCES = {
+    'user_activities': ('user_activity', 'user_id', 'activity_type', 'timestamp'),
+    'content_interactions': ('content_interaction', 'user_id', "content_type || '/' || interaction_type", 'timestamp'),
+    'social_interactions': ('social_interaction', 'user_id', 'interaction_type', 'timestamp'),
+    'profile_activities': ('profile_activity', 'visitor_id', 'activity_type', 'timestamp'),
+    'media_interactions': ('media_interaction', 'user_id', "media_type || '/' || interaction_type", 'timestamp'),
+    'session_activities': ('session_activity', 'user_id', "''", 'start_time'),
+}
+
+# Sources that count as interactions for the engagement score and active hours.
+ENGAGEMENT_SOURCES = ('user_activities', 'content_interactions', 'social_interactions')
+
+
+def _union(select: str, where: str) -> str:
+    return ' UNION ALL '.join(
+        select.format(source=source, table=table, user=user, kind=kind, ts=ts) + ' WHERE ' + where.format(ts=ts)
+        for source, (table, user, kind, ts) in ROLLUP_SOURCES.items()
+    )
+
+
+def engagement_score(counts: dict) -> float:
+    """
+    0-10 score of a daily bucket: interactions (up to 5), active hours (up to 3)
+    and variety of interaction types (up to 2).
+    """
+    interactions = sum(counts.get(source, 0) for source in ENGAGEMENT_SOURCES)
+    if not interactions:
+        return 0.0
+    types = set()
+    for source in ENGAGEMENT_SOURCES:
+        types.update(kind.rsplit('/', 1)[-1] for kind in counts.get('types', {}).get(source, {}))
+    score = (
+        min(interactions / 10.0, 5.0)
+        + min(counts.get('active_hours', 0) / 8.0, 3.0)
+        + min(len(types) / 5.0, 2.0)
+    )
+    return round(score, 2)
+
+
+def merge_counts(buckets) -> dict:
+    """Sum the activity_counts of several buckets into one."""
+    merged = {'types': {}}
+    for counts in buckets:
+        for key, value in counts.items():
+            if key == 'types':
+                for source, kinds in value.items():
+                    target = merged['types'].setdefault(source, {})
+                    for kind, n in kinds.items():
+                        target[kind] = target.get(kind, 0) + n
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+class AggregationService:
+    """Builds and reads ActivityAggregation rollups."""
+
+    def _earliest_late_event(self, watermark: datetime):
+        sql = 'SELECT MIN(ts) FROM (' + _union(
+            'SELECT MIN({ts}) AS ts FROM {table}', 'created_at >= %s'
+        ) + ') late'
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [watermark] * len(ROLLUP_SOURCES))
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _grouped_rows(self, since: datetime):
+        sql = (
+            "SELECT user_id, date_trunc('hour', ts) AS hour, source, kind, COUNT(*) FROM ("
+            + _union(
+                "SELECT {user} AS user_id, {ts} AS ts, '{source}' AS source, {kind} AS kind FROM {table}",
+                '{ts} >= %s',
+            )
+            + ') events GROUP BY 1, 2, 3, 4'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [since] * len(ROLLUP_SOURCES))
+            return cursor.fetchall()
+
+    def build_buckets(self, rows) -> list:
+        """ActivityAggregation objects (hourly and daily) for grouped rows."""
+        hourly = defaultdict(lambda: {'types': {}})
+        for user_id, hour, source, kind, n in rows:
+            if timezone.is_naive(hour):
+                hour = timezone.make_aware(hour, dt_timezone.utc)
+            hour = hour.astimezone(dt_timezone.utc)
+            counts = hourly[(user_id, hour)]
+            counts[source] = counts.get(source, 0) + n
+            kinds = counts['types'].setdefault(source, {})
+            kinds[kind or source] = kinds.get(kind or source, 0) + n
+
+        daily = defaultdict(list)
+        for (user_id, hour), counts in hourly.items():
+            daily[(user_id, hour.date())].append((hour, counts))
+
+        buckets = []
+        for (user_id, day), hours in daily.items():
+            counts = merge_counts(c for _, c in hours)
+            counts['active_hours'] = sum(
+                1 for _, c in hours if any(c.get(source) for source in ENGAGEMENT_SOURCES)
+            )
+            buckets.append(ActivityAggregation(
+                user_id=user_id, aggregation_type='daily', date=day, hour=0,
+                activity_counts=counts, engagement_score=engagement_score(counts),
+            ))
+            buckets.extend(
+                ActivityAggregation(
+                    user_id=user_id, aggregation_type='hourly', date=day, hour=hour.hour,
+                    activity_counts=c,
+                )
+                for hour, c in hours
+            )
+        return buckets
+
+    def aggregate_daily_activities(self, now: datetime = None, since: datetime = None) -> dict:
+        """
+        Recompute the hourly and daily buckets touched since the last run.
+
+        `since` forces the window start (e.g. a backfill); otherwise it is the
+        start of the UTC day of the earliest event inserted after the watermark,
+        bounded by ROLLUP_MAX_LOOKBACK_DAYS.
+        """
+        if not cache.add(ROLLUP_LOCK_KEY, 1, timeout=ROLLUP_LOCK_SECONDS):
+            logger.info("Activity rollup already running, skipping")
+            return {'skipped': True}
+        try:
+            now = now or timezone.now()
+            if since is None:
+                watermark = cache.get(ROLLUP_WATERMARK_KEY) or now - timedelta(hours=ROLLUP_DEFAULT_LOOKBACK_HOURS)
+                since = self._earliest_late_event(watermark)
+                if since is None:
+                    cache.set(ROLLUP_WATERMARK_KEY, now - ROLLUP_WATERMARK_SKEW, timeout=None)
+                    return {'since': None, 'rows': 0, 'buckets': 0}
+                since = max(since, now - timedelta(days=ROLLUP_MAX_LOOKBACK_DAYS))
+            since = datetime.combine(since.astimezone(dt_timezone.utc).date(), time.min, tzinfo=dt_timezone.utc)
+
+            rows = self._grouped_rows(since)
+            buckets = self.build_buckets(rows)
+            with transaction.atomic():
+                ActivityAggregation.objects.filter(
+                    aggregation_type__in=('hourly', 'daily'), date__gte=since.date()
+                ).delete()
+                ActivityAggregation.objects.bulk_create(buckets, batch_size=1000)
+            cache.set(ROLLUP_WATERMARK_KEY, now - ROLLUP_WATERMARK_SKEW, timeout=None)
+            logger.info(f"Activity rollup from {since:%Y-%m-%d}: {len(rows)} groups, {len(buckets)} buckets")
+            return {'since': since, 'rows': len(rows), 'buckets': len(buckets)}
+        finally:
+            cache.delete(ROLLUP_LOCK_KEY)
+
+    @staticmethod
+    def daily_buckets(user_id, start_date, end_date) -> dict:
+        """{date: ActivityAggregation} of a user's daily buckets in [start_date, end_date]."""
+        return {
+            bucket.date: bucket
+            for bucket in ActivityAggregation.objects.filter(
+                user_id=user_id, aggregation_type='daily', date__gte=start_date, date__lte=end_date,
+            ).only('date', 'activity_counts', 'engagement_score')
+        }
+
+    @staticmethod
+    def summarize(user_id, start_date, end_date) -> dict:
+        """Merged activity_counts of a user's daily buckets in [start_date, end_date]."""
+        counts = ActivityAggregation.objects.filter(
+            user_id=user_id, aggregation_type='daily', date__gte=start_date, date__lte=end_date,
+        ).values_list('activity_counts', flat=True)
+        return merge_counts(counts)
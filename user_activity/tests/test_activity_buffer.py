@@ -0,0 +1,49 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from user_activity.services import activity_buffer
+from user_activity.services.activity_buffer import ActivityBuffer, CONTENT
+from user_activity.services.activity_service import ActivityService, _ip
+
+
+class TestEventClipping(SimpleTestCase):
+    def setUp(self):
+        self.buffer = ActivityBuffer()
+        self.buffer._thread = object()  # keep the flusher thread from starting
+        patcher = mock.patch('user_activity.services.activity_service.get_activity_buffer', return_value=self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_content_values_are_clipped_to_column_lengths(self):
+        ActivityService.track_content_interaction(
+            user_id=1, content_type='connection', content_id='x' * 150,
+            interaction_type='update_relationship_v2', ip_address='unknown',
+        )
+        event = self.buffer._drain(10)[0]
+        self.assertEqual(event[0], CONTENT)
+        self.assertEqual(event[4], 'x' * 100)
+        self.assertEqual(event[5], 'update_relationship')
+        self.assertIsNone(event[8])
+
+    def test_ip_is_normalised(self):
+        self.assertEqual(_ip(' 10.0.0.1 '), '10.0.0.1')
+        self.assertIsNone(_ip('10.0.0.1:443'))
+        self.assertIsNone(_ip(None))
+
+
+class TestBulkCreateFallback(SimpleTestCase):
+    def test_bad_row_only_loses_itself(self):
+        rows = [mock.Mock(user_id=i, bad=(i == 2)) for i in range(4)]
+
+        def bulk_create(objs, batch_size=None):
+            if any(o.bad for o in objs):
+                raise ValueError('value too long')
+
+        model = mock.Mock(__name__='UserActivity')
+        model.objects.bulk_create.side_effect = bulk_create
+        with mock.patch.object(activity_buffer.transaction, 'atomic'):
+            written = activity_buffer._bulk_create(model, rows)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(model.objects.bulk_create.call_count, 5)
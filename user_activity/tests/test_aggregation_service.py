@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+
+from user_activity.services.aggregation_service import AggregationService, engagement_score, merge_counts
+
+
+def hour(h, day=1):
+    return datetime(2026, 3, day, h, tzinfo=timezone.utc)
+
+
+class TestBuildBuckets(SimpleTestCase):
+    """Grouped (user, hour, source, type) rows become hourly and daily buckets."""
+
+    def setUp(self):
+        self.rows = [
+            (7, hour(9), 'user_activities', 'login', 1),
+            (7, hour(9), 'content_interactions', 'post/like', 4),
+            (7, hour(14), 'content_interactions', 'post/comment', 2),
+            (7, hour(14), 'session_activities', '', 1),
+            (7, hour(3, day=2), 'social_interactions', 'follow', 1),
+        ]
+
+    def _buckets(self, rows):
+        return {
+            (b.aggregation_type, b.date.day, b.hour): b
+            for b in AggregationService().build_buckets(rows)
+        }
+
+    def test_hourly_and_daily_buckets(self):
+        buckets = self._buckets(self.rows)
+
+        self.assertEqual(
+            sorted(buckets),
+            [('daily', 1, 0), ('daily', 2, 0), ('hourly', 1, 9), ('hourly', 1, 14), ('hourly', 2, 3)],
+        )
+        day = buckets[('daily', 1, 0)].activity_counts
+        self.assertEqual(day['user_activities'], 1)
+        self.assertEqual(day['content_interactions'], 6)
+        self.assertEqual(day['session_activities'], 1)
+        self.assertEqual(day['types']['content_interactions'], {'post/like': 4, 'post/comment': 2})
+        self.assertEqual(day['active_hours'], 2)
+        self.assertEqual(buckets[('hourly', 1, 14)].activity_counts['content_interactions'], 2)
+
+    def test_daily_engagement_score(self):
+        day = self._buckets(self.rows)[('daily', 1, 0)]
+
+        # 7 interactions, 2 active hours, 3 types (login, like, comment)
+        self.assertAlmostEqual(day.engagement_score, round(0.7 + 2 / 8.0 + 3 / 5.0, 2))
+        self.assertEqual(engagement_score({'types': {}}), 0.0)
+
+    def test_rebuild_is_idempotent(self):
+        first = self._buckets(self.rows)
+        second = self._buckets(list(self.rows))
+
+        self.assertEqual(
+            {k: b.activity_counts for k, b in first.items()},
+            {k: b.activity_counts for k, b in second.items()},
+        )
+
+
+class TestMergeCounts(SimpleTestCase):
+
+    def test_sums_sources_and_types(self):
+        merged = merge_counts([
+            {'user_activities': 2, 'types': {'user_activities': {'login': 2}}, 'active_hours': 1},
+            {'user_activities': 1, 'types': {'user_activities': {'login': 1, 'search': 0}}, 'active_hours': 3},
+        ])
+
+        self.assertEqual(merged['user_activities'], 3)
+        self.assertEqual(merged['active_hours'], 4)
+        self.assertEqual(merged['types']['user_activities'], {'login': 3, 'search': 0})
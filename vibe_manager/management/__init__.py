@@ -0,0 +1 @@
+# Vibe manager management commands
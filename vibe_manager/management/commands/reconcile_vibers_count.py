@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from neomodel import db
+
+from vibe_manager.utils import DEFAULT_VIBERS_COUNT
+
+RECONCILE_QUERY = """
+MATCH (u:Users)-[:HAS_PROFILE]->(:Profile)-[:HAS_SCORE]->(s:Score)
+WITH u, s ORDER BY u.uid SKIP $skip LIMIT $limit
+OPTIONAL MATCH (u)-[:HAS_REPO]->(r:UserVibeRepo)
+WITH s, count(r) AS received
+SET s.vibers_count = $base_count + received
+RETURN count(s)
+"""
+
+
+class Command(BaseCommand):
+    help = 'Set Score.vibers_count from the number of UserVibeRepo records, which vibe scoring now relies on'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        skip = 0
+        batch_size = options['batch_size']
+        while True:
+            rows, _ = db.cypher_query(RECONCILE_QUERY, {
+                'skip': skip,
+                'limit': batch_size,
+                'base_count': DEFAULT_VIBERS_COUNT,
+            })
+            updated = rows[0][0] if rows else 0
+            skip += updated
+            if updated < batch_size:
+                break
+        self.stdout.write(self.style.SUCCESS(f'Reconciled vibers_count on {skip} scores'))
@@ -0,0 +1,20 @@
+from celery import shared_task
+import logging
+
+from vibe_manager.utils import VibeUtils
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def apply_queued_vibes(batch_size=500):
+    """Apply vibes queued with VIBE_SCORING_MODE=queued, one transaction per batch."""
+    total = 0
+    while True:
+        applied = VibeUtils.applyQueuedVibes(batch_size=batch_size)
+        total += applied
+        if applied < batch_size:
+            break
+    if total:
+        logger.info(f"Applied {total} queued vibes")
+    return total
@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+
+from vibe_manager.utils import apply_vibe_to_score
+
+
+class TestApplyVibeToScore(SimpleTestCase):
+    """The batch scoring formula must match the per-vibe Cypher update."""
+
+    def setUp(self):
+        self.score = {
+            'intelligence_score': 2.0,
+            'appeal_score': 2.0,
+            'social_score': 2.0,
+            'human_score': 2.0,
+            'vibers_count': 2.0,
+        }
+        self.weights = {'iq': 4.0, 'aq': 0, 'sq': 3.0, 'hq': 1.0}
+
+    def test_first_vibe_uses_full_rate(self):
+        result = apply_vibe_to_score(self.score, self.weights, 4.0)
+
+        # target (4 + 4) / 2 = 4, change (4 - 2) * 0.2
+        self.assertAlmostEqual(result['intelligence_score'], 2.4)
+        self.assertEqual(result['appeal_score'], 2.0)
+        self.assertAlmostEqual(result['social_score'], 2.3)
+        self.assertAlmostEqual(result['human_score'], 2.1)
+        self.assertEqual(result['vibers_count'], 3.0)
+        self.assertAlmostEqual(result['cumulative_vibescore'], (2.4 + 2.0 + 2.3 + 2.1) / 4)
+        self.assertEqual(result['overall_score'], result['cumulative_vibescore'])
+
+    def test_rate_shrinks_with_vibers_count(self):
+        self.score['vibers_count'] = 6.0  # four vibes received
+
+        result = apply_vibe_to_score(self.score, self.weights, 4.0)
+
+        self.assertAlmostEqual(result['intelligence_score'], 2.0 + 2.0 * 0.2 / 5)
+
+    def test_zero_vibe_leaves_scores_unchanged(self):
+        result = apply_vibe_to_score(self.score, self.weights, 0)
+
+        self.assertEqual(result['intelligence_score'], 2.0)
+        self.assertEqual(result['vibers_count'], 3.0)
+
+    def test_scores_stay_within_bounds(self):
+        self.score['intelligence_score'] = 4.0
+        self.score['human_score'] = 0.0
+
+        result = apply_vibe_to_score(self.score, {'iq': 4.0, 'aq': 0, 'sq': 0, 'hq': 0.5}, 4.0)
+
+        self.assertLessEqual(result['intelligence_score'], 4.0)
+        self.assertGreaterEqual(result['human_score'], 0.0)
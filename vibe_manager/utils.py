@@ -1,7 +1,94 @@
 # vibe_manager/utils.py
 
-from auth_manager.models import Users, UserVibeRepo
-from vibe_manager.models import *
+import os
+import json
+import logging
+from neomodel import db
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+# Score.vibers_count starts at this value and is incremented once per vibe,
+# so vibes received = vibers_count - DEFAULT_VIBERS_COUNT
+DEFAULT_VIBERS_COUNT = 2.0
+RATE_CHANGE_BASE = 0.2
+
+VIBE_SCORING_MODE = os.getenv('VIBE_SCORING_MODE', 'immediate')
+VIBE_QUEUE_KEY = "vibe_score_queue"
+
+# Bounded change for one dimension, computed on the server. Mirrors
+# apply_vibe_to_score() below.
+_DIMENSION_UPDATE = """
+CASE WHEN $numvibe = 0 OR coalesce(v.{w}, 0) = 0 THEN coalesce(s.{f}, 2.0)
+ELSE
+    CASE
+        WHEN coalesce(s.{f}, 2.0) + ((($numvibe + v.{w}) / 2.0) - coalesce(s.{f}, 2.0)) * k > 4 THEN 4.0
+        WHEN coalesce(s.{f}, 2.0) + ((($numvibe + v.{w}) / 2.0) - coalesce(s.{f}, 2.0)) * k < 0 THEN 0.0
+        ELSE coalesce(s.{f}, 2.0) + ((($numvibe + v.{w}) / 2.0) - coalesce(s.{f}, 2.0)) * k
+    END
+END
+"""
+
+VIBE_SCORE_UPDATE_QUERY = """
+MATCH (u:Users {{uid: $user_uid}})-[:HAS_PROFILE]->(:Profile)-[:HAS_SCORE]->(s:Score)
+MATCH (v:Vibe {{name: $vibe_name}})
+WITH u, s, v LIMIT 1
+SET s._vibe_lock = true
+WITH u, s, v,
+     $rate / (CASE WHEN coalesce(s.vibers_count, $base_count) > $base_count
+                   THEN coalesce(s.vibers_count, $base_count) - $base_count ELSE 0 END + 1) AS k
+SET s.intelligence_score = {iq},
+    s.appeal_score = {aq},
+    s.social_score = {sq},
+    s.human_score = {hq},
+    s.vibers_count = coalesce(s.vibers_count, $base_count) + 1
+SET s.cumulative_vibescore = (s.intelligence_score + s.appeal_score + s.social_score + s.human_score) / 4.0,
+    s.overall_score = (s.intelligence_score + s.appeal_score + s.social_score + s.human_score) / 4.0
+REMOVE s._vibe_lock
+CREATE (r:UserVibeRepo {{uid: replace(randomUUID(), '-', ''), custom_value: $numvibe, created_at: timestamp() / 1000.0}})
+CREATE (r)-[:VIBE_REPO]->(u)
+CREATE (u)-[:HAS_REPO]->(r)
+""".format(
+    iq=_DIMENSION_UPDATE.format(f='intelligence_score', w='iq'),
+    aq=_DIMENSION_UPDATE.format(f='appeal_score', w='aq'),
+    sq=_DIMENSION_UPDATE.format(f='social_score', w='sq'),
+    hq=_DIMENSION_UPDATE.format(f='human_score', w='hq'),
+)
+
+VIBE_SCORE_LOCK_QUERY = """
+UNWIND $user_uids AS user_uid
+MATCH (u:Users {uid: user_uid})-[:HAS_PROFILE]->(:Profile)-[:HAS_SCORE]->(s:Score)
+SET s._vibe_lock = true
+RETURN user_uid, s.intelligence_score, s.appeal_score, s.social_score, s.human_score, s.vibers_count
+"""
+
+VIBE_WEIGHTS_QUERY = """
+UNWIND $names AS name
+MATCH (v:Vibe {name: name})
+RETURN name, v.iq, v.aq, v.sq, v.hq
+"""
+
+VIBE_SCORE_WRITE_QUERY = """
+CALL {
+    UNWIND $scores AS row
+    MATCH (:Users {uid: row.user_uid})-[:HAS_PROFILE]->(:Profile)-[:HAS_SCORE]->(s:Score)
+    SET s.intelligence_score = row.intelligence_score,
+        s.appeal_score = row.appeal_score,
+        s.social_score = row.social_score,
+        s.human_score = row.human_score,
+        s.vibers_count = row.vibers_count,
+        s.cumulative_vibescore = row.cumulative_vibescore,
+        s.overall_score = row.overall_score
+    REMOVE s._vibe_lock
+}
+CALL {
+    UNWIND $repos AS repo
+    MATCH (u:Users {uid: repo.user_uid})
+    CREATE (r:UserVibeRepo {uid: replace(randomUUID(), '-', ''), custom_value: repo.custom_value, created_at: timestamp() / 1000.0})
+    CREATE (r)-[:VIBE_REPO]->(u)
+    CREATE (u)-[:HAS_REPO]->(r)
+}
+"""
 
 # Utility class for vibe-related operations and scoring calculations
 # Contains the core business logic for how vibes affect user scores
@@ -36,14 +123,16 @@ class VibeUtils:
         process of how sending/receiving a vibe affects a user's scores across
         multiple dimensions (intelligence, appeal, social, human).
         
-        The algorithm works as follows:
-        1. Find the vibe template by name
-        2. Get the user's current scores
-        3. Calculate how many vibes this user has received (affects rate of change)
-        4. Apply weighted scoring algorithm for each dimension
-        5. Update user scores within valid bounds (0-4)
-        6. Calculate new cumulative score
-        7. Record the vibe transaction
+        The whole update runs as one Cypher statement (VIBE_SCORE_UPDATE_QUERY):
+        the Score node is write-locked, the rate change constant is derived
+        from the stored vibers_count instead of loading the user's full vibe
+        history, the bounded IQ/AQ/SQ/HQ changes are applied on the server and
+        the UserVibeRepo record is created in the same transaction. Concurrent
+        vibes for the same user therefore serialize instead of overwriting
+        each other.
+        
+        With VIBE_SCORING_MODE=queued the vibe is pushed to a Redis queue and
+        applied later in batches by onVibesCreatedBatch.
         
         Args:
             pro (Users): The user receiving/being affected by the vibe
@@ -54,7 +143,9 @@ class VibeUtils:
             None: Method has side effects on user scores and database
             
         Algorithm details:
-            - Rate change decreases as user receives more vibes (diminishing returns)
+            - Rate change decreases as user receives more vibes (diminishing returns):
+              0.2 / (vibes received + 1), where vibes received = vibers_count - 2.0
+              (vibers_count starts at 2.0 and is incremented once per vibe)
             - Score changes are bounded between 0 and 4
             - Each dimension (IQ, AQ, SQ, HQ) is calculated independently
             - Cumulative score is the average of all four dimensions
@@ -73,124 +164,120 @@ class VibeUtils:
             - Analytics and reporting systems
         """
         try:
-            # Step 1: Find the vibe template by name
-            # This gets the vibe's inherent scoring weights (iq, aq, sq, hq)
-            v = Vibe.nodes.get(name=vibename)
-            
-            # Step 2: Get user and their current scores
-            pro_user = pro  # The user receiving the vibe
-            profile = pro.profile.single()  # User's profile information
-            score = profile.score.single()  # User's current score object
-            
-            # Step 3: Calculate vibe history for rate change calculation
-            # More vibes received = slower rate of change (diminishing returns)
-            if pro_user:
-                vibe_repos = list(pro_user.userviberepo.all())  # Get all vibe transactions
-                h = len(vibe_repos)  # Count of vibes received
-            else:
-                h = 0  # Default if no user found
-            
-            # Step 4: Extract vibe's scoring weights
-            # These determine how much this vibe type affects each dimension
-            weight_aq = v.aq  # Appeal quotient weight
-            weight_hq = v.hq  # Human quotient weight  
-            weight_sq = v.sq  # Social quotient weight
-            weight_iq = v.iq  # Intelligence quotient weight
-            
-            # Step 5: Calculate rate change constant
-            # As user receives more vibes, each new vibe has less impact
-            # This prevents score inflation and maintains balance
-            rate_change_constant = 0.2 / (h + 1)
-            
-            # Step 6: Define scoring calculation function
-            # This function calculates how much each dimension should change
-            def calculate_change(weight, vibe, score):
-                """
-                Calculates score change for a single dimension.
-                
-                This helper function implements the core scoring algorithm
-                for individual dimensions (IQ, AQ, SQ, HQ).
-                
-                Algorithm:
-                1. If either weight or vibe is 0, no change occurs
-                2. Calculate average of vibe weight and user's vibe score
-                3. Find difference from current score
-                4. Apply rate change constant to moderate the change
-                5. Ensure change doesn't push score outside bounds (0-4)
-                
-                Args:
-                    weight (float): Vibe's inherent weight for this dimension
-                    vibe (float): User's sent vibe score
-                    score (float): Current user score for this dimension
-                    
-                Returns:
-                    float: Calculated change amount (can be positive or negative)
-                    
-                Edge cases:
-                    - Zero weight or vibe returns 0 (no change)
-                    - Change is bounded to keep final score in 0-4 range
-                """
-                if vibe == 0 or weight == 0:
-                    return 0
-                    
-                # Calculate target score as average of vibe weight and user vibe score
-                target = (vibe + weight) / 2
-                
-                # Calculate raw change amount
-                change = (target - score) * rate_change_constant
-                
-                # Bound the change to keep final score within valid range (0-4)
-                return min(4 - score, max(-score, change))
-            
-            # Step 7: Calculate changes for each dimension
-            aq_change = calculate_change(weight_aq, numvibe, score.appeal_score)
-            hq_change = calculate_change(weight_hq, numvibe, score.human_score)
-            sq_change = calculate_change(weight_sq, numvibe, score.social_score)
-            iq_change = calculate_change(weight_iq, numvibe, score.intelligence_score)
-            
-            # Step 8: Apply changes to user scores
-            score.intelligence_score += iq_change
-            score.appeal_score += aq_change
-            score.social_score += sq_change
-            score.human_score += hq_change
-            
-            # Step 9: Increment vibe interaction counter
-            score.vibers_count += 1
-            
-            # Step 10: Enforce score bounds (0-4 range)
-            # This ensures scores never go below 0 or above 4
-            score.intelligence_score = max(0, min(4, score.intelligence_score))
-            score.appeal_score = max(0, min(4, score.appeal_score))
-            score.social_score = max(0, min(4, score.social_score))
-            score.human_score = max(0, min(4, score.human_score))
-            
-            # Step 11: Calculate cumulative score as average of all dimensions
-            # This provides an overall score that represents the user's total vibe rating
-            score.cumulative_vibescore = (
-                score.intelligence_score +
-                score.appeal_score +
-                score.social_score +
-                score.human_score
-            ) / 4
-            
-            # Step 11.5: Update overall_score to match cumulative_vibescore
-            # This ensures the overall_score is always in sync with the calculated vibe score
-            score.overall_score = score.cumulative_vibescore
-            
-            # Step 12: Save updated scores to database
-            score.save()
-            
-            # Step 13: Record this vibe transaction for future calculations
-            # This creates a historical record and affects future rate calculations
-            repo = UserVibeRepo(custom_value=numvibe)
-            repo.save()
-            
-            # Step 14: Establish relationships for the vibe transaction
-            repo.user.connect(pro_user)  # Link transaction to user
-            pro_user.userviberepo.connect(repo)  # Link user to transaction
-            
+            if VIBE_SCORING_MODE == 'queued':
+                VibeUtils.queueVibe(pro.uid, vibename, numvibe)
+                return
+            db.cypher_query(VIBE_SCORE_UPDATE_QUERY, {
+                'user_uid': pro.uid,
+                'vibe_name': vibename,
+                'numvibe': float(numvibe),
+                'base_count': DEFAULT_VIBERS_COUNT,
+                'rate': RATE_CHANGE_BASE,
+            })
         except Exception as e:
-            # Silently handle any errors during vibe processing
-            # In production, this should probably log the error for debugging
-            # Current implementation prevents crashes but loses error information
-            pass
\ No newline at end of file
+            # Vibe scoring must never fail the mutation that triggered it
+            logger.error(f"Vibe score update failed for user {getattr(pro, 'uid', None)}: {e}")
+
+    @staticmethod
+    def queueVibe(user_uid, vibename, numvibe):
+        """Push a vibe onto the Redis queue drained by applyQueuedVibes."""
+        get_redis_connection("default").rpush(
+            VIBE_QUEUE_KEY, json.dumps([user_uid, vibename, float(numvibe)])
+        )
+
+    @staticmethod
+    def applyQueuedVibes(batch_size=500):
+        """
+        Drain up to batch_size queued vibes and apply them in one transaction.
+
+        Returns the number of vibes applied. A batch that fails is pushed back
+        to the front of the queue.
+        """
+        redis = get_redis_connection("default")
+        pipe = redis.pipeline()
+        pipe.lrange(VIBE_QUEUE_KEY, 0, batch_size - 1)
+        pipe.ltrim(VIBE_QUEUE_KEY, batch_size, -1)
+        raw, _ = pipe.execute()
+        if not raw:
+            return 0
+        events = [json.loads(item) for item in raw]
+        try:
+            VibeUtils.onVibesCreatedBatch(events)
+        except Exception:
+            redis.lpush(VIBE_QUEUE_KEY, *reversed(raw))
+            raise
+        return len(events)
+
+    @staticmethod
+    def onVibesCreatedBatch(events):
+        """
+        Apply many vibes in a single transaction.
+
+        events: iterable of (user_uid, vibename, numvibe), in arrival order.
+        Locks and reads every affected Score once, applies the vibes per user
+        in order with the same formula as onVibeCreated, then writes all
+        scores and UserVibeRepo records back with one UNWIND statement.
+        """
+        events = [(str(u), name, float(n)) for u, name, n in events if u and name]
+        if not events:
+            return
+        user_uids = list(dict.fromkeys(e[0] for e in events))
+        vibe_names = list(dict.fromkeys(e[1] for e in events))
+
+        with db.transaction:
+            rows, _ = db.cypher_query(VIBE_SCORE_LOCK_QUERY, {'user_uids': user_uids})
+            scores = {
+                r[0]: {
+                    'intelligence_score': r[1], 'appeal_score': r[2],
+                    'social_score': r[3], 'human_score': r[4], 'vibers_count': r[5],
+                }
+                for r in rows
+            }
+            rows, _ = db.cypher_query(VIBE_WEIGHTS_QUERY, {'names': vibe_names})
+            weights = {r[0]: {'iq': r[1], 'aq': r[2], 'sq': r[3], 'hq': r[4]} for r in rows}
+
+            repos = []
+            for user_uid, vibename, numvibe in events:
+                if user_uid not in scores or vibename not in weights:
+                    continue
+                scores[user_uid] = apply_vibe_to_score(scores[user_uid], weights[vibename], numvibe)
+                repos.append({'user_uid': user_uid, 'custom_value': numvibe})
+
+            db.cypher_query(VIBE_SCORE_WRITE_QUERY, {
+                'scores': [dict(score, user_uid=uid) for uid, score in scores.items()],
+                'repos': repos,
+            })
+
+
+def apply_vibe_to_score(score, weights, numvibe):
+    """
+    Pure-Python version of VIBE_SCORE_UPDATE_QUERY for one vibe.
+
+    score: dict with intelligence_score, appeal_score, social_score,
+    human_score and vibers_count. weights: dict with iq, aq, sq, hq.
+    Returns the updated score dict (cumulative and overall included).
+    """
+    vibers_count = score.get('vibers_count')
+    vibers_count = DEFAULT_VIBERS_COUNT if vibers_count is None else vibers_count
+    rate_change_constant = RATE_CHANGE_BASE / (max(vibers_count - DEFAULT_VIBERS_COUNT, 0) + 1)
+
+    def updated(current, weight):
+        current = 2.0 if current is None else current
+        if numvibe == 0 or not weight:
+            return current
+        change = ((numvibe + weight) / 2 - current) * rate_change_constant
+        return max(0, min(4, current + min(4 - current, max(-current, change))))
+
+    result = {
+        'intelligence_score': updated(score.get('intelligence_score'), weights.get('iq')),
+        'appeal_score': updated(score.get('appeal_score'), weights.get('aq')),
+        'social_score': updated(score.get('social_score'), weights.get('sq')),
+        'human_score': updated(score.get('human_score'), weights.get('hq')),
+        'vibers_count': vibers_count + 1,
+    }
+    result['cumulative_vibescore'] = (
+        result['intelligence_score'] + result['appeal_score'] +
+        result['social_score'] + result['human_score']
+    ) / 4
+    result['overall_score'] = result['cumulative_vibescore']
+    return result